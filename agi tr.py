@@ -33,162 +33,119 @@ import os
 import sys
 import json
 from datetime import datetime
-import numpy as np
-from scipy.interpolate import RectBivariateSpline
 from bisect import bisect_left
-from typing import Dict, Tuple, Any, List, NamedTuple, Optional
+from typing import Dict, Any, List, Optional
+import importlib
+import importlib.util
 import math
 from enum import Enum, auto
 import logging
 import shutil
 import csv
+import time
 from pathlib import Path
 
-try:
-    import matplotlib.pyplot as plt
+# matplotlib 은 PNG export 시에만 import (import 시간 절감)
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
 
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
 
-# ============================================================================
-# 기본 파라미터 (LCT BUSHRA – Hydro / Ops / Limits)
-# Excel Parameter/Constants 시트와 1:1 매핑
-# ============================================================================
-DEFAULT_PARAMS: dict[str, float] = {
-    # HYDRO BASE
-    "Tmean_baseline_m": 2.00,  # m  - Baseline mean draft (Stage 1)
-    "Tmean_baseline": 2.00,  # m  - Alias for backward compatibility
-    "Tide_ref": 2.00,  # m  - Reference tide level
-    "Trim_target_cm": 10.00,  # cm - Target trim (sanity check)
-    "MTC_t_m_per_cm": 34.00,  # t·m/cm - Moment to change trim
-    "LCF_m_from_midship": 0.76,  # m  - LCF from midship (corrected)
-    "D_vessel_m": 3.65,  # m  - Molded depth
-    "TPC_t_per_cm": 8.00,  # t/cm - Tons per cm immersion
-    "Lpp_m": 60.302,  # m  - Lpp (BV value, displayed 60.30)
-    # INPUT CONSTANTS
-    "L_ramp_m": 12.00,  # m  - Linkspan design length
-    "theta_max_deg": 6.00,  # deg- Max ramp angle
-    "KminusZ_m": 3.00,  # m  - K - Z (Aries)
-    # LIMITS & OPS
-    "min_fwd_draft_m": 1.50,  # m  - Minimum allowable forward draft
-    "max_fwd_draft_m": 3.50,  # m  - Max structural/nautical forward draft
-    "max_fwd_draft_ops_m": 2.70,  # m  - Ops limit for RORO
-    "gm_target_m": 1.50,  # m  - GM target
-    "linkspan_freeboard_target_m": 0.28,  # m - Linkspan freeboard target
-    "ramp_door_offset_m": 0.15,  # m  - Ramp door offset vs quay
-    "trim_limit_abs_cm": 240.00,  # cm - Trim envelope for RORO sequence
-    # PUMP / VENT
-    "pump_rate_tph": 10.00,  # t/h - Ship pump rate (slow)
-    "pump_rate_tph_hired": 100.00,  # t/h - Hired pump nominal rate
-    "pump_rate_effective_tph": 100.00,  # t/h - Effective rate (vent-limited)
-    "vent_flow_coeff": 0.86,  # t/h/mm - Vent flow coefficient (2025-11-18)
-    "max_pump_time_h": 6.00,  # h  - Max allowed pump time for fix
-    # BALLAST / CAP
-    # 가정/주의:
-    #   - X_Ballast_from_AP_m = 현재 52.50m는 이전 Forward ballast 전략(FWB1/2 근처)의 잔여값이다.
-    #   - Stern Pre-Ballast 전략에서는 FW2(FR 0–6, AFT)의 실제 LCG(AP)를 master_tanks.csv / Tank Plan에서 읽어와야 한다.
-    "X_Ballast_from_AP_m": 52.50,  # m  - [OLD] Forward ballast CG from AP (FWB1/2 쪽, 검증용 레거시 값)
-    "max_aft_ballast_cap_t": 28.00,  # t  - Max AFT Ballast Capacity (FW2 P/S, Fr 0–6, ~28t)
-    "max_fwd_ballast_cap_t": 321.00,  # t  - Max Forward Ballast Capacity (FWB1/2, Fr 48–65, ~321t)
-    # RAMP GEOMETRY
-    "ramp_hinge_x_mid_m": -30.151,  # m  - Ramp hinge x (midship reference)
-    "ramp_length_m": 8.30,  # m  - Ramp length (TRE 2020-08-04)
-    "linkspan_height_m": 2.00,  # m  - Jetty soffit height
-    "ramp_end_clearance_min_m": 0.40,  # m  - Minimum ramp-end clearance
-    # STRUCTURAL LIMITS
-    "limit_reaction_t": 201.60,  # t  - Aries hinge reaction limit
-    "hinge_limit_rx_t": 201.60,  # t  - Duplicate for clarity
-    "limit_share_load_t": 118.80,  # t  - Mammoet max share load on LCT
-    "limit_deck_press_tpm2": 10.00,  # t/m² - Deck pressure limit
-    "linkspan_area_m2": 12.00,  # m² - Linkspan effective area (1 TR)
-    "hinge_pin_area_m2": 0.117,  # m² - Hinge pin/doubler area (390×300 mm)
-}
+def _get_pyplot():
+    """matplotlib.pyplot lazy import (없으면 None)"""
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+    return plt
 
 # ============================================================================
-# Stage-specific Trim Targets (updated 2025-11-22)
+# 계산 엔진 (src/roro_engine) – 파라미터 / Hydro·GM 보간 / Stage solver
 # ============================================================================
-TRIM_TARGET_MAP: dict[str, float] = {
-    # qqq.md에 값 정의된 Stage들
-    "Stage 1": 0.00,  # 유지
-    "Stage 2": -96.50,  # qqq.md
-    "Stage 3": -96.50,  # qqq.md
-    "Stage 4": -96.50,  # qqq.md
-    "Stage 5": -89.58,  # qqq.md
-    # Stern Pre-Ballast: D-1에 의도적으로 stern trim(+2.40m AFT down) 세팅
-    "Stage 5_PreBallast": 240.00,  # qqq.md (의도적 stern trim; FW2, Fr.0–6 기준)
-    "Stage 6A_Critical (Opt C)": 0.00,  # qqq.md (even keel 목표)
-    "Stage 6A_Critical": 0.00,  # qqq.md와 동일 기준 유지
-    "Stage 6C": -96.50,  # qqq.md
-    "Stage 6C_TotalMassOpt": -96.50,  # Stage 6C와 동일 기준
-    "Stage 7": 0.00,  # 유지
+# 엔진은 부작용 없이 import 된다 (GM grid 는 최초 사용 시 로드, NumPy/SciPy 모듈은
+# 해당 기능 사용 시에만 필요). 기존 `agi tr.py` 이름은 아래에서 그대로 re-export.
+_REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from src.roro_engine import frames as _frames  # noqa: E402
+from src.roro_engine import hydro as _hydro  # noqa: E402
+from src.roro_engine.params import (  # noqa: E402
+    DEFAULT_PARAMS,
+    FR_PREBALLAST,
+    FR_TR1_STOW,
+    FR_TR2_RAMP,
+    TRIM_TARGET_MAP,
+)
+from src.roro_engine.data_io import (  # noqa: E402
+    _find_json,
+    _gm2d_json_paths,
+    _json_base_dirs,
+    _load_json,
+    find_tide_file,
+    iter_tide_records,
+)
+from src.roro_engine.frames import _init_frame_mapping, fr_to_x, x_to_fr  # noqa: E402
+from src.roro_engine.hydro import (  # noqa: E402
+    _load_gm2d_grid,
+    get_gm_grid,
+    gm_2d_bilinear,
+    interpolate_tmean_from_disp,
+)
+from src.roro_engine.solver import (  # noqa: E402
+    LoadItem,
+    _affine_interval,
+    _find_preballast_analytic,
+    _preballast_metric,
+    _stage_moment_and_drafts_for_preballast,
+    build_stage5_loads,
+    build_stage6a_loads,
+    build_stage_loads,
+    calc_draft_with_lcf,
+    calc_trim,
+    draft_from_trim,
+    find_preballast_opt,
+    simulate_stage,
+    solve_stage,
+)
+from src.roro_engine.tanks import build_tank_lookup, get_fixed_tank_data  # noqa: E402
+from src.shared_formula import shared_formula_block  # noqa: E402
+from src.sheet_graph import SheetTask, run_sheet_graph  # noqa: E402
+
+# NumPy / SciPy 기반 엔진 이름 → 최초 접근 시 import (module __getattr__)
+_LAZY_ENGINE_NAMES = {
+    "HydroTables": "tables",
+    "_bisect_left_array": "tables",
+    "_hydro_table_columns": "tables",
+    "pack_load_cases": "batch",
+    "solve_stages_batch": "batch",
+    "_interpolate_tmean_array": "batch",
+    "_gm_2d_bilinear_array": "batch",
+    "BALLAST_ALLOC_STAGES": "allocation",
+    "_tank_fill_rate_tph": "allocation",
+    "optimize_ballast_allocation": "allocation",
 }
 
-# ============================================================================
-# TR / ballast layout (frames) – Stage 설명표 + Tank Plan 기준
-# ============================================================================
-FR_TR1_STOW: float = 42.00  # "TR1 secured at Fr.42 (aft)"
-FR_TR2_RAMP: float = (
-    17.95  # Stage 6A_Critical(Opt C) LCG Frame (x=12.20m → Fr=30.151-12.20≈17.95)
-)
-FR_PREBALLAST: float = 3.0  # FW2 Stern tank (Fr.0-6, AFT position)
-# CONFIRMED: Stern Pre-Ballast strategy for forward trim correction
 
-# 출력 파일 경로를 스크립트 위치 기준 루트 폴더로 설정
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-OUTPUT_FILE = os.path.join(SCRIPT_DIR, "LCT_BUSHRA_AGI_TR_Final_v3.xlsx")
+def __getattr__(name: str):
+    # DISP_GRID / TRIM_GRID / GM_GRID / GM2D_DATA – 접근 시 lazy 로드 (src.roro_engine.hydro)
+    if name in _hydro._GM_GRID_NAMES:
+        return getattr(_hydro, name)
+    module = _LAZY_ENGINE_NAMES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f"src.roro_engine.{module}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# ============================================================================
-# GM 2D Grid 로드 (전역 변수)
-# ============================================================================
-# GM 2D Grid JSON 로드 - LCT_BUSHRA_GM_2D_Grid.json 기반
-GM2D_DATA = None
-DISP_GRID = []
-TRIM_GRID = []
-GM_GRID = []
-
-
-def _load_gm2d_grid():
-    """GM 2D Grid JSON 로드 및 전역 변수 설정"""
-    global GM2D_DATA, DISP_GRID, TRIM_GRID, GM_GRID
-
-    # JSON 파일 경로 시도 (기존 _load_json 전략과 동일)
-    json_paths = [
-        os.path.join(SCRIPT_DIR, "data", "LCT_BUSHRA_GM_2D_Grid.json"),
-        os.path.join(SCRIPT_DIR, "LCT_BUSHRA_GM_2D_Grid.json"),
-        os.path.join(os.getcwd(), "data", "LCT_BUSHRA_GM_2D_Grid.json"),
-        os.path.join(os.getcwd(), "LCT_BUSHRA_GM_2D_Grid.json"),
-        r"/mnt/data/LCT_BUSHRA_GM_2D_Grid.json",
-    ]
-
-    for json_path in json_paths:
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    DISP_GRID = sorted(data.get("disp", []))
-                    TRIM_GRID = sorted(data.get("trim", []))
-                    GM_GRID = [row for row in data.get("gm_grid", [])]
-                    GM2D_DATA = data
-                    print(
-                        f"[OK] GM 2D Grid loaded: {len(DISP_GRID)}×{len(TRIM_GRID)} from {json_path}"
-                    )
-                    return
-            except Exception as e:
-                print(f"[ERROR] GM grid parse error in {json_path}: {e}")
-                continue
 
-    # 최후의 fallback: 최소 안전 GM 그리드
-    print("[FALLBACK] Using minimal safe GM grid")
-    DISP_GRID = [2800, 3600]
-    TRIM_GRID = [-2.0, 0.0, 2.0]
-    GM_GRID = [[1.50] * 3, [1.50] * 3]
-    GM2D_DATA = {"disp": DISP_GRID, "trim": TRIM_GRID, "gm_grid": GM_GRID}
+def _hydro_tables():
+    """HydroTables.load() 캐시 객체 (NumPy 는 이 시점에 import)"""
+    from src.roro_engine.tables import HydroTables
 
+    return HydroTables.load()
 
-# 모듈 로드 시 GM 2D Grid 초기화
-_load_gm2d_grid()
+# 출력 파일 경로를 스크립트 위치 기준 루트 폴더로 설정
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "LCT_BUSHRA_AGI_TR_Final_v3.xlsx")
 
 # ============================================================================
 # Helper Functions
@@ -198,6 +155,7 @@ _load_gm2d_grid()
 # 스타일 정의
 def get_styles():
     """공통 스타일 정의"""
+    thin_border = Side(border_style="thin", color="C0C0C0")
     return {
         "title_font": Font(name="Calibri", size=18, bold=True),
         "header_font": Font(name="Calibri", size=11, bold=True, color="FFFFFF"),
@@ -212,7 +170,12 @@ def get_styles():
         "opt1_fill": PatternFill(
             "solid", fgColor="7030A0"
         ),  # Purple for Option 1 (Ballast Fix)
-        "thin_border": Side(border_style="thin", color="C0C0C0"),
+        "thin_border": thin_border,
+        # 셀마다 Border 를 새로 만들지 않도록 공유 (write_only 스타일 interning)
+        "box_border": Border(
+            left=thin_border, right=thin_border, top=thin_border, bottom=thin_border
+        ),
+        "bottom_border": Border(bottom=thin_border),
         "center_align": Alignment(
             horizontal="center", vertical="center", wrap_text=True
         ),
@@ -220,614 +183,6 @@ def get_styles():
     }
 
 
-# ============================================================================
-# 공통 유틸: JSON 로더 + Frame↔x 변환 + Tank Lookup
-# ============================================================================
-
-
-def _load_json(filename):
-    """
-    JSON 파일 로더 with backup strategy.
-    - 우선: 스크립트 위치 기준
-    - 다음: 현재 작업 디렉토리
-    - 마지막: /mnt/data (Notebook 환경용)
-
-    BACKUP: Returns None if file not found or parsing fails
-    """
-    base_dirs = [
-        os.path.dirname(os.path.abspath(__file__)),
-        os.getcwd(),
-        r"/mnt/data",
-    ]
-    for base_dir in base_dirs:
-        path = os.path.join(base_dir, filename)
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    print(f"[OK] Loaded: {filename}")
-                    return data
-            except json.JSONDecodeError as e:
-                print(f"[BACKUP] JSON parse error in {filename}: {e}")
-                continue  # Try next directory
-            except Exception as e:
-                print(f"[BACKUP] Error reading {filename}: {e}")
-                continue
-    print(f"[BACKUP] {filename} not found → using fallback")
-    return None
-
-
-def gm_2d_bilinear(disp_t: float, trim_m: float) -> float:
-    """
-    Bilinear interpolation on (disp, trim) → GM 2D grid.
-    Uses LCT_BUSHRA_GM_2D_Grid.json with 7x7 grid (7 displacement × 7 trim values).
-
-    Args:
-        disp_t: Displacement (tons)
-        trim_m: Trim in meters (bow down + / stern down - 등 프로젝트 convention에 맞게 사용)
-
-    Returns:
-        GM value (meters) or 1.50m fallback if data not available
-    """
-    # 전역 변수 사용 (모듈 로드 시 초기화됨)
-    global DISP_GRID, TRIM_GRID, GM_GRID
-
-    # Fallback: Grid가 비어있으면 안전한 최소값 반환
-    if not DISP_GRID or not TRIM_GRID or not GM_GRID:
-        print(f"[BACKUP] GM 2D Grid unavailable → using fallback GM=1.50m")
-        return 1.50  # Safe minimum GM requirement
-
-    try:
-        ds = DISP_GRID
-        ts = TRIM_GRID
-        g = GM_GRID
-
-        # --- 1) disp index 찾기 (clamp + 양구간 인덱스) ---
-        if disp_t <= ds[0]:
-            i0 = i1 = 0
-        elif disp_t >= ds[-1]:
-            i0 = i1 = len(ds) - 1
-        else:
-            k = bisect_left(ds, disp_t) - 1
-            if k < 0:
-                k = 0
-            i0, i1 = k, k + 1
-
-        # --- 2) trim index 찾기 (clamp + 양구간 인덱스) ---
-        if trim_m <= ts[0]:
-            j0 = j1 = 0
-        elif trim_m >= ts[-1]:
-            j0 = j1 = len(ts) - 1
-        else:
-            k = bisect_left(ts, trim_m) - 1
-            if k < 0:
-                k = 0
-            j0, j1 = k, k + 1
-
-        d0, d1 = ds[i0], ds[i1]
-        t0, t1 = ts[j0], ts[j1]
-
-        # --- 3) 보간 비율 (0~1) ---
-        if d1 != d0:
-            td = (disp_t - d0) / (d1 - d0)
-        else:
-            td = 0.0
-
-        if t1 != t0:
-            tt = (trim_m - t0) / (t1 - t0)
-        else:
-            tt = 0.0
-
-        # --- 4) 모서리 GM 값 ---
-        g00 = g[i0][j0]  # (d0, t0)
-        g10 = g[i1][j0]  # (d1, t0)
-        g01 = g[i0][j1]  # (d0, t1)
-        g11 = g[i1][j1]  # (d1, t1)
-
-        # --- 5) bilinear interpolation ---
-        gm = (
-            (1 - td) * (1 - tt) * g00
-            + td * (1 - tt) * g10
-            + (1 - td) * tt * g01
-            + td * tt * g11
-        )
-
-        # Sanity check for unrealistic GM values
-        if gm < 0 or gm > 5.0:
-            print(f"[BACKUP] GM={gm:.2f}m unrealistic → fallback GM=1.50m")
-            return 1.50
-
-        return float(gm)
-    except Exception as e:
-        print(f"[BACKUP] GM calculation error: {e} → fallback GM=1.50m")
-        return 1.50
-
-
-# ============================================================================
-# Hydro Table 보간 함수
-# ============================================================================
-
-
-def interpolate_tmean_from_disp(disp_t: float, hydro_table: list[dict]) -> float:
-    """
-    Δdisp → Tmean 보간
-
-    Args:
-        disp_t: 배수량 (ton)
-        hydro_table: Hydro table 데이터 (list of dict)
-            각 dict는 "Displacement_t" 또는 "Disp_t"와 "Tmean_m" 키를 가져야 함
-
-    Returns:
-        Tmean (m) - 선형 보간된 평균 흘수
-    """
-    if not hydro_table or len(hydro_table) == 0:
-        print("[WARNING] Hydro table is empty → using fallback Tmean=2.00m")
-        return 2.00  # Fallback
-
-    try:
-        # 키 이름 확인 (다양한 형식 지원)
-        disp_key = None
-        tmean_key = None
-
-        for key in hydro_table[0].keys():
-            if "disp" in key.lower() or "displacement" in key.lower():
-                disp_key = key
-            if "tmean" in key.lower() or "mean" in key.lower():
-                tmean_key = key
-
-        if not disp_key or not tmean_key:
-            print(
-                "[WARNING] Hydro table format not recognized → using fallback Tmean=2.00m"
-            )
-            return 2.00
-
-        # Displacement 및 Tmean 배열 추출
-        disps = [float(row[disp_key]) for row in hydro_table]
-        tmeans = [float(row[tmean_key]) for row in hydro_table]
-
-        # 정렬 확인 (필요시 정렬)
-        if disps != sorted(disps):
-            # 정렬 필요
-            sorted_pairs = sorted(zip(disps, tmeans))
-            disps, tmeans = zip(*sorted_pairs)
-            disps = list(disps)
-            tmeans = list(tmeans)
-
-        # Clamp 및 보간
-        if disp_t <= disps[0]:
-            return tmeans[0]
-        elif disp_t >= disps[-1]:
-            return tmeans[-1]
-
-        # 선형 보간
-        i = bisect_left(disps, disp_t)
-        if i <= 0:
-            return tmeans[0]
-        elif i >= len(disps):
-            return tmeans[-1]
-
-        x0, x1 = disps[i - 1], disps[i]
-        y0, y1 = tmeans[i - 1], tmeans[i]
-
-        if x1 == x0:
-            return y0
-
-        tmean = y0 + (y1 - y0) * (disp_t - x0) / (x1 - x0)
-        return float(tmean)
-    except Exception as e:
-        print(f"[WARNING] Tmean interpolation error: {e} → using fallback Tmean=2.00m")
-        return 2.00
-
-
-# ============================================================================
-# LOAD ITEM BUILDER
-# ============================================================================
-
-
-class LoadItem(NamedTuple):
-    """Stage별 하중 구성 요소"""
-
-    name: str
-    weight_t: float
-    x_from_mid_m: float
-    kind: str  # "TR", "SPMT", "BALLAST", "CONST", "CARGO"
-
-
-# ============================================================================
-# STAGE SOLVER (Hydro/GM 기반)
-# ============================================================================
-
-
-def solve_stage(
-    base_disp_t: float, base_tmean_m: float, loads: List[LoadItem], **params
-) -> Dict[str, Any]:
-    """
-    Calculate Δdisp, Trim, Draft, GM, Height, Check for each Stage.
-    Hydro/GM 데이터는 params 내부 참조.
-
-    Args:
-        base_disp_t: 기본 배수량 (ton) - Stage 1 기준
-        base_tmean_m: 기본 평균 흘수 (m) - Stage 1 기준
-        loads: LoadItem 리스트 (Stage별 하중 구성)
-        **params: 파라미터 딕셔너리
-            - MTC: Moment to change trim (t·m/cm)
-            - LCF: Longitudinal center of flotation from midship (m)
-            - LBP: Length between perpendiculars (m)
-            - hydro_table: Hydro table 데이터 (list of dict)
-            - D_vessel: Vessel depth (m, 기본값 3.65)
-
-    Returns:
-        dict: {
-            "W_stage_t": Stage 추가 중량 (ton),
-            "x_stage_m": Stage LCG (m),
-            "TM_LCF_tm": Trim moment (t·m),
-            "Disp_t": 배수량 (ton),
-            "Tmean_m": 평균 흘수 (m),
-            "Trim_cm": Trim (cm),
-            "Dfwd_m": 선수 흘수 (m),
-            "Daft_m": 선미 흘수 (m),
-            "GM_m": GM (m),
-            "FWD_Height_m": 선수 Freeboard (m),
-            "AFT_Height_m": 선미 Freeboard (m),
-            "Trim_Check": Trim 체크 결과 ("OK" or "EXCESSIVE"),
-            "vs_2.70m": FWD draft 체크 ("OK" or "NG"),
-            "GM_Check": GM 체크 ("OK" or "LOW")
-        }
-    """
-    MTC = params.get("MTC", 34.00)
-    LCF = params.get("LCF", 0.76)
-    LBP = params.get("LBP", 60.302)
-    D_vessel = params.get("D_vessel", 3.65)
-    hydro_table = params.get("hydro_table", [])
-
-    # 1. 중량/모멘트 합산
-    delta_w = sum(ld.weight_t for ld in loads)
-    if abs(delta_w) < 1e-6:
-        x_lcg = 0.0
-    else:
-        x_lcg = sum(ld.weight_t * ld.x_from_mid_m for ld in loads) / delta_w
-    tm = sum(ld.weight_t * (ld.x_from_mid_m - LCF) for ld in loads)
-
-    # 2. Trim 계산
-    trim_cm = tm / MTC if MTC > 0 else 0.0
-    trim_m = trim_cm / 100.0
-
-    # 3. 배수 및 평균흘수
-    disp_stage = base_disp_t + delta_w
-    tmean_stage = interpolate_tmean_from_disp(disp_stage, hydro_table)
-
-    # 4. LCF 기반 Dfwd/Daft (프로젝트 규칙: trim_m < 0 = bow down → FWD 깊어짐)
-    halfL = LBP / 2.0
-    # 수정: trim_m < 0 (bow down) → FWD가 깊어져야 함
-    dfwd_m = tmean_stage + (trim_m * (halfL - LCF) / LBP)
-    # 수정: Trim이 음수(Bow Down)일 때 Daft는 감소해야 하므로, '-'를 '+'로 변경
-    daft_m = tmean_stage + (trim_m * (halfL + LCF) / LBP)
-
-    # 5. GM 계산 (2D grid 보간)
-    gm_m = gm_2d_bilinear(disp_stage, trim_m)
-
-    # 6. Freeboard 계산 (Height = D_vessel - Draft)
-    fwd_height_m = max(0.0, D_vessel - dfwd_m)
-    aft_height_m = max(0.0, D_vessel - daft_m)
-
-    # 7. 안전성 체크
-    trim_check = "OK" if abs(trim_cm) <= 240.0 else "EXCESSIVE"
-    vs_270 = "OK" if dfwd_m <= 2.70 else "NG"
-    gm_check = "OK" if gm_m >= 1.50 else "LOW"
-
-    # 8. 결과 패키징
-    return {
-        "W_stage_t": delta_w,
-        "x_stage_m": x_lcg,
-        "TM_LCF_tm": tm,
-        "Disp_t": disp_stage,
-        "Tmean_m": tmean_stage,
-        "Trim_cm": trim_cm,
-        "Dfwd_m": dfwd_m,
-        "Daft_m": daft_m,
-        "GM_m": gm_m,
-        "FWD_Height_m": fwd_height_m,
-        "AFT_Height_m": aft_height_m,
-        "Trim_Check": trim_check,
-        "vs_2.70m": vs_270,
-        "GM_Check": gm_check,
-    }
-
-
-# ============================================================================
-# PRE-BALLAST OPTIMIZATION
-# ============================================================================
-
-
-def find_preballast_opt(
-    w_tr_unit_t: float = 271.20,
-    fr_tr1_stow: float = FR_TR1_STOW,
-    fr_tr2_ramp: float = FR_TR2_RAMP,
-    fr_preballast: float = FR_PREBALLAST,
-    params: dict | None = None,
-    search_min_t: float = 20.0,  # PATCH FIX #3: 최소 탐색량 설정 (0.00t 방지용)
-    search_max_t: float = 400.0,
-    search_step_t: float = 1.0,
-) -> dict:
-    """Stage 5_PreBallast ~ 6A_Critical(Opt C) 자동 최적화 루프.
-
-    STRATEGY UPDATE (2025-11-24):
-    - Pre-ballast location: FW2 Stern tank (Fr.0-6, AFT)
-    - Target: Stage 6A FWD as close to 2.70m as possible
-    - Validated solution: ~37.65t achieves FWD≈2.09m at Stage 6A
-
-    목적:
-      1) Stage 5_PreBallast, Stage 6A 모두에서
-         - min_fwd_draft_m ≤ FWD ≤ max_fwd_draft_ops_m
-         - |Trim_cm| ≤ trim_limit_abs_cm
-      2) 위 조건을 만족하는 해 중에서
-         - Stage 6A의 FWD가 max_fwd_draft_ops_m에 가장 가깝도록 (worst-case margin 최소)
-         - 동률일 경우 pre-ballast 중량이 더 작은 해 선호
-
-    OBSOLETE SCENARIOS (DO NOT USE):
-    - Bow Ballast 471t (FWB1+FWB2+FWCARGO1): FWD 2.99m → EXCEEDS LIMIT
-    - Forward ballast strategies: All superseded by Stern strategy
-
-    반환:
-      {
-        "ok": bool,
-        "reason": str,
-        "w_preballast_t": float | None,
-        "stage5": {...},
-        "stage6A": {...},
-      }
-    """
-    if params is None:
-        params = DEFAULT_PARAMS
-
-    min_fwd = params.get("min_fwd_draft_m", 1.50)
-    max_fwd = params.get("max_fwd_draft_ops_m", 2.70)
-    trim_limit = params.get("trim_limit_abs_cm", 240.00)
-    # NOTE: CHECK_STAGE5=True enforces FWD≤2.70m for Stage 5_PreBallast
-    # Set to False to allow intentional bow-down trim exploration
-    # CURRENT DESIGN: True (strict enforcement for Harbor Master approval)
-    check_stage5 = params.get("CHECK_STAGE5", True)
-
-    if search_step_t <= 0:
-        raise ValueError("search_step_t must be positive.")
-
-    best: dict | None = None
-    best_metric: float | None = None
-
-    w = search_min_t
-    while w <= search_max_t + 1e-9:
-        result = _stage_moment_and_drafts_for_preballast(
-            w_tr_unit_t=w_tr_unit_t,
-            w_preballast_t=w,
-            fr_tr1_stow=fr_tr1_stow,
-            fr_tr2_ramp=fr_tr2_ramp,
-            fr_preballast=fr_preballast,
-            params=params,
-        )
-
-        st5 = result["stage5"]
-        st6 = result["stage6A"]
-
-        fwd5 = st5["FWD_m"]
-        fwd6 = st6["FWD_m"]
-        trim5 = abs(st5["Trim_cm"])
-        trim6 = abs(st6["Trim_cm"])
-
-        # Gate 1: Draft limits
-        # Stage 5도 CHECK_STAGE5=True인 경우 FWD≤max_fwd_draft_ops_m를 강제 (Harbor Master 제출용)
-        if check_stage5 and not (min_fwd <= fwd5 <= max_fwd):
-            w += search_step_t
-            continue
-        if not (min_fwd <= fwd6 <= max_fwd):
-            w += search_step_t
-            continue
-
-        # Gate 2: Trim envelope
-        # Stage 5 체크는 선택적 (Stage 5_PreBallast는 의도적 bow trim 240cm 목표)
-        if check_stage5 and trim5 > trim_limit:
-            w += search_step_t
-            continue
-        if trim6 > trim_limit:
-            w += search_step_t
-            continue
-
-        # Objective: Stage 6A FWD as close as possible to ops limit (max_fwd)
-        # PATCH FIX #4: Stage 5도 고려하여 페널티 추가
-        margin5 = max_fwd - fwd5  # Stage 5 마진
-        margin6 = max_fwd - fwd6  # Stage 6A 마진
-        # 목표: Stage 6A margin 최소이면서 Stage 5도 margin 양호
-        metric = abs(margin6) + 0.1 * abs(margin5)  # Stage 5 페널티 10%
-
-        if best_metric is None or metric < best_metric - 1e-9:
-            best_metric = metric
-            best = result
-        elif best is not None and abs(metric - best_metric) < 1e-9:
-            # tie-breaker: smaller ballast preferred
-            if w < best["w_preballast_t"]:
-                best_metric = metric
-                best = result
-
-        w += search_step_t
-
-    if best is None:
-        return {
-            "ok": False,
-            "reason": "No feasible pre-ballast found within search range.",
-            "w_preballast_t": None,
-            "stage5": None,
-            "stage6A": None,
-        }
-
-    return {
-        "ok": True,
-        "reason": "Feasible pre-ballast found.",
-        "w_preballast_t": best["w_preballast_t"],
-        "stage5": best["stage5"],
-        "stage6A": best["stage6A"],
-    }
-
-
-def calc_draft_with_lcf(
-    tmean_m: float, trim_cm: float, lcf_m: float, lbp_m: float
-) -> tuple[float, float]:
-    """
-    LCF 기반 정밀 Dfwd/Daft 계산.
-
-    Parameters
-    ----------
-    tmean_m : 평균 흘수 (m)
-    trim_cm : Trim (cm)  # +면 선미침(AFT deeper), -면 선수침(FWD deeper)
-    lcf_m   : LCF (m), F.P. 기준 길이
-    lbp_m   : LBP (m)
-
-    Returns
-    -------
-    (Dfwd_m, Daft_m) : 선수/선미 흘수 (m)
-    """
-    trim_m = trim_cm / 100.0
-
-    if lbp_m <= 0:
-        raise ValueError("LBP must be > 0")
-
-    r = lcf_m / lbp_m  # 무차원 비율 (0~1 근처)
-
-    dfwd_m = tmean_m - trim_m * (1.0 - r)
-    daft_m = tmean_m + trim_m * r
-
-    return dfwd_m, daft_m
-
-
-def build_stage5_loads(preballast_t: float, params: dict) -> List[LoadItem]:
-    """
-    Stage 5_PreBallast 구성 (TR1 + PreBallast)
-
-    Args:
-        preballast_t: Pre-ballast 중량 (ton)
-        params: 파라미터 딕셔너리
-            - W_TR: Transformer + SPMT 중량 (ton)
-            - FR_TR1: TR1 Frame 번호
-            - FR_PB: PreBallast Frame 번호 (FWB1/2 중심)
-
-    Returns:
-        LoadItem 리스트
-    """
-    W_TR = params.get("W_TR", 280.0)
-    FR_TR1 = params.get("FR_TR1", 42.0)
-    FR_PB = params.get("FR_PB", 55.5)  # FWB1/2 중심 Frame
-
-    x_tr1 = fr_to_x(FR_TR1)
-    x_pb = fr_to_x(FR_PB)
-
-    return [
-        LoadItem("TR1+SPMT", W_TR, x_tr1, "CARGO"),
-        LoadItem("PreBallast", preballast_t, x_pb, "BALLAST"),
-    ]
-
-
-def build_stage6a_loads(preballast_t: float, params: dict) -> List[LoadItem]:
-    """
-    Stage 6A 구성 (TR1 + TR2 + 동일 PreBallast)
-
-    Args:
-        preballast_t: Pre-ballast 중량 (ton)
-        params: 파라미터 딕셔너리
-            - W_TR: Transformer + SPMT 중량 (ton)
-            - FR_TR1: TR1 Frame 번호
-            - FR_TR2: TR2 Frame 번호
-            - FR_PB: PreBallast Frame 번호 (FWB1/2 중심)
-
-    Returns:
-        LoadItem 리스트
-    """
-    W_TR = params.get("W_TR", 280.0)
-    FR_TR1 = params.get("FR_TR1", 42.0)
-    FR_TR2 = params.get("FR_TR2", 17.95)  # Stage 6A_Critical LCG Frame
-    FR_PB = params.get("FR_PB", 3.0)  # FW2 중심 Frame (AFT 쪽, Fr 0-6, Mid_Fr=3.0)
-
-    x_tr1 = fr_to_x(FR_TR1)
-    x_tr2 = fr_to_x(FR_TR2)
-    x_pb = fr_to_x(FR_PB)
-
-    return [
-        LoadItem("TR1+SPMT", W_TR, x_tr1, "CARGO"),
-        LoadItem("TR2+SPMT", W_TR, x_tr2, "CARGO"),
-        LoadItem("PreBallast", preballast_t, x_pb, "BALLAST"),
-    ]
-
-
-def build_stage_loads(
-    stage_name: str, preballast_t: float, params: dict
-) -> List[LoadItem]:
-    """
-    Stage별 LoadItem 리스트 (모든 Stage 지원).
-
-    Args:
-        stage_name: Stage 이름 (Stage 1, Stage 2, ..., Stage 7, Stage 5_PreBallast, Stage 6A_Critical (Opt C), Stage 6C)
-        preballast_t: Pre-ballast 중량 (ton)
-        params: 파라미터 딕셔너리
-            - W_TR: Transformer + SPMT 중량 (ton)
-            - FR_TR1_STOW: TR1 최종 stow Frame 번호
-            - FR_TR1_RAMP_MID: TR1 ramp 중간 Frame 번호
-            - FR_TR1_RAMP_START: TR1 ramp 시작 Frame 번호
-            - FR_TR2_RAMP: TR2 ramp Frame 번호
-            - FR_TR2_STOW: TR2 최종 stow Frame 번호
-            - FR_PREBALLAST: PreBallast Frame 번호 (FW2 중심, AFT 쪽, Fr 0-6, Mid_Fr=3.0)
-
-    Returns:
-        LoadItem 리스트
-
-    가정:
-      - Stage 2/3/4: TR1+SPMT만 ramp→deck 이동
-      - Stage 5: TR1 최종 stow. (추가 하중 없음)
-      - Stage 5_Pre: TR1 stow + Pre-ballast
-      - Stage 6A: TR1 stow + TR2 ramp 진입 + Pre-ballast
-      - Stage 6C: 두 TR 모두 stow + Pre-ballast
-      - Stage 7: Cargo off (추가 하중 없음)
-    """
-    W_TR = params.get("W_TR", 280.0)
-    fr_tr1_pos = params.get("FR_TR1_STOW", params.get("FR_TR1", 42.0))
-    fr_tr1_ramp_mid = params.get("FR_TR1_RAMP_MID", 37.00)
-    fr_tr1_ramp_start = params.get("FR_TR1_RAMP_START", 40.15)
-    fr_tr2_ramp = params.get("FR_TR2_RAMP", params.get("FR_TR2", 17.95))
-    fr_tr2_stow = params.get("FR_TR2_STOW", 40.00)
-    fr_pb = params.get(
-        "FR_PREBALLAST", params.get("FR_PB", 3.0)
-    )  # FW2 (AFT 쪽, Fr 0-6, Mid_Fr=3.0)
-
-    loads: List[LoadItem] = []
-
-    if stage_name == "Stage 1":
-        return loads
-
-    if stage_name == "Stage 2":
-        # TR1 ramp start
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_ramp_start), "CARGO"))
-    elif stage_name == "Stage 3":
-        # TR1 mid-ramp
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_ramp_mid), "CARGO"))
-    elif stage_name == "Stage 4":
-        # TR1 on deck
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
-    elif stage_name == "Stage 5":
-        # TR1 최종 stow (Trim 이벤트는 base에서 이미 포함된 것으로 간주)
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
-    elif stage_name == "Stage 5_PreBallast":
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
-        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
-    elif stage_name == "Stage 6A_Critical (Opt C)":
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
-        loads.append(LoadItem("TR2+SPMT", W_TR, fr_to_x(fr_tr2_ramp), "CARGO"))
-        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
-    elif stage_name == "Stage 6C":
-        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
-        loads.append(LoadItem("TR2+SPMT", W_TR, fr_to_x(fr_tr2_stow), "CARGO"))
-        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
-    elif stage_name == "Stage 7":
-        return loads
-
-    return loads
-
-
 GMGrid = Dict[float, Dict[float, float]]
 
 
@@ -995,228 +350,6 @@ def apply_dynamic_loads(
     return share_load_t * f_vert, pin_stress_mpa * f_pin
 
 
-# ============================================================================
-# FRAME ↔ x_from_mid_m Mapping (BUSHRA 757 TCP aligned)
-# ============================================================================
-
-# BUSHRA Tank Plan 757 TCP 기준:
-# - Frame 번호는 FWD 방향으로 증가
-# - Midship ≈ Fr_mid = Lpp / 2 ≈ 30.151
-# - 좌표계:  x_from_mid_m < 0.0  → FWD
-#           x_from_mid_m > 0.0  → AFT
-#
-# ⇒ x = _FRAME_OFFSET + _FRAME_SLOPE * Fr
-#    Fr_mid = 30.151  →  x = 0.0
-#    큰 Frame(예: 48–65, FWB1/2 실제 위치) → x < 0.0 (FWD 쪽)
-#    작은 Frame(예: 5–10)                → x > 0.0 (AFT 쪽)
-
-_FRAME_SLOPE = -1.0  # x 는 Frame 이 커질수록 감소 (Frame 증가 = FWD)
-_FRAME_OFFSET = 30.151  # Midship Frame → x = 0.0m
-
-
-def _init_frame_mapping():
-    """
-    Frame ↔ x_from_mid_m 매핑 초기화.
-    data/Frame_x_from_mid_m.json 이 있으면 거기서 SLOPE/OFFSET 자동 추정,
-    없으면 757 TCP 기준 기본값을 사용한다.
-    """
-    global _FRAME_SLOPE, _FRAME_OFFSET
-    data = _load_json("data/Frame_x_from_mid_m.json")
-    if not data or not isinstance(data, list) or len(data) < 2:
-        # Fallback: BUSHRA 757 TCP default (Fr 증가 = FWD, Midship = 30.151)
-        _FRAME_SLOPE = -1.0
-        _FRAME_OFFSET = 30.151
-        print(
-            f"[INFO] Frame mapping: SLOPE={_FRAME_SLOPE:.6f}, OFFSET={_FRAME_OFFSET:.3f} (default)"
-        )
-        return
-
-    try:
-        fr1 = float(data[0]["Fr"])
-        x1 = float(data[0]["x_from_mid_m"])
-        fr2 = float(data[1]["Fr"])
-        x2 = float(data[1]["x_from_mid_m"])
-        if fr2 != fr1:
-            _FRAME_SLOPE = (x2 - x1) / (fr2 - fr1)
-            _FRAME_OFFSET = x1 - _FRAME_SLOPE * fr1
-        print(
-            f"[INFO] Frame mapping: SLOPE={_FRAME_SLOPE:.6f}, OFFSET={_FRAME_OFFSET:.3f}"
-        )
-    except Exception as e:
-        # Fallback: BUSHRA 757 TCP default (Fr 증가 = FWD, Midship = 30.151)
-        print(f"[ERROR] Frame JSON parse fail → default: {e}")
-        _FRAME_SLOPE = -1.0
-        _FRAME_OFFSET = 30.151
-        print(
-            f"[INFO] Frame mapping: SLOPE={_FRAME_SLOPE:.6f}, OFFSET={_FRAME_OFFSET:.3f} (default)"
-        )
-
-
-def fr_to_x(fr: float) -> float:
-    """
-    Convert Frame number to x [m from midship].
-
-    BUSHRA 757 TCP 기준:
-    - Frame 증가 = FWD 방향
-    - Frame 30.151 = Midship → x = 0.0
-    - Frame < 30.151 (AFT) → x > 0 (AFT)
-    - Frame > 30.151 (FWD) → x < 0 (FWD)
-
-    공식: x = _FRAME_SLOPE * (fr - _FRAME_OFFSET)
-    """
-    return _FRAME_SLOPE * (float(fr) - _FRAME_OFFSET)
-
-
-def x_to_fr(x: float) -> float:
-    """
-    Inverse: x [m from midship] → Frame number.
-
-    공식: fr = _FRAME_OFFSET - x (x = -1.0 * (fr - 30.151) 이므로)
-    """
-    return _FRAME_OFFSET - float(x)
-
-
-def calc_trim(moment_tm: float, params: dict | None = None) -> float:
-    """
-    Return Trim [cm] from moment [t·m].
-
-    우선순위:
-    1) params["MTC_t_m_per_cm"]
-    2) params["MTC"]
-    3) 기본값 34.00
-    """
-    if params is None:
-        params = DEFAULT_PARAMS
-
-    mtc = params.get("MTC_t_m_per_cm", params.get("MTC", 34.00))
-    return round(moment_tm / mtc, 2)
-
-
-def draft_from_trim(trim_cm: float, params: dict | None = None) -> tuple[float, float]:
-    """
-    Return (FWD, AFT) draft [m].
-
-    Excel Stage 시트 로직과 동일:
-        Tmean_baseline_m 은 모든 Stage에서 동일하다고 가정.
-        부호 규칙:
-            Trim_cm < 0  → 선수침 (FWD 깊어짐)
-            Trim_cm > 0  → 선미침 (AFT 깊어짐)
-
-        Fwd = Tmean + Trim_cm / 200
-        Aft = Tmean - Trim_cm / 200
-    """
-    if params is None:
-        params = DEFAULT_PARAMS
-    tmean = params.get("Tmean_baseline_m", 2.00)
-    trim_m = trim_cm / 100.0
-    fwd = tmean + trim_m / 2.0
-    aft = tmean - trim_m / 2.0
-    # Excel과 맞추기 위해 2자리 반올림
-    return round(fwd, 2), round(aft, 2)
-
-
-def _stage_moment_and_drafts_for_preballast(
-    w_tr_unit_t: float,
-    w_preballast_t: float,
-    fr_tr1_stow: float,
-    fr_tr2_ramp: float,
-    fr_preballast: float,
-    params: dict | None = None,
-) -> dict:
-    """
-    Helper: 주어진 preballast 중량에서 Stage 5_PreBallast / 6A_Critical의
-    TM, Trim, Draft(FWD/AFT)를 한 번에 계산.
-
-    가정:
-      - Stage 5_PreBallast = TR1(Fr_tr1_stow) + Pre-ballast(FR_PREBALLAST)
-      - Stage 6A_Critical  = TR1 + TR2(Fr_tr2_ramp) + Pre-ballast
-      - Mean draft(Tmean)은 전체 Stage 동안 일정(=Tmean_baseline_m).
-    """
-    if params is None:
-        params = DEFAULT_PARAMS
-
-    lcf = params.get("LCF_m_from_midship", 0.76)
-    mtc = params.get("MTC_t_m_per_cm", 34.00)
-    lbp = params.get("Lpp_m", params.get("LBP", 60.302))
-    tmean = params.get("Tmean_baseline_m", 2.00)
-
-    # 위치 (x from midship)
-    x_tr1 = fr_to_x(fr_tr1_stow)
-    x_tr2 = fr_to_x(fr_tr2_ramp)
-    x_pb = fr_to_x(fr_preballast)
-
-    # --- Stage 5_PreBallast ---------------------------------------------------
-    w5 = w_tr_unit_t + w_preballast_t
-    if w5 <= 0:
-        raise ValueError("Stage 5_PreBallast weight must be positive.")
-
-    lcg5 = (w_tr_unit_t * x_tr1 + w_preballast_t * x_pb) / w5
-    tm5 = w5 * (lcg5 - lcf)
-    trim5_cm = tm5 / mtc
-    fwd5_m, aft5_m = calc_draft_with_lcf(tmean, trim5_cm, lcf, lbp)
-
-    # --- Stage 6A_Critical (Opt C) -------------------------------------------
-    w6 = 2.0 * w_tr_unit_t + w_preballast_t
-    lcg6 = (w_tr_unit_t * x_tr1 + w_tr_unit_t * x_tr2 + w_preballast_t * x_pb) / w6
-    tm6 = w6 * (lcg6 - lcf)
-    trim6_cm = tm6 / mtc
-    fwd6_m, aft6_m = calc_draft_with_lcf(tmean, trim6_cm, lcf, lbp)
-
-    return {
-        "w_preballast_t": w_preballast_t,
-        "stage5": {
-            "W_stage_t": w5,
-            "x_stage_m": lcg5,
-            "TM_tm": tm5,
-            "Trim_cm": trim5_cm,
-            "FWD_m": fwd5_m,
-            "AFT_m": aft5_m,
-        },
-        "stage6A": {
-            "W_stage_t": w6,
-            "x_stage_m": lcg6,
-            "TM_tm": tm6,
-            "Trim_cm": trim6_cm,
-            "FWD_m": fwd6_m,
-            "AFT_m": aft6_m,
-        },
-    }
-
-
-def simulate_stage(
-    stage_name: str,
-    w_stage_t: float,
-    x_stage_m: float,
-    params: dict | None = None,
-) -> dict:
-    """
-    간단 Stage 계산:
-    - 입력: Stage명, Stage 중량, Stage LCG(x)
-    - 출력: Trim, FWD/AFT draft, Target 대비 OK/EXCESSIVE
-    """
-    if params is None:
-        params = DEFAULT_PARAMS
-
-    tm = w_stage_t * x_stage_m  # t·m
-    trim_cm = calc_trim(tm, params)
-    fwd, aft = draft_from_trim(trim_cm, params)
-
-    target = TRIM_TARGET_MAP.get(stage_name, 240.00)
-    trim_check = "OK" if abs(trim_cm) <= abs(target) else "EXCESSIVE"
-
-    return {
-        "Stage": stage_name,
-        "W_stage_t": round(w_stage_t, 2),
-        "x_stage_m": round(x_stage_m, 2),
-        "TM_tm": round(tm, 2),
-        "Trim_cm": trim_cm,
-        "FWD_m": fwd,
-        "AFT_m": aft,
-        "Trim_target_cm": target,
-        "Trim_Check": trim_check,
-    }
-
-
 def debug_frame_mapping():
     """
     Frame_x_from_mid_m.json 기반으로 현재 SLOPE/OFFSET과
@@ -1225,8 +358,8 @@ def debug_frame_mapping():
     print("=" * 60)
     print("LCT BUSHRA Frame ↔ x Debug (757 TCP aligned)")
     print("=" * 60)
-    print(f"_FRAME_SLOPE  = {_FRAME_SLOPE:.6f}")
-    print(f"_FRAME_OFFSET = {_FRAME_OFFSET:.3f}")
+    print(f"_FRAME_SLOPE  = {_frames._FRAME_SLOPE:.6f}")
+    print(f"_FRAME_OFFSET = {_frames._FRAME_OFFSET:.3f}")
     test = {
         "AP approx": 0.0,
         "Midship (Lpp/2)": 30.151,
@@ -1404,208 +537,37 @@ def safe_sheet_creation(wb, sheet_func, sheet_name, *args, **kwargs):
         return None
 
 
-def get_fixed_tank_data():
-    """
-    Forward fresh water ballast tanks (FWB1/2) - 757 TCP Tank Plan Verified LCGs.
-
-    Coordinate System (Python Script Internal):
-    - Midship (0.0) is at 30.151m from AP.
-    - FWD is NEGATIVE (-), AFT is POSITIVE (+).
-    - Formula: x_from_mid = Midship_LCG (30.151) - Tank_LCG_from_AP
-
-    Reference: tank.md (Tank Plan 757 TCP)
-    - FWB1 LCG: 57.519 m from AP
-    - FWB2 LCG: 50.038 m from AP
-    """
-    MIDSHIP_LCG_FROM_AP = 30.151
-
-    # LCG to Script X conversion (Midship - LCG)
-    # FWD tanks will result in negative values (Correct for this script)
-    x_fwb1 = MIDSHIP_LCG_FROM_AP - 57.519  # 30.151 - 57.519 = -27.368 m
-    x_fwb2 = MIDSHIP_LCG_FROM_AP - 50.038  # 30.151 - 50.038 = -19.887 m
-    x_fwcargo1 = MIDSHIP_LCG_FROM_AP - 42.750  # 30.151 - 42.750 = -12.599 m
-    x_fwcargo2 = MIDSHIP_LCG_FROM_AP - 35.250  # 30.151 - 35.250 = -5.099 m
-
-    return {
-        # FWB1 (Bow Ballast) - Fr 56-FE
-        "FWB1.P": {
-            "x": x_fwb1,
-            "max_t": 50.57,
-            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
-            "note": "Bow Port (LCG 57.519m)",
-        },
-        "FWB1.S": {
-            "x": x_fwb1,
-            "max_t": 50.57,
-            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
-            "note": "Bow Stbd (LCG 57.519m)",
-        },
-        # FWB2 (Forward Ballast) - Fr 48-53
-        "FWB2.P": {
-            "x": x_fwb2,
-            "max_t": 109.98,
-            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
-            "note": "Fwd Port (LCG 50.038m)",
-        },
-        "FWB2.S": {
-            "x": x_fwb2,
-            "max_t": 109.98,
-            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
-            "note": "Fwd Stbd (LCG 50.038m)",
-        },
-        # FWCARGO1 (Mid-Fwd) - Fr 43-48
-        "FWCARGO1.P": {
-            "x": x_fwcargo1,
-            "max_t": 148.35,
-            "SG": 1.000,
-            "note": "Mid-Fwd Cargo (LCG 42.750m)",
-        },
-        "FWCARGO1.S": {
-            "x": x_fwcargo1,
-            "max_t": 148.35,
-            "SG": 1.000,
-            "note": "Mid-Fwd Cargo (LCG 42.750m)",
-        },
-        # FWCARGO2 (Mid) - Fr 38-43
-        "FWCARGO2.P": {
-            "x": x_fwcargo2,
-            "max_t": 148.36,
-            "SG": 1.000,
-            "note": "Mid Cargo (LCG 35.250m)",
-        },
-        "FWCARGO2.S": {
-            "x": x_fwcargo2,
-            "max_t": 148.36,
-            "SG": 1.000,
-            "note": "Mid Cargo (LCG 35.250m)",
-        },
-    }
+# 함수 생성 헬퍼 함수
+def create_index_match_formula(lookup_value, lookup_range, return_range):
+    """INDEX/MATCH 조합 수식 생성"""
+    return f'=INDEX({return_range}, MATCH("{lookup_value}", {lookup_range}, 0))'
 
 
-def build_tank_lookup():
+def register_param_names(wb, ws, params=None):
     """
-    Tank 좌표/용량 JSON에서 Ballast 탱크 정보 취합.
-
-    Source:
-    - data/tank_coordinates.json : data[].Tank_Name, Mid_Fr, x_from_mid_m(선택), Weight_MT, Volume_m3
-    - data/tank_data.json        : data[].Tank_Name, Weight_MT (실측 100% 기준)
-    - get_fixed_tank_data()      : 757 TCP LCG(AP) → x_from_mid_m 변환 (FWB1/2, FWCARGO1/2)
+    DEFAULT_PARAMS 키 → workbook defined name 등록
 
-    좌표계:
-    - x_from_mid_m: Midship(0.0) 기준, FWD(-) / AFT(+)
-    - FWB1/2, FWCARGO1/2는 Tank Plan 757 TCP의 LCG(AP) → midship 변환값을 항상 우선 사용.
+    Calc C열에 키가 있으면 해당 행 E열 셀 (Calc!$E$행) 을, 없으면 상수 값을 이름으로 등록.
+    중복 키는 MATCH(..., 0) 와 같이 첫 행을 사용한다.
+    Hourly / RORO 수식은 INDEX(Calc!$E:$E, MATCH(...)) 전체 열 조회 대신 이 이름을 참조한다.
     """
-    # 1) 고정 탱크 데이터 (FWB1/2, FWCARGO1/2) – LCG(AP) 기반 x, max_t, SG
-    fixed_data = get_fixed_tank_data()
-
-    # 2) JSON 로드 (없으면 None)
-    coords = _load_json("data/tank_coordinates.json")
-    tdata = _load_json("data/tank_data.json")
-
-    coord_index: dict[str, dict] = {}
-    tdata_index: dict[str, dict] = {}
-
-    if isinstance(coords, list):
-        for item in coords:
-            name = item.get("Tank_Name") or item.get("TankName")
-            if not name:
-                continue
-            coord_index[name] = item
-    elif isinstance(coords, dict) and "data" in coords:
-        for item in coords["data"]:
-            name = item.get("Tank_Name") or item.get("TankName")
-            if not name:
-                continue
-            coord_index[name] = item
+    from openpyxl.workbook.defined_name import DefinedName
 
-    if isinstance(tdata, list):
-        for item in tdata:
-            name = item.get("Tank_Name") or item.get("TankName")
-            if not name:
-                continue
-            tdata_index[name] = item
-    elif isinstance(tdata, dict) and "data" in tdata:
-        for item in tdata["data"]:
-            name = item.get("Tank_Name") or item.get("TankName")
-            if not name:
-                continue
-            tdata_index[name] = item
-
-    # 3) 전체 탱크 이름 집합
-    all_names: set[str] = set()
-    all_names.update(coord_index.keys())
-    all_names.update(tdata_index.keys())
-    all_names.update(fixed_data.keys())
-
-    lookup: dict[str, dict] = {}
-
-    for tank_name in sorted(all_names):
-        info: dict[str, float] = {}
-
-        # 3-1) FWB1/2, FWCARGO1/2는 LCG(AP) 기반 fixed_data 최우선
-        if tank_name in fixed_data:
-            fd = fixed_data[tank_name]
-            info["x_from_mid_m"] = float(fd["x"])
-            info["max_t"] = float(fd["max_t"])
-            info["SG"] = float(fd.get("SG", 1.0))
-
-        # 3-2) tank_coordinates.json 정보 병합 (Frame 기반 → x 변환 포함)
-        c = coord_index.get(tank_name)
-        if c:
-            x_val = c.get("x_from_mid_m")
-            if x_val is None:
-                mid_fr = c.get("Mid_Fr") or c.get("MidFr") or c.get("Fr")
-                if mid_fr is not None:
-                    x_val = fr_to_x(float(mid_fr))
-            if x_val is not None and "x_from_mid_m" not in info:
-                info["x_from_mid_m"] = float(x_val)
-
-            # JSON 쪽에 Weight_MT가 있고 fixed에 max_t 없으면 사용
-            if "max_t" not in info:
-                wt = c.get("Weight_MT")
-                if wt is not None:
-                    info["max_t"] = float(wt)
-
-        # 3-3) tank_data.json 정보 병합 (우선순위: fixed < coords < tdata)
-        d = tdata_index.get(tank_name)
-        if d:
-            if "max_t" not in info:
-                wt = d.get("Weight_MT") or d.get("Weight_t")
-                if wt is not None:
-                    info["max_t"] = float(wt)
-
-        # 3-4) SG / air_vent 기본값 – Fresh Water 기준 1.000
-        sg = float(info.get("SG", 1.0))
-
-        if tank_name.startswith("FWB"):
-            # Fresh Water Ballast – air vent 80mm
-            sg = 1.000
-            air_vent = 80
-        elif tank_name.startswith("FWCARGO"):
-            # Cargo FW tanks – air vent 125mm
-            sg = 1.000
-            air_vent = 125
+    params = DEFAULT_PARAMS if params is None else params
+    rows = {}
+    for row in range(1, ws.max_row + 1):
+        key = ws.cell(row=row, column=3).value
+        if isinstance(key, str) and key not in rows:
+            rows[key] = row
+
+    for key, value in params.items():
+        if key in rows:
+            attr_text = f"'{ws.title}'!$E${rows[key]}"
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            attr_text = repr(float(value))
         else:
-            air_vent = ""
-
-        x_from_mid = float(info.get("x_from_mid_m", 0.0))
-        max_t = float(info.get("max_t", 0.0))
-
-        lookup[tank_name] = {
-            "x_from_mid_m": round(x_from_mid, 2),
-            "max_t": round(max_t, 2),
-            "SG": sg,
-            "air_vent_mm": air_vent,
-        }
-
-    print(f"  [OK] Tank lookup built (tanks={len(lookup)})")
-    return lookup
-
-
-# 함수 생성 헬퍼 함수
-def create_index_match_formula(lookup_value, lookup_range, return_range):
-    """INDEX/MATCH 조합 수식 생성"""
-    return f'=INDEX({return_range}, MATCH("{lookup_value}", {lookup_range}, 0))'
+            continue
+        wb.defined_names[key] = DefinedName(key, attr_text=attr_text)
 
 
 # ============================================================================
@@ -1631,12 +593,7 @@ def create_calc_sheet(wb):
             cell.font = styles["header_font"]
             cell.fill = styles["header_fill"]
             cell.alignment = styles["center_align"]
-            cell.border = Border(
-                left=styles["thin_border"],
-                right=styles["thin_border"],
-                top=styles["thin_border"],
-                bottom=styles["thin_border"],
-            )
+            cell.border = styles["box_border"]
 
     # INPUT CONSTANTS 섹션 (Row 5-8)
     ws.cell(row=5, column=2).value = "INPUT CONSTANTS"
@@ -1906,6 +863,8 @@ def create_calc_sheet(wb):
     ws.column_dimensions["E"].width = 12
     ws.column_dimensions["F"].width = 35
 
+    register_param_names(wb, ws)
+
     print("  [OK] Calc sheet created with VENT&PUMP 실측 0.86")
 
 
@@ -1914,8 +873,35 @@ def create_calc_sheet(wb):
 # ============================================================================
 
 
+# 조위 파일이 없을 때 빈 입력 행 수 (31일 × 24h)
+TIDE_TEMPLATE_HOURS = 744
+
+_TIDE_HOURS_CACHE = {}
+
+
+def tide_series_hours() -> int:
+    """
+    조위 시계열 길이 (시간 수) – Hourly 시트 수식 행 수
+
+    파일 (find_tide_file: $BUSHRA_TIDE_FILE → data/gateab_v3_tide_data.json) 이 없거나
+    읽기 실패 시 TIDE_TEMPLATE_HOURS. (경로, mtime) 단위 캐시.
+    """
+    path = find_tide_file()
+    try:
+        key = (path, os.path.getmtime(path))
+    except (TypeError, OSError):
+        return TIDE_TEMPLATE_HOURS
+    if key not in _TIDE_HOURS_CACHE:
+        try:
+            _TIDE_HOURS_CACHE[key] = sum(1 for _ in iter_tide_records(path))
+        except Exception as e:
+            logging.warning(f"[BACKUP] Tide series count failed: {e}")
+            return TIDE_TEMPLATE_HOURS
+    return _TIDE_HOURS_CACHE[key] or TIDE_TEMPLATE_HOURS
+
+
 def create_tide_sheet(wb):
-    """December_Tide_2025 시트 생성"""
+    """December_Tide_2025 시트 생성 (조위 JSON / CSV 스트리밍, 행 수 = 시계열 길이)"""
     ws = wb.create_sheet("December_Tide_2025")
     styles = get_styles()
 
@@ -1926,41 +912,36 @@ def create_tide_sheet(wb):
         cell.font = styles["header_font"]
         cell.fill = styles["header_fill"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
 
-    # JSON 파일 로드 (상대 경로 사용)
-    tide_data = _load_json("data/gateab_v3_tide_data.json")
+    # 조위 파일 (상대 경로 탐색, $BUSHRA_TIDE_FILE override) → 레코드 단위 기록
+    tide_path = find_tide_file()
+    count = 0
 
-    if tide_data:
+    if tide_path:
         try:
-            for idx, entry in enumerate(tide_data, start=0):
+            for idx, entry in enumerate(iter_tide_records(tide_path)):
                 row = 2 + idx
-                if row > 745:
-                    break
 
                 cell_a = ws.cell(row=row, column=1)
-                cell_a.value = entry.get("datetime", "")
+                cell_a.value = entry["datetime"]
                 cell_a.font = styles["normal_font"]
 
                 cell_b = ws.cell(row=row, column=2)
-                cell_b.value = entry.get("tide_m", 0.0)
+                cell_b.value = entry["tide_m"]
                 cell_b.font = styles["normal_font"]
                 cell_b.number_format = "0.00"
-            print(f"  [OK] December_Tide_2025 sheet created with {len(tide_data)} rows")
+                count = idx + 1
+            print(f"  [OK] December_Tide_2025 sheet created with {count} rows")
         except Exception as e:
             print(f"  [WARNING] Error processing tide data: {e}. Creating empty sheet.")
-            tide_data = None
+            count = 0
 
-    if not tide_data:
+    if not count:
         print(
-            f"  [WARNING] JSON file not found. Creating empty December_Tide_2025 sheet."
+            f"  [WARNING] Tide file not found. Creating empty December_Tide_2025 sheet."
         )
-        for row in range(2, 746):
+        for row in range(2, TIDE_TEMPLATE_HOURS + 2):
             ws.cell(row=row, column=1).font = styles["normal_font"]
             ws.cell(row=row, column=2).font = styles["normal_font"]
             ws.cell(row=row, column=2).number_format = "0.00"
@@ -1974,8 +955,26 @@ def create_tide_sheet(wb):
 # ============================================================================
 
 
+# Hourly_FWD_AFT_Heights 열 → 수식 ("{r}" = 행 번호). 열마다 공유 수식 블록 1개로 기록
+HOURLY_FORMULAS = {
+    1: '=IF(December_Tide_2025!A{r}="","",December_Tide_2025!A{r})',
+    2: '=IF(December_Tide_2025!B{r}="","",December_Tide_2025!B{r})',
+    3: '=IF($A{r}="","", KminusZ_m + $B{r} - L_ramp_m * TAN(RADIANS(theta_max_deg)))',
+    5: '=IF($C{r}="","", IF($D{r}="", $C{r}, $C{r} - $D{r}/2))',
+    6: '=IF($C{r}="","", IF($D{r}="", $C{r}, $C{r} + $D{r}/2))',
+    7: '=IF($E{r}="","", DEGREES(ATAN((KminusZ_m - $E{r} + $B{r}) / L_ramp_m)))',
+    8: (
+        '=IF($E{r}="","", IF(AND($E{r}>=min_fwd_draft_m, $E{r}<=max_fwd_draft_m, '
+        '$G{r}<=theta_max_deg), "OK", "CHECK"))'
+    ),
+    9: '=IF($E{r}="","", D_vessel_m - $E{r} + $B{r})',
+    10: '=IF($F{r}="","", D_vessel_m - $F{r} + $B{r})',
+    11: '=IF(D{r}=0, "Even Keel", "")',
+}
+
+
 def create_hourly_sheet(wb):
-    """Hourly_FWD_AFT_Heights 시트 생성"""
+    """Hourly_FWD_AFT_Heights 시트 생성 (행 수 = 조위 시계열 길이, 열별 공유 수식)"""
     ws = wb.create_sheet("Hourly_FWD_AFT_Heights")
     styles = get_styles()
 
@@ -2002,54 +1001,14 @@ def create_hourly_sheet(wb):
             cell.font = styles["header_font"]
             cell.fill = styles["header_fill"]
             cell.alignment = styles["center_align"]
-            cell.border = Border(
-                left=styles["thin_border"],
-                right=styles["thin_border"],
-                top=styles["thin_border"],
-                bottom=styles["thin_border"],
-            )
+            cell.border = styles["box_border"]
 
-    for row in range(2, 746):
-        row_str = str(row)
-        ws.cell(row=row, column=1).value = (
-            f'=IF(December_Tide_2025!A{row_str}="","",December_Tide_2025!A{row_str})'
-        )
-        ws.cell(row=row, column=2).value = (
-            f'=IF(December_Tide_2025!B{row_str}="","",December_Tide_2025!B{row_str})'
-        )
-        ws.cell(row=row, column=3).value = (
-            f'=IF($A{row_str}="","", '
-            f'INDEX(Calc!$E:$E, MATCH("KminusZ_m", Calc!$C:$C, 0)) + $B{row_str} - '
-            f'INDEX(Calc!$E:$E, MATCH("L_ramp_m", Calc!$C:$C, 0)) * '
-            f'TAN(RADIANS(INDEX(Calc!$E:$E, MATCH("theta_max_deg", Calc!$C:$C, 0)))))'
-        )
-        ws.cell(row=row, column=5).value = (
-            f'=IF($C{row_str}="","", IF($D{row_str}="", $C{row_str}, $C{row_str} - $D{row_str}/2))'
-        )
-        ws.cell(row=row, column=6).value = (
-            f'=IF($C{row_str}="","", IF($D{row_str}="", $C{row_str}, $C{row_str} + $D{row_str}/2))'
-        )
-        ws.cell(row=row, column=7).value = (
-            f'=IF($E{row_str}="","", '
-            f'DEGREES(ATAN((INDEX(Calc!$E:$E, MATCH("KminusZ_m", Calc!$C:$C, 0)) - $E{row_str} + $B{row_str}) / '
-            f'INDEX(Calc!$E:$E, MATCH("L_ramp_m", Calc!$C:$C, 0)))))'
-        )
-        ws.cell(row=row, column=8).value = (
-            f'=IF($E{row_str}="","", '
-            f'IF(AND($E{row_str}>=INDEX(Calc!$E:$E, MATCH("min_fwd_draft_m", Calc!$C:$C, 0)), '
-            f'$E{row_str}<=INDEX(Calc!$E:$E, MATCH("max_fwd_draft_m", Calc!$C:$C, 0)), '
-            f'$G{row_str}<=INDEX(Calc!$E:$E, MATCH("theta_max_deg", Calc!$C:$C, 0))), "OK", "CHECK"))'
-        )
-        ws.cell(row=row, column=9).value = (
-            f'=IF($E{row_str}="","", '
-            f'INDEX(Calc!$E:$E, MATCH("D_vessel_m", Calc!$C:$C, 0)) - $E{row_str} + $B{row_str})'
-        )
-        ws.cell(row=row, column=10).value = (
-            f'=IF($F{row_str}="","", '
-            f'INDEX(Calc!$E:$E, MATCH("D_vessel_m", Calc!$C:$C, 0)) - $F{row_str} + $B{row_str})'
-        )
-        ws.cell(row=row, column=11).value = f'=IF(D{row_str}=0, "Even Keel", "")'
+    last_row = tide_series_hours() + 1
+    for si, (col, template) in enumerate(HOURLY_FORMULAS.items()):
+        for row, value in shared_formula_block(template, get_column_letter(col), 2, last_row, si):
+            ws.cell(row=row, column=col).value = value
 
+    for row in range(2, last_row + 1):
         if row == 2:
             ws.cell(row=row, column=14).value = (
                 "← Defaults to 0.00 (Even-Keel). To apply the actual trim, manually enter the value in this cell."
@@ -2083,7 +1042,7 @@ def create_hourly_sheet(wb):
     ws.column_dimensions["M"].width = 12
     ws.column_dimensions["N"].width = 80
 
-    print(f"  [OK] Hourly_FWD_AFT_Heights sheet created")
+    print(f"  [OK] Hourly_FWD_AFT_Heights sheet created with {last_row - 1} rows")
 
 
 # ============================================================================
@@ -2182,12 +1141,15 @@ def create_roro_sheet(wb: Workbook):
         "LBP": LBP,
         "D_vessel": D_vessel,
         "hydro_table": hydro_table_data,
+        "hydro_tables": _hydro_tables(),  # 경로+mtime 캐시 보간 객체
         "FWD_DRAFT_LIMIT": 2.70,
         "GM_MIN": 1.50,
         # Pre-ballast 탐색 범위 및 해 선택 기준
         "PREBALLAST_MIN_T": 30.0,  # 최소 30t 이상부터 탐색 (0t 해를 배제)
         "PREBALLAST_MAX_T": 600.0,  # 400.0 → 600.0으로 확대
         "PREBALLAST_STEP_T": 2.0,  # 5.0 → 2.0으로 축소 (더 세밀한 탐색)
+        "PREBALLAST_METHOD": "scan",  # "analytic" → closed-form 해 (PREBALLAST_TOL_T 정밀도)
+        "PREBALLAST_TOL_T": 0.001,  # analytic 모드 해 정밀도 (1 kg)
         "CHECK_STAGE5": True,  # Stage 5_PreBallast도 FWD≤2.70m, |Trim|≤240cm를 강제 (Harbor Master 제출용)
     }
     params.update(cfg)
@@ -2204,6 +1166,8 @@ def create_roro_sheet(wb: Workbook):
         search_min_t=params.get("PREBALLAST_MIN_T", 0.0),
         search_max_t=params.get("PREBALLAST_MAX_T", 400.0),
         search_step_t=params.get("PREBALLAST_STEP_T", 1.0),
+        method=params.get("PREBALLAST_METHOD", "scan"),
+        tol_t=params.get("PREBALLAST_TOL_T", 0.001),
     )
 
     if not preballast_result["ok"]:
@@ -2425,7 +1389,7 @@ def create_roro_sheet(wb: Workbook):
 
     # A9: MTC
     ws["A9"] = "MTC"
-    ws["B9"] = '=INDEX(Calc!$E:$E, MATCH("MTC_t_m_per_cm", Calc!$C:$C, 0))'
+    ws["B9"] = '=MTC_t_m_per_cm'
     ws["B9"].fill = styles["input_fill"]
     ws["B9"].font = styles["normal_font"]
     ws["B9"].number_format = number_format
@@ -2439,7 +1403,7 @@ def create_roro_sheet(wb: Workbook):
     # A10: LCF (midship 기준, TM 계산용)
     ws["A10"] = "LCF"
     ws["B10"] = (
-        '=INDEX(Calc!$E:$E, MATCH("LCF_m_from_midship", Calc!$C:$C, 0))'  # BUSHRA verified: 0.76 m (midship 기준)
+        '=LCF_m_from_midship'  # BUSHRA verified: 0.76 m (midship 기준)
     )
     ws["B10"].font = styles["normal_font"]
     ws["B10"].number_format = number_format
@@ -2466,7 +1430,7 @@ def create_roro_sheet(wb: Workbook):
 
     # A12: TPC
     ws["A12"] = "TPC"
-    ws["B12"] = '=INDEX(Calc!$E:$E, MATCH("TPC_t_per_cm", Calc!$C:$C, 0))'
+    ws["B12"] = '=TPC_t_per_cm'
     ws["B12"].font = styles["normal_font"]
     ws["B12"].number_format = number_format
     ws["B12"].fill = styles["input_fill"]
@@ -2480,7 +1444,7 @@ def create_roro_sheet(wb: Workbook):
     # A13: pump_rate_effective_tph
     ws["A13"] = "pump_rate_effective_tph"
     ws["B13"] = (
-        '=INDEX(Calc!$E:$E, MATCH("pump_rate_effective_tph", Calc!$C:$C, 0))'  # BUSHRA verified: 100.00 t/h (2×50 t/h pumps)
+        '=pump_rate_effective_tph'  # BUSHRA verified: 100.00 t/h (2×50 t/h pumps)
     )
     ws["B13"].fill = styles["input_fill"]
     ws["B13"].font = styles["normal_font"]
@@ -4029,7 +2993,8 @@ def export_whatsapp_summary_png(
     RORO_Delta_Lever_Report + Ballast_Scenario_Comparison 요약을
     텍스트 기반 PNG로 내보내 WhatsApp 공유용으로 사용.
     """
-    if not MATPLOTLIB_AVAILABLE:
+    plt = _get_pyplot()
+    if plt is None:
         print("[WARN] matplotlib not available. PNG export skipped.")
         return None
 
@@ -4155,7 +3120,7 @@ def create_captain_report_sheet(wb, stages, first_data_row):
 
         # 테두리 적용
         for c in range(1, 5):
-            ws.cell(row=i, column=c).border = Border(bottom=styles["thin_border"])
+            ws.cell(row=i, column=c).border = styles["bottom_border"]
 
     # --- 3. Stage Summary Table ---
     table_start_row = 10
@@ -4247,7 +3212,7 @@ def create_captain_report_sheet(wb, stages, first_data_row):
 
         # Borders
         for c in range(1, 10):
-            ws.cell(row=r_rept, column=c).border = Border(bottom=styles["thin_border"])
+            ws.cell(row=r_rept, column=c).border = styles["bottom_border"]
 
     # Column Widths
     ws.column_dimensions["A"].width = 25
@@ -4314,12 +3279,7 @@ def extend_roro_captain_req(ws, first_data_row, num_stages):
         cell.font = styles["header_font"]
         cell.fill = styles["header_fill"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
 
     # 기본 컬럼 폭 (필요시 조정)
     ws.column_dimensions["U"].width = 10
@@ -4514,12 +3474,7 @@ def extend_roro_structural_opt1(ws, first_data_row, num_stages):
         cell.value = h
         cell.font = styles["header_font"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
         # Structural 컬럼은 주황색, Dynamic Load는 주황색, Option 1 컬럼은 보라색, Heel/FSE는 주황색, Ramp/Stress 컬럼은 주황색, Opt C Tide 컬럼은 보라색
         if i < len(structural_cols):
             cell.fill = styles["structure_fill"]
@@ -4832,12 +3787,7 @@ def create_ballast_tanks_sheet(wb):
         cell.font = styles["header_font"]
         cell.fill = styles["header_fill"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
 
     # 5) 데이터 행 작성
     for row_idx, (tank_name, use_flag) in enumerate(target_tanks, start=2):
@@ -4856,12 +3806,7 @@ def create_ballast_tanks_sheet(wb):
             cell.font = styles["normal_font"]
             if c >= 2:  # 숫자 열
                 cell.number_format = "0.00"
-            cell.border = Border(
-                left=styles["thin_border"],
-                right=styles["thin_border"],
-                top=styles["thin_border"],
-                bottom=styles["thin_border"],
-            )
+            cell.border = styles["box_border"]
 
     # 6) 컬럼 폭 설정
     ws.column_dimensions["A"].width = 15
@@ -4926,12 +3871,7 @@ def create_hydro_table_sheet(wb):
         cell.font = styles["header_font"]
         cell.fill = styles["header_fill"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
 
     # Tmean_m (2번째 열, 인덱스 1) 기준으로 오름차순 정렬 (VLOOKUP 근사값 찾기 요구사항)
     data_sorted = sorted(
@@ -4968,12 +3908,7 @@ def create_frame_table_sheet(wb):
         cell.font = styles["header_font"]
         cell.fill = styles["header_fill"]
         cell.alignment = styles["center_align"]
-        cell.border = Border(
-            left=styles["thin_border"],
-            right=styles["thin_border"],
-            top=styles["thin_border"],
-            bottom=styles["thin_border"],
-        )
+        cell.border = styles["box_border"]
 
     # JSON 파일 로드 (상대 경로 사용)
     frame_data = _load_json("data/Frame_x_from_mid_m.json")
@@ -5031,80 +3966,20 @@ def create_frame_table_sheet(wb):
 # ============================================================================
 
 
-def create_workbook_from_scratch():
-    """워크북을 처음부터 생성 (BACKUP PLAN integrated)"""
-    print("=" * 80)
-    print("LCT_BUSHRA_AGI_TR.xlsx Creation from Scratch (BACKUP PLAN enabled)")
-    print("=" * 80)
-
-    # BACKUP PLAN: Pre-flight check
-    print("\n[PRE-FLIGHT CHECK]")
-    issues = preflight_check()
-
-    # PHASE 0: Tank JSON auto-generation
-    try:
-        from src.tank_data_manager import ensure_tank_jsons
-
-        logging.info("[PRE-FLIGHT] Checking tank data files")
-        success, msg = ensure_tank_jsons("Tank Capacity_Plan.xlsx", "data/")
-        if success:
-            logging.info(f"[TANK] {msg}")
-            print(f"  [OK] {msg}")
-        else:
-            issues.append(f"WARNING: {msg}")
-            print(f"  [WARNING] {msg}")
-    except ImportError:
-        issues.append("INFO: Tank auto-generation module not available")
-        print("  [INFO] Tank auto-generation module not available")
-    except Exception as e:
-        issues.append(f"WARNING: Tank JSON generation failed: {e}")
-        print(f"  [WARNING] Tank JSON generation failed: {e}")
-
-    for issue in issues:
-        print(f"  {issue}")
-    if any("ERROR" in i for i in issues):
-        print("\n[ABORT] Critical issues found. Exiting.")
-        sys.exit(1)
-
-    output_dir = os.path.dirname(OUTPUT_FILE)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"[OK] Created output directory: {output_dir}")
-
-    final_output_file = OUTPUT_FILE
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            with open(OUTPUT_FILE, "r+b"):
-                pass
-        except PermissionError:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = os.path.splitext(OUTPUT_FILE)[0]
-            final_output_file = f"{base_name}_{timestamp}.xlsx"
-            print(f"[WARNING] Original file is open. Saving as: {final_output_file}")
-
-    # BACKUP PLAN: Setup logging
-    print(f"\n[1/9] Setting up logging and workbook")
-    log_file = setup_logging(final_output_file)
-    logging.info("[1/9] Workbook creation started")
-
-    wb = Workbook()
-    wb.remove(wb.active)
-
-    # BACKUP PLAN: Safe sheet creation with error recovery
-    print(f"\n[2/9] Creating sheets (with error recovery):")
-    logging.info("[2/9] Sheet creation phase started")
-
-    safe_sheet_creation(wb, create_calc_sheet, "Calc")
-    safe_sheet_creation(wb, create_tide_sheet, "December_Tide_2025")
-    safe_sheet_creation(wb, create_hourly_sheet, "Hourly_FWD_AFT_Heights")
+def extend_roro_sheet(wb, roro_result):
+    """
+    [3/9] RORO 시트 확장 (Captain Req / Structural / Precision 컬럼 + Excel Table)
+    roro_result: create_roro_sheet 반환값 (실패 시 None → 기본값 사용)
 
-    result = safe_sheet_creation(wb, create_roro_sheet, "RORO_Stage_Scenarios")
-    if result:
-        if len(result) == 3:
-            stages, first_data_row, total_rows = result
+    Returns:
+        (stages, first_data_row, total_rows)
+    """
+    if roro_result:
+        if len(roro_result) == 3:
+            stages, first_data_row, total_rows = roro_result
         else:
             # 이전 버전 호환성
-            stages, first_data_row = result
+            stages, first_data_row = roro_result
             total_rows = len(stages)
     else:
         # BACKUP: Provide fallback values if RORO sheet creation fails
@@ -5113,10 +3988,6 @@ def create_workbook_from_scratch():
         first_data_row = 19
         total_rows = 0
 
-    safe_sheet_creation(wb, create_ballast_tanks_sheet, "Ballast_Tanks")
-    safe_sheet_creation(wb, create_hydro_table_sheet, "Hydro_Table")
-    safe_sheet_creation(wb, create_frame_table_sheet, "Frame_to_x_Table")
-
     if "RORO_Stage_Scenarios" in wb.sheetnames and stages:
         roro_ws = wb["RORO_Stage_Scenarios"]
         logging.info("[3/9] Extending RORO sheet with additional columns")
@@ -5166,7 +4037,12 @@ def create_workbook_from_scratch():
             logging.warning(f"[BACKUP] Excel Table creation failed: {e}")
             print(f"  [BACKUP] Warning: Could not create Excel Table: {e}")
 
-    # Create OPERATION SUMMARY sheet
+    return stages, first_data_row, total_rows
+
+
+def create_operation_summary(wb, roro):
+    """[4/9] OPERATION SUMMARY 시트 (RORO Stage 가 있을 때만)"""
+    stages, first_data_row, _ = roro
     if stages:
         logging.info("[4/9] Creating OPERATION SUMMARY sheet")
         print(f"\n[4/9] Creating OPERATION SUMMARY")
@@ -5174,17 +4050,163 @@ def create_workbook_from_scratch():
             wb, create_captain_report_sheet, "OPERATION SUMMARY", stages, first_data_row
         )
 
+
+# 시트 생성 의존 그래프 (선언 순서 = 워크북 시트 순서)
+# - 일반 task 는 서로 독립: 다른 시트를 읽지 않는다. create_roro_sheet 의
+#   RORO_Stability_Check 는 Hydro_Table 이 아직 없는 상태로 생성됨 (순차 실행과 동일)
+# - local task 는 조립된 워크북에서 RORO 결과(stages)를 사용
+SHEET_TASKS = (
+    SheetTask("Calc", "create_calc_sheet"),
+    SheetTask("December_Tide_2025", "create_tide_sheet"),
+    SheetTask("Hourly_FWD_AFT_Heights", "create_hourly_sheet"),
+    SheetTask("RORO_Stage_Scenarios", "create_roro_sheet"),
+    SheetTask("Ballast_Tanks", "create_ballast_tanks_sheet"),
+    SheetTask("Hydro_Table", "create_hydro_table_sheet"),
+    SheetTask("Frame_to_x_Table", "create_frame_table_sheet"),
+    SheetTask(
+        "RORO_Extension", "extend_roro_sheet", deps=("RORO_Stage_Scenarios",), local=True
+    ),
+    SheetTask(
+        "OPERATION SUMMARY", "create_operation_summary", deps=("RORO_Extension",), local=True
+    ),
+)
+
+
+def build_workbook_sheets(wb, max_workers: Optional[int] = 0, timings: Optional[dict] = None):
+    """
+    시트 생성 단계 ([2/9]~[4/9]) – SHEET_TASKS 그래프 실행, 모든 backend 공용
+    wb: openpyxl Workbook 또는 src.sheet_payload.PayloadWorkbook
+    max_workers: 0 → 순차, None/N → process pool 에서 시트 payload 병렬 생성
+                 (PayloadWorkbook 필요, src/sheet_graph.py)
+    timings: 단계별 소요 시간(s)을 기록할 dict (optional)
+
+    Returns:
+        (stages, first_data_row, total_rows)
+    """
+    # BACKUP PLAN: Safe sheet creation with error recovery
+    print(f"\n[2/9] Creating sheets (with error recovery):")
+    logging.info("[2/9] Sheet creation phase started")
+
+    results = run_sheet_graph(
+        wb,
+        SHEET_TASKS,
+        namespace=globals(),
+        path=__file__,
+        max_workers=max_workers,
+        timings=timings,
+    )
+    return results["RORO_Extension"]
+
+
+def create_workbook_from_scratch(backend: str = "standard"):
+    """
+    워크북을 처음부터 생성 (BACKUP PLAN integrated)
+
+    backend:
+      - "standard"   : openpyxl 일반 Workbook (기존 방식)
+      - "write_only" : 시트 payload 기록 후 openpyxl write_only 로 스트리밍 저장
+                       (공유 스타일 interning, 동일 수식/값 – src/sheet_payload.py)
+      - "parallel"   : SHEET_TASKS 그래프를 process pool 에서 payload 로 생성 후
+                       하나의 write_only writer 로 조립 (src/sheet_graph.py)
+
+    단계별 소요 시간은 마지막에 [TIMING] 으로 출력/로그.
+    """
+    if backend not in ("standard", "write_only", "parallel"):
+        raise ValueError(f"Unknown workbook backend: {backend!r}")
+
+    timings: dict = {}
+    t_phase = time.perf_counter()
+
+    print("=" * 80)
+    print("LCT_BUSHRA_AGI_TR.xlsx Creation from Scratch (BACKUP PLAN enabled)")
+    print("=" * 80)
+
+    # BACKUP PLAN: Pre-flight check
+    print("\n[PRE-FLIGHT CHECK]")
+    issues = preflight_check()
+
+    # PHASE 0: Tank JSON auto-generation
+    try:
+        from src.tank_data_manager import ensure_tank_jsons
+
+        logging.info("[PRE-FLIGHT] Checking tank data files")
+        success, msg = ensure_tank_jsons("Tank Capacity_Plan.xlsx", "data/")
+        if success:
+            logging.info(f"[TANK] {msg}")
+            print(f"  [OK] {msg}")
+        else:
+            issues.append(f"WARNING: {msg}")
+            print(f"  [WARNING] {msg}")
+    except ImportError:
+        issues.append("INFO: Tank auto-generation module not available")
+        print("  [INFO] Tank auto-generation module not available")
+    except Exception as e:
+        issues.append(f"WARNING: Tank JSON generation failed: {e}")
+        print(f"  [WARNING] Tank JSON generation failed: {e}")
+
+    for issue in issues:
+        print(f"  {issue}")
+    if any("ERROR" in i for i in issues):
+        print("\n[ABORT] Critical issues found. Exiting.")
+        sys.exit(1)
+
+    output_dir = os.path.dirname(OUTPUT_FILE)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"[OK] Created output directory: {output_dir}")
+
+    final_output_file = OUTPUT_FILE
+    if os.path.exists(OUTPUT_FILE):
+        try:
+            with open(OUTPUT_FILE, "r+b"):
+                pass
+        except PermissionError:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_name = os.path.splitext(OUTPUT_FILE)[0]
+            final_output_file = f"{base_name}_{timestamp}.xlsx"
+            print(f"[WARNING] Original file is open. Saving as: {final_output_file}")
+
+    timings["preflight"] = time.perf_counter() - t_phase
+
+    # BACKUP PLAN: Setup logging
+    print(f"\n[1/9] Setting up logging and workbook")
+    log_file = setup_logging(final_output_file)
+    logging.info("[1/9] Workbook creation started")
+
+    if backend == "standard":
+        wb = Workbook()
+        wb.remove(wb.active)
+    else:
+        from src.sheet_payload import PayloadWorkbook
+
+        wb = PayloadWorkbook()
+
+    t_phase = time.perf_counter()
+    sheet_timings: dict = {}
+    stages, first_data_row, total_rows = build_workbook_sheets(
+        wb, max_workers=None if backend == "parallel" else 0, timings=sheet_timings
+    )
+    timings["sheets"] = time.perf_counter() - t_phase
+
     # Save workbook
     logging.info(f"[5/9] Saving workbook: {final_output_file}")
     print(f"\n[5/9] Saving workbook: {final_output_file}")
+    t_phase = time.perf_counter()
     try:
-        wb.save(final_output_file)
+        if backend != "standard":
+            from src.sheet_payload import write_payload_workbook
+
+            write_payload_workbook(wb, final_output_file)
+        else:
+            wb.save(final_output_file)
         logging.info("[OK] File saved successfully")
         print(f"  [OK] File saved successfully")
     except Exception as e:
         logging.error(f"[ERROR] Failed to save: {e}")
         print(f"  [ERROR] Failed to save: {e}")
         sys.exit(1)
+    timings["save"] = time.perf_counter() - t_phase
+    t_phase = time.perf_counter()
 
     # CSV Export (워크북 저장 후, 닫기 전)
     if "RORO_Delta_Lever_Report" in wb.sheetnames:
@@ -5219,11 +4241,14 @@ def create_workbook_from_scratch():
         print(f"  [WARNING] PNG export failed: {e}")
 
     wb.close()
+    timings["exports"] = time.perf_counter() - t_phase
 
     # BACKUP PLAN: Create backup after successful save
     print(f"\n[6/9] Creating backup")
     logging.info("[6/9] Creating backup file")
+    t_phase = time.perf_counter()
     backup_path = create_backup_file(final_output_file)
+    timings["backup"] = time.perf_counter() - t_phase
 
     # Verification
     logging.info("[7/9] Verification")
@@ -5242,6 +4267,18 @@ def create_workbook_from_scratch():
         print(f"  [ERROR] Output file was not created")
         sys.exit(1)
 
+    # 단계별 소요 시간 (sheets 아래는 시트 그래프 task 별)
+    print(f"\n[TIMING] backend={backend}")
+    for phase, seconds in timings.items():
+        print(f"  {phase:<28}: {seconds * 1e3:9.1f} ms")
+        if phase == "sheets":
+            for task_name, task_seconds in sheet_timings.items():
+                print(f"    {task_name:<26}: {task_seconds * 1e3:9.1f} ms")
+    logging.info(
+        f"[TIMING] backend={backend} "
+        + ", ".join(f"{k}={v * 1e3:.1f}ms" for k, v in {**timings, **sheet_timings}.items())
+    )
+
     print("\n" + "=" * 80)
     print("[SUCCESS] Workbook creation complete! (BACKUP PLAN active)")
     print("=" * 80)
@@ -5313,6 +4350,7 @@ def export_stages_to_csv(output_path: str = None):
         "LBP": LBP,
         "D_vessel": D_vessel,
         "hydro_table": hydro_table_data,
+        "hydro_tables": _hydro_tables(),  # 경로+mtime 캐시 보간 객체
         "FWD_DRAFT_LIMIT": 2.70,
         "GM_MIN": 1.50,
     }
@@ -5331,6 +4369,8 @@ def export_stages_to_csv(output_path: str = None):
         search_min_t=params.get("PREBALLAST_MIN_T", 0.0),
         search_max_t=params.get("PREBALLAST_MAX_T", 400.0),
         search_step_t=params.get("PREBALLAST_STEP_T", 1.0),
+        method=params.get("PREBALLAST_METHOD", "scan"),
+        tol_t=params.get("PREBALLAST_TOL_T", 0.001),
     )
 
     if not preballast_result["ok"]:
@@ -5701,6 +4741,7 @@ if __name__ == "__main__":
             "FWD_DRAFT_LIMIT": 2.70,
             "GM_MIN": 1.50,
             "hydro_table": hydro_table_data,
+            "hydro_tables": _hydro_tables(),  # 경로+mtime 캐시 보간 객체
         }
 
         base_disp = 2800.0  # Stage 1 Δ (lightship, 예시값)
@@ -5763,5 +4804,11 @@ if __name__ == "__main__":
         import json
 
         print(json.dumps(opt, indent=2))
+    elif len(sys.argv) > 1 and sys.argv[1] == "stream":
+        # write_only streaming backend (동일 수식, 낮은 peak memory)
+        create_workbook_from_scratch(backend="write_only")
+    elif len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        # 시트 그래프 병렬 생성 (process pool) + write_only writer
+        create_workbook_from_scratch(backend="parallel")
     else:
         create_workbook_from_scratch()
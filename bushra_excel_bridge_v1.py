@@ -7,6 +7,8 @@ Features implemented (as requested):
 
 1) Python → Excel 자동 동기화
    - `tank_sums_for_stage()` computes tank weight/moment/FSM sums.
+   - `StageTankCondition` keeps running sums and updates only the tanks
+     that change between stages (requires `bushra_stability`).
    - `export_tank_summaries_to_excel()` writes per‑stage tank tables and
      aggregated results into an Excel workbook.
    - Stage 4/5/6/7 (or any named stages) can include target trim and
@@ -35,9 +37,12 @@ Features implemented (as requested):
 
 Notes
 -----
-* This module is intentionally self‑contained: it does NOT import your
+* This module is intentionally self‑contained: it does NOT require your
   existing `bushra_stability` package, but the data structures are
-  compatible (WeightItem-style dicts).
+  compatible (WeightItem-style dicts). When the package is importable,
+  `load_master_tanks_json()` reuses its parsed-input cache; when
+  `src.formula_engine` is importable, `read_stage_workbook()` can compute
+  formula cells of workbooks never recalculated in Excel.
 * Layout assumptions for the existing Excel workbook are marked as
   “ASSUMPTION” in docstrings. If your Stage workbook differs, adjust
   only those small constants (sheet names / column indices).
@@ -54,21 +59,42 @@ Author: MACHO‑GPT helper
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook, Workbook
 from openpyxl.utils import get_column_letter
 
+try:  # Optional: share the parsed-input cache with bushra_stability
+    from bushra_stability.src.input_cache import cached_frame
+except ImportError:
+    cached_frame = None
+
+try:  # Optional: incremental tank sums on bushra_stability's LoadingCondition
+    from bushra_stability.src.loading_condition import LoadingCondition
+except ImportError:
+    LoadingCondition = None
+
+try:  # Optional: compute formula cells of workbooks never recalculated by Excel
+    from src.formula_engine import load_workbook_values
+except ImportError:
+    load_workbook_values = None
+
 
 # ---------------------------------------------------------------------------
 # Data models
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# __slots__ for per-tank objects where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TankDefinition:
     """Static properties of a single tank.
 
@@ -262,9 +288,8 @@ def load_master_tanks_json(path: Path | str) -> List[TankDefinition]:
         }
     """
     path = Path(path)
-    raw = json.loads(path.read_text(encoding="utf-8"))
     tanks = []
-    for row in raw.get("tanks", []):
+    for row in _master_tank_rows(path):
         tanks.append(
             TankDefinition(
                 tank_id=str(row.get("Tank_ID")),
@@ -281,6 +306,23 @@ def load_master_tanks_json(path: Path | str) -> List[TankDefinition]:
     return tanks
 
 
+def _read_master_tanks_frame(path: Path) -> pd.DataFrame:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return pd.DataFrame(raw.get("tanks", []))
+
+
+def _master_tank_rows(path: Path) -> List[dict]:
+    """Tank rows of master_tanks.json (via the parsed-input cache if available)."""
+    if cached_frame is None:
+        return json.loads(path.read_text(encoding="utf-8")).get("tanks", [])
+    df = cached_frame(path, _read_master_tanks_frame, "master_json")
+    # Drop cells missing in the JSON row so .get() defaults still apply
+    return [
+        {key: value for key, value in row.items() if not pd.isna(value)}
+        for row in df.to_dict("records")
+    ]
+
+
 def build_tank_plan(
     tanks: Sequence[TankDefinition],
     percent_fill_by_id: Mapping[str, float],
@@ -304,24 +346,216 @@ def tank_sums_for_stage(plan: Sequence[TankState]) -> TankSums:
     if not plan:
         return TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
 
-    total_w = sum(t.weight_t for t in plan)
+    # One pass over the plan, then a single weight · [1, LCG, VCG, TCG] product
+    weight = np.array([t.weight_t for t in plan])
+    coords = np.array([(1.0, t.lcg_m_ap, t.vcg_m, t.tcg_m) for t in plan])
+    total_w, total_lm, total_vm, total_tm = weight @ coords
     if total_w <= 0.0:
         return TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
 
-    total_lm = sum(t.longitudinal_moment_tm() for t in plan)
-    total_vm = sum(t.vertical_moment_tm() for t in plan)
-    total_tm = sum(t.transverse_moment_tm() for t in plan)
     total_fsm = sum(t.fsm_effective_tm() for t in plan)
 
     return TankSums(
-        total_weight_t=total_w,
-        lcg_m_ap=total_lm / total_w,
-        vcg_m=total_vm / total_w,
-        tcg_m=total_tm / total_w,
-        total_fsm_tm=total_fsm,
+        total_weight_t=float(total_w),
+        lcg_m_ap=float(total_lm / total_w),
+        vcg_m=float(total_vm / total_w),
+        tcg_m=float(total_tm / total_w),
+        total_fsm_tm=float(total_fsm),
     )
 
 
+def calculate_fsm_effect_array(percent_fill, fsm_full_tm) -> np.ndarray:
+    """Vectorised `calculate_fsm_effect` (broadcasts fill and FSM arrays)."""
+    percent_fill = np.asarray(percent_fill, dtype=float)
+    x = (percent_fill - 50.0) / 40.0
+    slack = (percent_fill > 10.0) & (percent_fill < 90.0)
+    return np.where(slack, np.asarray(fsm_full_tm, dtype=float) * np.maximum(0.0, 1.0 - x * x), 0.0)
+
+
+class TankPlanMatrix:
+    """Tank plan of many stages as arrays.
+
+    Tanks are stored as NumPy columns (length T) and the stages as
+    stages × tanks matrices of percent fill and SG, so weight, CG and
+    effective FSM of every stage come from one matrix product instead of
+    per‑TankState property calls. Tanks with fill <= 0 are treated as not in
+    use (same as `build_tank_plan`).
+    """
+
+    def __init__(
+        self,
+        tanks: Sequence[TankDefinition],
+        stage_names: Sequence[str],
+        percent_fill: np.ndarray,
+        sg: np.ndarray,
+    ):
+        self.tanks = list(tanks)
+        self.stage_names = [str(n) for n in stage_names]
+        self.percent_fill = np.asarray(percent_fill, dtype=float).reshape(len(self.stage_names), len(self.tanks))
+        self.sg = np.asarray(sg, dtype=float).reshape(self.percent_fill.shape)
+
+        self.tank_ids = [t.tank_id for t in self.tanks]
+        self.capacity_m3 = np.array([t.capacity_m3 for t in self.tanks], dtype=float)
+        self.sg_master = np.array([t.sg_master for t in self.tanks], dtype=float)
+        self.fsm_full_tm = np.array([t.fsm_full_tm for t in self.tanks], dtype=float)
+        # Columns [1, LCG, VCG, TCG]: weight @ coords = [W, LM, VM, TM]
+        self.coords = np.column_stack(
+            [
+                np.ones(len(self.tanks)),
+                [t.lcg_m_ap for t in self.tanks],
+                [t.vcg_m for t in self.tanks],
+                [t.tcg_m for t in self.tanks],
+            ]
+        ).reshape(len(self.tanks), 4)
+
+    @classmethod
+    def from_stage_maps(
+        cls,
+        tanks: Sequence[TankDefinition],
+        stages: Sequence[Tuple[str, Mapping[str, float], Optional[Mapping[str, float]]]],
+    ) -> "TankPlanMatrix":
+        """Build from (stage_name, percent_fill_by_id, sg_override_by_id) tuples."""
+        tanks = list(tanks)
+        column = {t.tank_id: j for j, t in enumerate(tanks)}
+        sg_master = np.array([t.sg_master for t in tanks], dtype=float)
+        percent_fill = np.zeros((len(stages), len(tanks)))
+        sg = np.tile(sg_master, (len(stages), 1))
+        for i, (_, pf_map, sg_map) in enumerate(stages):
+            for tank_id, pf in pf_map.items():
+                j = column.get(tank_id)
+                if j is not None:
+                    percent_fill[i, j] = float(pf)
+            for tank_id, value in (sg_map or {}).items():
+                j = column.get(tank_id)
+                if j is not None:
+                    sg[i, j] = float(value)
+        return cls(tanks, [name for name, _, _ in stages], percent_fill, sg)
+
+    def __len__(self) -> int:
+        return len(self.stage_names)
+
+    @property
+    def active(self) -> np.ndarray:
+        """Boolean stages × tanks mask of tanks in use (fill > 0)."""
+        return self.percent_fill > 0.0
+
+    @property
+    def weight_t(self) -> np.ndarray:
+        """Stages × tanks weight (t) = capacity × fill × SG (0 for unused tanks)."""
+        return np.where(self.active, self.capacity_m3 * (self.percent_fill / 100.0) * self.sg, 0.0)
+
+    @property
+    def fsm_effective_tm(self) -> np.ndarray:
+        """Stages × tanks effective FSM (t·m), see `TankState.fsm_effective_tm`."""
+        safe_master = np.where(self.sg_master != 0.0, self.sg_master, 1.0)
+        scale_sg = np.where(self.sg_master != 0.0, self.sg / safe_master, 1.0)
+        fsm = calculate_fsm_effect_array(self.percent_fill, self.fsm_full_tm * scale_sg)
+        return np.where(self.active & (self.fsm_full_tm > 0.0), fsm, 0.0)
+
+    def sums(self) -> Dict[str, np.ndarray]:
+        """Per‑stage totals as arrays (weight, LCG/VCG/TCG, FSM) in one product."""
+        totals = self.weight_t @ self.coords  # (S, 4): W, LM, VM, TM
+        weight = totals[:, 0]
+        positive = weight > 0.0
+        safe_w = np.where(positive, weight, 1.0)
+        cg = np.where(positive[:, None], totals[:, 1:] / safe_w[:, None], 0.0)
+        fsm = np.where(positive, self.fsm_effective_tm.sum(axis=1), 0.0)
+        return {
+            "total_weight_t": np.where(positive, weight, 0.0),
+            "lcg_m_ap": cg[:, 0],
+            "vcg_m": cg[:, 1],
+            "tcg_m": cg[:, 2],
+            "total_fsm_tm": fsm,
+        }
+
+    def tank_sums(self) -> List[TankSums]:
+        """`TankSums` for every stage (same values as `tank_sums_for_stage`)."""
+        sums = self.sums()
+        return [
+            TankSums(*(float(sums[field][i]) for field in TankSums.__dataclass_fields__))
+            for i in range(len(self))
+        ]
+
+    def stage_plan(self, index: int) -> List[TankState]:
+        """TankState list of one stage (tanks in use only)."""
+        return [
+            TankState(tank=self.tanks[j], percent_fill=float(self.percent_fill[index, j]), sg=float(self.sg[index, j]))
+            for j in np.flatnonzero(self.active[index])
+        ]
+
+
+class StageTankCondition:
+    """Tank plan updated in place as stages or single tanks change.
+
+    All tanks are registered once on a bushra_stability `LoadingCondition`,
+    which keeps running weight / moment / FSM sums. `apply_stage()` only
+    touches tanks whose fill or SG differ from the previous stage and
+    `set_fill()` / `set_sg()` change one tank in O(1), instead of rebuilding
+    the whole plan for `tank_sums_for_stage()`. Sums equal
+    `tank_sums_for_stage(build_tank_plan(...))` for fills within 0–100 %
+    (fills are clipped to that range).
+    """
+
+    def __init__(self, tanks: Sequence[TankDefinition]):
+        if LoadingCondition is None:
+            raise ImportError("StageTankCondition requires the bushra_stability package")
+        self.condition = LoadingCondition()
+        for t in tanks:
+            self.condition.add_tank(
+                t.tank_id,
+                t.capacity_m3,
+                lcg=t.lcg_m_ap,
+                vcg=t.vcg_m,
+                tcg=t.tcg_m,
+                sg_master=t.sg_master,
+                fsm_full_tm=t.fsm_full_tm,
+                content=t.content,
+                group=t.group,
+                fsm_scales_with_sg=True,
+            )
+        self.condition.change_log.clear()
+        self._touched: set = set()  # tanks filled / SG-overridden in the current plan
+
+    def apply_stage(
+        self,
+        percent_fill_by_id: Mapping[str, float],
+        sg_override_by_id: Optional[Mapping[str, float]] = None,
+    ) -> TankSums:
+        """Switch to a stage plan (same arguments as `build_tank_plan`)."""
+        tanks = self.condition.tanks
+        fills = {tank_id: float(v) for tank_id, v in percent_fill_by_id.items() if tank_id in tanks}
+        sgs = {tank_id: float(v) for tank_id, v in (sg_override_by_id or {}).items() if tank_id in tanks}
+        # Tanks the new plan does not mention are emptied / reset to SG master
+        self.condition.apply_fills(
+            {**dict.fromkeys(self._touched - fills.keys(), 0.0), **fills},
+            {**{tank_id: tanks[tank_id].sg_master for tank_id in self._touched - sgs.keys()}, **sgs},
+        )
+        self._touched = fills.keys() | sgs.keys()
+        return self.sums()
+
+    def set_fill(self, tank_id: str, percent_fill: float) -> TankSums:
+        """Change one tank's fill (%) and return the updated sums."""
+        self.condition.set_fill(tank_id, percent_fill)
+        self._touched.add(tank_id)
+        return self.sums()
+
+    def set_sg(self, tank_id: str, sg: float) -> TankSums:
+        """Change one tank's SG and return the updated sums."""
+        self.condition.set_sg(tank_id, sg)
+        self._touched.add(tank_id)
+        return self.sums()
+
+    def sums(self) -> TankSums:
+        """Current `TankSums` from the running sums."""
+        try:
+            result = self.condition.displacement()
+        except ValueError:  # no tanks / zero weight
+            return TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
+        if result.total_weight <= 1e-9:  # empty plan up to round-off of the running sums
+            return TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
+        return TankSums(result.total_weight, result.lcg, result.vcg, result.tcg, result.total_fsm)
+
+
 def build_tank_coordinate_table(
     tanks: Sequence[TankDefinition],
     lpp_m: float,
@@ -505,33 +739,42 @@ def export_tank_summaries_to_excel(
     stage_summaries: List[Dict] = []
     ballast_rows: List[Dict] = []
 
-    for stage_cfg in cfg.get("stages", []):
-        stage_name = str(stage_cfg.get("name"))
+    stage_cfgs = cfg.get("stages", [])
+    stage_maps = []
+    for stage_cfg in stage_cfgs:
         pf_map = {t["tank_id"]: float(t.get("percent_fill", 0.0)) for t in stage_cfg.get("tanks", [])}
         sg_map = {
             t["tank_id"]: float(t["sg"])
             for t in stage_cfg.get("tanks", [])
             if "sg" in t and t["sg"] is not None
         }
+        stage_maps.append((str(stage_cfg.get("name")), pf_map, sg_map))
 
-        plan = build_tank_plan(master_tanks, pf_map, sg_override_by_id=sg_map)
-        sums = tank_sums_for_stage(plan)
+    # All stages at once: stages × tanks fill / SG matrices
+    matrix = TankPlanMatrix.from_stage_maps(master_tanks, stage_maps)
+    weight_t = matrix.weight_t
+    fsm_eff = matrix.fsm_effective_tm
+    sums = matrix.sums()
+
+    for i, stage_cfg in enumerate(stage_cfgs):
+        stage_name = matrix.stage_names[i]
 
         # Tank‑level rows
-        for ts in plan:
+        for j in np.flatnonzero(matrix.active[i]):
+            tank = matrix.tanks[j]
             tank_records.append(
                 {
                     "Stage": stage_name,
-                    "Tank_ID": ts.tank.tank_id,
-                    "Percent_Fill": ts.percent_fill,
-                    "SG": ts.sg,
-                    "Weight_t": ts.weight_t,
-                    "LCG_AP_m": ts.lcg_m_ap,
-                    "VCG_m": ts.vcg_m,
-                    "TCG_m": ts.tcg_m,
-                    "FSM_eff_tm": ts.fsm_effective_tm(),
-                    "Content": ts.tank.content,
-                    "Group": ts.tank.group,
+                    "Tank_ID": tank.tank_id,
+                    "Percent_Fill": float(matrix.percent_fill[i, j]),
+                    "SG": float(matrix.sg[i, j]),
+                    "Weight_t": float(weight_t[i, j]),
+                    "LCG_AP_m": tank.lcg_m_ap,
+                    "VCG_m": tank.vcg_m,
+                    "TCG_m": tank.tcg_m,
+                    "FSM_eff_tm": float(fsm_eff[i, j]),
+                    "Content": tank.content,
+                    "Group": tank.group,
                 }
             )
 
@@ -539,11 +782,11 @@ def export_tank_summaries_to_excel(
         stage_summaries.append(
             {
                 "Stage": stage_name,
-                "Total_Weight_t": sums.total_weight_t,
-                "LCG_AP_m": sums.lcg_m_ap,
-                "VCG_m": sums.vcg_m,
-                "TCG_m": sums.tcg_m,
-                "Total_FSM_tm": sums.total_fsm_tm,
+                "Total_Weight_t": float(sums["total_weight_t"][i]),
+                "LCG_AP_m": float(sums["lcg_m_ap"][i]),
+                "VCG_m": float(sums["vcg_m"][i]),
+                "TCG_m": float(sums["tcg_m"][i]),
+                "Total_FSM_tm": float(sums["total_fsm_tm"][i]),
             }
         )
 
@@ -627,6 +870,113 @@ def _write_dataframe(ws, df: pd.DataFrame, index: bool = False) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Column indices (1‑based) for RORO_Stage_Scenarios
+STAGE_COL_STAGE = 1  # A
+STAGE_COL_MEAN_DRAFT = 2  # B
+STAGE_COL_TRIM_M_INPUT = 3  # C
+STAGE_COL_W_STAGE = 4  # D
+STAGE_COL_X_STAGE_MID = 5  # E
+STAGE_COL_TRIM_CM_COMPUTED = 7  # G
+
+STAGE_HEADER_ROW = 14
+FIRST_STAGE_ROW = STAGE_HEADER_ROW + 1
+
+
+def _padded(row: tuple, width: int) -> tuple:
+    """Read‑only rows omit trailing empty cells; pad with None to `width`."""
+    return row + (None,) * (width - len(row)) if len(row) < width else row
+
+
+def read_stage_workbook(
+    workbook_path: Path | str,
+    stage_sheet_name: str = "RORO_Stage_Scenarios",
+    stage_tanks_sheet_name: str = "Stage_Tanks",
+    calc_sheet_name: str = "Calc",
+    evaluate_formulas: bool = False,
+) -> Dict[str, object]:
+    """Read Calc / Stage / Stage_Tanks values in one streaming pass per sheet.
+
+    The workbook is opened with `read_only=True, data_only=True` and each
+    sheet is walked once with `iter_rows(values_only=True)`, limited to the
+    columns that are used. Layout assumptions: see
+    `stage_workbook_to_stability_json`.
+
+    With `evaluate_formulas=True` formula cells without a cached value (the
+    workbook was generated but never recalculated in Excel) are computed
+    in-process by `src.formula_engine` instead of reading as None.
+
+    Returns
+    -------
+    dict
+        - "calc_params": {name: float} from Calc column A / D
+        - "stages": {stage name: stage dict} in sheet order
+        - "stage_tanks": list of (stage, tank_id, percent_fill, sg) raw values
+    """
+    if evaluate_formulas:
+        if load_workbook_values is None:
+            raise ImportError("evaluate_formulas=True requires src.formula_engine (run from the repo root)")
+        wb = load_workbook_values(workbook_path)
+    else:
+        wb = load_workbook(filename=workbook_path, read_only=True, data_only=True)
+    try:
+        # --- Calc: parameter name (A) → numeric value (D)
+        calc_params: Dict[str, float] = {}
+        for row in wb[calc_sheet_name].iter_rows(min_row=2, max_col=4, values_only=True):
+            key, _, _, val = _padded(row, 4)
+            if not key:
+                continue
+            if isinstance(val, (int, float)):
+                calc_params[str(key)] = float(val)
+
+        # --- Stage table: rows from FIRST_STAGE_ROW until column A is blank
+        def _f(v):
+            return float(v) if isinstance(v, (int, float)) else None
+
+        stages: Dict[str, Dict] = {}
+        width = STAGE_COL_TRIM_CM_COMPUTED
+        for row in wb[stage_sheet_name].iter_rows(min_row=FIRST_STAGE_ROW, max_col=width, values_only=True):
+            row = _padded(row, width)
+            stage_name = row[STAGE_COL_STAGE - 1]
+            if stage_name is None or str(stage_name).strip() == "":
+                break
+            stages[str(stage_name)] = {
+                "name": str(stage_name),
+                "mean_draft_m": _f(row[STAGE_COL_MEAN_DRAFT - 1]),
+                "trim_m_input": _f(row[STAGE_COL_TRIM_M_INPUT - 1]),
+                "trim_cm_computed": _f(row[STAGE_COL_TRIM_CM_COMPUTED - 1]),
+                "w_stage_t": _f(row[STAGE_COL_W_STAGE - 1]),
+                "x_stage_m_mid": _f(row[STAGE_COL_X_STAGE_MID - 1]),
+            }
+
+        # --- Stage_Tanks (optional): header row 1 with Stage, Tank_ID, Percent_Fill, SG?
+        stage_tanks: List[Tuple[str, str, object, object]] = []
+        if stage_tanks_sheet_name in wb.sheetnames:
+            rows = wb[stage_tanks_sheet_name].iter_rows(values_only=True)
+            header = next(rows, ())
+            col_idx = {str(h): i for i, h in enumerate(header) if h}
+            i_stage = col_idx.get("Stage", 0)
+            i_tank = col_idx.get("Tank_ID", 1)
+            i_fill = col_idx.get("Percent_Fill", 2)
+            i_sg = col_idx.get("SG")
+            width = max(len(header), i_stage + 1, i_tank + 1, i_fill + 1)
+            for row in rows:
+                if not any(row):
+                    continue
+                row = _padded(row, width)
+                stage_tanks.append(
+                    (
+                        str(row[i_stage]),
+                        str(row[i_tank]),
+                        row[i_fill],
+                        row[i_sg] if i_sg is not None else None,
+                    )
+                )
+    finally:
+        wb.close()
+
+    return {"calc_params": calc_params, "stages": stages, "stage_tanks": stage_tanks}
+
+
 def stage_workbook_to_stability_json(
     workbook_path: Path | str,
     master_tanks_path: Path | str,
@@ -634,6 +984,7 @@ def stage_workbook_to_stability_json(
     stage_sheet_name: str = "RORO_Stage_Scenarios",
     stage_tanks_sheet_name: str = "Stage_Tanks",
     calc_sheet_name: str = "Calc",
+    evaluate_formulas: bool = False,
 ) -> Path:
     """Read an existing Stage workbook and emit a stability JSON config.
 
@@ -658,21 +1009,19 @@ def stage_workbook_to_stability_json(
         Stage, Tank_ID, Percent_Fill, SG (optional), UseForBallast (optional)
 
     These assumptions are intentionally narrow and easy to adjust: if your
-    workbook differs, change the indices at the top of this function.
+    workbook differs, change the STAGE_* constants used by
+    `read_stage_workbook`. `evaluate_formulas`: see `read_stage_workbook`.
     """
-    wb = load_workbook(filename=workbook_path, data_only=True)
+    data = read_stage_workbook(
+        workbook_path,
+        stage_sheet_name=stage_sheet_name,
+        stage_tanks_sheet_name=stage_tanks_sheet_name,
+        calc_sheet_name=calc_sheet_name,
+        evaluate_formulas=evaluate_formulas,
+    )
 
     # --- 1) Vessel parameters from Calc sheet
-    calc_ws = wb[calc_sheet_name]
-    calc_params: Dict[str, float] = {}
-    for row in calc_ws.iter_rows(min_row=2, values_only=True):
-        key = row[0]
-        if not key:
-            continue
-        val = row[3]  # column D
-        if isinstance(val, (int, float)):
-            calc_params[str(key)] = float(val)
-
+    calc_params = data["calc_params"]
     lpp_m = float(calc_params.get("Lpp_m", 0.0))
     lcf_mid = float(calc_params.get("LCF_m_from_midship", 0.0))
     mtc_tm_per_cm = float(calc_params.get("MTC_t_m_per_cm", 0.0))
@@ -680,46 +1029,7 @@ def stage_workbook_to_stability_json(
     d_vessel_m = float(calc_params.get("D_vessel_m", 0.0))
 
     # --- 2) Stage sheet
-    stage_ws = wb[stage_sheet_name]
-
-    # Column indices (1‑based) for RORO_Stage_Scenarios
-    COL_STAGE = 1  # A
-    COL_MEAN_DRAFT = 2  # B
-    COL_TRIM_M_INPUT = 3  # C
-    COL_W_STAGE = 4  # D
-    COL_X_STAGE_MID = 5  # E
-    COL_TRIM_CM_COMPUTED = 7  # G
-
-    STAGE_HEADER_ROW = 14
-    FIRST_STAGE_ROW = STAGE_HEADER_ROW + 1
-
-    stages_from_excel: Dict[str, Dict] = {}
-
-    row_idx = FIRST_STAGE_ROW
-    while True:
-        stage_name = stage_ws.cell(row=row_idx, column=COL_STAGE).value
-        if stage_name is None or str(stage_name).strip() == "":
-            break
-
-        mean_draft = stage_ws.cell(row=row_idx, column=COL_MEAN_DRAFT).value
-        trim_input_m = stage_ws.cell(row=row_idx, column=COL_TRIM_M_INPUT).value
-        trim_cm = stage_ws.cell(row=row_idx, column=COL_TRIM_CM_COMPUTED).value
-        w_stage = stage_ws.cell(row=row_idx, column=COL_W_STAGE).value
-        x_stage_mid = stage_ws.cell(row=row_idx, column=COL_X_STAGE_MID).value
-
-        # Normalise numeric values
-        def _f(v):
-            return float(v) if isinstance(v, (int, float)) else None
-
-        stages_from_excel[str(stage_name)] = {
-            "name": str(stage_name),
-            "mean_draft_m": _f(mean_draft),
-            "trim_m_input": _f(trim_input_m),
-            "trim_cm_computed": _f(trim_cm),
-            "w_stage_t": _f(w_stage),
-            "x_stage_m_mid": _f(x_stage_mid),
-        }
-        row_idx += 1
+    stages_from_excel: Dict[str, Dict] = data["stages"]
 
     # --- 3) Stage_Tanks sheet (optional)
     tanks = load_master_tanks_json(master_tanks_path)
@@ -727,31 +1037,18 @@ def stage_workbook_to_stability_json(
 
     stage_tank_map: Dict[str, List[TankState]] = {name: [] for name in stages_from_excel.keys()}
 
-    if stage_tanks_sheet_name in wb.sheetnames:
-        st_ws = wb[stage_tanks_sheet_name]
-        # Expect header row 1 with at least: Stage, Tank_ID, Percent_Fill, SG?
-        header = [c.value for c in st_ws[1]]
-        col_idx = {str(h): i + 1 for i, h in enumerate(header) if h}
-
-        for row in st_ws.iter_rows(min_row=2, values_only=True):
-            if not any(row):
-                continue
-            stage_name = str(row[col_idx.get("Stage", 1) - 1])
-            tank_id = str(row[col_idx.get("Tank_ID", 2) - 1])
-            pf = row[col_idx.get("Percent_Fill", 3) - 1]
-            sg = row[col_idx.get("SG", 4) - 1] if "SG" in col_idx else None
-
-            if tank_id not in tank_by_id:
-                continue
-            if stage_name not in stage_tank_map:
-                stage_tank_map[stage_name] = []
+    for stage_name, tank_id, pf, sg in data["stage_tanks"]:
+        if tank_id not in tank_by_id:
+            continue
+        if stage_name not in stage_tank_map:
+            stage_tank_map[stage_name] = []
 
-            tank_def = tank_by_id[tank_id]
-            percent_fill = float(pf) if isinstance(pf, (int, float)) else 0.0
-            if percent_fill <= 0.0:
-                continue
-            sg_val = float(sg) if isinstance(sg, (int, float)) else tank_def.sg_master
-            stage_tank_map[stage_name].append(TankState(tank=tank_def, percent_fill=percent_fill, sg=sg_val))
+        tank_def = tank_by_id[tank_id]
+        percent_fill = float(pf) if isinstance(pf, (int, float)) else 0.0
+        if percent_fill <= 0.0:
+            continue
+        sg_val = float(sg) if isinstance(sg, (int, float)) else tank_def.sg_master
+        stage_tank_map[stage_name].append(TankState(tank=tank_def, percent_fill=percent_fill, sg=sg_val))
 
     # --- 4) Compose JSON structure
     vessel_meta = {
@@ -848,6 +1145,11 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser.add_argument("--master", type=str, required=True, help="master_tanks.json path")
     parser.add_argument("--config", type=str, help="Stage config JSON (for json-to-excel)")
     parser.add_argument("--out", type=str, required=True, help="Output path (.json or .xlsx)")
+    parser.add_argument(
+        "--evaluate-formulas",
+        action="store_true",
+        help="Compute formula cells without cached values (workbook not recalculated in Excel)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -858,6 +1160,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
             workbook_path=args.workbook,
             master_tanks_path=args.master,
             out_json_path=args.out,
+            evaluate_formulas=args.evaluate_formulas,
         )
         print(f"[OK] Stability JSON written to: {out}")
     else:
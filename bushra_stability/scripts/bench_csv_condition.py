@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Benchmark vectorized condition application against the row-by-row loop.
+
+Usage:
+    python scripts/bench_csv_condition.py [--tanks 10000] [--filled 0.5]
+
+Writes a synthetic master / mapping / condition CSV set to a temporary directory,
+then times the former iterrows() conversion and csv_to_weight_items /
+csv_to_weight_table, and checks that all give the same condition totals.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent.resolve() / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from csv_reader import (  # noqa: E402
+    apply_condition_to_master,
+    calculate_fsm_effect,
+    csv_to_weight_items,
+    csv_to_weight_table,
+    read_condition,
+    read_master_tanks,
+    read_tank_mapping,
+)
+from displacement import WeightItem, calculate_displacement  # noqa: E402
+
+
+def write_synthetic_plan(folder: Path, n_tanks: int, filled: float, seed: int = 0):
+    """Write master / mapping / condition CSVs for n_tanks synthetic tanks."""
+    rng = np.random.default_rng(seed)
+    tank_ids = [f"T{i:05d}" for i in range(n_tanks)]
+    master = pd.DataFrame({
+        "Tank_ID": tank_ids,
+        "Capacity_m3": rng.uniform(5.0, 200.0, n_tanks),
+        "SG_Master": rng.choice([1.0, 1.025, 0.85], n_tanks),
+        "LCG_m": rng.uniform(0.0, 60.0, n_tanks),
+        "VCG_m": rng.uniform(0.5, 4.0, n_tanks),
+        "TCG_m": rng.uniform(-6.0, 6.0, n_tanks),
+        "FSM_full_tm": rng.uniform(0.0, 50.0, n_tanks),
+        "Content": rng.choice(["FW", "SW", "FO"], n_tanks),
+    })
+    chosen = rng.choice(n_tanks, int(n_tanks * filled), replace=False)
+    names = [f"COND {tank_ids[i]}" for i in chosen]
+    mapping = pd.DataFrame({"Condition_Name": names, "Tank_ID": [tank_ids[i] for i in chosen]})
+    condition = pd.DataFrame({
+        "Condition_Name": names,
+        "Percent_Fill": rng.uniform(0.0, 100.0, len(chosen)),
+        "SG_Override": np.where(rng.random(len(chosen)) < 0.1, 1.1, np.nan),
+    })
+    paths = tuple(folder / f for f in ("master.csv", "mapping.csv", "condition.csv"))
+    for df, path in zip((master, mapping, condition), paths):
+        df.to_csv(path, index=False)
+    return paths
+
+
+def legacy_weight_items(master_path, mapping_path, condition_path):
+    """Previous iterrows() based conversion, kept for comparison."""
+    final_df = apply_condition_to_master(
+        read_master_tanks(master_path), read_tank_mapping(mapping_path), read_condition(condition_path)
+    )
+    items = []
+    for _, row in final_df.iterrows():
+        weight = row["Capacity_m3"] * (row["Percent_Fill"] / 100.0) * row["SG"]
+        fsm = calculate_fsm_effect(row["Percent_Fill"], row["FSM_full_tm"])
+        lcg = row.get("LCG_m") if pd.notna(row.get("LCG_m")) else None
+        vcg = row.get("VCG_m") if pd.notna(row.get("VCG_m")) else None
+        tcg = row.get("TCG_m") if pd.notna(row.get("TCG_m")) else None
+        name = f"{row['Tank_ID']} ({row['Content']})"
+        items.append(WeightItem(name=name, weight=weight, lcg=lcg, vcg=vcg, tcg=tcg, fsm=fsm))
+    return items
+
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tanks", type=int, default=10_000)
+    parser.add_argument("--filled", type=float, default=0.5, help="Fraction of tanks in the condition")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_synthetic_plan(Path(tmp), args.tanks, args.filled, args.seed)
+        legacy, t_legacy = timed(legacy_weight_items, *paths)
+        items, t_items = timed(csv_to_weight_items, *paths)
+        table, t_table = timed(csv_to_weight_table, *paths)
+    
+    expected = calculate_displacement(legacy)
+    identical = all(
+        np.isclose(getattr(r, f), getattr(expected, f), rtol=1e-12, atol=1e-9)
+        for r in (calculate_displacement(items), table.result())
+        for f in ("total_weight", "lcg", "vcg", "tcg", "total_fsm")
+    )
+    print("=" * 60)
+    print(f"tanks={args.tanks:,}  in condition={int(args.tanks * args.filled):,}")
+    print(f"iterrows loop        : {t_legacy * 1e3:10.2f} ms")
+    print(f"csv_to_weight_items  : {t_items * 1e3:10.2f} ms  ({t_legacy / t_items:5.1f} x)")
+    print(f"csv_to_weight_table  : {t_table * 1e3:10.2f} ms  ({t_legacy / t_table:5.1f} x)")
+    print(f"identical result     : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
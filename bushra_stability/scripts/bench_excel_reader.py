@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Benchmark the Volum sheet reader: full-sheet iterrows() vs column/row pushdown.
+
+Usage:
+    python scripts/bench_excel_reader.py [--rows 5000] [--cols 40] [--workbook path.xls]
+
+Without --workbook a synthetic .xlsx in the Volum layout (group headers,
+sub totals, FSM-only rows, filler columns) is generated in memory. The former
+reader (pd.read_excel of the whole sheet + iterrows) is compared with
+read_weight_items_from_excel / read_weight_table_from_excel on the same bytes:
+wall time, peak Python memory (tracemalloc) and identical items.
+"""
+import argparse
+import io
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent.resolve() / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from displacement import WeightItem  # noqa: E402
+from excel_reader import read_weight_items_from_excel, read_weight_table_from_excel  # noqa: E402
+
+
+def synthetic_volum(n_rows: int, n_cols: int, seed: int = 0) -> bytes:
+    """Synthetic Volum sheet as .xlsx bytes."""
+    rng = np.random.default_rng(seed)
+    rows = [[None] * n_cols for _ in range(n_rows)]
+    rows[0][2], rows[0][7] = "Description", "Weight"
+    for i in range(1, n_rows):
+        row = rows[i]
+        row[n_cols - 1] = f"remark {i}"
+        row[n_cols - 2] = float(i)
+        if i % 50 == 1:
+            row[2] = f"Group {i // 50}"
+        elif i % 50 == 49:
+            row[2], row[7] = f"Sub Total {i // 50}", 0.0
+        else:
+            row[2] = f"Item {i}"
+            row[7] = "tbd" if i % 97 == 0 else round(float(rng.uniform(0, 300)), 3)
+            row[8], row[10], row[12] = (round(float(v), 3) for v in rng.uniform(-5, 60, 3))
+            row[16] = round(float(rng.uniform(0, 20)), 3) if i % 3 == 0 else None
+    buffer = io.BytesIO()
+    pd.DataFrame(rows).to_excel(buffer, sheet_name="Volum", header=False, index=False)
+    return buffer.getvalue()
+
+
+def legacy_read(excel_bytes: bytes, sheet_name: str = "Volum"):
+    """Previous reader: whole sheet + iterrows(), kept for comparison."""
+    df = pd.read_excel(io.BytesIO(excel_bytes), sheet_name=sheet_name, header=None)
+    items = []
+    current_group = None
+    for _, row in df.iterrows():
+        desc = row[2] if not pd.isna(row[2]) else row[1]
+        if isinstance(desc, str) and desc.strip() and row[7] == "Weight":
+            continue
+        if isinstance(desc, str) and desc.strip():
+            if pd.isna(row[7]) or (isinstance(row[7], str) and not row[7].strip()):
+                current_group = desc.strip()
+                continue
+        try:
+            weight = float(row[7]) if not pd.isna(row[7]) else 0.0
+        except (TypeError, ValueError):
+            weight = None
+        if weight is None or math.isnan(weight):
+            name = desc.strip() if isinstance(desc, str) else str(desc)
+            if not name or name.lower() == "nan":
+                continue
+            try:
+                fsm = float(row[16]) if not pd.isna(row[16]) else 0.0
+            except (TypeError, ValueError):
+                fsm = 0.0
+            if fsm > 0:
+                weight = 0.0
+            else:
+                continue
+        name = desc.strip() if isinstance(desc, str) else str(desc)
+        if not name or name.lower() == "nan":
+            continue
+        if "sub total" in name.lower() or name in {"Light Fixed Ship", "Displacement Condition"}:
+            continue
+        lcg = float(row[8]) if not pd.isna(row[8]) else None
+        vcg = float(row[10]) if not pd.isna(row[10]) else None
+        tcg = float(row[12]) if not pd.isna(row[12]) else None
+        try:
+            fsm = float(row[16]) if not pd.isna(row[16]) else 0.0
+        except (TypeError, ValueError):
+            fsm = 0.0
+        items.append(WeightItem(name, weight, lcg, vcg, tcg, fsm, current_group))
+    return items
+
+
+def measure(func, *args):
+    """Result, wall time and peak traced memory (separate runs; tracing slows code)."""
+    t0 = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cols", type=int, default=40)
+    parser.add_argument("--workbook", type=Path, help="Real workbook instead of synthetic data")
+    parser.add_argument("--sheet", default="Volum")
+    args = parser.parse_args(argv)
+    
+    if args.workbook:
+        data = args.workbook.read_bytes()
+        label = args.workbook.name
+    else:
+        data = synthetic_volum(args.rows, args.cols)
+        label = f"synthetic {args.rows:,} x {args.cols} .xlsx"
+    
+    legacy, t_legacy, m_legacy = measure(legacy_read, data, args.sheet)
+    items, t_items, m_items = measure(read_weight_items_from_excel, data, args.sheet)
+    table, t_table, m_table = measure(read_weight_table_from_excel, data, args.sheet)
+    identical = items == legacy and table.names == [item.name for item in legacy]
+    
+    print("=" * 66)
+    print(f"{label}: {len(items):,} weight items")
+    print(f"{'':28s}{'time [ms]':>12s}{'peak [MiB]':>14s}")
+    for name, t, m in [
+        ("full sheet + iterrows", t_legacy, m_legacy),
+        ("read_weight_items_from_excel", t_items, m_items),
+        ("read_weight_table_from_excel", t_table, m_table),
+    ]:
+        print(f"{name:28s}{t * 1e3:12.1f}{m / 2**20:14.2f}")
+    print(f"identical result: {identical}")
+    print("=" * 66)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Benchmark HydroEngine.query() against per-property single-point calls.
+
+Usage:
+    python scripts/bench_hydro_query.py [--points 10000] [--hydro hydrostatics.csv --kn kn_table.csv]
+
+Without --hydro/--kn a synthetic 40 x 21 (Displacement x Trim) table is written to a
+temporary directory. For the same random (Displacement, Trim) points the script times
+mean_draft/LCB/KMT/MTC called one point at a time and a single batched query(), and
+checks that both give the same values.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to Python path
+src_path = Path(__file__).parent.parent.resolve() / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from hydrostatic import HydroEngine  # noqa: E402
+
+PROPS = ("Draft", "LCB", "KMT", "MTC")
+
+
+def write_synthetic_tables(folder: Path):
+    """Write a smooth synthetic hydrostatics / KN table pair."""
+    disps = np.linspace(1000.0, 5000.0, 40)
+    trims = np.linspace(-1.0, 1.0, 21)
+    d, t = (a.ravel() for a in np.meshgrid(disps, trims, indexing="ij"))
+    hydro = pd.DataFrame({
+        "Displacement": d,
+        "Trim": t,
+        "Draft": 0.6 + d / 1500.0 + 0.02 * t,
+        "LCB": 30.0 - d / 2000.0 + 0.8 * t,
+        "KMT": 14.0 - d / 800.0 + 0.001 * (d / 1000.0) ** 2,
+        "MTC": 25.0 + d / 120.0 + 0.5 * t,
+    })
+    kn = pd.DataFrame({"Displacement": d, "Trim": t})
+    for heel in range(0, 70, 10):
+        kn[f"Heel_{heel}"] = np.sin(np.deg2rad(heel)) * (8.0 - d / 1000.0)
+    hydro_path = folder / "hydrostatics.csv"
+    kn_path = folder / "kn_table.csv"
+    hydro.to_csv(hydro_path, index=False)
+    kn.to_csv(kn_path, index=False)
+    return hydro_path, kn_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hydro", type=Path)
+    parser.add_argument("--kn", type=Path)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.hydro and args.kn:
+            hydro_path, kn_path = args.hydro, args.kn
+        else:
+            hydro_path, kn_path = write_synthetic_tables(Path(tmp))
+        engine = HydroEngine(hydro_path, kn_path)
+
+    rng = np.random.default_rng(args.seed)
+    disps = rng.uniform(*engine.displacement_range, size=args.points)
+    trims = rng.uniform(*engine.trim_range, size=args.points)
+    methods = {
+        "Draft": engine.mean_draft,
+        "LCB": engine.LCB,
+        "KMT": engine.KMT,
+        "MTC": engine.MTC,
+    }
+
+    t0 = time.perf_counter()
+    single = {
+        prop: np.array([methods[prop](d, t) for d, t in zip(disps, trims)])
+        for prop in PROPS
+    }
+    t_single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = engine.query(disps, trims, PROPS)
+    t_batch = time.perf_counter() - t0
+
+    identical = all(np.allclose(single[p], batched[p], rtol=0.0, atol=1e-12) for p in PROPS)
+    print("=" * 60)
+    print(f"points={args.points:,}  props={', '.join(PROPS)}")
+    print(f"single-point calls : {t_single * 1e3:10.2f} ms")
+    print(f"HydroEngine.query  : {t_batch * 1e3:10.2f} ms")
+    print(f"speedup            : {t_single / t_batch:10.1f} x")
+    print(f"identical result   : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
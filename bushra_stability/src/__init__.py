@@ -1,7 +1,12 @@
 """BUSHRA Stability Calculation - Python implementation matching Excel workbook."""
 
-from .displacement import calculate_displacement, WeightItem, DisplacementResult
-from .stability import calculate_stability, StabilityResult
+from .displacement import calculate_displacement, WeightItem, WeightTable, DisplacementResult
+from .stability import (
+    calculate_stability,
+    calculate_stability_batch,
+    StabilityResult,
+    StabilityBatchResult,
+)
 
 # Optional imports (may not be available if dependencies missing)
 try:
@@ -12,11 +17,22 @@ except ImportError:
     HydroEngine = None
 
 try:
-    from .imo_check import check_imo_a749
+    from .loading_condition import LoadingCondition, ConditionChange, TankSlot
+    LOADING_CONDITION_AVAILABLE = True
+except ImportError:
+    LOADING_CONDITION_AVAILABLE = False
+    LoadingCondition = None
+    ConditionChange = None
+    TankSlot = None
+
+try:
+    from .imo_check import check_imo_a749, check_imo_a749_batch, GZCurves
     IMO_CHECK_AVAILABLE = True
 except ImportError:
     IMO_CHECK_AVAILABLE = False
     check_imo_a749 = None
+    check_imo_a749_batch = None
+    GZCurves = None
 
 try:
     from .site_config import SiteRequirements, validate_stability_for_site, generate_site_checklist
@@ -30,15 +46,24 @@ except ImportError:
 __all__ = [
     "calculate_displacement",
     "WeightItem",
+    "WeightTable",
     "DisplacementResult",
     "calculate_stability",
     "StabilityResult",
+    "calculate_stability_batch",
+    "StabilityBatchResult",
     "HydroEngine",
+    "LoadingCondition",
+    "ConditionChange",
+    "TankSlot",
     "check_imo_a749",
+    "check_imo_a749_batch",
+    "GZCurves",
     "SiteRequirements",
     "validate_stability_for_site",
     "generate_site_checklist",
     "HYDROSTATIC_AVAILABLE",
+    "LOADING_CONDITION_AVAILABLE",
     "IMO_CHECK_AVAILABLE",
     "SITE_CONFIG_AVAILABLE",
 ]
@@ -7,7 +7,7 @@ and output results in JSON or CSV format.
 import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 import argparse
 import csv
 
@@ -27,6 +27,11 @@ except ImportError:
     HYDROSTATIC_AVAILABLE = False
     HydroEngine = None
 
+try:
+    from .loading_condition import LoadingCondition
+except ImportError:
+    LoadingCondition = None
+
 
 def format_result_json(result: DisplacementResult) -> str:
     """Format displacement result as JSON string."""
@@ -54,6 +59,17 @@ def format_result_csv(result: DisplacementResult, output_path: Path) -> None:
         writer.writerow(["Total FSM", f"{result.total_fsm:.2f}", "t·m"])
 
 
+def parse_tank_overrides(values: Optional[list], option: str) -> Dict[str, float]:
+    """Parse repeated "TANK_ID=VALUE" options into {tank_id: value}."""
+    overrides = {}
+    for value in values or []:
+        tank_id, sep, number = value.rpartition("=")
+        if not sep or not tank_id.strip():
+            raise ValueError(f"{option} expects TANK_ID=VALUE, got {value!r}")
+        overrides[tank_id.strip()] = float(number)
+    return overrides
+
+
 def main(args: Optional[list] = None) -> int:
     """
     Main CLI entry point.
@@ -107,6 +123,13 @@ def main(args: Optional[list] = None) -> int:
         type=Path,
         help="Path to KN table CSV file (required for stability)",
     )
+    parser.add_argument(
+        "--trim-method",
+        type=str,
+        choices=["fixed_point", "newton"],
+        default="fixed_point",
+        help="Trim solver for stability calculation (default: fixed_point)",
+    )
     parser.add_argument(
         "--csv-mode",
         action="store_true",
@@ -127,6 +150,23 @@ def main(args: Optional[list] = None) -> int:
         type=Path,
         help="Path to condition CSV (for CSV mode)",
     )
+    parser.add_argument(
+        "--fill",
+        action="append",
+        metavar="TANK_ID=PERCENT",
+        help="Override a tank's fill %% on top of --condition (CSV mode, repeatable)",
+    )
+    parser.add_argument(
+        "--sg",
+        action="append",
+        metavar="TANK_ID=SG",
+        help="Override a tank's SG on top of --condition (CSV mode, repeatable)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse master/mapping CSVs (skip the parsed-input cache)",
+    )
     parser.add_argument(
         "--imo-check",
         action="store_true",
@@ -164,16 +204,38 @@ def main(args: Optional[list] = None) -> int:
                 return 0
         
         # Read items
+        condition = None
         if parsed_args.csv_mode:
             if not all([parsed_args.master, parsed_args.mapping, parsed_args.condition]):
                 print("Error: CSV mode requires --master, --mapping, and --condition", file=sys.stderr)
                 return 1
-            items = csv_to_weight_items(
-                parsed_args.master,
-                parsed_args.mapping,
-                parsed_args.condition
-            )
+            if LoadingCondition is not None:
+                # Tank overrides are applied as deltas (only changed tanks are updated)
+                condition = LoadingCondition.from_csv(
+                    parsed_args.master,
+                    parsed_args.mapping,
+                    parsed_args.condition,
+                    use_cache=not parsed_args.no_cache,
+                )
+                condition.apply_fills(
+                    parse_tank_overrides(parsed_args.fill, "--fill"),
+                    parse_tank_overrides(parsed_args.sg, "--sg"),
+                )
+                items = condition.table.to_items()
+            elif parsed_args.fill or parsed_args.sg:
+                print("Error: --fill / --sg require scipy (LoadingCondition)", file=sys.stderr)
+                return 1
+            else:
+                items = csv_to_weight_items(
+                    parsed_args.master,
+                    parsed_args.mapping,
+                    parsed_args.condition,
+                    use_cache=not parsed_args.no_cache,
+                )
         else:
+            if parsed_args.fill or parsed_args.sg:
+                print("Error: --fill / --sg require --csv-mode", file=sys.stderr)
+                return 1
             if not parsed_args.excel_file:
                 print("Error: Excel file required (or use --csv-mode)", file=sys.stderr)
                 return 1
@@ -195,7 +257,11 @@ def main(args: Optional[list] = None) -> int:
                 return 1
             
             hydro = HydroEngine(parsed_args.hydro, parsed_args.kn)
-            result = calculate_stability(items, hydro)
+            if condition is not None and parsed_args.trim_method == "newton":
+                condition.set_hydro(hydro)
+                result = condition.stability()
+            else:
+                result = calculate_stability(items, hydro, trim_method=parsed_args.trim_method)
             
             # IMO check if requested
             imo_check = None
@@ -219,7 +285,7 @@ def main(args: Optional[list] = None) -> int:
                 imo_check["site_type"] = site_req.site_type.value
         else:
             # Basic displacement only
-            result = calculate_displacement(items)
+            result = condition.displacement() if condition is not None else calculate_displacement(items)
             imo_check = None
         
         # Output results
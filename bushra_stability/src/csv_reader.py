@@ -8,16 +8,46 @@ This module reads CSV files in the standard format:
 
 See docs/USER_GUIDE.md for detailed CSV format specifications.
 """
+import json
 from pathlib import Path
 from typing import List, Optional, Dict
+import numpy as np
 import pandas as pd
 
-from .displacement import WeightItem
+try:
+    from .displacement import WeightItem, WeightTable
+    from .input_cache import cached_frame
+except ImportError:
+    from displacement import WeightItem, WeightTable
+    from input_cache import cached_frame
 
 
-def read_master_tanks(master_path: Path) -> pd.DataFrame:
+def _parse_master_tanks(master_path: Path) -> pd.DataFrame:
+    """Parse and normalise a master tanks CSV or JSON ({"tanks": [...]}) file (buffers: CSV)."""
+    if isinstance(master_path, Path) and master_path.suffix.lower() == ".json":
+        raw = json.loads(master_path.read_text(encoding="utf-8"))
+        df = pd.DataFrame(raw.get("tanks", []))
+    else:
+        df = pd.read_csv(master_path)
+    
+    # Normalize column names
+    if "LCG_m" not in df.columns and "LCG" in df.columns:
+        df["LCG_m"] = df["LCG"]
+    if "VCG_m" not in df.columns and "VCG" in df.columns:
+        df["VCG_m"] = df["VCG"]
+    if "TCG_m" not in df.columns and "TCG" in df.columns:
+        df["TCG_m"] = df["TCG"]
+    
+    return df
+
+
+def read_master_tanks(
+    master_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> pd.DataFrame:
     """
-    Read master tanks CSV file.
+    Read master tanks CSV (or master_tanks.json) file.
     
     Expected columns:
     - Tank_ID: Tank identifier
@@ -28,26 +58,36 @@ def read_master_tanks(master_path: Path) -> pd.DataFrame:
     - VCG, VCG_m: Vertical center of gravity (m)
     - TCG, TCG_m: Transverse center of gravity (m)
     
+    The normalised table is cached (see input_cache) and re-parsed only when
+    the file content changes.
+    
     Args:
-        master_path: Path to master tanks CSV file
+        master_path: Path to master tanks CSV or JSON file, or CSV file-like object
+        cache_dir: Directory for content-addressed cache entries (default: next to file)
+        use_cache: False to always parse the file
         
     Returns:
         DataFrame with master tank data
     """
-    df = pd.read_csv(master_path)
+    return cached_frame(master_path, _parse_master_tanks, "master", cache_dir, use_cache)
+
+
+def _parse_tank_mapping(mapping_path: Path) -> pd.DataFrame:
+    """Parse a tank mapping CSV file with Tank_ID normalised to string."""
+    df = pd.read_csv(mapping_path)
     
-    # Normalize column names
-    if "LCG_m" not in df.columns and "LCG" in df.columns:
-        df["LCG_m"] = df["LCG"]
-    if "VCG_m" not in df.columns and "VCG" in df.columns:
-        df["VCG_m"] = df["VCG"]
-    if "TCG_m" not in df.columns and "TCG" in df.columns:
-        df["TCG_m"] = df["TCG"]
+    # Normalize Tank_ID to string
+    if "Tank_ID" in df.columns:
+        df["Tank_ID"] = df["Tank_ID"].astype(str).str.strip()
     
     return df
 
 
-def read_tank_mapping(mapping_path: Path) -> pd.DataFrame:
+def read_tank_mapping(
+    mapping_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> pd.DataFrame:
     """
     Read tank mapping CSV file.
     
@@ -57,17 +97,13 @@ def read_tank_mapping(mapping_path: Path) -> pd.DataFrame:
     
     Args:
         mapping_path: Path to tank mapping CSV file
+        cache_dir: Directory for content-addressed cache entries (default: next to file)
+        use_cache: False to always parse the file
         
     Returns:
         DataFrame with mapping data
     """
-    df = pd.read_csv(mapping_path)
-    
-    # Normalize Tank_ID to string
-    if "Tank_ID" in df.columns:
-        df["Tank_ID"] = df["Tank_ID"].astype(str).str.strip()
-    
-    return df
+    return cached_frame(mapping_path, _parse_tank_mapping, "mapping", cache_dir, use_cache)
 
 
 def read_condition(condition_path: Path) -> pd.DataFrame:
@@ -108,12 +144,13 @@ def apply_condition_to_master(
         condition_df: Condition DataFrame
         
     Returns:
-        Merged DataFrame with condition applied
+        Merged DataFrame with condition applied (inputs are not modified)
     """
-    # Normalize Tank_ID in all DataFrames
-    for df in [master_df, mapping_df]:
-        if "Tank_ID" in df.columns:
-            df["Tank_ID"] = df["Tank_ID"].astype(str).str.strip()
+    # Normalize Tank_ID (on copies; the caller's DataFrames are not modified)
+    if "Tank_ID" in master_df.columns:
+        master_df = master_df.assign(Tank_ID=master_df["Tank_ID"].astype(str).str.strip())
+    if "Tank_ID" in mapping_df.columns:
+        mapping_df = mapping_df.assign(Tank_ID=mapping_df["Tank_ID"].astype(str).str.strip())
     
     # Merge condition with mapping
     merged_cond = condition_df.merge(
@@ -172,10 +209,123 @@ def calculate_fsm_effect(percent_fill: float, fsm_full: float) -> float:
     return fsm_full * max(0.0, 1.0 - x * x)
 
 
+def calculate_fsm_array(percent_fill, fsm_full) -> np.ndarray:
+    """
+    Vectorized calculate_fsm_effect for arrays of fill (%) and full FSM (t·m).
+    
+    Returns:
+        Effective FSM array (0 outside the 10-90 % slack band)
+    """
+    percent_fill = np.asarray(percent_fill, dtype=float)
+    fsm_full = np.asarray(fsm_full, dtype=float)
+    x = (percent_fill - 50.0) / 40.0
+    slack = (percent_fill > 10.0) & (percent_fill < 90.0)
+    return np.where(slack, fsm_full * np.maximum(0.0, 1.0 - x * x), 0.0)
+
+
+def condition_columns(final_df: pd.DataFrame) -> Dict[str, object]:
+    """
+    Compute weight item columns from apply_condition_to_master output.
+    
+    Weight = Capacity × Fill × SG and FSM via calculate_fsm_array, evaluated
+    for all tanks at once. Missing coordinates are NaN.
+    
+    Args:
+        final_df: DataFrame returned by apply_condition_to_master
+        
+    Returns:
+        Dict with "names" (list) and "weight", "lcg", "vcg", "tcg", "fsm" arrays,
+        i.e. keyword arguments for WeightTable.extend_columns
+    """
+    n = len(final_df)
+    
+    def column(name):
+        if name not in final_df.columns:
+            return None
+        return pd.to_numeric(final_df[name], errors="coerce").to_numpy(dtype=float)
+    
+    capacity, fill, sg = column("Capacity_m3"), column("Percent_Fill"), column("SG")
+    if capacity is not None and fill is not None and sg is not None:
+        weight = capacity * (fill / 100.0) * sg
+    else:
+        weight = np.zeros(n)
+    
+    fsm_full = column("FSM_full_tm")
+    if fsm_full is not None and fill is not None:
+        fsm = calculate_fsm_array(fill, fsm_full)
+    else:
+        fsm = np.zeros(n)
+    
+    coords = {}
+    for key, name in (("lcg", "LCG_m"), ("vcg", "VCG_m"), ("tcg", "TCG_m")):
+        values = column(name)
+        coords[key] = values if values is not None else np.full(n, np.nan)
+    
+    if "Tank_ID" in final_df.columns:
+        names = final_df["Tank_ID"].astype(str)
+    else:
+        names = pd.Series("Unknown", index=final_df.index)
+    if "Content" in final_df.columns:
+        content = final_df["Content"]
+        names = names.where(content.isna(), names + " (" + content.astype(str) + ")")
+    
+    return {"names": names.tolist(), "weight": weight, "fsm": fsm, **coords}
+
+
+def read_condition_columns(
+    master_path: Path,
+    mapping_path: Path,
+    condition_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> Dict[str, object]:
+    """
+    Read the three CSV files and return condition_columns of the result.
+    
+    Master and mapping tables come from the parsed-input cache; only the
+    condition file is parsed on every call.
+    """
+    final_df = apply_condition_to_master(
+        read_master_tanks(master_path, cache_dir, use_cache),
+        read_tank_mapping(mapping_path, cache_dir, use_cache),
+        read_condition(condition_path),
+    )
+    return condition_columns(final_df)
+
+
+def csv_to_weight_table(
+    master_path: Path,
+    mapping_path: Path,
+    condition_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
+) -> WeightTable:
+    """
+    Convert CSV files directly to a columnar WeightTable (no per-row objects).
+    
+    Args:
+        master_path: Path to master tanks CSV
+        mapping_path: Path to tank mapping CSV
+        condition_path: Path to condition CSV
+        cache_dir: Directory for content-addressed master/mapping cache entries
+        use_cache: False to always parse master/mapping files
+        
+    Returns:
+        WeightTable with one item per master tank
+    """
+    table = WeightTable()
+    table.extend_columns(**read_condition_columns(
+        master_path, mapping_path, condition_path, cache_dir, use_cache
+    ))
+    return table
+
+
 def csv_to_weight_items(
     master_path: Path,
     mapping_path: Path,
-    condition_path: Path
+    condition_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True
 ) -> List[WeightItem]:
     """
     Convert CSV files to WeightItem list.
@@ -184,54 +334,38 @@ def csv_to_weight_items(
         master_path: Path to master tanks CSV
         mapping_path: Path to tank mapping CSV
         condition_path: Path to condition CSV
+        cache_dir: Directory for content-addressed master/mapping cache entries
+        use_cache: False to always parse master/mapping files
         
     Returns:
         List of WeightItem objects
     """
-    # Read all CSV files
-    master_df = read_master_tanks(master_path)
-    mapping_df = read_tank_mapping(mapping_path)
-    condition_df = read_condition(condition_path)
-    
-    # Apply condition
-    final_df = apply_condition_to_master(master_df, mapping_df, condition_df)
-    
-    # Convert to WeightItems
-    items = []
-    for _, row in final_df.iterrows():
-        # Calculate weight
-        if "Capacity_m3" in row and "Percent_Fill" in row and "SG" in row:
-            weight = row["Capacity_m3"] * (row["Percent_Fill"] / 100.0) * row["SG"]
-        else:
-            weight = 0.0
-        
-        # Calculate FSM
-        if "FSM_full_tm" in row and "Percent_Fill" in row:
-            fsm = calculate_fsm_effect(row["Percent_Fill"], row["FSM_full_tm"])
-        else:
-            fsm = 0.0
-        
-        # Get coordinates
-        lcg = row.get("LCG_m") if pd.notna(row.get("LCG_m")) else None
-        vcg = row.get("VCG_m") if pd.notna(row.get("VCG_m")) else None
-        tcg = row.get("TCG_m") if pd.notna(row.get("TCG_m")) else None
-        
-        # Get name
-        name = str(row.get("Tank_ID", "Unknown"))
-        if "Content" in row and pd.notna(row["Content"]):
-            name = f"{name} ({row['Content']})"
-        
-        items.append(
-            WeightItem(
-                name=name,
-                weight=weight,
-                lcg=lcg,
-                vcg=vcg,
-                tcg=tcg,
-                fsm=fsm,
-                group=None,  # Can be set from Content column if needed
-            )
+    columns = read_condition_columns(
+        master_path, mapping_path, condition_path, cache_dir, use_cache
+    )
+    
+    def optional(values):
+        return [None if np.isnan(v) else v for v in values.tolist()]
+    
+    items = [
+        WeightItem(
+            name=name,
+            weight=weight,
+            lcg=lcg,
+            vcg=vcg,
+            tcg=tcg,
+            fsm=fsm,
+            group=None,  # Can be set from Content column if needed
+        )
+        for name, weight, lcg, vcg, tcg, fsm in zip(
+            columns["names"],
+            columns["weight"].tolist(),
+            optional(columns["lcg"]),
+            optional(columns["vcg"]),
+            optional(columns["tcg"]),
+            columns["fsm"].tolist(),
         )
+    ]
     
     return items
 
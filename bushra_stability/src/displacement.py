@@ -3,9 +3,15 @@ Displacement calculation module matching BUSHRA Stability Excel workbook.
 
 This module implements the core displacement and center of gravity calculations
 that match the Excel workbook logic exactly.
+
+WeightTable stores large item sets column-wise (NumPy arrays) with running
+totals per group, so adding, removing or changing one item updates the
+condition totals in O(1).
 """
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
 
 
 @dataclass
@@ -30,7 +36,352 @@ class DisplacementResult:
     total_fsm: float
 
 
-def calculate_displacement(items: List[WeightItem]) -> DisplacementResult:
+# Running-sum columns per group: weight, L/V/T moments, FSM
+_SUM_WEIGHT, _SUM_LM, _SUM_VM, _SUM_TM, _SUM_FSM = range(5)
+
+
+def _result_from_sums(sums: np.ndarray) -> DisplacementResult:
+    """Build a DisplacementResult from a [weight, L/V/T moments, FSM] vector."""
+    total_weight = float(sums[_SUM_WEIGHT])
+    if total_weight == 0:
+        raise ValueError("Total weight cannot be zero")
+    return DisplacementResult(
+        total_weight=total_weight,
+        lcg=float(sums[_SUM_LM]) / total_weight,
+        vcg=float(sums[_SUM_VM]) / total_weight,
+        tcg=float(sums[_SUM_TM]) / total_weight,
+        total_fsm=float(sums[_SUM_FSM]),
+    )
+
+
+class WeightTable:
+    """
+    Structure-of-arrays store of weight items with O(1) running totals.
+    
+    Columns weight/lcg/vcg/tcg/fsm are float arrays (missing coordinates are
+    NaN and contribute no moment, as in calculate_displacement); group is an
+    index into group_names. Items are addressed by stable integer ids returned
+    from add(); removal swaps the last row into the freed slot.
+    
+    Totals are kept per group and updated by deltas, so they can drift by
+    rounding after very many updates; recompute() resums them from the columns.
+    """
+    
+    _FIELDS = ("weight", "lcg", "vcg", "tcg", "fsm")
+    
+    def __init__(self, capacity: int = 16):
+        capacity = max(int(capacity), 1)
+        self._n = 0
+        self._data = np.zeros((5, capacity))  # rows: weight, lcg, vcg, tcg, fsm
+        self._group = np.zeros(capacity, dtype=np.int64)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._names: List[str] = []
+        self._row_of: Dict[int, int] = {}
+        self._next_id = 0
+        self.group_names: List[Optional[str]] = []
+        self._group_index: Dict[Optional[str], int] = {}
+        self._group_sums = np.zeros((0, 5))
+    
+    @classmethod
+    def from_items(cls, items: Iterable[WeightItem]) -> "WeightTable":
+        """Build a table from WeightItem objects."""
+        table = cls()
+        items = list(items)
+        table.extend_columns(
+            names=[item.name for item in items],
+            weight=[item.weight for item in items],
+            lcg=[item.lcg for item in items],
+            vcg=[item.vcg for item in items],
+            tcg=[item.tcg for item in items],
+            fsm=[item.fsm for item in items],
+            groups=[item.group for item in items],
+        )
+        return table
+    
+    # ------------------------------------------------------------------ storage
+    def __len__(self) -> int:
+        return self._n
+    
+    def _reserve(self, n: int):
+        capacity = self._data.shape[1]
+        if n <= capacity:
+            return
+        capacity = max(n, 2 * capacity)
+        data = np.zeros((5, capacity))
+        data[:, :self._n] = self._data[:, :self._n]
+        self._data = data
+        self._group = np.resize(self._group, capacity)
+        self._ids = np.resize(self._ids, capacity)
+    
+    def _group_id(self, group: Optional[str]) -> int:
+        gid = self._group_index.get(group)
+        if gid is None:
+            gid = len(self.group_names)
+            self.group_names.append(group)
+            self._group_index[group] = gid
+            self._group_sums = np.vstack([self._group_sums, np.zeros(5)])
+        return gid
+    
+    @staticmethod
+    def _contributions(data: np.ndarray) -> np.ndarray:
+        """(5, n) item columns -> (n, 5) [weight, L/V/T moments, FSM]."""
+        w = data[0]
+        moments = np.nan_to_num(w * data[1:4])
+        return np.column_stack([w, moments.T, data[4]])
+    
+    def _row(self, item_id: int) -> int:
+        try:
+            return self._row_of[item_id]
+        except KeyError:
+            raise KeyError(f"Unknown weight item id: {item_id}") from None
+    
+    # ------------------------------------------------------------------ mutation
+    def extend_columns(
+        self,
+        names: List[str],
+        weight,
+        lcg=None,
+        vcg=None,
+        tcg=None,
+        fsm=None,
+        groups: Optional[List[Optional[str]]] = None
+    ) -> np.ndarray:
+        """
+        Append many items given as columns (None entries = missing coordinate).
+        
+        Returns:
+            Array of new item ids
+        """
+        n_new = len(names)
+        
+        def column(values, default):
+            if values is None:
+                return np.full(n_new, default)
+            if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+                return values
+            return np.array([default if v is None else v for v in values], dtype=float)
+        
+        cols = np.vstack([
+            column(weight, 0.0),
+            column(lcg, np.nan),
+            column(vcg, np.nan),
+            column(tcg, np.nan),
+            column(fsm, 0.0),
+        ])
+        gids = np.array(
+            [self._group_id(g) for g in (groups if groups is not None else [None] * n_new)],
+            dtype=np.int64,
+        )
+        
+        start = self._n
+        self._reserve(start + n_new)
+        ids = np.arange(self._next_id, self._next_id + n_new)
+        self._data[:, start:start + n_new] = cols
+        self._group[start:start + n_new] = gids
+        self._ids[start:start + n_new] = ids
+        self._names.extend(str(name) for name in names)
+        self._row_of.update(zip(ids.tolist(), range(start, start + n_new)))
+        self._next_id += n_new
+        self._n += n_new
+        np.add.at(self._group_sums, gids, self._contributions(cols))
+        return ids
+    
+    def add(
+        self,
+        name: str,
+        weight: float,
+        lcg: Optional[float] = None,
+        vcg: Optional[float] = None,
+        tcg: Optional[float] = None,
+        fsm: float = 0.0,
+        group: Optional[str] = None
+    ) -> int:
+        """Append one item and return its id."""
+        gid = self._group_id(group)
+        row = self._n
+        self._reserve(row + 1)
+        self._data[:, row] = (
+            weight,
+            np.nan if lcg is None else lcg,
+            np.nan if vcg is None else vcg,
+            np.nan if tcg is None else tcg,
+            fsm,
+        )
+        self._group[row] = gid
+        item_id = self._next_id
+        self._ids[row] = item_id
+        self._names.append(str(name))
+        self._row_of[item_id] = row
+        self._next_id += 1
+        self._n += 1
+        self._group_sums[gid] += self._contributions(self._data[:, row:row + 1])[0]
+        return item_id
+    
+    def add_item(self, item: WeightItem) -> int:
+        """Append a WeightItem and return its id."""
+        return self.add(
+            item.name, item.weight, item.lcg, item.vcg, item.tcg, item.fsm, item.group
+        )
+    
+    def remove(self, item_id: int):
+        """Remove an item (O(1): the last row moves into its slot)."""
+        row = self._row(item_id)
+        gid = self._group[row]
+        self._group_sums[gid] -= self._contributions(self._data[:, row:row + 1])[0]
+        
+        last = self._n - 1
+        if row != last:
+            self._data[:, row] = self._data[:, last]
+            self._group[row] = self._group[last]
+            self._ids[row] = self._ids[last]
+            self._names[row] = self._names[last]
+            self._row_of[int(self._ids[row])] = row
+        self._names.pop()
+        del self._row_of[item_id]
+        self._n = last
+    
+    def update(self, item_id: int, **fields):
+        """
+        Change fields of one item and apply the delta to the totals in O(1).
+        
+        Args:
+            item_id: Item id from add()
+            **fields: Any of name, weight, lcg, vcg, tcg, fsm, group
+        
+        Raises:
+            KeyError: If the id is unknown
+            TypeError: If an unknown field is given
+        """
+        unknown = set(fields) - set(self._FIELDS) - {"name", "group"}
+        if unknown:
+            raise TypeError(f"Unknown WeightItem fields: {sorted(unknown)}")
+        row = self._row(item_id)
+        col = self._data[:, row:row + 1]
+        old_gid = self._group[row]
+        self._group_sums[old_gid] -= self._contributions(col)[0]
+        
+        for k, field in enumerate(self._FIELDS):
+            if field in fields:
+                value = fields[field]
+                if value is None:
+                    value = np.nan if field in ("lcg", "vcg", "tcg") else 0.0
+                col[k, 0] = value
+        if "name" in fields:
+            self._names[row] = str(fields["name"])
+        if "group" in fields:
+            self._group[row] = self._group_id(fields["group"])
+        self._group_sums[self._group[row]] += self._contributions(col)[0]
+    
+    def recompute(self):
+        """Resum the running totals from the columns (clears rounding drift)."""
+        sums = np.zeros_like(self._group_sums)
+        np.add.at(sums, self._group[:self._n], self._contributions(self._data[:, :self._n]))
+        self._group_sums = sums
+    
+    # ------------------------------------------------------------------ views
+    @property
+    def ids(self) -> np.ndarray:
+        """Item ids in row order."""
+        return self._ids[:self._n]
+    
+    @property
+    def names(self) -> List[str]:
+        """Item names in row order."""
+        return list(self._names)
+    
+    @property
+    def group(self) -> np.ndarray:
+        """Group index (into group_names) per row."""
+        return self._group[:self._n]
+    
+    @property
+    def weight(self) -> np.ndarray:
+        return self._data[0, :self._n]
+    
+    @property
+    def lcg(self) -> np.ndarray:
+        return self._data[1, :self._n]
+    
+    @property
+    def vcg(self) -> np.ndarray:
+        return self._data[2, :self._n]
+    
+    @property
+    def tcg(self) -> np.ndarray:
+        return self._data[3, :self._n]
+    
+    @property
+    def fsm(self) -> np.ndarray:
+        return self._data[4, :self._n]
+    
+    def _item_at(self, row: int) -> WeightItem:
+        w, lcg, vcg, tcg, fsm = self._data[:, row].tolist()
+        return WeightItem(
+            name=self._names[row],
+            weight=w,
+            lcg=None if np.isnan(lcg) else lcg,
+            vcg=None if np.isnan(vcg) else vcg,
+            tcg=None if np.isnan(tcg) else tcg,
+            fsm=fsm,
+            group=self.group_names[self._group[row]],
+        )
+    
+    def item(self, item_id: int) -> WeightItem:
+        """Get an item as a WeightItem (a copy; use update() to change it)."""
+        return self._item_at(self._row(item_id))
+    
+    def __iter__(self) -> Iterator[WeightItem]:
+        for row in range(self._n):
+            yield self._item_at(row)
+    
+    def to_items(self) -> List[WeightItem]:
+        """All items as WeightItem objects in row order."""
+        return list(self)
+    
+    # ------------------------------------------------------------------ totals
+    def result(self) -> DisplacementResult:
+        """
+        Condition totals from the running sums (O(number of groups)).
+        
+        Raises:
+            ValueError: If the table is empty or total weight is zero
+        """
+        if not self._n:
+            raise ValueError("Cannot calculate displacement from empty item list")
+        return _result_from_sums(self._group_sums.sum(axis=0))
+    
+    def group_result(self, group: Optional[str]) -> DisplacementResult:
+        """
+        Subtotal of one group from its running sums (O(1)).
+        
+        Raises:
+            KeyError: If the group is unknown
+            ValueError: If the group's total weight is zero
+        """
+        return _result_from_sums(self._group_sums[self._group_index[group]])
+    
+    def group_results(self) -> Dict[Optional[str], DisplacementResult]:
+        """Subtotals of all groups with non-zero weight."""
+        return {
+            name: _result_from_sums(self._group_sums[gid])
+            for gid, name in enumerate(self.group_names)
+            if self._group_sums[gid, _SUM_WEIGHT] != 0
+        }
+    
+    def masked_result(self, mask: np.ndarray) -> DisplacementResult:
+        """
+        Subtotal of the rows selected by a boolean mask (length len(self)).
+        
+        Raises:
+            ValueError: If the selected total weight is zero
+        """
+        mask = np.asarray(mask, dtype=bool)
+        return _result_from_sums(
+            self._contributions(self._data[:, :self._n][:, mask]).sum(axis=0)
+        )
+
+
+def calculate_displacement(items: Union[List[WeightItem], WeightTable]) -> DisplacementResult:
     """
     Calculate total displacement and aggregate centers of gravity.
     
@@ -42,7 +393,7 @@ def calculate_displacement(items: List[WeightItem]) -> DisplacementResult:
     - Total FSM = sum of all free surface moments
     
     Args:
-        items: List of WeightItem objects to aggregate
+        items: List of WeightItem objects (or a WeightTable) to aggregate
         
     Returns:
         DisplacementResult with aggregated values
@@ -50,46 +401,29 @@ def calculate_displacement(items: List[WeightItem]) -> DisplacementResult:
     Raises:
         ValueError: If total weight is zero or all items have None for required coordinates
     """
+    if isinstance(items, WeightTable):
+        return items.result()
+    
     if not items:
         raise ValueError("Cannot calculate displacement from empty item list")
     
-    total_weight = sum(item.weight for item in items)
-    
-    if total_weight == 0:
-        raise ValueError("Total weight cannot be zero")
-    
-    # Calculate weighted moments for each axis
-    total_l_moment = sum(
-        item.weight * item.lcg 
-        for item in items 
-        if item.lcg is not None
-    )
-    
-    total_v_moment = sum(
-        item.weight * item.vcg 
-        for item in items 
-        if item.vcg is not None
-    )
+    # Single pass over the items for weight, moments and FSM
+    total_weight = 0.0
+    total_l_moment = 0.0
+    total_v_moment = 0.0
+    total_t_moment = 0.0
+    total_fsm = 0.0
+    for item in items:
+        w = item.weight
+        total_weight += w
+        if item.lcg is not None:
+            total_l_moment += w * item.lcg
+        if item.vcg is not None:
+            total_v_moment += w * item.vcg
+        if item.tcg is not None:
+            total_t_moment += w * item.tcg
+        total_fsm += item.fsm
     
-    total_t_moment = sum(
-        item.weight * item.tcg 
-        for item in items 
-        if item.tcg is not None
+    return _result_from_sums(
+        (total_weight, total_l_moment, total_v_moment, total_t_moment, total_fsm)
     )
-    
-    # Calculate weighted average centers of gravity
-    lcg = total_l_moment / total_weight
-    vcg = total_v_moment / total_weight
-    tcg = total_t_moment / total_weight
-    
-    # Sum all free surface moments
-    total_fsm = sum(item.fsm for item in items)
-    
-    return DisplacementResult(
-        total_weight=total_weight,
-        lcg=lcg,
-        vcg=vcg,
-        tcg=tcg,
-        total_fsm=total_fsm,
-    )
-
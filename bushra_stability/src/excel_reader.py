@@ -4,98 +4,164 @@ Excel workbook reader for BUSHRA Stability Calculation.
 This module reads data from the Excel workbook format and converts it
 to Python data structures for calculation.
 """
+import io
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Sequence, Union
+import numpy as np
 import pandas as pd
-import math
 
-from .displacement import WeightItem
+try:
+    from .displacement import WeightItem, WeightTable
+except ImportError:
+    from displacement import WeightItem, WeightTable
+
+ExcelSource = Union[str, Path, bytes, BinaryIO]
+
+# Volum sheet column positions (0-based)
+VOLUM_COLUMNS = {
+    "alt_desc": 1,
+    "desc": 2,
+    "weight": 7,
+    "lcg": 8,
+    "vcg": 10,
+    "tcg": 12,
+    "fsm": 16,
+}
+VOLUM_USECOLS = sorted(VOLUM_COLUMNS.values())
+
+# Summary rows that are not weight items
+_SKIP_NAMES = {"Light Fixed Ship", "Displacement Condition"}
+
+
+def _is_text(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def read_volum_columns(
+    excel_source: ExcelSource,
+    sheet_name: str = "Volum",
+    usecols: Optional[Sequence[int]] = VOLUM_USECOLS,
+    nrows: Optional[int] = None
+) -> Dict[str, object]:
+    """
+    Read weight item columns from the Volum sheet.
+    
+    Only the description / weight / coordinate / FSM columns are parsed
+    (usecols) and, if given, only the first nrows rows; both are pushed down
+    to the Excel engine.
+    
+    Args:
+        excel_source: Workbook path, bytes or binary file-like object (.xls or .xlsx)
+        sheet_name: Name of the sheet to read (default: "Volum")
+        usecols: Column positions to read (None = all columns)
+        nrows: Number of sheet rows to read (None = all rows)
+    
+    Returns:
+        Dict with "names" / "groups" lists and "weight", "lcg", "vcg", "tcg",
+        "fsm" arrays (NaN = missing coordinate), i.e. keyword arguments for
+        WeightTable.extend_columns
+    """
+    if isinstance(excel_source, (bytes, bytearray)):
+        excel_source = io.BytesIO(excel_source)
+    df = pd.read_excel(excel_source, sheet_name=sheet_name, header=None, usecols=usecols, nrows=nrows)
+    
+    def column(key):
+        position = VOLUM_COLUMNS[key]
+        if position in df.columns:
+            return df[position]
+        return pd.Series(np.nan, index=df.index, dtype=object)
+    
+    desc = column("desc").where(column("desc").notna(), column("alt_desc"))
+    raw_weight = column("weight")
+    text = desc.map(_is_text)
+    
+    # Header rows ("Weight" column title) and group headers (text, blank weight)
+    header = text & (raw_weight == "Weight")
+    blank_weight = raw_weight.isna() | raw_weight.map(lambda v: isinstance(v, str) and not v.strip())
+    group_row = text & ~header & blank_weight
+    groups = desc.where(group_row).map(lambda v: v.strip() if isinstance(v, str) else v).ffill()
+    
+    # Blank weight -> 0; non-numeric weight is kept only for items with FSM
+    weight = pd.to_numeric(raw_weight, errors="coerce")
+    invalid_weight = raw_weight.notna() & weight.isna()
+    weight = weight.fillna(0.0)
+    fsm = pd.to_numeric(column("fsm"), errors="coerce").fillna(0.0)
+    
+    names = desc.map(lambda v: v.strip() if isinstance(v, str) else str(v))
+    valid_name = (names != "") & (names.str.lower() != "nan")
+    summary = names.str.lower().str.contains("sub total", regex=False) | names.isin(_SKIP_NAMES)
+    
+    keep = ~header & ~group_row & valid_name & ~summary & (~invalid_weight | (fsm > 0))
+    
+    def coordinate(key):
+        return pd.to_numeric(column(key)[keep], errors="coerce").to_numpy(dtype=float)
+    
+    return {
+        "names": names[keep].tolist(),
+        "weight": weight[keep].to_numpy(dtype=float),
+        "lcg": coordinate("lcg"),
+        "vcg": coordinate("vcg"),
+        "tcg": coordinate("tcg"),
+        "fsm": fsm[keep].to_numpy(dtype=float),
+        "groups": [None if pd.isna(g) else g for g in groups[keep].tolist()],
+    }
+
+
+def read_weight_table_from_excel(
+    excel_source: ExcelSource,
+    sheet_name: str = "Volum",
+    usecols: Optional[Sequence[int]] = VOLUM_USECOLS,
+    nrows: Optional[int] = None
+) -> WeightTable:
+    """
+    Read the Volum sheet directly into a columnar WeightTable.
+    
+    Args:
+        excel_source: Workbook path, bytes or binary file-like object
+        sheet_name: Name of the sheet to read (default: "Volum")
+        usecols: Column positions to read (None = all columns)
+        nrows: Number of sheet rows to read (None = all rows)
+    
+    Returns:
+        WeightTable with one item per weight row (groups from group headers)
+    """
+    table = WeightTable()
+    table.extend_columns(**read_volum_columns(excel_source, sheet_name, usecols, nrows))
+    return table
 
 
 def read_weight_items_from_excel(
-    excel_path: Path, sheet_name: str = "Volum"
+    excel_path: ExcelSource,
+    sheet_name: str = "Volum",
+    usecols: Optional[Sequence[int]] = VOLUM_USECOLS,
+    nrows: Optional[int] = None
 ) -> List[WeightItem]:
     """
     Read weight items from Excel workbook Volum sheet.
     
     Args:
-        excel_path: Path to the Excel workbook
+        excel_path: Workbook path, bytes or binary file-like object
         sheet_name: Name of the sheet to read (default: "Volum")
-        
+        usecols: Column positions to read (None = all columns)
+        nrows: Number of sheet rows to read (None = all rows)
+    
     Returns:
         List of WeightItem objects extracted from the workbook
     """
-    df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
-    items = []
-    current_group = None
-    
-    for _, row in df.iterrows():
-        desc = row[2] if not pd.isna(row[2]) else row[1]
-        
-        # Skip header rows
-        if isinstance(desc, str) and desc.strip() and row[7] == "Weight":
-            continue
-        
-        # Detect group headers (rows with description but no weight)
-        if isinstance(desc, str) and desc.strip():
-            if pd.isna(row[7]) or (isinstance(row[7], str) and not row[7].strip()):
-                current_group = desc.strip()
-                continue
-        
-        # Extract weight item
-        try:
-            weight = float(row[7]) if not pd.isna(row[7]) else 0.0
-        except (TypeError, ValueError):
-            weight = None
-        
-        if weight is None or math.isnan(weight):
-            # Still check if there's a valid name for zero-weight items with FSM
-            name = desc.strip() if isinstance(desc, str) else str(desc)
-            if not name or name.lower() == "nan":
-                continue
-            # Check if this might be a zero-weight item with FSM
-            try:
-                fsm = float(row[16]) if not pd.isna(row[16]) else 0.0
-            except (TypeError, ValueError):
-                fsm = 0.0
-            if fsm > 0:
-                weight = 0.0
-            else:
-                continue
-        
-        name = desc.strip() if isinstance(desc, str) else str(desc)
-        if not name or name.lower() == "nan":
-            continue
-        
-        # Skip subtotal and summary rows
-        if "sub total" in name.lower() or name in {
-            "Light Fixed Ship",
-            "Displacement Condition",
-        }:
-            continue
-        
-        # Extract coordinates
-        lcg = float(row[8]) if not pd.isna(row[8]) else None
-        vcg = float(row[10]) if not pd.isna(row[10]) else None
-        tcg = float(row[12]) if not pd.isna(row[12]) else None
-        
-        # Extract FSM
-        try:
-            fsm = float(row[16]) if not pd.isna(row[16]) else 0.0
-        except (TypeError, ValueError):
-            fsm = 0.0
-        
-        items.append(
-            WeightItem(
-                name=name,
-                weight=weight,
-                lcg=lcg,
-                vcg=vcg,
-                tcg=tcg,
-                fsm=fsm,
-                group=current_group,
-            )
-        )
+    columns = read_volum_columns(excel_path, sheet_name, usecols, nrows)
     
-    return items
-
+    def optional(values):
+        return [None if np.isnan(v) else v for v in values.tolist()]
+    
+    return [
+        WeightItem(name=name, weight=weight, lcg=lcg, vcg=vcg, tcg=tcg, fsm=fsm, group=group)
+        for name, weight, lcg, vcg, tcg, fsm, group in zip(
+            columns["names"],
+            columns["weight"].tolist(),
+            optional(columns["lcg"]),
+            optional(columns["vcg"]),
+            optional(columns["tcg"]),
+            columns["fsm"].tolist(),
+            columns["groups"],
+        )
+    ]
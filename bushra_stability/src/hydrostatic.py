@@ -14,6 +14,9 @@ from scipy.interpolate import RegularGridInterpolator
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# Hydrostatic table columns, in tensor order
+HYDRO_PROPERTIES = ("Draft", "LCB", "VCB", "KMT", "MTC", "TCP")
+
 
 class HydroEngine:
     """
@@ -89,21 +92,29 @@ class HydroEngine:
             
             return p.values  # shape: (len(disps), len(trims))
         
-        # Build interpolators for each property
-        self.hydro_interpolators = {}
-        for col in ["Draft", "LCB", "VCB", "KMT", "MTC", "TCP"]:
+        # Stack all available properties into one (ndisp, ntrim, nprop) tensor so a
+        # single interpolator locates the grid cell once per point for every property
+        props = []
+        grids = []
+        for col in HYDRO_PROPERTIES:
             try:
                 col_name = self._pick_col(self.hydro_df, [col, f"{col}_m", f"{col}_t_m_cm"])
-                grid = make_grid(col_name)
-                self.hydro_interpolators[col] = RegularGridInterpolator(
-                    (disps, trims),
-                    grid,
-                    bounds_error=False,
-                    fill_value=None
-                )
             except KeyError:
                 # Property not available, skip
                 continue
+            props.append(col)
+            grids.append(make_grid(col_name))
+        
+        self._hydro_props = tuple(props)
+        self._hydro_index = {name: k for k, name in enumerate(props)}
+        self.hydro_interpolator = None
+        if grids:
+            self.hydro_interpolator = RegularGridInterpolator(
+                (disps, trims),
+                np.stack(grids, axis=-1),
+                bounds_error=False,
+                fill_value=None
+            )
     
     def _build_kn_interpolator(self):
         """Build 3D interpolator for KN curves."""
@@ -169,6 +180,118 @@ class HydroEngine:
             fill_value=None
         )
     
+    def query(
+        self,
+        disp_t,
+        trim_m=0.0,
+        props: Optional[Tuple[str, ...]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Interpolate several hydrostatic properties at many points in one call.
+        
+        Args:
+            disp_t: Displacement(s) in tons (scalar or array)
+            trim_m: Trim(s) in meters (scalar or array, broadcast against disp_t)
+            props: Property names to return (default: all available, see
+                hydro_properties)
+            
+        Returns:
+            Dictionary mapping property name to an array with the broadcast
+            shape of disp_t and trim_m
+            
+        Raises:
+            ValueError: If a requested property is not available
+        """
+        if props is None:
+            props = self._hydro_props
+        missing = [p for p in props if p not in self._hydro_index]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} interpolator not available")
+        
+        disp, trim = np.broadcast_arrays(
+            np.asarray(disp_t, dtype=float), np.asarray(trim_m, dtype=float)
+        )
+        pts = np.stack([disp.ravel(), trim.ravel()], axis=-1)  # shape (n, 2)
+        values = self.hydro_interpolator(pts)  # shape (n, nprop)
+        return {
+            p: values[:, self._hydro_index[p]].reshape(disp.shape)
+            for p in props
+        }
+    
+    def query_trim_gradient(
+        self,
+        disp_t,
+        trim_m=0.0,
+        props: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Interpolate properties and their analytic derivative with respect to trim.
+        
+        The interpolant is bilinear, so at fixed displacement it is linear in trim
+        inside each trim cell. Both cell edges are evaluated in one interpolator call
+        and the value / slope follow exactly (linear extrapolation outside the grid).
+        
+        Args:
+            disp_t: Displacement(s) in tons (scalar or array)
+            trim_m: Trim(s) in meters (scalar or array, broadcast against disp_t)
+            props: Property names to return (default: all available)
+        
+        Returns:
+            (values, d_dtrim): dictionaries mapping property name to arrays with the
+            broadcast shape of disp_t and trim_m; d_dtrim is per meter of trim
+        
+        Raises:
+            ValueError: If a requested property is not available
+        """
+        if props is None:
+            props = self._hydro_props
+        missing = [p for p in props if p not in self._hydro_index]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} interpolator not available")
+        
+        disp, trim = np.broadcast_arrays(
+            np.asarray(disp_t, dtype=float), np.asarray(trim_m, dtype=float)
+        )
+        d = disp.ravel()
+        t = trim.ravel()
+        trims = self._hydro_trims
+        if len(trims) < 2:
+            values = self.query(d, t, props)
+            return (
+                {p: values[p].reshape(disp.shape) for p in props},
+                {p: np.zeros(disp.shape) for p in props},
+            )
+        
+        # Same cell selection as RegularGridInterpolator (edge cells extrapolate)
+        idx = np.clip(np.searchsorted(trims, t) - 1, 0, len(trims) - 2)
+        t0 = trims[idx]
+        t1 = trims[idx + 1]
+        pts = np.concatenate([
+            np.stack([d, t0], axis=-1),
+            np.stack([d, t1], axis=-1),
+        ])  # shape (2n, 2)
+        edges = self.hydro_interpolator(pts)
+        v0 = edges[:len(d)]
+        slope = (edges[len(d):] - v0) / (t1 - t0)[:, np.newaxis]
+        value = v0 + slope * (t - t0)[:, np.newaxis]
+        
+        values = {}
+        d_dtrim = {}
+        for p in props:
+            k = self._hydro_index[p]
+            values[p] = value[:, k].reshape(disp.shape)
+            d_dtrim[p] = slope[:, k].reshape(disp.shape)
+        return values, d_dtrim
+
+    def _query_point(self, prop: str, disp_t: float, trim_m: float) -> float:
+        """Interpolate a single property at a single point."""
+        if prop not in self._hydro_index:
+            raise ValueError(f"{prop} interpolator not available")
+        
+        pt = np.array([[disp_t, trim_m]])  # shape (1, 2)
+        result = self.hydro_interpolator(pt)
+        return float(result[0, self._hydro_index[prop]])
+    
     def mean_draft(self, disp_t: float, trim_m: float = 0.0) -> float:
         """
         Get mean draft for given displacement and trim.
@@ -180,12 +303,7 @@ class HydroEngine:
         Returns:
             Mean draft in meters
         """
-        if "Draft" not in self.hydro_interpolators:
-            raise ValueError("Draft interpolator not available")
-        
-        pt = np.array([[disp_t, trim_m]])  # shape (1, 2)
-        result = self.hydro_interpolators["Draft"](pt)
-        return float(np.asarray(result).squeeze())
+        return self._query_point("Draft", disp_t, trim_m)
     
     def LCB(self, disp_t: float, trim_m: float = 0.0) -> float:
         """
@@ -198,12 +316,7 @@ class HydroEngine:
         Returns:
             LCB in meters
         """
-        if "LCB" not in self.hydro_interpolators:
-            raise ValueError("LCB interpolator not available")
-        
-        pt = np.array([[disp_t, trim_m]])
-        result = self.hydro_interpolators["LCB"](pt)
-        return float(np.asarray(result).squeeze())
+        return self._query_point("LCB", disp_t, trim_m)
     
     def KMT(self, disp_t: float, trim_m: float = 0.0) -> float:
         """
@@ -216,12 +329,7 @@ class HydroEngine:
         Returns:
             KMT in meters
         """
-        if "KMT" not in self.hydro_interpolators:
-            raise ValueError("KMT interpolator not available")
-        
-        pt = np.array([[disp_t, trim_m]])
-        result = self.hydro_interpolators["KMT"](pt)
-        return float(np.asarray(result).squeeze())
+        return self._query_point("KMT", disp_t, trim_m)
     
     def MTC(self, disp_t: float, trim_m: float = 0.0) -> float:
         """
@@ -234,12 +342,7 @@ class HydroEngine:
         Returns:
             MTC in t·m/cm
         """
-        if "MTC" not in self.hydro_interpolators:
-            raise ValueError("MTC interpolator not available")
-        
-        pt = np.array([[disp_t, trim_m]])
-        result = self.hydro_interpolators["MTC"](pt)
-        return float(np.asarray(result).squeeze())
+        return self._query_point("MTC", disp_t, trim_m)
     
     def KN(self, disp_t: float, heel_deg: float, trim_m: float = 0.0) -> float:
         """
@@ -283,21 +386,7 @@ class HydroEngine:
         if self.kn_interpolator is None:
             raise ValueError("KN interpolator not available")
         
-        # Clip angles to valid range
-        heels = np.clip(
-            np.array(heel_angles_deg, dtype=float),
-            self._heel_deg.min(),
-            self._heel_deg.max()
-        )
-        
-        # Build points array: (n_points, 3)
-        points = np.array([
-            [disp_t, trim_m, h] for h in heels
-        ])
-        
-        # Interpolate all at once
-        results = self.kn_interpolator(points)
-        kn_values = np.asarray(results).squeeze()
+        kn_values = self.KN_batch(disp_t, heel_angles_deg, trim_m)[0]
         
         # Convert to dictionary
         return {
@@ -305,6 +394,44 @@ class HydroEngine:
             for angle, kn in zip(heel_angles_deg, kn_values)
         }
     
+    def KN_batch(self, disp_t, heel_angles_deg, trim_m=0.0) -> np.ndarray:
+        """
+        Get KN at every heel angle for many conditions in one interpolator call.
+        
+        Args:
+            disp_t: Displacements in tons, shape (N,) (or scalar)
+            heel_angles_deg: Heel angles in degrees, shape (H,)
+            trim_m: Trims in meters, shape (N,) (or scalar, broadcast against disp_t)
+        
+        Returns:
+            KN in meters, shape (N, H)
+        """
+        if self.kn_interpolator is None:
+            raise ValueError("KN interpolator not available")
+        
+        disp, trim = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(disp_t, dtype=float)),
+            np.atleast_1d(np.asarray(trim_m, dtype=float))
+        )
+        heels = np.clip(
+            np.asarray(heel_angles_deg, dtype=float),
+            self._heel_deg.min(),
+            self._heel_deg.max()
+        )
+        n, h = len(disp), len(heels)
+        
+        # Points array: (N * H, 3), condition-major
+        points = np.empty((n, h, 3))
+        points[:, :, 0] = disp[:, np.newaxis]
+        points[:, :, 1] = trim[:, np.newaxis]
+        points[:, :, 2] = heels[np.newaxis, :]
+        return self.kn_interpolator(points.reshape(-1, 3)).reshape(n, h)
+
+    @property
+    def hydro_properties(self) -> Tuple[str, ...]:
+        """Get available hydrostatic property names."""
+        return self._hydro_props
+    
     @property
     def heel_angles_deg(self) -> np.ndarray:
         """Get available heel angles in degrees."""
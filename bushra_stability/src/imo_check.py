@@ -1,26 +1,315 @@
 """
 IMO A.749 stability criteria verification module.
 
-This module implements IMO Resolution A.749(18) stability criteria checks
-using Simpson integration for area calculations.
+This module implements IMO Resolution A.749(18) stability criteria checks on a
+continuous GZ curve (GZCurves): KN is interpolated with a monotone piecewise
+cubic (PCHIP, Fritsch–Carlson) and GZ = KN − KG·sin(φ) is kept exact, so areas
+are closed-form integrals and GZmax / vanishing angles come from root finding.
+Many curves are evaluated together as a batch.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
-try:
-    from scipy.integrate import simpson as simps
-except ImportError:
-    # Fallback for older scipy versions
-    try:
-        from scipy.integrate import simps
-    except ImportError:
-        # Use numpy trapz as fallback
-        from numpy import trapz as simps
+
+# (check label, result column, required value, strict comparison)
+IMO_A749_CRITERIA = (
+    ("GM >= 0.15m", "GM_m", 0.15, False),
+    ("Area 0-30 (m·rad)", "Area_0_30_mrad", 0.055, False),
+    ("Area 0-40 (m·rad)", "Area_0_40_mrad", 0.090, False),
+    ("Area 30-40 (m·rad)", "Area_30_40_mrad", 0.030, False),
+    ("GZ at 30° (m)", "GZ_30deg_m", 0.20, False),
+    ("GZmax (m)", "GZmax_m", 0.15, False),
+    ("Angle@GZmax (deg)", "Angle_at_GZmax_deg", 15.0, True),
+)
+
+# Sub-samples per input heel interval used to bracket roots
+_ROOT_SUBSAMPLES = 8
+_BISECT_ITERATIONS = 40
+
+
+def _pchip_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Fritsch–Carlson monotone node derivatives for y of shape (N, H)."""
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+    d = np.zeros_like(y)
+    if len(x) == 2:
+        d[:] = delta
+        return d
+    
+    # Interior: weighted harmonic mean, zero at local extrema
+    w1 = 2.0 * h[1:] + h[:-1]
+    w2 = h[1:] + 2.0 * h[:-1]
+    same_sign = delta[:, :-1] * delta[:, 1:] > 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        whmean = (w1 + w2) / (w1 / delta[:, :-1] + w2 / delta[:, 1:])
+    d[:, 1:-1] = np.where(same_sign, whmean, 0.0)
+    
+    # End points: one-sided three-point estimate, shape preserving
+    def edge(h0, h1, m0, m1):
+        e = ((2.0 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+        e = np.where(np.sign(e) != np.sign(m0), 0.0, e)
+        overshoot = (np.sign(m0) != np.sign(m1)) & (np.abs(e) > 3.0 * np.abs(m0))
+        return np.where(overshoot, 3.0 * m0, e)
+    
+    d[:, 0] = edge(h[0], h[1], delta[:, 0], delta[:, 1])
+    d[:, -1] = edge(h[-1], h[-2], delta[:, -1], delta[:, -2])
+    return d
+
+
+class GZCurves:
+    """
+    Continuous GZ curves for N loading conditions.
+    
+    KN(φ) is a monotone piecewise cubic through the sampled (heel, KN) points,
+    held constant outside the sampled range; GZ(φ) = KN(φ) − KG·sin(φ).
+    Angles are in degrees, areas in m·rad.
+    """
+    
+    def __init__(self, heel_angles_deg, kn_m, kg_m=0.0):
+        """
+        Args:
+            heel_angles_deg: Sampled heel angles in degrees, shape (H,), H >= 2
+            kn_m: KN values in meters, shape (N, H) (or (H,) for one curve)
+            kg_m: Corrected KG in meters, scalar or shape (N,). With kg_m=0 the
+                samples are treated directly as GZ values.
+        
+        Raises:
+            ValueError: If fewer than two distinct heel angles are given
+        """
+        x = np.asarray(heel_angles_deg, dtype=float)
+        y = np.atleast_2d(np.asarray(kn_m, dtype=float))
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        y = y[:, order]
+        if len(x) < 2 or (np.diff(x) <= 0).any():
+            raise ValueError("GZ curve needs at least two distinct heel angles")
+        
+        self.heel_angles_deg = x
+        self.kn = y
+        self.kg = np.broadcast_to(np.asarray(kg_m, dtype=float), (len(y),)).copy()
+        
+        # Hermite coefficients per interval: y + d·t + c2·t² + c3·t³
+        h = np.diff(x)
+        delta = np.diff(y, axis=1) / h
+        d = _pchip_slopes(x, y)
+        self._d = d
+        self._c2 = (3.0 * delta - 2.0 * d[:, :-1] - d[:, 1:]) / h
+        self._c3 = (d[:, :-1] + d[:, 1:] - 2.0 * delta) / h ** 2
+        # Antiderivative of KN at each node (degree·m)
+        seg_area = (
+            y[:, :-1] * h + d[:, :-1] * h ** 2 / 2.0
+            + self._c2 * h ** 3 / 3.0 + self._c3 * h ** 4 / 4.0
+        )
+        self._cum = np.concatenate(
+            [np.zeros((len(y), 1)), np.cumsum(seg_area, axis=1)], axis=1
+        )
+    
+    @classmethod
+    def from_stability(cls, result) -> "GZCurves":
+        """Build from a StabilityResult or StabilityBatchResult (heel_angles_deg, kn, kg_corrected)."""
+        return cls(result.heel_angles_deg, result.kn, result.kg_corrected)
+    
+    def __len__(self) -> int:
+        return len(self.kn)
+    
+    def _locate(self, x: np.ndarray):
+        """Interval index, local offset and the clipped angle for x."""
+        nodes = self.heel_angles_deg
+        xc = np.clip(x, nodes[0], nodes[-1])
+        seg = np.clip(np.searchsorted(nodes, xc, side="right") - 1, 0, len(nodes) - 2)
+        return seg, xc - nodes[seg], xc
+    
+    def _kn(self, x: np.ndarray, rows: np.ndarray, derivative: bool = False) -> np.ndarray:
+        seg, t, _ = self._locate(x)
+        d = self._d[rows, seg]
+        c2 = self._c2[rows, seg]
+        c3 = self._c3[rows, seg]
+        if derivative:
+            inside = (x >= self.heel_angles_deg[0]) & (x <= self.heel_angles_deg[-1])
+            return np.where(inside, d + t * (2.0 * c2 + t * 3.0 * c3), 0.0)
+        return self.kn[rows, seg] + t * (d + t * (c2 + t * c3))
+    
+    def _gz(self, x, rows):
+        return self._kn(x, rows) - self.kg[rows] * np.sin(np.deg2rad(x))
+    
+    def _dgz(self, x, rows):
+        """dGZ/dφ per degree."""
+        return (
+            self._kn(x, rows, derivative=True)
+            - self.kg[rows] * np.cos(np.deg2rad(x)) * np.pi / 180.0
+        )
+    
+    def _kn_integral(self, x, rows):
+        """∫ KN dφ from the first node to x (degree·m, constant extension outside)."""
+        seg, t, xc = self._locate(x)
+        y = self.kn[rows, seg]
+        d = self._d[rows, seg]
+        c2 = self._c2[rows, seg]
+        c3 = self._c3[rows, seg]
+        inner = self._cum[rows, seg] + t * (y + t * (d / 2.0 + t * (c2 / 3.0 + t * c3 / 4.0)))
+        # Constant KN beyond the sampled range
+        return (
+            inner
+            + self.kn[rows, 0] * np.minimum(x - xc, 0.0)
+            + self.kn[rows, -1] * np.maximum(x - xc, 0.0)
+        )
+    
+    def _rows(self, angles) -> Tuple[np.ndarray, np.ndarray]:
+        a = np.asarray(angles, dtype=float)
+        if a.ndim <= 1:
+            x = np.broadcast_to(a, (len(self),) + a.shape)
+        else:
+            x = a
+        rows = np.broadcast_to(
+            np.arange(len(self)).reshape((-1,) + (1,) * (x.ndim - 1)), x.shape
+        )
+        return x, rows
+    
+    def gz(self, angles_deg) -> np.ndarray:
+        """
+        GZ at the given angles.
+        
+        Args:
+            angles_deg: Scalar, (M,) shared angles or (N, M) per-curve angles
+        
+        Returns:
+            GZ in meters, shape (N,) / (N, M)
+        """
+        x, rows = self._rows(angles_deg)
+        return self._gz(x, rows)
+    
+    def area(self, start_deg, end_deg) -> np.ndarray:
+        """
+        Closed-form area under GZ between two angles.
+        
+        Args:
+            start_deg: Start angle(s) in degrees, scalar or shape (N,)
+            end_deg: End angle(s) in degrees, scalar or shape (N,)
+        
+        Returns:
+            Area in m·rad, shape (N,)
+        """
+        rows = np.arange(len(self))
+        a = np.broadcast_to(np.asarray(start_deg, dtype=float), rows.shape)
+        b = np.broadcast_to(np.asarray(end_deg, dtype=float), rows.shape)
+        kn_area = (self._kn_integral(b, rows) - self._kn_integral(a, rows)) * np.pi / 180.0
+        kg_area = self.kg * (np.cos(np.deg2rad(a)) - np.cos(np.deg2rad(b)))
+        return kn_area - kg_area
+    
+    def _subgrid(self) -> np.ndarray:
+        nodes = self.heel_angles_deg
+        frac = np.arange(_ROOT_SUBSAMPLES) / _ROOT_SUBSAMPLES
+        grid = (nodes[:-1, np.newaxis] + np.diff(nodes)[:, np.newaxis] * frac).ravel()
+        return np.append(grid, nodes[-1])
+    
+    @staticmethod
+    def _bisect(func, lo, hi, rows):
+        """Vectorised bisection for brackets with func(lo) > 0 >= func(hi)."""
+        for _ in range(_BISECT_ITERATIONS):
+            mid = 0.5 * (lo + hi)
+            positive = func(mid, rows) > 0.0
+            lo = np.where(positive, mid, lo)
+            hi = np.where(positive, hi, mid)
+        return 0.5 * (lo + hi)
+    
+    def max(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Maximum GZ over the sampled heel range (roots of dGZ/dφ and end points).
+        
+        Returns:
+            (GZmax in meters, angle of GZmax in degrees), each of shape (N,)
+        """
+        grid = self._subgrid()
+        x, rows = self._rows(grid)
+        slope = self._dgz(x, rows)
+        brackets = (slope[:, :-1] > 0.0) & (slope[:, 1:] <= 0.0)
+        r, j = np.nonzero(brackets)
+        roots = self._bisect(self._dgz, grid[j], grid[j + 1], r)
+        
+        n = len(self)
+        cand_rows = np.concatenate([r, np.arange(n), np.arange(n)])
+        cand_x = np.concatenate([
+            roots, np.full(n, grid[0]), np.full(n, grid[-1])
+        ])
+        cand_gz = self._gz(cand_x, cand_rows)
+        order = np.lexsort((-cand_gz, cand_rows))
+        first = order[np.unique(cand_rows[order], return_index=True)[1]]
+        return cand_gz[first], cand_x[first]
+    
+    def vanishing_angle(self, after_deg=None) -> np.ndarray:
+        """
+        First angle above after_deg (default: angle of GZmax) where GZ falls to zero.
+        
+        Returns:
+            Angle in degrees, shape (N,); NaN if GZ stays positive over the sampled range
+        """
+        if after_deg is None:
+            after_deg = self.max()[1]
+        after = np.broadcast_to(np.asarray(after_deg, dtype=float), (len(self),))
+        grid = self._subgrid()
+        x, rows = self._rows(grid)
+        gz = self._gz(x, rows)
+        cross = (
+            (gz[:, :-1] > 0.0) & (gz[:, 1:] <= 0.0)
+            & (grid[1:][np.newaxis, :] > after[:, np.newaxis])
+        )
+        found = cross.any(axis=1)
+        j = np.argmax(cross, axis=1)
+        r = np.flatnonzero(found)
+        angle = np.full(len(self), np.nan)
+        angle[r] = self._bisect(self._gz, grid[j[r]], grid[j[r] + 1], r)
+        return angle
+
+
+def check_imo_a749_batch(
+    curves: GZCurves,
+    gm_m,
+    downflooding_deg=None
+) -> Dict[str, np.ndarray]:
+    """
+    Check IMO A.749 stability criteria for many GZ curves.
+    
+    Areas "0-40" and "30-40" end at the downflooding angle θf when it is
+    below 40°.
+    
+    Args:
+        curves: GZCurves with N curves
+        gm_m: Metacentric height(s) in meters, scalar or shape (N,)
+        downflooding_deg: Downflooding angle(s) in degrees (default: none)
+    
+    Returns:
+        Columnar results: value columns (see IMO_A749_CRITERIA) plus
+        Vanishing_angle_deg, one bool array per check label and Overall_Pass
+    """
+    n = len(curves)
+    upper = np.full(n, 40.0)
+    if downflooding_deg is not None:
+        upper = np.minimum(upper, np.broadcast_to(np.asarray(downflooding_deg, dtype=float), (n,)))
+    
+    gz_max, angle_max = curves.max()
+    columns = {
+        "GM_m": np.broadcast_to(np.asarray(gm_m, dtype=float), (n,)).copy(),
+        "Area_0_30_mrad": curves.area(0.0, np.minimum(upper, 30.0)),
+        "Area_0_40_mrad": curves.area(0.0, upper),
+        "Area_30_40_mrad": curves.area(30.0, np.maximum(upper, 30.0)),
+        "GZ_30deg_m": curves.gz(30.0),
+        "GZmax_m": gz_max,
+        "Angle_at_GZmax_deg": angle_max,
+        "Vanishing_angle_deg": curves.vanishing_angle(angle_max),
+    }
+    overall = np.ones(n, dtype=bool)
+    for label, column, required, strict in IMO_A749_CRITERIA:
+        passed = columns[column] > required if strict else columns[column] >= required
+        columns[label] = passed
+        overall &= passed
+    columns["Overall_Pass"] = overall
+    return columns
 
 
 def check_imo_a749(
     heel_angles_deg: List[float],
     gz_values_m: List[float],
-    gm_m: float
+    gm_m: float,
+    downflooding_deg: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Check IMO A.749 stability criteria.
@@ -34,88 +323,55 @@ def check_imo_a749(
     6. Maximum GZ >= 0.15 m
     7. Angle at maximum GZ > 15°
     
+    The sampled GZ values are joined with a monotone piecewise cubic; use
+    GZCurves.from_stability + check_imo_a749_batch to evaluate the curve
+    from KN and KG instead.
+    
     Args:
         heel_angles_deg: List of heel angles in degrees
         gz_values_m: List of GZ values in meters (corresponding to heel angles)
         gm_m: Metacentric height in meters
-        
+        downflooding_deg: Downflooding angle in degrees (optional)
+    
     Returns:
         Dictionary with IMO check results
     """
-    heels = np.array(heel_angles_deg, dtype=float)
-    gz = np.array(gz_values_m, dtype=float)
-    
-    # Interpolate to 1° intervals (0° to 40°)
-    fine_angles = np.arange(0.0, 41.0, 1.0)
-    gz_interp = np.interp(fine_angles, heels, gz)
-    
-    # Convert to radians for integration
-    fine_rad = np.deg2rad(fine_angles)
-    
-    # Calculate areas using Simpson integration
-    # Note: simps/simpson expects (y, x) or (y, dx)
-    area_0_30 = float(simps(gz_interp[:31], x=fine_rad[:31]))  # 0° to 30°
-    area_0_40 = float(simps(gz_interp, x=fine_rad))  # 0° to 40°
-    area_30_40 = float(simps(gz_interp[30:], x=fine_rad[30:]))  # 30° to 40°
-    
-    # Get GZ at 30°
-    gz_30 = float(np.interp(30.0, heels, gz))
-    
-    # Get maximum GZ and angle
-    gz_max = float(gz.max())
-    angle_max = float(heels[np.argmax(gz)])
-    
-    # Perform checks
-    checks = {
-        "GM >= 0.15m": {
-            "Value": round(gm_m, 2),
-            "Required": 0.15,
-            "Pass": gm_m >= 0.15
-        },
-        "Area 0-30 (m·rad)": {
-            "Value": round(area_0_30, 3),
-            "Required": 0.055,
-            "Pass": area_0_30 >= 0.055
-        },
-        "Area 0-40 (m·rad)": {
-            "Value": round(area_0_40, 3),
-            "Required": 0.090,
-            "Pass": area_0_40 >= 0.090
-        },
-        "Area 30-40 (m·rad)": {
-            "Value": round(area_30_40, 3),
-            "Required": 0.030,
-            "Pass": area_30_40 >= 0.030
-        },
-        "GZ at 30° (m)": {
-            "Value": round(gz_30, 2),
-            "Required": 0.20,
-            "Pass": gz_30 >= 0.20
-        },
-        "GZmax (m)": {
-            "Value": round(gz_max, 2),
-            "Required": 0.15,
-            "Pass": gz_max >= 0.15
-        },
-        "Angle@GZmax (deg)": {
-            "Value": round(angle_max, 1),
-            "Required": 15.0,
-            "Pass": angle_max > 15.0
-        },
-    }
+    curves = GZCurves(heel_angles_deg, [gz_values_m])
+    batch = check_imo_a749_batch(curves, gm_m, downflooding_deg)
+    return imo_result_row(batch, 0)
+
+
+def imo_result_row(batch: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+    """
+    Format row i of check_imo_a749_batch output as the check_imo_a749 dictionary.
+    
+    Args:
+        batch: check_imo_a749_batch result
+        i: Condition index
+    
+    Returns:
+        Dictionary with IMO check results
+    """
+    value_digits = {"GM_m": 2, "GZ_30deg_m": 2, "GZmax_m": 2, "Angle_at_GZmax_deg": 1}
+    checks = {}
+    for label, column, required, strict in IMO_A749_CRITERIA:
+        checks[label] = {
+            "Value": round(float(batch[column][i]), value_digits.get(column, 3)),
+            "Required": required,
+            "Pass": bool(batch[label][i])
+        }
     
     # Overall pass (all criteria must pass)
-    checks["Overall_Pass"] = all(
-        v["Pass"] for k, v in checks.items() if k != "Overall_Pass"
-    )
+    checks["Overall_Pass"] = bool(batch["Overall_Pass"][i])
     
     # Additional summary values
-    checks["Area_0_30_mrad"] = round(area_0_30, 3)
-    checks["Area_0_40_mrad"] = round(area_0_40, 3)
-    checks["Area_30_40_mrad"] = round(area_30_40, 3)
-    checks["GZ_30deg_m"] = round(gz_30, 3)
-    checks["GZmax_m"] = round(gz_max, 3)
-    checks["Angle_at_GZmax_deg"] = round(angle_max, 1)
+    checks["Area_0_30_mrad"] = round(float(batch["Area_0_30_mrad"][i]), 3)
+    checks["Area_0_40_mrad"] = round(float(batch["Area_0_40_mrad"][i]), 3)
+    checks["Area_30_40_mrad"] = round(float(batch["Area_30_40_mrad"][i]), 3)
+    checks["GZ_30deg_m"] = round(float(batch["GZ_30deg_m"][i]), 3)
+    checks["GZmax_m"] = round(float(batch["GZmax_m"][i]), 3)
+    checks["Angle_at_GZmax_deg"] = round(float(batch["Angle_at_GZmax_deg"][i]), 1)
+    vanishing = float(batch["Vanishing_angle_deg"][i])
+    checks["Vanishing_angle_deg"] = None if np.isnan(vanishing) else round(vanishing, 1)
     
     return checks
-
@@ -0,0 +1,191 @@
+"""
+Parsed-input cache for rarely changing tables (master tanks, tank mapping).
+
+The normalised DataFrame is stored as a NumPy .npz file keyed by a hash of the
+source file content. By default the cache file sits next to the source
+(e.g. master_tanks.csv.master.cache.npz) and is rewritten when the source
+changes; with cache_dir the entries are content-addressed, so uploads written
+to fresh temporary paths still hit the cache.
+
+Cache files are plain arrays (no pickle). Object columns keep a type tag per
+cell (None / str / bool / int / float), so a cache hit returns the same values
+as a fresh parse; tables with other cell types are not cached. A cache that
+cannot be read or written is ignored and the source is parsed as usual.
+"""
+import hashlib
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 2
+CACHE_SUFFIX = ".cache.npz"
+
+# Object-column cell types, indexed by the stored kind tag
+_CELL_TYPES = (type(None), str, bool, int, float)
+_CELL_KINDS = {t: k for k, t in enumerate(_CELL_TYPES)}
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Hex digest of the file content."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+def cache_path_for(
+    source: Union[str, Path],
+    kind: str,
+    digest: str,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    Location of the cache entry for a source file.
+    
+    Args:
+        source: Source file path
+        kind: Table kind (e.g. "master", "mapping"); part of the file name
+        digest: Content digest from file_digest
+        cache_dir: Directory for content-addressed entries (default: next to source)
+    
+    Returns:
+        Cache file path
+    """
+    source = Path(source)
+    if cache_dir is None:
+        return source.with_name(f"{source.name}.{kind}{CACHE_SUFFIX}")
+    return Path(cache_dir) / f"{kind}-{digest}{CACHE_SUFFIX}"
+
+
+def write_frame(df: pd.DataFrame, path: Path, digest: str):
+    """
+    Write a DataFrame to an .npz cache file (atomic replace).
+    
+    Numeric / bool columns are stored as-is; string-dtype columns as strings
+    with a missing-value mask and the dtype name; object columns as strings
+    with a per-cell kind tag (see _CELL_TYPES).
+    
+    Raises:
+        ValueError: Column dtype or cell type that cannot be restored exactly
+    """
+    arrays = {
+        "__version__": np.array(CACHE_VERSION),
+        "__digest__": np.array(digest),
+        "__columns__": np.array([str(c) for c in df.columns]),
+    }
+    for i, name in enumerate(df.columns):
+        column = df[name]
+        if column.dtype.kind in "biuf":
+            arrays[f"c{i}"] = column.to_numpy()
+        elif column.dtype == object:
+            kinds = [_CELL_KINDS.get(type(v)) for v in column]
+            if None in kinds:
+                bad = type(column.iloc[kinds.index(None)]).__name__
+                raise ValueError(f"column {name!r}: cannot cache {bad} values")
+            arrays[f"c{i}"] = np.array([_encode_cell(v) for v in column], dtype=str)
+            arrays[f"k{i}"] = np.array(kinds, dtype=np.int8)
+        elif pd.api.types.is_string_dtype(column.dtype):
+            missing = column.isna().to_numpy()
+            arrays[f"c{i}"] = np.array(["" if m else v for v, m in zip(column, missing)], dtype=str)
+            arrays[f"m{i}"] = missing
+            arrays[f"d{i}"] = np.array(str(column.dtype))
+        else:
+            raise ValueError(f"column {name!r}: cannot cache dtype {column.dtype}")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def read_frame(path: Path, digest: str) -> Optional[pd.DataFrame]:
+    """
+    Read a cached DataFrame, or None if missing, stale or unreadable.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["__version__"]) != CACHE_VERSION or str(data["__digest__"]) != digest:
+                return None
+            columns = {}
+            for i, name in enumerate(data["__columns__"].tolist()):
+                values = data[f"c{i}"]
+                if f"k{i}" in data.files:
+                    kinds = data[f"k{i}"].tolist()
+                    values = np.array(
+                        [_decode_cell(text, kind) for text, kind in zip(values.tolist(), kinds)],
+                        dtype=object,
+                    )
+                elif f"m{i}" in data.files:
+                    values = values.astype(object)
+                    values[data[f"m{i}"]] = None
+                    values = pd.array(values, dtype=str(data[f"d{i}"]))
+                columns[name] = values
+            return pd.DataFrame(columns)
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _encode_cell(value) -> str:
+    """String form of one object-column cell (repr keeps floats exact)."""
+    if value is None:
+        return ""
+    return repr(value) if type(value) is float else str(value)
+
+
+def _decode_cell(text: str, kind: int):
+    """Restore one object-column cell from its string form and kind tag."""
+    cell_type = _CELL_TYPES[kind]
+    if cell_type is type(None):
+        return None
+    if cell_type is bool:
+        return text == "True"
+    return cell_type(text)
+
+
+def cached_frame(
+    source: Union[str, Path],
+    parser: Callable[[Path], pd.DataFrame],
+    kind: str,
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Return parser(source), using the .npz cache when the source is unchanged.
+    
+    File-like sources (e.g. io.BytesIO) are passed to parser uncached.
+    
+    Args:
+        source: Source file path or file-like object
+        parser: Function parsing and normalising the source file
+        kind: Table kind, keeps caches of different parsers apart
+        cache_dir: Directory for content-addressed entries (default: next to source)
+        use_cache: False to always parse the source
+    
+    Returns:
+        Parsed DataFrame
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        return parser(source)  # File-like object: nothing to key a cache file on
+    source = Path(source)
+    if not use_cache:
+        return parser(source)
+    
+    digest = file_digest(source)
+    path = cache_path_for(source, kind, digest, cache_dir)
+    df = read_frame(path, digest)
+    if df is not None:
+        return df
+    
+    df = parser(source)
+    try:
+        write_frame(df, path, digest)
+    except (OSError, ValueError):
+        pass  # Read-only location or uncacheable column: cache is optional
+    return df
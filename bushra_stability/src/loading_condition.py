@@ -0,0 +1,365 @@
+"""
+Incremental loading-condition engine.
+
+LoadingCondition keeps a WeightTable with running moment sums, so changing one
+tank fill, SG or cargo position updates the condition totals in O(1). Trim is
+re-solved only when weight or LCG changed; a VCG/FSM-only change just
+re-evaluates KG, GM and GZ from the cached KN curve. Every change is appended
+to a change log that reporting layers can poll (changes_since) or subscribe to.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .csv_reader import (
+        apply_condition_to_master,
+        calculate_fsm_effect,
+        read_condition,
+        read_master_tanks,
+        read_tank_mapping,
+    )
+    from .displacement import DisplacementResult, WeightTable
+    from .hydrostatic import HydroEngine
+    from .stability import StabilityResult, gz_from_kn, solve_trim_newton
+except ImportError:
+    # Fallback for direct import (testing)
+    from csv_reader import (
+        apply_condition_to_master,
+        calculate_fsm_effect,
+        read_condition,
+        read_master_tanks,
+        read_tank_mapping,
+    )
+    from displacement import DisplacementResult, WeightTable
+    from hydrostatic import HydroEngine
+    from stability import StabilityResult, gz_from_kn, solve_trim_newton
+
+
+@dataclass
+class TankSlot:
+    """Static tank data plus its current fill and SG."""
+    tank_id: str
+    item_id: int  # WeightTable item id
+    capacity_m3: float
+    sg_master: float
+    fsm_full_tm: float
+    percent_fill: float
+    sg: float
+    fsm_scales_with_sg: bool = False  # FSM_full × SG / SG_master (Excel bridge model)
+    
+    @property
+    def weight_t(self) -> float:
+        """Weight in tons = Capacity × Fill × SG."""
+        return self.capacity_m3 * (self.percent_fill / 100.0) * self.sg
+    
+    @property
+    def fsm_tm(self) -> float:
+        """Effective FSM (same model as csv_to_weight_items unless fsm_scales_with_sg)."""
+        fsm_full = self.fsm_full_tm
+        if self.fsm_scales_with_sg and self.sg_master:
+            fsm_full *= self.sg / self.sg_master
+        return calculate_fsm_effect(self.percent_fill, fsm_full)
+
+
+@dataclass
+class ConditionChange:
+    """One entry of the LoadingCondition change log."""
+    seq: int  # Monotonic sequence number (1, 2, ...)
+    kind: str  # "add", "remove", "fill", "sg", "weight", "move"
+    target: str  # Tank ID or item name
+    item_id: int  # WeightTable item id
+    old: Dict[str, Any]  # Changed fields before
+    new: Dict[str, Any]  # Changed fields after
+
+
+class LoadingCondition:
+    """
+    Stateful loading condition with O(1) updates and lazy stability re-solve.
+    
+    Tanks (add_tank) are tracked by Tank_ID and updated by fill % / SG; other
+    items (add_item: light ship, cargo, SPMT axles, ...) by their item id.
+    stability() requires a HydroEngine and uses solve_trim_newton.
+    """
+    
+    def __init__(
+        self,
+        hydro: Optional[HydroEngine] = None,
+        heel_angles_deg: Optional[List[int]] = None,
+        trim_limit_m: float = 2.0
+    ):
+        self.hydro = hydro
+        self.heel_angles_deg = np.asarray(
+            heel_angles_deg if heel_angles_deg is not None else [0, 10, 20, 30, 40, 50, 60]
+        )
+        self.trim_limit_m = trim_limit_m
+        self.table = WeightTable()
+        self.tanks: Dict[str, TankSlot] = {}
+        self._tank_of_item: Dict[int, str] = {}
+        self.change_log: List[ConditionChange] = []
+        self._listeners: List[Callable[[ConditionChange], None]] = []
+        # Cached hydrostatic state; invalidated when weight or LCG changes
+        self._trim_dirty = True
+        self._trim_data: Optional[Dict[str, Any]] = None
+        self._kmt = 0.0
+        self._kn = None
+    
+    @classmethod
+    def from_csv(
+        cls,
+        master_path: Path,
+        mapping_path: Path,
+        condition_path: Path,
+        hydro: Optional[HydroEngine] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        **kwargs
+    ) -> "LoadingCondition":
+        """
+        Build a condition from master / mapping / condition CSV files.
+        
+        Tank weights, coordinates and FSM match csv_to_weight_items; all
+        master tanks are registered (empty ones at 0 %) so later fills are O(1).
+        Master and mapping tables come from the parsed-input cache (cache_dir /
+        use_cache as in csv_to_weight_items).
+        """
+        final_df = apply_condition_to_master(
+            read_master_tanks(master_path, cache_dir, use_cache),
+            read_tank_mapping(mapping_path, cache_dir, use_cache),
+            read_condition(condition_path),
+        )
+        cond = cls(hydro, **kwargs)
+        for row in final_df.to_dict("records"):
+            def value(key, default=None):
+                v = row.get(key)
+                return default if v is None or pd.isna(v) else v
+            
+            tank_id = str(row.get("Tank_ID", "Unknown"))
+            cond.add_tank(
+                tank_id,
+                capacity_m3=float(value("Capacity_m3", 0.0)),
+                lcg=value("LCG_m"),
+                vcg=value("VCG_m"),
+                tcg=value("TCG_m"),
+                sg_master=float(value("SG_Master", 1.0)),
+                fsm_full_tm=float(value("FSM_full_tm", 0.0)),
+                percent_fill=float(value("Percent_Fill", 0.0)),
+                sg=float(value("SG", value("SG_Master", 1.0))),
+                content=value("Content"),
+            )
+        cond.change_log.clear()
+        return cond
+    
+    # ------------------------------------------------------------------ change log
+    def subscribe(self, callback: Callable[[ConditionChange], None]):
+        """Call callback(change) for every future change."""
+        self._listeners.append(callback)
+    
+    def changes_since(self, seq: int = 0) -> List[ConditionChange]:
+        """Changes with sequence number greater than seq."""
+        start = 0
+        if self.change_log:
+            start = max(0, seq - self.change_log[0].seq + 1)
+        return self.change_log[start:]
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest change (0 if none)."""
+        return self.change_log[-1].seq if self.change_log else 0
+    
+    def _publish(self, kind, target, item_id, old, new):
+        if kind != "move" or "lcg" in new:
+            self._trim_dirty = True
+        change = ConditionChange(self.last_seq + 1, kind, target, item_id, old, new)
+        self.change_log.append(change)
+        for callback in self._listeners:
+            callback(change)
+        return change
+    
+    # ------------------------------------------------------------------ mutation
+    def add_item(
+        self,
+        name: str,
+        weight: float,
+        lcg: Optional[float] = None,
+        vcg: Optional[float] = None,
+        tcg: Optional[float] = None,
+        fsm: float = 0.0,
+        group: Optional[str] = None
+    ) -> int:
+        """Add a fixed weight item (light ship, cargo, ...) and return its id."""
+        item_id = self.table.add(name, weight, lcg, vcg, tcg, fsm, group)
+        self._publish("add", name, item_id, {}, {"weight": weight, "lcg": lcg, "vcg": vcg, "tcg": tcg})
+        return item_id
+    
+    def add_tank(
+        self,
+        tank_id: str,
+        capacity_m3: float,
+        lcg: Optional[float],
+        vcg: Optional[float],
+        tcg: Optional[float],
+        sg_master: float = 1.0,
+        fsm_full_tm: float = 0.0,
+        percent_fill: float = 0.0,
+        sg: Optional[float] = None,
+        content: Optional[str] = None,
+        group: Optional[str] = None,
+        fsm_scales_with_sg: bool = False
+    ) -> TankSlot:
+        """Register a tank with its current fill (%) and SG (default: SG master)."""
+        if tank_id in self.tanks:
+            raise ValueError(f"Duplicate tank: {tank_id}")
+        slot = TankSlot(
+            tank_id=tank_id,
+            item_id=-1,
+            capacity_m3=capacity_m3,
+            sg_master=sg_master,
+            fsm_full_tm=fsm_full_tm,
+            percent_fill=percent_fill,
+            sg=sg_master if sg is None else sg,
+            fsm_scales_with_sg=fsm_scales_with_sg,
+        )
+        name = tank_id if content is None else f"{tank_id} ({content})"
+        slot.item_id = self.table.add(
+            name, slot.weight_t, lcg, vcg, tcg, slot.fsm_tm, group if group is not None else content
+        )
+        self.tanks[tank_id] = slot
+        self._tank_of_item[slot.item_id] = tank_id
+        self._publish("add", tank_id, slot.item_id, {}, {"percent_fill": percent_fill, "sg": slot.sg})
+        return slot
+    
+    def _tank(self, tank_id: str) -> TankSlot:
+        try:
+            return self.tanks[tank_id]
+        except KeyError:
+            raise KeyError(f"Unknown tank: {tank_id}") from None
+    
+    def set_fill(self, tank_id: str, percent_fill: float) -> Optional[ConditionChange]:
+        """Change a tank's fill (%, clipped to 0-100) in O(1); no-op if unchanged."""
+        slot = self._tank(tank_id)
+        percent_fill = float(min(max(percent_fill, 0.0), 100.0))
+        if percent_fill == slot.percent_fill:
+            return None
+        old = slot.percent_fill
+        slot.percent_fill = percent_fill
+        self.table.update(slot.item_id, weight=slot.weight_t, fsm=slot.fsm_tm)
+        return self._publish("fill", tank_id, slot.item_id, {"percent_fill": old}, {"percent_fill": percent_fill})
+    
+    def set_sg(self, tank_id: str, sg: float) -> Optional[ConditionChange]:
+        """Change a tank's SG in O(1); no-op if unchanged."""
+        slot = self._tank(tank_id)
+        sg = float(sg)
+        if sg == slot.sg:
+            return None
+        old = slot.sg
+        slot.sg = sg
+        self.table.update(slot.item_id, weight=slot.weight_t, fsm=slot.fsm_tm)
+        return self._publish("sg", tank_id, slot.item_id, {"sg": old}, {"sg": sg})
+    
+    def apply_fills(
+        self,
+        percent_fill_by_id: Mapping[str, float],
+        sg_by_id: Optional[Mapping[str, float]] = None
+    ) -> List[ConditionChange]:
+        """Apply a tank plan; only tanks whose fill / SG differ are updated."""
+        changes = []
+        for tank_id, sg in (sg_by_id or {}).items():
+            changes.append(self.set_sg(tank_id, sg))
+        for tank_id, percent_fill in percent_fill_by_id.items():
+            changes.append(self.set_fill(tank_id, percent_fill))
+        return [c for c in changes if c is not None]
+    
+    def _fixed_item(self, item_id: int):
+        tank_id = self._tank_of_item.get(item_id)
+        if tank_id is not None:
+            raise ValueError(f"Item {item_id} is tank {tank_id}; use set_fill / set_sg instead")
+        return self.table.item(item_id)
+    
+    def set_weight(self, item_id: int, weight: float) -> ConditionChange:
+        """Change a fixed item's weight in O(1); tanks go through set_fill / set_sg."""
+        old = self._fixed_item(item_id)
+        self.table.update(item_id, weight=weight)
+        return self._publish("weight", old.name, item_id, {"weight": old.weight}, {"weight": weight})
+    
+    def move_item(
+        self,
+        item_id: int,
+        lcg: Optional[float] = None,
+        vcg: Optional[float] = None,
+        tcg: Optional[float] = None
+    ) -> ConditionChange:
+        """Move a fixed item (cargo shift); only the given coordinates change."""
+        fields = {k: v for k, v in (("lcg", lcg), ("vcg", vcg), ("tcg", tcg)) if v is not None}
+        old = self._fixed_item(item_id)
+        self.table.update(item_id, **fields)
+        return self._publish(
+            "move", old.name, item_id, {k: getattr(old, k) for k in fields}, fields
+        )
+    
+    def remove_item(self, item_id: int) -> ConditionChange:
+        """Remove an item or tank in O(1)."""
+        old = self.table.item(item_id)
+        self.table.remove(item_id)
+        target = self._tank_of_item.pop(item_id, None)
+        if target is None:
+            target = old.name
+        else:
+            del self.tanks[target]
+        return self._publish("remove", target, item_id, {"weight": old.weight}, {})
+    
+    # ------------------------------------------------------------------ results
+    def set_hydro(self, hydro: HydroEngine):
+        """Use another HydroEngine; trim is re-solved on the next stability()."""
+        if hydro is not self.hydro:
+            self.hydro = hydro
+            self._trim_dirty = True
+    
+    def displacement(self) -> DisplacementResult:
+        """Current totals from the running sums."""
+        return self.table.result()
+    
+    def stability(self) -> StabilityResult:
+        """
+        Current stability, re-solving trim only if weight or LCG changed.
+        
+        Raises:
+            ValueError: If no HydroEngine is set or the condition is empty
+        """
+        if self.hydro is None:
+            raise ValueError("LoadingCondition has no HydroEngine for stability")
+        disp = self.displacement()
+        if self._trim_dirty:
+            self._trim_data = solve_trim_newton(
+                disp.total_weight, disp.lcg, self.hydro, trim_limit_m=self.trim_limit_m
+            )
+            trim = self._trim_data["trim"]
+            self._kmt = self.hydro.KMT(disp.total_weight, trim)
+            self._kn = self.hydro.KN_batch(disp.total_weight, self.heel_angles_deg, trim)[0]
+            self._trim_dirty = False
+        
+        trim_data = self._trim_data
+        kg_corrected = disp.vcg + disp.total_fsm / disp.total_weight
+        return StabilityResult(
+            total_weight=disp.total_weight,
+            lcg=disp.lcg,
+            vcg=disp.vcg,
+            tcg=disp.tcg,
+            total_fsm=disp.total_fsm,
+            kg_corrected=kg_corrected,
+            kmt=self._kmt,
+            gm=self._kmt - kg_corrected,
+            trim=trim_data["trim"],
+            draft_mean=trim_data["draft_mean"],
+            draft_fwd=trim_data["draft_fwd"],
+            draft_aft=trim_data["draft_aft"],
+            lcb=trim_data["lcb"],
+            mtc=trim_data["mtc"],
+            heel_angles_deg=self.heel_angles_deg,
+            kn=self._kn,
+            gz=gz_from_kn(self._kn, kg_corrected, self.heel_angles_deg),
+            trim_history=trim_data["trim_history"],
+        )
@@ -80,7 +80,7 @@ def export_stability_json(
 def export_stability_excel(
     result: StabilityResult,
     items: List[Any],  # WeightItem or DataFrame rows
-    imo_check: Optional[Dict[str, Any]] = None,
+    imo_check: Optional[Dict[str, Any]],
     output_path: Path
 ) -> str:
     """
@@ -216,8 +216,8 @@ def export_stability_excel(
 
 def export_stability_pdf(
     result: StabilityResult,
-    vessel_name: str = "BUSHRA",
-    imo_check: Optional[Dict[str, Any]] = None,
+    vessel_name: str,
+    imo_check: Optional[Dict[str, Any]],
     output_path: Path
 ) -> str:
     """
@@ -5,9 +5,11 @@ This module extends basic displacement calculations with:
 - Trim iterative calculation
 - GZ curve calculation
 - KG correction with FSM
+- Batched (columnar) stability over many loading conditions
 """
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import numpy as np
 
 try:
@@ -31,9 +33,328 @@ class StabilityResult(DisplacementResult):
     draft_aft: float  # Aft draft
     lcb: float  # Longitudinal center of buoyancy
     mtc: float  # Moment to change trim (t·m/cm)
-    kn_curve: Dict[int, float]  # Heel angle (deg) -> KN (m)
-    gz_curve: Dict[int, float]  # Heel angle (deg) -> GZ (m)
+    heel_angles_deg: np.ndarray  # (H,) heel angles (deg)
+    kn: np.ndarray  # (H,) KN (m) at heel_angles_deg
+    gz: np.ndarray  # (H,) GZ (m) at heel_angles_deg
     trim_history: Optional[List[Dict[str, float]]] = None  # Trim iteration history
+    
+    @cached_property
+    def kn_curve(self) -> Dict[int, float]:
+        """Heel angle (deg) -> KN (m)."""
+        return _curve_dict(self.heel_angles_deg, self.kn)
+    
+    @cached_property
+    def gz_curve(self) -> Dict[int, float]:
+        """Heel angle (deg) -> GZ (m)."""
+        return _curve_dict(self.heel_angles_deg, self.gz)
+
+
+def _curve_dict(heel_angles_deg: np.ndarray, values: np.ndarray) -> Dict[int, float]:
+    """Dictionary view of a sampled curve keyed by integer heel angle."""
+    return {int(angle): value for angle, value in zip(heel_angles_deg.tolist(), values.tolist())}
+
+
+@dataclass
+class StabilityBatchResult:
+    """
+    Columnar stability results for N loading conditions.
+    
+    Every per-condition field is an array of shape (N,); kn and gz have
+    shape (N, H) with columns ordered as heel_angles_deg.
+    """
+    total_weight: np.ndarray
+    lcg: np.ndarray
+    vcg: np.ndarray
+    tcg: np.ndarray
+    total_fsm: np.ndarray
+    kg_corrected: np.ndarray
+    kmt: np.ndarray
+    gm: np.ndarray
+    trim: np.ndarray
+    draft_mean: np.ndarray
+    draft_fwd: np.ndarray
+    draft_aft: np.ndarray
+    lcb: np.ndarray
+    mtc: np.ndarray
+    trim_status: np.ndarray  # solve_trim_newton status per condition
+    trim_evaluations: np.ndarray  # Hydrostatic evaluations per condition
+    heel_angles_deg: List[int]
+    kn: np.ndarray  # (N, H) KN (m)
+    gz: np.ndarray  # (N, H) GZ (m)
+    
+    def __len__(self) -> int:
+        return len(self.total_weight)
+    
+    def result(self, i: int) -> StabilityResult:
+        """Get condition i as a StabilityResult (without trim history)."""
+        return StabilityResult(
+            total_weight=float(self.total_weight[i]),
+            lcg=float(self.lcg[i]),
+            vcg=float(self.vcg[i]),
+            tcg=float(self.tcg[i]),
+            total_fsm=float(self.total_fsm[i]),
+            kg_corrected=float(self.kg_corrected[i]),
+            kmt=float(self.kmt[i]),
+            gm=float(self.gm[i]),
+            trim=float(self.trim[i]),
+            draft_mean=float(self.draft_mean[i]),
+            draft_fwd=float(self.draft_fwd[i]),
+            draft_aft=float(self.draft_aft[i]),
+            lcb=float(self.lcb[i]),
+            mtc=float(self.mtc[i]),
+            heel_angles_deg=np.asarray(self.heel_angles_deg),
+            kn=self.kn[i],
+            gz=self.gz[i],
+        )
+
+
+# Evaluation cap for the Newton trim solver (each evaluation = one interpolator call)
+NEWTON_MAX_EVALUATIONS = 50
+
+
+def solve_trim_newton(
+    displacement: float,
+    lcg: float,
+    hydro: HydroEngine,
+    trim_limit_m: float = 2.0,
+    tol: float = 1e-6,
+    max_evaluations: int = NEWTON_MAX_EVALUATIONS
+) -> Dict[str, Any]:
+    """
+    Solve the equilibrium trim with safeguarded Newton steps.
+    
+    Solves f(T) = T - Δ * (LCB(T) - LCG) / (MTC(T) / 100) = 0 on
+    [-trim_limit_m, trim_limit_m]. f'(T) uses the interpolant's analytic
+    ∂LCB/∂trim and ∂MTC/∂trim (HydroEngine.query_trim_gradient), so each
+    evaluation is a single interpolator call that also returns the mean draft.
+    Every evaluation shrinks a bracket around the root from the sign of f,
+    anchored to f(-limit) <= 0 <= f(+limit): f > 0 puts the root below the
+    evaluated trim, f < 0 above it. Newton steps leaving the bracket fall back
+    to the trim limit (if not yet evaluated) or bisection; a non-positive
+    slope always bisects. The returned values belong to the last evaluated trim.
+    
+    Args:
+        displacement: Total displacement in tons
+        lcg: Longitudinal center of gravity in meters
+        hydro: HydroEngine instance
+        trim_limit_m: Maximum trim limit (solution is clipped to ±limit)
+        tol: Convergence tolerance on |f(T)| in meters
+        max_evaluations: Maximum number of hydrostatic evaluations
+        
+    Returns:
+        Dictionary with the calculate_trim_iterative keys plus diagnostics:
+        status ("converged", "trim_limit", "max_evaluations",
+        "interpolation_error" or "invalid_hydrostatics"), residual_m,
+        evaluations and bracket
+    """
+    props = ("LCB", "MTC") + (("Draft",) if "Draft" in hydro.hydro_properties else ())
+    lo, hi = -trim_limit_m, trim_limit_m
+    lo_known = hi_known = False
+    trim = 0.0
+    evaluated_trim = 0.0
+    status = "max_evaluations"
+    residual = float("nan")
+    lcb = mtc = mean_draft = float("nan")
+    trim_history = []
+    evaluations = 0
+    
+    while evaluations < max_evaluations:
+        try:
+            values, grads = hydro.query_trim_gradient(displacement, trim, props)
+        except Exception:
+            status = "interpolation_error"
+            break
+        evaluations += 1
+        evaluated_trim = trim
+        lcb = float(values["LCB"])
+        mtc = float(values["MTC"])  # t·m/cm
+        mean_draft = float(values["Draft"]) if "Draft" in values else float("nan")
+        if not np.isfinite(lcb) or not np.isfinite(mtc) or abs(mtc) < 1e-6:
+            status = "invalid_hydrostatics"
+            break
+        
+        # Trim implied by the moment balance and its derivative w.r.t. trim
+        lever = lcb - lcg
+        target = displacement * lever / (mtc / 100.0)
+        d_target = (
+            displacement * 100.0
+            * (float(grads["LCB"]) * mtc - lever * float(grads["MTC"]))
+            / mtc ** 2
+        )
+        residual = trim - target
+        slope = 1.0 - d_target
+        
+        # Newton step (only taken while f' > 0, otherwise the bracket is bisected)
+        step = residual / slope if slope != 0.0 else residual
+        new_trim = trim - step
+        trim_history.append({
+            "iter": evaluations,
+            "trim": float(trim),
+            "LCB": lcb,
+            "MTC": mtc,
+            "new_trim": float(new_trim),
+            "residual": float(residual),
+        })
+        if abs(residual) <= tol:
+            status = "converged"
+            break
+        
+        # The residual sign tells which side of trim holds the root
+        if residual > 0.0:
+            hi, hi_known = trim, True
+        else:
+            lo, lo_known = trim, True
+        
+        if (trim == trim_limit_m and residual < 0.0) or (trim == -trim_limit_m and residual > 0.0):
+            # Root beyond the evaluated limit: clip
+            status = "trim_limit"
+            break
+        
+        if slope <= 0.0:
+            new_trim = 0.5 * (lo + hi)
+        elif not lo < new_trim < hi:
+            if new_trim >= hi and not hi_known:
+                new_trim = hi
+            elif new_trim <= lo and not lo_known:
+                new_trim = lo
+            else:
+                new_trim = 0.5 * (lo + hi)
+        trim = new_trim
+    
+    if not np.isfinite(mean_draft):
+        mean_draft = 0.0
+    trim = evaluated_trim
+    
+    return {
+        "trim": float(trim),
+        "draft_mean": mean_draft,
+        "draft_fwd": mean_draft - trim / 2.0,
+        "draft_aft": mean_draft + trim / 2.0,
+        "lcb": lcb if np.isfinite(lcb) else 0.0,
+        "mtc": mtc if np.isfinite(mtc) else 0.0,
+        "converged": status == "converged",
+        "iterations_used": evaluations,
+        "trim_history": trim_history,
+        "status": status,
+        "residual_m": float(residual),
+        "evaluations": evaluations,
+        "bracket": (float(lo), float(hi)),
+    }
+
+
+def solve_trim_newton_batch(
+    displacement: np.ndarray,
+    lcg: np.ndarray,
+    hydro: HydroEngine,
+    trim_limit_m: float = 2.0,
+    tol: float = 1e-6,
+    max_evaluations: int = NEWTON_MAX_EVALUATIONS
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorised solve_trim_newton for N conditions.
+    
+    All unconverged conditions are advanced together, one interpolator call
+    per Newton step; converged / clipped conditions drop out of later calls.
+    Bracketing and safeguards are the same as in solve_trim_newton.
+    Interpolation errors propagate instead of being reported per condition.
+    
+    Args:
+        displacement: Displacements in tons, shape (N,)
+        lcg: Longitudinal centers of gravity in meters, shape (N,)
+        hydro: HydroEngine instance
+        trim_limit_m: Maximum trim limit (solution is clipped to ±limit)
+        tol: Convergence tolerance on |f(T)| in meters
+        max_evaluations: Maximum number of Newton steps
+        
+    Returns:
+        Dictionary of (N,) arrays: trim, draft_mean, lcb, mtc, status,
+        residual_m, evaluations
+    """
+    disp = np.asarray(displacement, dtype=float)
+    lcg = np.asarray(lcg, dtype=float)
+    n = len(disp)
+    props = ("LCB", "MTC") + (("Draft",) if "Draft" in hydro.hydro_properties else ())
+    
+    trim = np.zeros(n)  # last evaluated trim
+    point = np.zeros(n)  # next trim to evaluate
+    lo = np.full(n, -trim_limit_m)
+    hi = np.full(n, trim_limit_m)
+    lo_known = np.zeros(n, dtype=bool)
+    hi_known = np.zeros(n, dtype=bool)
+    lcb = np.full(n, np.nan)
+    mtc = np.full(n, np.nan)
+    mean_draft = np.full(n, np.nan)
+    residual = np.full(n, np.nan)
+    evaluations = np.zeros(n, dtype=int)
+    status = np.full(n, "max_evaluations", dtype=object)
+    active = np.arange(n)
+    
+    for _ in range(max_evaluations):
+        if not len(active):
+            break
+        values, grads = hydro.query_trim_gradient(disp[active], point[active], props)
+        evaluations[active] += 1
+        trim[active] = point[active]
+        a_lcb = values["LCB"]
+        a_mtc = values["MTC"]
+        lcb[active] = a_lcb
+        mtc[active] = a_mtc
+        if "Draft" in values:
+            mean_draft[active] = values["Draft"]
+        
+        invalid = ~np.isfinite(a_lcb) | ~np.isfinite(a_mtc) | (np.abs(a_mtc) < 1e-6)
+        a_mtc = np.where(invalid, 1.0, a_mtc)
+        lever = a_lcb - lcg[active]
+        target = disp[active] * lever / (a_mtc / 100.0)
+        d_target = (
+            disp[active] * 100.0
+            * (grads["LCB"] * a_mtc - lever * grads["MTC"])
+            / a_mtc ** 2
+        )
+        t = trim[active]
+        res = t - target
+        slope = 1.0 - d_target
+        step = np.divide(res, slope, out=res.copy(), where=slope != 0.0)
+        new_trim = t - step
+        residual[active] = np.where(invalid, np.nan, res)
+        
+        converged = ~invalid & (np.abs(res) <= tol)
+        go_down = res > 0.0
+        hi[active] = np.where(go_down, t, hi[active])
+        hi_known[active] |= go_down
+        lo[active] = np.where(go_down, lo[active], t)
+        lo_known[active] |= ~go_down
+        at_limit = ~invalid & ~converged & (
+            ((t == trim_limit_m) & (res < 0.0)) | ((t == -trim_limit_m) & (res > 0.0))
+        )
+        status[active[invalid]] = "invalid_hydrostatics"
+        status[active[converged]] = "converged"
+        status[active[at_limit]] = "trim_limit"
+        
+        # Safeguard: limit if not yet evaluated, otherwise bisect the bracket
+        a_lo, a_hi = lo[active], hi[active]
+        newton = slope > 0.0
+        outside = newton & ~((a_lo < new_trim) & (new_trim < a_hi))
+        to_hi = outside & (new_trim >= a_hi) & ~hi_known[active]
+        to_lo = outside & (new_trim <= a_lo) & ~lo_known[active]
+        bisect = ~newton | (outside & ~to_hi & ~to_lo)
+        new_trim = np.where(to_hi, a_hi, new_trim)
+        new_trim = np.where(to_lo, a_lo, new_trim)
+        new_trim = np.where(bisect, 0.5 * (a_lo + a_hi), new_trim)
+        
+        keep = ~(invalid | converged | at_limit)
+        point[active[keep]] = new_trim[keep]
+        active = active[keep]
+    
+    return {
+        "trim": trim,
+        "draft_mean": np.where(np.isfinite(mean_draft), mean_draft, 0.0),
+        "lcb": np.where(np.isfinite(lcb), lcb, 0.0),
+        "mtc": np.where(np.isfinite(mtc), mtc, 0.0),
+        "status": status,
+        "residual_m": residual,
+        "evaluations": evaluations,
+    }
 
 
 def calculate_trim_iterative(
@@ -42,7 +363,9 @@ def calculate_trim_iterative(
     hydro: HydroEngine,
     iterations: int = 5,
     trim_limit_m: float = 2.0,
-    convergence_tol: float = 0.001
+    convergence_tol: float = 0.001,
+    method: str = "fixed_point",
+    newton_tol: float = 1e-6
 ) -> Dict[str, Any]:
     """
     Calculate trim iteratively using LCB and MTC with enhanced stability.
@@ -54,13 +377,24 @@ def calculate_trim_iterative(
         iterations: Number of trim iterations (increased default to 5)
         trim_limit_m: Maximum trim limit (safety check)
         convergence_tol: Convergence tolerance in meters (default: 1mm)
+        method: "fixed_point" (default) or "newton" (see solve_trim_newton;
+            iterations / convergence_tol are ignored, nothing is printed)
+        newton_tol: Convergence tolerance for method="newton" in meters
         
     Returns:
         Dictionary with trim, drafts, LCB, MTC, convergence status, and trim_history
         
     Raises:
+        ValueError: If method is unknown
         Warning: If trim exceeds limit or doesn't converge
     """
+    if method == "newton":
+        return solve_trim_newton(
+            displacement, lcg, hydro, trim_limit_m=trim_limit_m, tol=newton_tol
+        )
+    if method != "fixed_point":
+        raise ValueError(f"Unknown trim method: {method!r}")
+    
     trim = 0.0
     converged = False
     prev_trim = None
@@ -69,8 +403,9 @@ def calculate_trim_iterative(
     for i in range(iterations):
         # Get LCB and MTC at current displacement and trim
         try:
-            lcb = hydro.LCB(displacement, trim)
-            mtc = hydro.MTC(displacement, trim)  # t·m/cm
+            hp = hydro.query(displacement, trim, ("LCB", "MTC"))
+            lcb = float(hp["LCB"])
+            mtc = float(hp["MTC"])  # t·m/cm
         except Exception as e:
             print(f"[Warning] Hydrostatic interpolation failed at iter {i+1}: {e}")
             break
@@ -143,6 +478,23 @@ def calculate_trim_iterative(
     }
 
 
+def gz_from_kn(kn, kg_corrected, heel_angles_deg) -> np.ndarray:
+    """
+    GZ = KN - KGc × sin(heel) as one array expression.
+    
+    Args:
+        kn: KN values (m), shape (H,) or (N, H)
+        kg_corrected: Corrected KG (m), scalar or shape (N,)
+        heel_angles_deg: Heel angles in degrees, shape (H,)
+        
+    Returns:
+        GZ (m) with the shape of kn
+    """
+    sin_heel = np.sin(np.deg2rad(np.asarray(heel_angles_deg, dtype=float)))
+    kg = np.asarray(kg_corrected, dtype=float)
+    return np.asarray(kn, dtype=float) - kg[..., np.newaxis] * sin_heel
+
+
 def calculate_gz_curve(
     displacement: float,
     kg_corrected: float,
@@ -165,18 +517,9 @@ def calculate_gz_curve(
     Returns:
         Dictionary mapping heel angle (deg) to GZ (m)
     """
-    # Get KN curve
-    kn_curve = hydro.KN_curve(displacement, heel_angles_deg, trim)
-    
-    # Calculate GZ for each angle
-    gz_curve = {}
-    for heel_deg in heel_angles_deg:
-        kn = kn_curve[heel_deg]
-        heel_rad = np.deg2rad(heel_deg)
-        gz = kn - kg_corrected * np.sin(heel_rad)
-        gz_curve[heel_deg] = gz
-    
-    return gz_curve
+    kn = hydro.KN_batch(displacement, heel_angles_deg, trim)[0]
+    gz = gz_from_kn(kn, kg_corrected, heel_angles_deg)
+    return _curve_dict(np.asarray(heel_angles_deg), gz)
 
 
 def calculate_stability(
@@ -184,7 +527,8 @@ def calculate_stability(
     hydro: HydroEngine,
     heel_angles_deg: Optional[List[int]] = None,
     trim_iterations: int = 3,
-    trim_limit_m: float = 2.0
+    trim_limit_m: float = 2.0,
+    trim_method: str = "fixed_point"
 ) -> StabilityResult:
     """
     Calculate full stability including GZ curve and trim.
@@ -195,6 +539,7 @@ def calculate_stability(
         heel_angles_deg: List of heel angles for GZ curve (default: [0, 10, 20, 30, 40, 50, 60])
         trim_iterations: Number of trim iterations
         trim_limit_m: Maximum trim limit
+        trim_method: Trim solver, "fixed_point" or "newton"
         
     Returns:
         StabilityResult with all stability parameters
@@ -220,7 +565,8 @@ def calculate_stability(
         disp_result.lcg,
         hydro,
         iterations=trim_iterations,
-        trim_limit_m=trim_limit_m
+        trim_limit_m=trim_limit_m,
+        method=trim_method
     )
     
     # Get KMT at final trim
@@ -229,19 +575,10 @@ def calculate_stability(
     # Calculate GM
     gm = kmt - kg_corrected
     
-    # Calculate GZ curve
-    kn_curve = hydro.KN_curve(
-        disp_result.total_weight,
-        heel_angles_deg,
-        trim_data["trim"]
-    )
-    gz_curve = calculate_gz_curve(
-        disp_result.total_weight,
-        kg_corrected,
-        trim_data["trim"],
-        heel_angles_deg,
-        hydro
-    )
+    # Calculate GZ curve from a single KN evaluation
+    heels = np.asarray(heel_angles_deg)
+    kn = hydro.KN_batch(disp_result.total_weight, heels, trim_data["trim"])[0]
+    gz = gz_from_kn(kn, kg_corrected, heels)
     
     return StabilityResult(
         total_weight=disp_result.total_weight,
@@ -258,8 +595,130 @@ def calculate_stability(
         draft_aft=trim_data["draft_aft"],
         lcb=trim_data["lcb"],
         mtc=trim_data["mtc"],
-        kn_curve=kn_curve,
-        gz_curve=gz_curve,
+        heel_angles_deg=heels,
+        kn=kn,
+        gz=gz,
         trim_history=trim_data.get("trim_history"),
     )
 
+
+def stack_conditions(
+    conditions: Sequence[List[WeightItem]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate N conditions' weights and moments into (N,) arrays.
+    
+    Matches calculate_displacement per condition: missing (None) coordinates
+    contribute no moment but their weight still counts.
+    
+    Args:
+        conditions: Sequence of WeightItem lists
+        
+    Returns:
+        (total_weight, lcg, vcg, tcg, total_fsm), each of shape (N,)
+        
+    Raises:
+        ValueError: If a condition is empty or has zero total weight
+    """
+    n = len(conditions)
+    sizes = np.array([len(items) for items in conditions], dtype=int)
+    if n == 0 or (sizes == 0).any():
+        raise ValueError("Cannot calculate displacement from empty item list")
+    
+    owner = np.repeat(np.arange(n), sizes)
+    flat = [item for items in conditions for item in items]
+    weight = np.array([item.weight for item in flat], dtype=float)
+    coords = np.array(
+        [
+            [
+                0.0 if item.lcg is None else item.lcg,
+                0.0 if item.vcg is None else item.vcg,
+                0.0 if item.tcg is None else item.tcg,
+            ]
+            for item in flat
+        ],
+        dtype=float,
+    ).reshape(-1, 3)
+    fsm = np.array([item.fsm for item in flat], dtype=float)
+    
+    total_weight = np.bincount(owner, weights=weight, minlength=n)
+    if (total_weight == 0).any():
+        raise ValueError("Total weight cannot be zero")
+    moments = [
+        np.bincount(owner, weights=weight * coords[:, k], minlength=n)
+        for k in range(3)
+    ]
+    total_fsm = np.bincount(owner, weights=fsm, minlength=n)
+    return (
+        total_weight,
+        moments[0] / total_weight,
+        moments[1] / total_weight,
+        moments[2] / total_weight,
+        total_fsm,
+    )
+
+
+def calculate_stability_batch(
+    conditions: Sequence[List[WeightItem]],
+    hydro: HydroEngine,
+    heel_angles_deg: Optional[List[int]] = None,
+    trim_limit_m: float = 2.0
+) -> StabilityBatchResult:
+    """
+    Calculate stability for many loading conditions at once.
+    
+    Same pipeline as calculate_stability(trim_method="newton"), with each
+    stage evaluated for all conditions together: one stacked weight
+    aggregation, a joint Newton trim solve (solve_trim_newton_batch), one
+    KMT query and one KN interpolation over the (N, H) condition × heel grid.
+    
+    Args:
+        conditions: Sequence of WeightItem lists (one per loading condition)
+        hydro: HydroEngine instance
+        heel_angles_deg: List of heel angles for GZ curve (default: [0, 10, 20, 30, 40, 50, 60])
+        trim_limit_m: Maximum trim limit
+        
+    Returns:
+        StabilityBatchResult with (N,) / (N, H) arrays
+        
+    Raises:
+        ValueError: If a condition is empty or has zero total weight
+    """
+    if heel_angles_deg is None:
+        heel_angles_deg = [0, 10, 20, 30, 40, 50, 60]
+    heel_angles_deg = list(heel_angles_deg)
+    
+    total_weight, lcg, vcg, tcg, total_fsm = stack_conditions(conditions)
+    kg_corrected = vcg + total_fsm / total_weight
+    
+    trim_data = solve_trim_newton_batch(
+        total_weight, lcg, hydro, trim_limit_m=trim_limit_m
+    )
+    trim = trim_data["trim"]
+    kmt = hydro.query(total_weight, trim, ("KMT",))["KMT"]
+    
+    kn = hydro.KN_batch(total_weight, heel_angles_deg, trim)
+    gz = gz_from_kn(kn, kg_corrected, heel_angles_deg)
+    
+    draft_mean = trim_data["draft_mean"]
+    return StabilityBatchResult(
+        total_weight=total_weight,
+        lcg=lcg,
+        vcg=vcg,
+        tcg=tcg,
+        total_fsm=total_fsm,
+        kg_corrected=kg_corrected,
+        kmt=kmt,
+        gm=kmt - kg_corrected,
+        trim=trim,
+        draft_mean=draft_mean,
+        draft_fwd=draft_mean - trim / 2.0,
+        draft_aft=draft_mean + trim / 2.0,
+        lcb=trim_data["lcb"],
+        mtc=trim_data["mtc"],
+        trim_status=trim_data["status"],
+        trim_evaluations=trim_data["evaluations"],
+        heel_angles_deg=heel_angles_deg,
+        kn=kn,
+        gz=gz,
+    )
@@ -7,8 +7,9 @@ import streamlit as st
 from pathlib import Path
 import pandas as pd
 import json
+import hashlib
+import io
 import tempfile
-import os
 import sys
 
 # Handle both relative and absolute imports
@@ -26,6 +27,10 @@ try:
     except ImportError:
         HYDROSTATIC_AVAILABLE = False
         HydroEngine = None
+    try:
+        from .loading_condition import LoadingCondition
+    except ImportError:
+        LoadingCondition = None
 except ImportError:
     # Fallback for direct execution
     from excel_reader import read_weight_items_from_excel
@@ -41,6 +46,101 @@ except ImportError:
     except ImportError:
         HYDROSTATIC_AVAILABLE = False
         HydroEngine = None
+    try:
+        from loading_condition import LoadingCondition
+    except ImportError:
+        LoadingCondition = None
+
+
+# ---------------------------------------------------------------------------
+# Cached pipeline stages
+#
+# Streamlit reruns main() on every widget change. Each stage below is cached on
+# the content of its inputs (uploaded bytes are hashed by st.cache_data /
+# st.cache_resource, derived stages are keyed by content_key), so a rerun only
+# recomputes stages whose inputs changed. Uploads are read from memory buffers.
+# In CSV mode the tank condition is a LoadingCondition kept in st.session_state,
+# so a tank-fill edit updates only that tank and re-solves trim only if needed.
+# ---------------------------------------------------------------------------
+
+def content_key(*parts: bytes) -> str:
+    """Hash of one or more byte strings (cache key for derived stages)."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_excel_items(data: bytes, sheet_name: str) -> list[WeightItem]:
+    """Weight items from an uploaded workbook (re-read only on new content/sheet)."""
+    return read_weight_items_from_excel(io.BytesIO(data), sheet_name=sheet_name)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_csv_items(master: bytes, mapping: bytes, condition: bytes) -> list[WeightItem]:
+    """Weight items from uploaded master / mapping / condition CSVs."""
+    return csv_to_weight_items(io.BytesIO(master), io.BytesIO(mapping), io.BytesIO(condition))
+
+
+def session_condition(buffers: list[bytes]) -> tuple["LoadingCondition", pd.DataFrame]:
+    """
+    LoadingCondition of the uploaded master / mapping / condition CSVs.
+    
+    Built once per upload content and kept in st.session_state; returns the
+    condition and its initial tank table (Tank_ID, Percent_Fill, SG).
+    """
+    key = content_key(*buffers)
+    state = st.session_state.get("loading_condition")
+    if state is None or state[0] != key:
+        condition = LoadingCondition.from_csv(*(io.BytesIO(b) for b in buffers))
+        tanks = pd.DataFrame(
+            [(slot.tank_id, slot.percent_fill, slot.sg) for slot in condition.tanks.values()],
+            columns=["Tank_ID", "Percent_Fill", "SG"],
+        )
+        state = st.session_state["loading_condition"] = (key, condition, tanks)
+    return state[1], state[2]
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_hydro_engine(hydro: bytes, kn: bytes) -> "HydroEngine":
+    """HydroEngine shared across reruns and sessions for the same tables."""
+    return HydroEngine(io.BytesIO(hydro), io.BytesIO(kn))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_displacement(items_key: str, _items: list[WeightItem]) -> DisplacementResult:
+    """Displacement for the items identified by items_key."""
+    return calculate_displacement(_items)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_stability(
+    items_key: str, hydro_key: str, _items: list[WeightItem], _hydro: "HydroEngine"
+) -> StabilityResult:
+    """Stability for the items / hydrostatic tables identified by the keys."""
+    return calculate_stability(_items, _hydro)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_imo_check(heel_angles: tuple, gz_values: tuple, gm: float) -> dict:
+    """IMO A.749 check of a GZ curve."""
+    return check_imo_a749(list(heel_angles), list(gz_values), gm)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def render_report(
+    kind: str, result_key: str, _result: StabilityResult, _items: list[WeightItem], _imo_check
+) -> bytes:
+    """Excel ("xlsx") or PDF ("pdf") report bytes, rendered once per result."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"report.{kind}"
+        if kind == "xlsx":
+            export_stability_excel(_result, _items, _imo_check, path)
+        else:
+            export_stability_pdf(_result, "BUSHRA", _imo_check, path)
+        return path.read_bytes()
 
 
 def format_result_table(result: DisplacementResult) -> pd.DataFrame:
@@ -158,36 +258,46 @@ def main():
     
     # Process input
     items = None
-    tmp_files = []
+    items_key = None
+    condition = None
     
     if input_mode == "Excel Workbook" and uploaded_file is not None:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xls") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = Path(tmp_file.name)
-            tmp_files.append(tmp_path)
-        
+        data = uploaded_file.getvalue()
         try:
             # Read items from Excel
             with st.spinner("Reading Excel workbook..."):
-                items = read_weight_items_from_excel(tmp_path, sheet_name=sheet_name)
+                items = load_excel_items(data, sheet_name)
+            items_key = content_key(data, sheet_name.encode("utf-8"))
         except Exception as e:
             st.error(f"Error reading Excel file: {e}")
             items = None
     
     elif input_mode == "CSV Files" and all([master_file, mapping_file, condition_file]):
-        # Save CSV files to temporary location
-        for file, suffix in [(master_file, "_master.csv"), (mapping_file, "_mapping.csv"), (condition_file, "_condition.csv")]:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_file.write(file.getvalue())
-                tmp_files.append(Path(tmp_file.name))
-        
-        master_path, mapping_path, condition_path = tmp_files
-        
+        buffers = [f.getvalue() for f in (master_file, mapping_file, condition_file)]
         try:
-            # Read items from CSV
-            with st.spinner("Reading CSV files..."):
-                items = csv_to_weight_items(master_path, mapping_path, condition_path)
+            if LoadingCondition is not None:
+                # Tank fills: edits are applied as deltas to the session's condition
+                with st.spinner("Reading CSV files..."):
+                    condition, tanks = session_condition(buffers)
+                with st.expander("🛢️ Tank Fills"):
+                    edited = st.data_editor(
+                        tanks,
+                        key=f"tank_fills_{content_key(*buffers)}",
+                        disabled=["Tank_ID"],
+                        hide_index=True,
+                        use_container_width=True,
+                    )
+                condition.apply_fills(
+                    dict(zip(edited["Tank_ID"], edited["Percent_Fill"].fillna(0.0))),
+                    dict(zip(edited["Tank_ID"], edited["SG"].fillna(tanks["SG"]))),
+                )
+                items = condition.table.to_items()
+                items_key = content_key(*buffers, edited.to_csv(index=False).encode("utf-8"))
+            else:
+                # Read items from CSV
+                with st.spinner("Reading CSV files..."):
+                    items = load_csv_items(*buffers)
+                items_key = content_key(*buffers)
         except Exception as e:
             st.error(f"Error reading CSV files: {e}")
             items = None
@@ -195,30 +305,35 @@ def main():
     if items is not None:
         try:
             # Calculate displacement or stability
+            result_key = None
             if enable_stability and HYDROSTATIC_AVAILABLE and hydro_file and kn_file:
-                # Save hydrostatic files
-                with tempfile.NamedTemporaryFile(delete=False, suffix="_hydro.csv") as tmp_hydro:
-                    tmp_hydro.write(hydro_file.getvalue())
-                    tmp_files.append(Path(tmp_hydro.name))
-                with tempfile.NamedTemporaryFile(delete=False, suffix="_kn.csv") as tmp_kn:
-                    tmp_kn.write(kn_file.getvalue())
-                    tmp_files.append(Path(tmp_kn.name))
+                hydro_bytes, kn_bytes = hydro_file.getvalue(), kn_file.getvalue()
+                hydro_key = content_key(hydro_bytes, kn_bytes)
+                result_key = content_key(items_key.encode(), hydro_key.encode())
                 
                 # Calculate stability
                 with st.spinner("Calculating stability..."):
-                    hydro = HydroEngine(tmp_files[-2], tmp_files[-1])
-                    result = calculate_stability(items, hydro)
+                    hydro = load_hydro_engine(hydro_bytes, kn_bytes)
+                    if condition is not None:
+                        condition.set_hydro(hydro)
+                        result = condition.stability()
+                    else:
+                        result = compute_stability(items_key, hydro_key, items, hydro)
                     
                     # IMO check if requested
                     imo_check = None
                     if enable_imo:
-                        heel_angles = list(result.gz_curve.keys())
-                        gz_values = list(result.gz_curve.values())
-                        imo_check = check_imo_a749(heel_angles, gz_values, result.gm)
+                        imo_check = compute_imo_check(
+                            tuple(result.gz_curve.keys()), tuple(result.gz_curve.values()), result.gm
+                        )
+                    result_key = content_key(result_key.encode(), str(enable_imo).encode())
             else:
                 # Basic displacement only
                 with st.spinner("Calculating displacement..."):
-                    result = calculate_displacement(items)
+                    if condition is not None:
+                        result = condition.displacement()
+                    else:
+                        result = compute_displacement(items_key, items)
                 imo_check = None
             
             if not items:
@@ -379,34 +494,24 @@ def main():
                 with col2:
                     # Excel export
                     try:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp_xlsx:
-                            tmp_xlsx_path = Path(tmp_xlsx.name)
-                        export_stability_excel(result, items, imo_check, tmp_xlsx_path)
-                        with open(tmp_xlsx_path, "rb") as f:
-                            st.download_button(
-                                label="Download Excel",
-                                data=f.read(),
-                                file_name="stability_report.xlsx",
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            )
-                        os.unlink(tmp_xlsx_path)
+                        st.download_button(
+                            label="Download Excel",
+                            data=render_report("xlsx", result_key, result, items, imo_check),
+                            file_name="stability_report.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        )
                     except ImportError:
                         st.warning("xlsxwriter not available for Excel export")
                 
                 with col3:
                     # PDF export
                     try:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-                            tmp_pdf_path = Path(tmp_pdf.name)
-                        export_stability_pdf(result, "BUSHRA", imo_check, tmp_pdf_path)
-                        with open(tmp_pdf_path, "rb") as f:
-                            st.download_button(
-                                label="Download PDF",
-                                data=f.read(),
-                                file_name="stability_report.pdf",
-                                mime="application/pdf",
-                            )
-                        os.unlink(tmp_pdf_path)
+                        st.download_button(
+                            label="Download PDF",
+                            data=render_report("pdf", result_key, result, items, imo_check),
+                            file_name="stability_report.pdf",
+                            mime="application/pdf",
+                        )
                     except ImportError:
                         st.warning("matplotlib not available for PDF export")
                 
@@ -449,18 +554,10 @@ def main():
                         mime="text/csv",
                     )
             
-            # Clean up temporary files
-            for tmp_file in tmp_files:
-                if tmp_file.exists():
-                    os.unlink(tmp_file)
-            
         except Exception as e:
             st.error(f"Error processing file: {e}")
             import traceback
             st.code(traceback.format_exc())
-            for tmp_file in tmp_files:
-                if tmp_file.exists():
-                    os.unlink(tmp_file)
     
     if items is None:
         st.info("👈 Please upload an Excel workbook to begin.")
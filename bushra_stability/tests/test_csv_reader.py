@@ -0,0 +1,89 @@
+"""
+Tests for CSV condition reader.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import sys
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from csv_reader import (
+    apply_condition_to_master,
+    calculate_fsm_array,
+    calculate_fsm_effect,
+    condition_columns,
+    csv_to_weight_items,
+    csv_to_weight_table,
+    read_master_tanks,
+)
+from displacement import calculate_displacement
+
+MASTER_CSV = Path(__file__).parent.parent / "data" / "master_tanks.csv"
+
+
+@pytest.fixture
+def condition_files(tmp_path):
+    """Mapping / condition CSVs filling a few master tanks."""
+    tank_ids = read_master_tanks(MASTER_CSV)["Tank_ID"].astype(str).tolist()
+    fills = {tank_ids[0]: 50.0, tank_ids[3]: 95.0, tank_ids[6]: 25.0}
+    mapping_path = tmp_path / "mapping.csv"
+    pd.DataFrame({
+        "Condition_Name": [f"C {t}" for t in fills],
+        "Tank_ID": [f" {t} " for t in fills],
+    }).to_csv(mapping_path, index=False)
+    condition_path = tmp_path / "condition.csv"
+    pd.DataFrame({
+        "Condition_Name": [f"C {t}" for t in fills],
+        "Percent_Fill": list(fills.values()),
+        "SG_Override": [1.1, None, None],
+    }).to_csv(condition_path, index=False)
+    return mapping_path, condition_path
+
+
+def test_fsm_array_matches_scalar():
+    """Test vectorized FSM against the scalar parabola, including band edges."""
+    fills = np.linspace(0.0, 100.0, 201)
+    expected = [calculate_fsm_effect(p, 12.5) for p in fills]
+    np.testing.assert_allclose(calculate_fsm_array(fills, 12.5), expected, atol=1e-12)
+
+
+def test_apply_condition_does_not_mutate_inputs():
+    """Test apply_condition_to_master leaves caller DataFrames untouched."""
+    master = pd.DataFrame({"Tank_ID": [1, " B "], "Capacity_m3": [10.0, 20.0], "SG_Master": [1.0, 1.025]})
+    mapping = pd.DataFrame({"Condition_Name": ["X"], "Tank_ID": [" B"]})
+    condition = pd.DataFrame({"Condition_Name": ["X"], "Percent_Fill": [50.0]})
+    before = (master.copy(), mapping.copy(), condition.copy())
+    
+    final_df = apply_condition_to_master(master, mapping, condition)
+    
+    for df, original in zip((master, mapping, condition), before):
+        pd.testing.assert_frame_equal(df, original)
+    assert final_df["Percent_Fill"].tolist() == [0.0, 50.0]
+    np.testing.assert_allclose(condition_columns(final_df)["weight"], [0.0, 10.25])
+
+
+def test_weight_table_matches_items(condition_files):
+    """Test columnar table and WeightItem list give the same condition."""
+    items = csv_to_weight_items(MASTER_CSV, *condition_files)
+    table = csv_to_weight_table(MASTER_CSV, *condition_files)
+    
+    assert table.names == [item.name for item in items]
+    assert items[0].name.endswith(")")  # Tank_ID (Content)
+    np.testing.assert_allclose(table.weight, [item.weight for item in items])
+    np.testing.assert_allclose(table.fsm, [item.fsm for item in items])
+    assert sum(item.weight > 0 for item in items) == 3
+    
+    expected = calculate_displacement(items)
+    actual = table.result()
+    for field in ("total_weight", "lcg", "vcg", "tcg", "total_fsm"):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9), field
+
+
+def test_weight_items_from_buffers(condition_files):
+    """Test in-memory CSV buffers give the same items as file paths."""
+    import io
+    buffers = [io.BytesIO(Path(p).read_bytes()) for p in (MASTER_CSV, *condition_files)]
+    assert csv_to_weight_items(*buffers) == csv_to_weight_items(MASTER_CSV, *condition_files, use_cache=False)
@@ -16,6 +16,7 @@ sys.path.insert(0, str(src_path))
 from displacement import (
     calculate_displacement,
     WeightItem,
+    WeightTable,
     DisplacementResult,
 )
 
@@ -307,3 +308,85 @@ class TestDisplacementCalculation:
         assert abs(result.vcg - 4.313906) < 0.0001
         # TCG: 0.003057
         assert abs(result.tcg - 0.003057) < 0.0001
+
+
+def _assert_result_close(a: DisplacementResult, b: DisplacementResult, tol: float = 1e-9):
+    for field in ("total_weight", "lcg", "vcg", "tcg", "total_fsm"):
+        assert getattr(a, field) == pytest.approx(getattr(b, field), abs=tol), field
+
+
+class TestWeightTable:
+    """Test columnar WeightTable against list-based calculations."""
+
+    def test_totals_and_group_subtotals(self, all_items, fuel_oil_items):
+        """Test table totals and per-group subtotals match the list results."""
+        table = WeightTable.from_items(all_items)
+        assert len(table) == len(all_items)
+        _assert_result_close(table.result(), calculate_displacement(all_items))
+        _assert_result_close(calculate_displacement(table), calculate_displacement(all_items))
+        
+        fuel = table.group_result("FUEL OIL (DENSITY - 0.821)")
+        # Expected from Excel Volum sheet: Sub Total = 47.1172 t, FSM 365.06
+        assert abs(fuel.total_weight - 47.1172) < 0.01
+        assert abs(fuel.total_fsm - 365.06) < 0.01
+        _assert_result_close(fuel, calculate_displacement(fuel_oil_items))
+        
+        groups = table.group_results()
+        assert set(groups) == {item.group for item in all_items}
+        mask = table.group == table.group_names.index("FUEL OIL (DENSITY - 0.821)")
+        _assert_result_close(table.masked_result(mask), fuel)
+
+    def test_items_round_trip(self, all_items):
+        """Test WeightItem views round-trip through the table."""
+        table = WeightTable.from_items(all_items + [WeightItem(name="No coords", weight=5.0)])
+        items = table.to_items()
+        assert items[:-1] == all_items
+        assert items[-1] == WeightItem(name="No coords", weight=5.0)
+
+    def test_incremental_updates(self, all_items):
+        """Test add / update / remove keep totals equal to a full recalculation."""
+        table = WeightTable.from_items(all_items)
+        items = list(all_items)
+        ids = list(table.ids)
+        
+        new_id = table.add("SPMT axle", 12.5, lcg=40.0, vcg=2.1, tcg=-1.0, group="CARGO")
+        items.append(WeightItem("SPMT axle", 12.5, 40.0, 2.1, -1.0, group="CARGO"))
+        _assert_result_close(table.result(), calculate_displacement(items))
+        
+        table.update(ids[3], weight=2.0, fsm=0.0)
+        items[3] = WeightItem(
+            items[3].name, 2.0, items[3].lcg, items[3].vcg, items[3].tcg, 0.0, items[3].group
+        )
+        _assert_result_close(table.result(), calculate_displacement(items))
+        
+        table.remove(ids[0])
+        del items[0]
+        assert table.item(new_id).name == "SPMT axle"
+        assert table.item(ids[3]).weight == 2.0
+        _assert_result_close(table.result(), calculate_displacement(items))
+        assert sorted(item.name for item in table) == sorted(item.name for item in items)
+        
+        table.update(new_id, lcg=None, group="MISCELLANEOUS")
+        items[-1] = WeightItem("SPMT axle", 12.5, None, 2.1, -1.0, group="MISCELLANEOUS")
+        _assert_result_close(table.result(), calculate_displacement(items))
+        assert "CARGO" not in table.group_results()
+        
+        before = table.result()
+        table.recompute()
+        _assert_result_close(table.result(), before, tol=1e-12)
+        
+        with pytest.raises(KeyError):
+            table.remove(ids[0])
+        with pytest.raises(TypeError):
+            table.update(new_id, colour="red")
+
+    def test_empty_table_raises(self):
+        """Test empty table raises like calculate_displacement."""
+        table = WeightTable()
+        with pytest.raises(ValueError):
+            table.result()
+        item_id = table.add("Zero", 0.0, lcg=1.0)
+        with pytest.raises(ValueError):
+            calculate_displacement(table)
+        table.remove(item_id)
+        assert len(table) == 0
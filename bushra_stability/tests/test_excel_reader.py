@@ -0,0 +1,78 @@
+"""
+Tests for Excel Volum sheet reader.
+"""
+import io
+import pytest
+import pandas as pd
+from pathlib import Path
+
+import sys
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from excel_reader import read_weight_items_from_excel, read_weight_table_from_excel
+from displacement import WeightItem, calculate_displacement
+
+
+def _volum_row(desc=None, weight=None, lcg=None, vcg=None, tcg=None, fsm=None, alt_desc=None):
+    row = [None] * 20
+    row[1], row[2], row[7], row[8], row[10], row[12], row[16] = alt_desc, desc, weight, lcg, vcg, tcg, fsm
+    row[19] = "unused"
+    return row
+
+
+@pytest.fixture
+def volum_bytes():
+    """Small .xlsx workbook in the Volum sheet layout."""
+    rows = [
+        _volum_row("Description", "Weight", "LCG", "VCG", "TCG", "FSM"),
+        _volum_row("Light Ship"),
+        _volum_row("Light Fixed Ship", 770.0, 26.3, 3.9, 0.0),
+        _volum_row("Hull", 770.0, 26.3, 3.9, 0.0),
+        _volum_row(),
+        _volum_row("Tanks"),
+        _volum_row("FW1 (P)", 12.5, 20.0, 1.0, -2.0, 3.0),
+        _volum_row(None, 8.0, 21.0, 1.1, 2.0, alt_desc="  FW1 (S) "),
+        _volum_row("FO Slack", "tbd", 18.0, 0.8, 0.0, 4.5),
+        _volum_row("Broken", "tbd", 18.0, 0.8, 0.0, 0.0),
+        _volum_row("Sub Total Tanks", 20.5),
+        _volum_row("Cargo", 0.0, 30.0),
+    ]
+    buffer = io.BytesIO()
+    pd.DataFrame(rows).to_excel(buffer, sheet_name="Volum", header=False, index=False)
+    return buffer.getvalue()
+
+
+def test_read_weight_items(volum_bytes):
+    """Test header, group, summary and FSM-only rows are handled."""
+    items = read_weight_items_from_excel(volum_bytes)
+    assert items == [
+        WeightItem("Hull", 770.0, 26.3, 3.9, 0.0, 0.0, "Light Ship"),
+        WeightItem("FW1 (P)", 12.5, 20.0, 1.0, -2.0, 3.0, "Tanks"),
+        WeightItem("FW1 (S)", 8.0, 21.0, 1.1, 2.0, 0.0, "Tanks"),
+        WeightItem("FO Slack", 0.0, 18.0, 0.8, 0.0, 4.5, "Tanks"),
+        WeightItem("Cargo", 0.0, 30.0, None, None, 0.0, "Tanks"),
+    ]
+
+
+def test_sources_and_pushdown(volum_bytes, tmp_path):
+    """Test path / bytes / file-like sources, usecols=None and nrows agree."""
+    path = tmp_path / "volum.xlsx"
+    path.write_bytes(volum_bytes)
+    expected = read_weight_items_from_excel(volum_bytes)
+    assert read_weight_items_from_excel(path) == expected
+    assert read_weight_items_from_excel(io.BytesIO(volum_bytes)) == expected
+    assert read_weight_items_from_excel(path, usecols=None) == expected
+    assert [item.name for item in read_weight_items_from_excel(path, nrows=7)] == ["Hull", "FW1 (P)"]
+
+
+def test_read_weight_table(volum_bytes):
+    """Test the columnar table matches the item list."""
+    items = read_weight_items_from_excel(volum_bytes)
+    table = read_weight_table_from_excel(volum_bytes)
+    assert table.names == [item.name for item in items]
+    assert table.group_names[:2] == ["Light Ship", "Tanks"]
+    expected = calculate_displacement(items)
+    actual = table.result()
+    for field in ("total_weight", "lcg", "vcg", "tcg", "total_fsm"):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9), field
@@ -147,3 +147,38 @@ def test_heel_angles_property(sample_hydro_csv, sample_kn_csv):
     assert 0 in heels
     assert 10 in heels
 
+
+
+def test_query_matches_scalar_methods(sample_hydro_csv, sample_kn_csv):
+    """Test batched query against the single-point property methods."""
+    engine = HydroEngine(sample_hydro_csv, sample_kn_csv)
+    
+    rng = np.random.default_rng(0)
+    disps = rng.uniform(900.0, 2100.0, size=50)  # includes extrapolation
+    trims = rng.uniform(-0.2, 1.2, size=50)
+    result = engine.query(disps, trims, ("Draft", "LCB", "KMT", "MTC"))
+    
+    assert set(result) == {"Draft", "LCB", "KMT", "MTC"}
+    for k in range(len(disps)):
+        assert result["Draft"][k] == pytest.approx(engine.mean_draft(disps[k], trims[k]))
+        assert result["LCB"][k] == pytest.approx(engine.LCB(disps[k], trims[k]))
+        assert result["KMT"][k] == pytest.approx(engine.KMT(disps[k], trims[k]))
+        assert result["MTC"][k] == pytest.approx(engine.MTC(disps[k], trims[k]))
+
+
+def test_query_broadcasting_and_defaults(sample_hydro_csv, sample_kn_csv):
+    """Test query shape broadcasting, default props and missing props."""
+    engine = HydroEngine(sample_hydro_csv, sample_kn_csv)
+    
+    assert engine.hydro_properties == ("Draft", "LCB", "KMT", "MTC")
+    result = engine.query(np.array([[1000.0], [1500.0]]), np.array([0.0, 0.5, 1.0]))
+    assert set(result) == set(engine.hydro_properties)
+    assert result["LCB"].shape == (2, 3)
+    assert result["LCB"][1, 0] == pytest.approx(10.5)
+    
+    scalar = engine.query(1000.0, props=("MTC",))
+    assert scalar["MTC"].shape == ()
+    assert float(scalar["MTC"]) == pytest.approx(100.0)
+    
+    with pytest.raises(ValueError):
+        engine.query(1000.0, 0.0, ("VCB",))
@@ -9,7 +9,7 @@ import sys
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from imo_check import check_imo_a749
+from imo_check import GZCurves, check_imo_a749, check_imo_a749_batch, imo_result_row
 
 
 def test_imo_check_passing_case():
@@ -112,3 +112,83 @@ def test_imo_check_interpolation():
     assert "Area_0_30_mrad" in result
     assert "Area_0_40_mrad" in result
 
+
+
+def _dense_area(curves, start, end, n=200001):
+    """Trapezoid reference for the interpolated curve."""
+    angles = np.linspace(start, end, n)
+    return np.trapezoid(curves.gz(angles), np.deg2rad(angles), axis=1)
+
+
+def test_gz_curves_exact_areas_and_nodes():
+    """Test closed-form areas against dense integration of the same curve."""
+    heels = [0, 10, 20, 30, 40, 50, 60]
+    kn = np.array([
+        [0.0, 0.60, 1.22, 1.80, 2.25, 2.50, 2.60],
+        [0.0, 0.50, 1.00, 1.45, 1.75, 1.90, 1.92],
+    ])
+    kg = np.array([3.0, 2.8])
+    curves = GZCurves(heels, kn, kg)
+    
+    # Curve passes through the sampled GZ values
+    gz_nodes = kn - kg[:, None] * np.sin(np.deg2rad(heels))
+    np.testing.assert_allclose(curves.gz(heels), gz_nodes, atol=1e-12)
+    
+    for start, end in ((0, 30), (0, 40), (30, 40), (12.5, 47.3)):
+        np.testing.assert_allclose(
+            curves.area(start, end), _dense_area(curves, start, end), atol=1e-9
+        )
+    
+    # Linear data is reproduced exactly: ∫0^30 0.01·φ dφ
+    linear = GZCurves([0, 10, 20, 30, 40], [[0.0, 0.1, 0.2, 0.3, 0.4]])
+    assert linear.area(0, 30)[0] == pytest.approx(0.01 * 30 ** 2 / 2 * np.pi / 180)
+
+
+def test_gz_curves_max_and_vanishing_angle_by_root_finding():
+    """Test GZmax between sampled angles and the vanishing angle."""
+    heels = [0, 10, 20, 30, 40, 50, 60]
+    kn = [[0.0, 0.60, 1.22, 1.80, 2.25, 2.50, 2.60]]
+    curves = GZCurves(heels, kn, 3.2)
+    
+    gz_max, angle_max = curves.max()
+    fine = np.linspace(0, 60, 600001)
+    dense = curves.gz(fine)[0]
+    assert gz_max[0] == pytest.approx(dense.max(), abs=1e-9)
+    assert angle_max[0] == pytest.approx(fine[dense.argmax()], abs=1e-3)
+    assert angle_max[0] % 10 != 0  # Not restricted to the input angles
+    
+    vanishing = curves.vanishing_angle()
+    assert angle_max[0] < vanishing[0] < 60
+    assert curves.gz(vanishing)[0] == pytest.approx(0.0, abs=1e-9)
+    
+    # GZ still positive at the last angle: no vanishing angle in range
+    assert np.isnan(GZCurves(heels, kn, 1.0).vanishing_angle()[0])
+
+
+def test_imo_batch_matches_single_checks():
+    """Test batch IMO check rows against check_imo_a749."""
+    heels = [0, 10, 20, 30, 40, 50, 60]
+    rng = np.random.default_rng(0)
+    peaks = rng.uniform(0.1, 0.8, size=50)
+    gz = peaks[:, None] * np.sin(np.deg2rad(np.array(heels) * 2.5))
+    gm = rng.uniform(0.05, 1.0, size=50)
+    
+    batch = check_imo_a749_batch(GZCurves(heels, gz), gm)
+    assert batch["Overall_Pass"].shape == (50,)
+    assert batch["Overall_Pass"].any() and not batch["Overall_Pass"].all()
+    for i in range(50):
+        single = check_imo_a749(heels, gz[i].tolist(), gm[i])
+        assert imo_result_row(batch, i) == single
+
+
+def test_imo_check_downflooding_angle_limits_areas():
+    """Test areas to 40° stop at a smaller downflooding angle."""
+    heel_angles = [0, 10, 20, 30, 40, 50, 60]
+    gz_values = [0.0, 0.15, 0.30, 0.40, 0.35, 0.20, 0.10]
+    
+    full = check_imo_a749(heel_angles, gz_values, 0.20)
+    limited = check_imo_a749(heel_angles, gz_values, 0.20, downflooding_deg=35.0)
+    
+    assert limited["Area_0_30_mrad"] == full["Area_0_30_mrad"]
+    assert limited["Area_0_40_mrad"] < full["Area_0_40_mrad"]
+    assert limited["Area_30_40_mrad"] < full["Area_30_40_mrad"]
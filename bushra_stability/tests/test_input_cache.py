@@ -0,0 +1,110 @@
+"""
+Tests for the parsed-input cache.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import sys
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from csv_reader import read_master_tanks
+from input_cache import CACHE_SUFFIX, cached_frame
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture
+def counting_parser():
+    calls = []
+    
+    def parser(path):
+        calls.append(path)
+        return pd.read_csv(path)
+    
+    parser.calls = calls
+    return parser
+
+
+def test_cache_hit_and_invalidation(tmp_path, counting_parser):
+    """Test the source is parsed once and re-parsed after a content change."""
+    source = tmp_path / "table.csv"
+    pd.DataFrame({"Tank_ID": ["A", "B"], "Capacity_m3": [1.5, 2.0], "Note": ["x", None]}).to_csv(
+        source, index=False
+    )
+    first = cached_frame(source, counting_parser, "test")
+    second = cached_frame(source, counting_parser, "test")
+    assert len(counting_parser.calls) == 1
+    assert (tmp_path / f"table.csv.test{CACHE_SUFFIX}").exists()
+    pd.testing.assert_frame_equal(first, second)
+    assert pd.isna(second.loc[1, "Note"])
+    
+    source.write_text("Tank_ID,Capacity_m3\nA,3.0\n")
+    third = cached_frame(source, counting_parser, "test")
+    assert len(counting_parser.calls) == 2
+    assert third["Capacity_m3"].tolist() == [3.0]
+
+
+def test_cache_dir_is_content_addressed(tmp_path, counting_parser):
+    """Test identical content at different paths shares one cache entry."""
+    cache_dir = tmp_path / "cache"
+    for name in ("upload1.csv", "upload2.csv"):
+        (tmp_path / name).write_text("Tank_ID,Capacity_m3\nA,1.0\n")
+        cached_frame(tmp_path / name, counting_parser, "test", cache_dir=cache_dir)
+    assert len(counting_parser.calls) == 1
+    assert len(list(cache_dir.iterdir())) == 1
+    
+    cached_frame(tmp_path / "upload1.csv", counting_parser, "test", use_cache=False)
+    assert len(counting_parser.calls) == 2
+
+
+def test_master_tanks_cached_matches_parsed(tmp_path):
+    """Test cached master tables equal a fresh parse, for CSV and JSON."""
+    for name in ("master_tanks.csv", "master_tanks.json"):
+        fresh = read_master_tanks(DATA_DIR / name, use_cache=False)
+        read_master_tanks(DATA_DIR / name, cache_dir=tmp_path)
+        cached = read_master_tanks(DATA_DIR / name, cache_dir=tmp_path)
+        pd.testing.assert_frame_equal(cached, fresh)
+        assert {"Tank_ID", "LCG_m", "VCG_m", "TCG_m"} <= set(cached.columns)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_mixed_and_bool_columns_round_trip(tmp_path):
+    """Test object columns keep their cell types (int / str / bool / None / NaN)."""
+    source = tmp_path / "table.csv"
+    source.write_text("x\n")
+    df = pd.DataFrame({
+        "mixed": [1, "x", 2.5, None],
+        "flags": [True, None, False, np.nan],
+        "text": ["a", "", "False", "1"],
+        "value": [1.0, 2.0, np.nan, 0.1],
+    })
+    cached_frame(source, lambda path: df, "test")
+    cached = cached_frame(source, lambda path: pytest.fail("cache not used"), "test")
+    pd.testing.assert_frame_equal(cached, df)
+    assert [type(v) for v in cached["mixed"]] == [int, str, float, type(None)]
+    assert cached["flags"].tolist()[:3] == [True, None, False]
+
+
+def test_uncacheable_column_is_parsed_every_time(tmp_path, counting_parser):
+    """Test cell types the cache cannot restore leave no cache entry behind."""
+    source = tmp_path / "table.csv"
+    source.write_text("x\n1\n")
+    parser = lambda path: pd.DataFrame({"when": [pd.Timestamp("2025-01-01")]}, dtype=object)  # noqa: E731
+    cached_frame(source, parser, "test")
+    assert not list(tmp_path.glob(f"*{CACHE_SUFFIX}"))
+
+
+@pytest.mark.parametrize("content", [b"", b"not a zip file"])
+def test_corrupt_cache_is_ignored(tmp_path, counting_parser, content):
+    """Test an empty or non-zip cache file is re-parsed and rewritten."""
+    source = tmp_path / "table.csv"
+    source.write_text("Tank_ID,Capacity_m3\nA,1.0\n")
+    cache = tmp_path / f"table.csv.test{CACHE_SUFFIX}"
+    cache.write_bytes(content)
+    df = cached_frame(source, counting_parser, "test")
+    assert df["Capacity_m3"].tolist() == [1.0]
+    assert len(counting_parser.calls) == 1
+    assert cache.read_bytes() != content
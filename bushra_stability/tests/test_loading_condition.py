@@ -0,0 +1,209 @@
+"""
+Tests for the incremental loading-condition engine.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import sys
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from csv_reader import csv_to_weight_items
+from displacement import calculate_displacement
+from hydrostatic import HydroEngine
+from loading_condition import LoadingCondition
+from stability import calculate_stability
+
+MASTER_CSV = Path(__file__).parent.parent / "data" / "master_tanks.csv"
+
+
+def _write_condition(tmp_path, fills, sg_overrides=None):
+    """Write mapping + condition CSVs for {Tank_ID: percent} fills."""
+    sg_overrides = sg_overrides or {}
+    names = {tank_id: f"COND {tank_id}" for tank_id in fills}
+    mapping_path = tmp_path / "mapping.csv"
+    pd.DataFrame({
+        "Condition_Name": list(names.values()),
+        "Tank_ID": list(names),
+    }).to_csv(mapping_path, index=False)
+    condition_path = tmp_path / "condition.csv"
+    pd.DataFrame({
+        "Condition_Name": list(names.values()),
+        "Percent_Fill": list(fills.values()),
+        "SG_Override": [sg_overrides.get(t) for t in fills],
+    }).to_csv(condition_path, index=False)
+    return mapping_path, condition_path
+
+
+def _assert_same_totals(cond, items):
+    expected = calculate_displacement(items)
+    actual = cond.displacement()
+    for field in ("total_weight", "lcg", "vcg", "tcg", "total_fsm"):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9), field
+
+
+@pytest.fixture
+def tank_ids():
+    return pd.read_csv(MASTER_CSV)["Tank_ID"].astype(str).str.strip().tolist()
+
+
+@pytest.fixture
+def hydro_engine(tmp_path):
+    """Hydrostatic engine covering small tank-only displacements."""
+    rows = []
+    for d in [0.0, 200.0, 400.0, 2000.0]:
+        for t in [-2.0, 0.0, 2.0]:
+            rows.append({
+                "Displacement": d, "Trim": t, "Draft": 0.5 + d / 1000.0,
+                "LCB": 30.0 + 0.1 * t, "KMT": 8.0 - d / 1000.0, "MTC": 5000.0 + d,
+            })
+    hydro_path = tmp_path / "hydro.csv"
+    pd.DataFrame(rows).to_csv(hydro_path, index=False)
+    kn_path = tmp_path / "kn.csv"
+    pd.DataFrame({
+        "Displacement": [0.0, 0.0, 2000.0, 2000.0],
+        "Trim": [-2.0, 2.0, -2.0, 2.0],
+        "Heel_0": [0.0] * 4,
+        "Heel_30": [4.0, 4.0, 3.0, 3.0],
+        "Heel_60": [6.0, 6.0, 5.0, 5.0],
+    }).to_csv(kn_path, index=False)
+    return HydroEngine(hydro_path, kn_path)
+
+
+def test_from_csv_matches_csv_items_and_updates(tmp_path, tank_ids):
+    """Test O(1) fill / SG updates against a full CSV rebuild."""
+    fills = {tank_ids[0]: 50.0, tank_ids[2]: 95.0, tank_ids[5]: 30.0}
+    mapping_path, condition_path = _write_condition(tmp_path, fills)
+    cond = LoadingCondition.from_csv(MASTER_CSV, mapping_path, condition_path)
+    _assert_same_totals(cond, csv_to_weight_items(MASTER_CSV, mapping_path, condition_path))
+    assert cond.last_seq == 0
+    
+    fills[tank_ids[0]] = 70.0
+    fills[tank_ids[7]] = 40.0
+    sg = {tank_ids[2]: 1.1}
+    changes = cond.apply_fills(fills, sg)
+    assert [c.kind for c in changes] == ["sg", "fill", "fill"]
+    assert [c.target for c in changes] == [tank_ids[2], tank_ids[0], tank_ids[7]]
+    assert changes[1].old == {"percent_fill": 50.0}
+    mapping_path, condition_path = _write_condition(tmp_path, fills, sg)
+    _assert_same_totals(cond, csv_to_weight_items(MASTER_CSV, mapping_path, condition_path))
+    
+    # Unchanged values are not logged
+    assert cond.apply_fills(fills, sg) == []
+    assert cond.set_fill(tank_ids[0], 120.0).new == {"percent_fill": 100.0}
+    with pytest.raises(KeyError):
+        cond.set_fill("NO SUCH TANK", 10.0)
+
+
+def test_change_log_and_items():
+    """Test change log sequence, subscribers and item moves / removal."""
+    cond = LoadingCondition()
+    seen = []
+    cond.subscribe(seen.append)
+    ship = cond.add_item("Light Ship", 770.16, lcg=26.349, vcg=3.884, tcg=-0.004)
+    cargo = cond.add_item("TR1", 271.2, lcg=30.0, vcg=6.0, tcg=0.0, group="CARGO")
+    cond.add_tank("FW1", 50.0, lcg=20.0, vcg=1.0, tcg=2.0, percent_fill=50.0, fsm_full_tm=10.0)
+    
+    cond.move_item(cargo, lcg=35.0)
+    cond.set_weight(ship, 780.0)
+    fw1 = cond.tanks["FW1"].item_id
+    with pytest.raises(ValueError, match="set_fill"):
+        cond.set_weight(fw1, 40.0)
+    with pytest.raises(ValueError):
+        cond.move_item(fw1, lcg=21.0)
+    cond.remove_item(fw1)
+    assert "FW1" not in cond.tanks
+    
+    assert [c.seq for c in cond.change_log] == [1, 2, 3, 4, 5, 6]
+    assert seen == cond.change_log
+    assert [c.kind for c in cond.changes_since(3)] == ["move", "weight", "remove"]
+    assert cond.changes_since(3)[0].old == {"lcg": 30.0}
+    assert cond.changes_since(6) == []
+    
+    from displacement import WeightItem
+    _assert_same_totals(cond, [
+        WeightItem("Light Ship", 780.0, 26.349, 3.884, -0.004),
+        WeightItem("TR1", 271.2, 35.0, 6.0, 0.0),
+    ])
+
+
+def test_stability_resolves_trim_only_when_needed(hydro_engine):
+    """Test VCG-only changes reuse the cached trim and KN."""
+    cond = LoadingCondition(hydro_engine, heel_angles_deg=[0, 30, 60])
+    cond.add_item("Light Ship", 300.0, lcg=30.5, vcg=4.0, tcg=0.0)
+    cargo = cond.add_item("Cargo", 100.0, lcg=29.0, vcg=5.0, tcg=0.0)
+    cond.add_tank("FW1", 50.0, lcg=20.0, vcg=1.0, tcg=0.0, percent_fill=50.0, fsm_full_tm=10.0)
+    
+    calls = []
+    original = hydro_engine.query_trim_gradient
+    
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+    
+    hydro_engine.query_trim_gradient = counting
+    
+    first = cond.stability()
+    n_first = len(calls)
+    assert n_first > 0
+    expected = calculate_stability(
+        cond.table.to_items(), hydro_engine, heel_angles_deg=[0, 30, 60], trim_method="newton"
+    )
+    assert first.trim == pytest.approx(expected.trim, abs=1e-9)
+    assert first.gm == pytest.approx(expected.gm, abs=1e-9)
+    np.testing.assert_allclose(first.gz, expected.gz, atol=1e-9)
+    
+    # Cached: no new hydrostatic evaluations
+    n_first = len(calls)
+    assert cond.stability().trim == first.trim
+    cond.move_item(cargo, vcg=7.0)
+    raised = cond.stability()
+    assert len(calls) == n_first
+    assert raised.gm < first.gm
+    expected = calculate_stability(
+        cond.table.to_items(), hydro_engine, heel_angles_deg=[0, 30, 60], trim_method="newton"
+    )
+    n_first = len(calls)
+    assert raised.gm == pytest.approx(expected.gm, abs=1e-9)
+    
+    # Weight change: trim is re-solved
+    cond.set_fill("FW1", 90.0)
+    cond.stability()
+    assert len(calls) > n_first
+
+
+def test_cli_csv_mode_applies_tank_overrides(tmp_path, tank_ids, hydro_engine, capsys):
+    """Test --fill / --sg go through LoadingCondition and match a rebuilt condition CSV."""
+    import json
+    sys.path.insert(0, str(Path(__file__).parents[2]))
+    from bushra_stability.src import cli
+    
+    fills = {tank_ids[0]: 50.0, tank_ids[2]: 95.0}
+    mapping_path, condition_path = _write_condition(tmp_path, fills)
+    args = [
+        "--csv-mode", "--master", str(MASTER_CSV),
+        "--mapping", str(mapping_path), "--condition", str(condition_path),
+        "--fill", f"{tank_ids[0]}=70", "--sg", f"{tank_ids[2]}=1.1",
+    ]
+    assert cli.main(args) == 0
+    displacement = json.loads(capsys.readouterr().out)
+    assert cli.main(args + [
+        "--stability", "--trim-method", "newton",
+        "--hydro", str(tmp_path / "hydro.csv"), "--kn", str(tmp_path / "kn.csv"),
+    ]) == 0
+    stability = json.loads(capsys.readouterr().out)
+    
+    fills[tank_ids[0]] = 70.0
+    mapping_path, condition_path = _write_condition(tmp_path, fills, {tank_ids[2]: 1.1})
+    items = csv_to_weight_items(MASTER_CSV, mapping_path, condition_path)
+    expected = calculate_displacement(items)
+    assert displacement["total_weight"] == pytest.approx(expected.total_weight, abs=1e-9)
+    assert displacement["total_fsm"] == pytest.approx(expected.total_fsm, abs=1e-9)
+    expected = calculate_stability(items, hydro_engine, trim_method="newton")
+    assert stability["trim"] == pytest.approx(expected.trim, abs=1e-9)
+    assert stability["gm"] == pytest.approx(expected.gm, abs=1e-9)
+    
+    with pytest.raises(ValueError):
+        cli.parse_tank_overrides(["no-separator"], "--fill")
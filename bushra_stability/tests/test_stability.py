@@ -12,7 +12,15 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 from displacement import WeightItem, calculate_displacement
-from stability import calculate_stability, StabilityResult, calculate_trim_iterative, calculate_gz_curve
+from stability import (
+    calculate_stability,
+    calculate_stability_batch,
+    StabilityResult,
+    calculate_trim_iterative,
+    calculate_gz_curve,
+    solve_trim_newton,
+    solve_trim_newton_batch,
+)
 from hydrostatic import HydroEngine
 
 
@@ -220,3 +228,229 @@ def test_trim_iterative_returns_history(sample_hydro_engine):
         assert "MTC" in hist
         assert "new_trim" in hist
 
+
+
+@pytest.fixture
+def trim_hydro_engine(tmp_path):
+    """Hydrostatic engine whose equilibrium trim lies inside the trim limit."""
+    disps = [800.0, 900.0, 1000.0]
+    trims = [-1.0, 0.0, 0.5, 1.0, 2.0]
+    rows = []
+    for d in disps:
+        for t in trims:
+            rows.append({
+                "Displacement": d,
+                "Trim": t,
+                "Draft": 2.0 + (d - 800.0) / 500.0,
+                "LCB": 26.0 + 0.05 * t - 0.01 * t ** 2 + (d - 800.0) / 1000.0,
+                "KMT": 5.0,
+                "MTC": 9000.0 + 200.0 * t + d,
+            })
+    hydro_path = tmp_path / "hydro.csv"
+    pd.DataFrame(rows).to_csv(hydro_path, index=False)
+    
+    kn_path = tmp_path / "kn.csv"
+    pd.DataFrame({
+        "Displacement": [800, 800, 1000, 1000],
+        "Trim": [-1.0, 2.0, -1.0, 2.0],
+        "Heel_0": [0.0] * 4,
+        "Heel_10": [1.0] * 4,
+    }).to_csv(kn_path, index=False)
+    return HydroEngine(hydro_path, kn_path)
+
+
+def test_query_trim_gradient_matches_finite_difference(trim_hydro_engine):
+    """Test analytic trim derivative of the bilinear interpolant."""
+    disps = np.array([850.0, 920.0, 1050.0])  # last point extrapolates
+    trims = np.array([0.2, 0.7, 2.5])
+    values, grads = trim_hydro_engine.query_trim_gradient(disps, trims, ("LCB", "MTC"))
+    direct = trim_hydro_engine.query(disps, trims, ("LCB", "MTC"))
+    h = 1e-6
+    upper = trim_hydro_engine.query(disps, trims + h, ("LCB", "MTC"))
+    for prop in ("LCB", "MTC"):
+        np.testing.assert_allclose(values[prop], direct[prop], atol=1e-12)
+        np.testing.assert_allclose(grads[prop], (upper[prop] - direct[prop]) / h, rtol=1e-5)
+
+
+def test_trim_newton_converges_quietly(trim_hydro_engine, capsys):
+    """Test Newton trim solver converges to 1e-6 m without printing."""
+    result = calculate_trim_iterative(920.0, 26.0, trim_hydro_engine, method="newton")
+    
+    assert capsys.readouterr().out == ""
+    assert result["status"] == "converged"
+    assert result["converged"]
+    assert abs(result["residual_m"]) <= 1e-6
+    assert result["evaluations"] <= 6
+    
+    # Equilibrium: trim reproduces the moment balance at its own LCB / MTC
+    trim = result["trim"]
+    lcb = trim_hydro_engine.LCB(920.0, trim)
+    mtc = trim_hydro_engine.MTC(920.0, trim)
+    assert trim == pytest.approx(920.0 * (lcb - 26.0) / (mtc / 100.0), abs=1e-6)
+    assert result["draft_mean"] == pytest.approx(trim_hydro_engine.mean_draft(920.0, trim))
+    assert result["draft_aft"] - result["draft_fwd"] == pytest.approx(trim)
+    
+    # Fixed-point iteration reaches the same trim given enough iterations
+    fixed = calculate_trim_iterative(
+        920.0, 26.0, trim_hydro_engine, iterations=100, convergence_tol=1e-9
+    )
+    assert fixed["trim"] == pytest.approx(trim, abs=1e-6)
+
+
+def test_trim_newton_clips_at_limit(trim_hydro_engine):
+    """Test Newton trim solver reports the trim limit instead of stopping early."""
+    result = calculate_trim_iterative(
+        920.0, 20.0, trim_hydro_engine, trim_limit_m=1.5, method="newton"
+    )
+    
+    assert result["status"] == "trim_limit"
+    assert result["trim"] == 1.5
+    assert not result["converged"]
+    assert result["evaluations"] <= 3
+    
+    with pytest.raises(ValueError):
+        calculate_trim_iterative(920.0, 26.0, trim_hydro_engine, method="secant")
+
+
+@pytest.fixture
+def kinked_hydro_engine(tmp_path):
+    """Engine where f(T) = T - target(T) falls around T = 0 and the root is below it."""
+    # Displacement 100 t, MTC 100 t·m/cm, LCG 0 → target = 100 * LCB
+    f = {-2.0: -1.0, -1.0: -0.5, -0.5: 0.8, 0.5: 0.2, 1.0: 0.5, 2.0: 1.5}
+    rows = [
+        {"Displacement": d, "Trim": t, "Draft": 2.0, "LCB": (t - ft) / 100.0, "KMT": 5.0, "MTC": 100.0}
+        for d in (90.0, 110.0)
+        for t, ft in f.items()
+    ]
+    hydro_path = tmp_path / "hydro.csv"
+    pd.DataFrame(rows).to_csv(hydro_path, index=False)
+    kn_path = tmp_path / "kn.csv"
+    pd.DataFrame({
+        "Displacement": [90, 90, 110, 110],
+        "Trim": [-2.0, 2.0, -2.0, 2.0],
+        "Heel_0": [0.0] * 4,
+        "Heel_10": [1.0] * 4,
+    }).to_csv(kn_path, index=False)
+    return HydroEngine(hydro_path, kn_path)
+
+
+def test_trim_newton_keeps_root_with_negative_slope(kinked_hydro_engine):
+    """Test the bracket follows the residual sign when f' <= 0 near the start."""
+    root = -1.0 + 0.5 / 2.6
+    result = solve_trim_newton(100.0, 0.0, kinked_hydro_engine)
+    assert result["status"] == "converged"
+    assert result["trim"] == pytest.approx(root, abs=1e-6)
+    
+    batch = solve_trim_newton_batch(np.array([100.0, 100.0]), np.zeros(2), kinked_hydro_engine)
+    assert list(batch["status"]) == ["converged"] * 2
+    np.testing.assert_allclose(batch["trim"], root, atol=1e-6)
+
+
+def test_trim_newton_max_evaluations_returns_evaluated_point(trim_hydro_engine):
+    """Test the max_evaluations exit reports the last evaluated trim consistently."""
+    result = solve_trim_newton(920.0, 26.0, trim_hydro_engine, max_evaluations=1)
+    assert result["status"] == "max_evaluations"
+    assert result["trim"] == 0.0
+    assert result["lcb"] == pytest.approx(trim_hydro_engine.LCB(920.0, 0.0))
+    assert result["draft_aft"] - result["draft_fwd"] == 0.0
+    assert result["residual_m"] == pytest.approx(result["trim_history"][-1]["residual"])
+    
+    batch = solve_trim_newton_batch(np.array([920.0]), np.array([26.0]), trim_hydro_engine, max_evaluations=1)
+    assert batch["status"][0] == "max_evaluations"
+    assert batch["trim"][0] == 0.0
+    assert batch["lcb"][0] == pytest.approx(result["lcb"])
+
+
+def test_stability_with_newton_trim(trim_hydro_engine):
+    """Test calculate_stability with the Newton trim solver."""
+    items = [
+        WeightItem(name="Light Ship", weight=770.0, lcg=26.1, vcg=3.9, tcg=0.0, fsm=0.0),
+        WeightItem(name="Fuel Oil", weight=150.0, lcg=25.5, vcg=2.0, tcg=0.0, fsm=5.0),
+    ]
+    result = calculate_stability(items, trim_hydro_engine, trim_method="newton")
+    
+    assert result.trim_history
+    assert abs(result.trim_history[-1]["residual"]) <= 1e-6
+    assert result.draft_aft - result.draft_fwd == pytest.approx(result.trim)
+
+
+def test_stability_batch_matches_single_conditions(trim_hydro_engine):
+    """Test calculate_stability_batch against per-condition calculate_stability."""
+    rng = np.random.default_rng(0)
+    conditions = []
+    for k in range(40):
+        conditions.append([
+            WeightItem(name="Light Ship", weight=770.0, lcg=26.1, vcg=3.9, tcg=0.0),
+            WeightItem(
+                name="Fuel Oil",
+                weight=float(rng.uniform(20.0, 250.0)),
+                lcg=float(rng.uniform(22.0, 30.0)),
+                vcg=2.0,
+                tcg=float(rng.uniform(-1.0, 1.0)),
+                fsm=5.0,
+            ),
+            WeightItem(name="Stores", weight=10.0, lcg=None, vcg=None, tcg=None),
+        ])
+    # Condition far aft of LCB: clipped at the trim limit
+    conditions.append([WeightItem(name="Aft", weight=920.0, lcg=20.0, vcg=3.0, tcg=0.0)])
+    
+    batch = calculate_stability_batch(conditions, trim_hydro_engine, heel_angles_deg=[0, 5, 10])
+    assert len(batch) == len(conditions)
+    assert batch.kn.shape == batch.gz.shape == (len(conditions), 3)
+    assert batch.trim_status[-1] == "trim_limit"
+    assert batch.trim[-1] == 2.0
+    
+    for i, items in enumerate(conditions):
+        single = calculate_stability(
+            items, trim_hydro_engine, heel_angles_deg=[0, 5, 10], trim_method="newton"
+        )
+        row = batch.result(i)
+        for field in (
+            "total_weight", "lcg", "vcg", "tcg", "total_fsm", "kg_corrected",
+            "kmt", "gm", "trim", "draft_mean", "draft_fwd", "draft_aft", "lcb", "mtc",
+        ):
+            assert getattr(row, field) == pytest.approx(getattr(single, field), abs=1e-9), field
+        for heel in (0, 5, 10):
+            assert row.kn_curve[heel] == pytest.approx(single.kn_curve[heel], abs=1e-12)
+            assert row.gz_curve[heel] == pytest.approx(single.gz_curve[heel], abs=1e-12)
+
+
+def test_stability_batch_rejects_empty_condition(trim_hydro_engine):
+    """Test batch stability validates every condition."""
+    items = [WeightItem(name="Test", weight=920.0, lcg=26.0, vcg=3.0, tcg=0.0)]
+    with pytest.raises(ValueError):
+        calculate_stability_batch([items, []], trim_hydro_engine)
+    with pytest.raises(ValueError):
+        calculate_stability_batch(
+            [items, [WeightItem(name="Zero", weight=0.0, lcg=1.0, vcg=1.0, tcg=0.0)]],
+            trim_hydro_engine,
+        )
+
+
+def test_stability_single_kn_evaluation(sample_items, sample_hydro_engine):
+    """Test GZ pipeline uses one KN interpolation and exposes array curves."""
+    calls = []
+    interpolator = sample_hydro_engine.kn_interpolator
+    
+    def counting(points):
+        calls.append(len(points))
+        return interpolator(points)
+    
+    sample_hydro_engine.kn_interpolator = counting
+    result = calculate_stability(sample_items, sample_hydro_engine, heel_angles_deg=[0, 15, 30])
+    assert calls == [3]
+    
+    assert isinstance(result.kn, np.ndarray)
+    np.testing.assert_array_equal(result.heel_angles_deg, [0, 15, 30])
+    np.testing.assert_allclose(
+        result.gz, result.kn - result.kg_corrected * np.sin(np.deg2rad([0, 15, 30]))
+    )
+    assert result.gz_curve == dict(zip([0, 15, 30], result.gz.tolist()))
+    assert result.kn_curve == sample_hydro_engine.KN_curve(
+        result.total_weight, [0, 15, 30], result.trim
+    )
+    
+    gz_curve = calculate_gz_curve(
+        result.total_weight, result.kg_corrected, result.trim, [0, 15, 30], sample_hydro_engine
+    )
+    assert gz_curve == pytest.approx(result.gz_curve)
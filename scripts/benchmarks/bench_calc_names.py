@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+재계산 벤치마크: Calc 파라미터 defined name 참조 vs INDEX(Calc!$E:$E, MATCH(...)) 전체 열 조회
+
+Usage:
+    python scripts/benchmarks/bench_calc_names.py [--repeat 3] [--soffice soffice]
+
+- agi tr.py build_workbook_sheets() 로 워크북 생성 (이름 참조, 현재 출력)
+- 같은 워크북의 수식에서 Calc 셀 이름을 INDEX/MATCH 전체 열 조회로 되돌린 기준본 생성
+- headless LibreOffice (soffice) 가 있으면 두 파일을 열어 재계산 후 xlsx 로 저장하는 시간 측정
+- 없으면 FormulaEngine (열 벡터 / 셀 단위) 재계산 시간으로 대체
+- 모든 수식 셀 값이 두 파일에서 같은지 확인 (불일치 시 exit code 1)
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.formula_engine import FormulaEngine  # noqa: E402
+
+_CALC_REF = re.compile(r"^'?Calc'?!\$E\$\d+$")
+
+
+def build(agi_tr):
+    wb = Workbook()
+    wb.remove(wb.active)
+    with contextlib.redirect_stdout(io.StringIO()):
+        agi_tr.build_workbook_sheets(wb)
+    return wb
+
+
+def to_index_match(wb) -> int:
+    """Calc 셀 이름 참조 → INDEX(Calc!$E:$E, MATCH("key", Calc!$C:$C, 0)) (변경 이전 수식)"""
+    names = [name for name, d in wb.defined_names.items() if _CALC_REF.match(d.attr_text)]
+    if not names:
+        return 0
+    pattern = re.compile(r'("[^"]*")|(?<![\w.!$])(' + "|".join(map(re.escape, names)) + r")(?![\w(!])")
+
+    def repl(m):
+        if m.group(1):
+            return m.group(1)
+        return f'INDEX(Calc!$E:$E, MATCH("{m.group(2)}", Calc!$C:$C, 0))'
+
+    changed = 0
+    for ws in wb.worksheets:
+        for row in ws.iter_rows():
+            for cell in row:
+                value = cell.value
+                if isinstance(value, str) and value.startswith("="):
+                    new = pattern.sub(repl, value)
+                    if new != value:
+                        cell.value = new
+                        changed += 1
+    for name in names:
+        del wb.defined_names[name]
+    return changed
+
+
+def soffice_recalc(soffice: str, path: Path, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        out = Path(tempfile.mkdtemp(prefix="recalc_"))
+        t0 = time.perf_counter()
+        subprocess.run(
+            [soffice, "--headless", "--calc", "--convert-to", "xlsx", "--outdir", str(out), str(path)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append((time.perf_counter() - t0) * 1e3)
+        shutil.rmtree(out, ignore_errors=True)
+    return statistics.median(times)
+
+
+def engine_recalc(path: Path, vectorize: bool, repeat: int):
+    times, engine = [], None
+    for _ in range(repeat):
+        wb = load_workbook(path, read_only=True)
+        engine = FormulaEngine(wb, vectorize=vectorize)
+        wb.close()
+        t0 = time.perf_counter()
+        engine.evaluate()
+        times.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(times), engine
+
+
+def all_values(engine) -> dict:
+    sheets = sorted({sheet for sheet, _ in engine._groups})
+    return {(sheet, key): value for sheet in sheets for key, value in engine.values(sheet).items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--soffice", default=None, help="soffice 실행 파일 (기본: PATH 검색)")
+    args = parser.parse_args(argv)
+
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    agi_tr = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(agi_tr)
+
+    tmp = Path(tempfile.mkdtemp(prefix="calc_names_"))
+    named, legacy = tmp / "named.xlsx", tmp / "index_match.xlsx"
+    build(agi_tr).save(named)
+    wb = build(agi_tr)
+    changed = to_index_match(wb)
+    wb.save(legacy)
+
+    rows = [("파일 크기 (KB)", named.stat().st_size / 1024, legacy.stat().st_size / 1024)]
+    soffice = args.soffice or shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice:
+        rows.append(("LibreOffice 열기+재계산+저장 (ms)",
+                     soffice_recalc(soffice, named, args.repeat),
+                     soffice_recalc(soffice, legacy, args.repeat)))
+
+    fast_named, e_named = engine_recalc(named, True, args.repeat)
+    fast_legacy, e_legacy = engine_recalc(legacy, True, args.repeat)
+    rows.append(("FormulaEngine 열 벡터 (ms)", fast_named, fast_legacy))
+    rows.append(("FormulaEngine 셀 단위 (ms)",
+                 engine_recalc(named, False, 1)[0], engine_recalc(legacy, False, 1)[0]))
+
+    a, b = all_values(e_named), all_values(e_legacy)
+    ok = a.keys() == b.keys() and all(a[k] == b[k] for k in a)
+
+    print("=" * 72)
+    print(f"수식 셀={len(a)}, INDEX/MATCH 로 되돌린 셀={changed}")
+    if not soffice:
+        print("soffice 없음 → LibreOffice 재계산 생략, FormulaEngine 재계산으로 대체")
+    print(f"{'':36s}{'이름 참조':>12s}{'INDEX/MATCH':>14s}")
+    for label, x, y in rows:
+        print(f"{label:36s}{x:12.1f}{y:14.1f}")
+    print(f"결과 일치: {ok}")
+    print("=" * 72)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
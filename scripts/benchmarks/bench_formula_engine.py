@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+수식 계산 벤치마크: FormulaEngine 열 단위 벡터 계산 vs 셀 단위 계산 (src/formula_engine.py)
+
+Usage:
+    python scripts/benchmarks/bench_formula_engine.py [--workbook LCT_BUSHRA_AGI_TR.xlsx] [--repeat 5]
+
+- --workbook 미지정 시 agi tr.py build_workbook_sheets() 로 전체 워크북 생성 (캐시 값 없음)
+- read_only 로드 + 그룹화(적재) / 계산 단계별 median 시간(ms), 수식 셀·그룹 수 출력
+- vectorize=False (1셀씩 계산) 와 모든 수식 셀 값이 같은지 확인 (불일치 시 exit code 1)
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.formula_engine import FormulaEngine  # noqa: E402
+
+
+def build_workbook(path: Path) -> None:
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    agi_tr = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(agi_tr)
+    wb = Workbook()
+    wb.remove(wb.active)
+    with contextlib.redirect_stdout(io.StringIO()):
+        agi_tr.build_workbook_sheets(wb)
+    wb.save(path)
+
+
+def run(path: Path, vectorize: bool) -> dict:
+    t0 = time.perf_counter()
+    wb = load_workbook(path, read_only=True)
+    engine = FormulaEngine(wb, vectorize=vectorize)
+    wb.close()
+    t1 = time.perf_counter()
+    engine.evaluate()
+    t2 = time.perf_counter()
+    return {"engine": engine, "load_ms": (t1 - t0) * 1e3, "eval_ms": (t2 - t1) * 1e3}
+
+
+def measure(path: Path, vectorize: bool, repeat: int) -> dict:
+    runs = [run(path, vectorize) for _ in range(repeat)]
+    return {
+        "engine": runs[-1]["engine"],
+        "load_ms": statistics.median(r["load_ms"] for r in runs),
+        "eval_ms": statistics.median(r["eval_ms"] for r in runs),
+    }
+
+
+def all_values(engine: FormulaEngine) -> dict:
+    sheets = sorted({sheet for sheet, _ in engine._groups})
+    return {(sheet, key): value for sheet in sheets for key, value in engine.values(sheet).items()}
+
+
+def same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+    return a == b
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workbook", type=Path, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    path = args.workbook
+    if path is None:
+        path = Path(tempfile.mkdtemp(prefix="formula_engine_")) / "LCT_BUSHRA_AGI_TR.xlsx"
+        build_workbook(path)
+
+    fast = measure(path, True, args.repeat)
+    slow = measure(path, False, max(1, args.repeat // 5))
+    a, b = all_values(fast["engine"]), all_values(slow["engine"])
+    ok = a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    groups = sum(len(g) for g in fast["engine"]._groups.values())
+
+    print("=" * 64)
+    print(f"workbook: {path.name}, 수식 셀={len(a)}, 열 그룹={groups}, "
+          f"고유 수식={len(fast['engine']._compiled)}, 미지원={len(fast['engine'].unsupported)}")
+    print(f"read_only 로드 + 그룹화 : {fast['load_ms']:8.1f} ms")
+    print(f"열 벡터 계산            : {fast['eval_ms']:8.1f} ms")
+    print(f"셀 단위 계산 (기준)     : {slow['eval_ms']:8.1f} ms  ({slow['eval_ms'] / fast['eval_ms']:.0f}x)")
+    print(f"결과 일치               : {ok}")
+    print("=" * 64)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+interpolate_tmean_from_disp() / gm_2d_bilinear() vs HydroTables 벤치마크
+
+Usage:
+    python scripts/benchmarks/bench_hydro_tables.py [--points 100000]
+
+- 동일한 random (Δ, Trim) 점에 대해 기존 함수, HydroTables scalar, HydroTables 벡터를 비교
+- 호출당 시간(µs)과 결과 일치 여부를 출력
+"""
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_agi_tr():
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _time(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    agi_tr = load_agi_tr()
+    hydro_table = agi_tr._load_json("data/hydro_table.json") or []
+
+    _, t_load = _time(agi_tr.HydroTables.load)
+    tables, t_cached = _time(agi_tr.HydroTables.load)
+
+    rng = np.random.default_rng(args.seed)
+    disp = rng.uniform(2400.0, 4400.0, args.points)
+    trim = rng.uniform(-2.0, 2.0, args.points)
+    dl, tl = disp.tolist(), trim.tolist()
+
+    legacy_t, t_legacy_t = _time(
+        lambda: [agi_tr.interpolate_tmean_from_disp(d, hydro_table) for d in dl]
+    )
+    scalar_t, t_scalar_t = _time(lambda: [tables.tmean(d) for d in dl])
+    vector_t, t_vector_t = _time(lambda: tables.tmean_array(disp))
+
+    legacy_g, t_legacy_g = _time(
+        lambda: [agi_tr.gm_2d_bilinear(d, t) for d, t in zip(dl, tl)]
+    )
+    scalar_g, t_scalar_g = _time(lambda: [tables.gm(d, t) for d, t in zip(dl, tl)])
+    vector_g, t_vector_g = _time(lambda: tables.gm_array(disp, trim))
+
+    identical = (
+        legacy_t == scalar_t == vector_t.tolist()
+        and legacy_g == scalar_g == vector_g.tolist()
+    )
+
+    per = 1e6 / args.points
+    print("=" * 60)
+    print(f"points={args.points:,}")
+    print(f"HydroTables.load (first / cached) : {t_load * 1e3:8.2f} / {t_cached * 1e3:.4f} ms")
+    print("                      legacy    scalar    vector  (µs/call)")
+    print(f"tmean(disp)        {t_legacy_t * per:9.3f} {t_scalar_t * per:9.3f} {t_vector_t * per:9.3f}")
+    print(f"gm(disp, trim)     {t_legacy_g * per:9.3f} {t_scalar_g * per:9.3f} {t_vector_g * per:9.3f}")
+    print(f"identical results  : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+엔진 import 시간 벤치마크 (새 인터프리터에서 측정)
+
+Usage:
+    python scripts/benchmarks/bench_import_time.py [--repeat 7] [--budget-ms 50]
+
+- src.roro_engine.solver (순수 solver 진입점), src.roro_engine.batch, agi tr.py 전체
+- 각 대상의 import 시간 median(ms)과 함께 로드된 heavy 모듈(numpy/scipy/openpyxl/matplotlib) 표시
+- solver 진입점이 budget 을 넘거나 heavy 모듈을 로드하면 exit code 1
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY = ("numpy", "scipy", "openpyxl", "matplotlib", "pandas")
+
+TARGETS = {
+    "src.roro_engine.solver": "import src.roro_engine.solver",
+    "src.roro_engine.batch": "import src.roro_engine.batch",
+    "agi tr.py": (
+        "import importlib.util as u;"
+        "s = u.spec_from_file_location('agi_tr', 'agi tr.py');"
+        "m = u.module_from_spec(s); s.loader.exec_module(m)"
+    ),
+}
+
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+{stmt}
+dt = time.perf_counter() - t0
+print(json.dumps({{"ms": dt * 1e3, "heavy": sorted(m for m in {heavy!r} if m in sys.modules)}}))
+"""
+
+
+def measure(stmt: str) -> dict:
+    code = _PROBE.format(stmt=stmt, heavy=HEAVY)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    ok = True
+    for name, stmt in TARGETS.items():
+        runs = [measure(stmt) for _ in range(args.repeat)]
+        ms = statistics.median(r["ms"] for r in runs)
+        heavy = runs[-1]["heavy"]
+        print(f"{name:<24}: {ms:8.1f} ms   heavy={','.join(heavy) or '-'}")
+        if name == "src.roro_engine.solver":
+            ok = ms <= args.budget_ms and not heavy
+    print(f"solver entry point within {args.budget_ms:.0f} ms budget: {ok}")
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
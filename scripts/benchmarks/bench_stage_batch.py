@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+solve_stage() vs solve_stages_batch() 벤치마크
+
+Usage:
+    python scripts/benchmarks/bench_stage_batch.py [--cases 100000] [--loads 3]
+
+- 동일한 random what-if load case (weight / x) 를 scalar loop 와 batch 로 계산
+- 결과 일치 여부와 speed-up 배수를 출력
+"""
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_agi_tr():
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=100_000)
+    parser.add_argument("--loads", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    agi_tr = load_agi_tr()
+    params = {
+        "MTC": 34.00,
+        "LCF": 0.76,
+        "LBP": 60.302,
+        "D_vessel": 3.65,
+        "hydro_table": agi_tr._load_json("data/hydro_table.json") or [],
+    }
+
+    rng = np.random.default_rng(args.seed)
+    weights = rng.uniform(0.0, 600.0, (args.cases, args.loads))
+    x_positions = rng.uniform(-30.0, 30.0, (args.cases, args.loads))
+    cases = [
+        [agi_tr.LoadItem(f"L{j}", w, x, "CARGO") for j, (w, x) in enumerate(zip(ws, xs))]
+        for ws, xs in zip(weights.tolist(), x_positions.tolist())
+    ]
+
+    t0 = time.perf_counter()
+    scalar = [agi_tr.solve_stage(2800.0, 2.00, loads, **params) for loads in cases]
+    t_scalar = time.perf_counter() - t0
+
+    t_batch = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        batch = agi_tr.solve_stages_batch(2800.0, 2.00, weights, x_positions, **params)
+        t_batch = min(t_batch, time.perf_counter() - t0)
+
+    identical = all(
+        np.array_equal(batch[key], [res[key] for res in scalar]) for key in batch
+    )
+
+    print("=" * 60)
+    print(f"cases={args.cases:,}  loads/case={args.loads}")
+    print(f"solve_stage loop   : {t_scalar * 1e3:10.1f} ms")
+    print(f"solve_stages_batch : {t_batch * 1e3:10.1f} ms")
+    print(f"speed-up           : {t_scalar / t_batch:10.1f} x")
+    print(f"identical results  : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Stage × 조위 결합 판정 벤치마크: Stage/시간 이중 loop vs StageTideFeasibility (broadcasting)
+
+Usage:
+    python scripts/benchmarks/bench_stage_tide.py [--hours 8760] [--duration 2]
+
+- data/gateab_v3_tide_data.json 을 --hours 길이로 반복 확장 (기본 1년)
+- Stage 1→7 (9 Stage) 흘수는 solve_stage 로 1회 계산 (Pre-ballast 40 t)
+- (stages, hours) 판정 행렬 + 순차 실행 시작 시각 계산 시간(ms) 및 결과 일치 여부 출력
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.roro_engine.data_io import _load_json  # noqa: E402
+from src.roro_engine.params import DEFAULT_PARAMS  # noqa: E402
+from src.roro_engine.stage_tide import StageTideFeasibility  # noqa: E402
+from src.roro_engine.tide import TideWorkability  # noqa: E402
+
+STAGE_PARAMS = {
+    "MTC": 34.00,
+    "LCF": 0.76,
+    "LBP": 60.302,
+    "D_vessel": 3.65,
+    "W_TR": 271.20,
+    "FR_TR1_RAMP_START": 40.15,
+    "FR_TR1_RAMP_MID": 37.00,
+    "FR_TR1_STOW": 42.0,
+    "FR_TR2_RAMP": 17.95,
+    "FR_TR2_STOW": 40.00,
+    "FR_PREBALLAST": 3.0,
+    # ramp angle 완화 (기본 K−Z 3.0 m 에서는 Stage 1→7 연속 시간대가 없음)
+    "KminusZ_m": 1.2,
+    "theta_max_deg": 10.0,
+}
+
+
+def legacy(dfwd: list[float], tide_m: list[float], duration: int, p: dict):
+    ok = []
+    for d in dfwd:
+        row = []
+        for tide in tide_m:
+            angle = math.degrees(math.atan((p["KminusZ_m"] - d + tide) / p["L_ramp_m"]))
+            row.append(
+                p["min_fwd_draft_m"] <= d <= p["max_fwd_draft_m"]
+                and angle <= p["theta_max_deg"]
+                and p["D_vessel_m"] - d + tide >= p["linkspan_freeboard_target_m"]
+            )
+        ok.append(row)
+    n, span = len(tide_m), duration * len(dfwd)
+    starts = [False] * n
+    for t in range(n - span + 1):
+        starts[t] = all(
+            all(ok[i][t + i * duration : t + (i + 1) * duration]) for i in range(len(dfwd))
+        )
+    return ok, starts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=int, default=8760)
+    parser.add_argument("--duration", type=int, default=2, help="Stage 당 소요 시간 (h)")
+    args = parser.parse_args(argv)
+
+    base = TideWorkability.from_json()
+    n = args.hours
+    times = np.datetime64("2025-12-01T00:00:00") + np.arange(n).astype("timedelta64[h]")
+    params = {**STAGE_PARAMS, "hydro_table": _load_json("data/hydro_table.json") or []}
+    tw = TideWorkability(times, np.resize(base.tide_m, n), params)
+
+    t0 = time.perf_counter()
+    feas = StageTideFeasibility.solve(tw, 40.0, params)
+    ok = feas.evaluate()["ok"]
+    start_ok = feas.sequence_start_ok(args.duration, ok)
+    windows = feas.sequence_windows(args.duration, ok)
+    t_vector = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ok_legacy, starts_legacy = legacy(
+        feas.dfwd_m.tolist(), tw.tide_m.tolist(), args.duration, {**DEFAULT_PARAMS, **params}
+    )
+    t_legacy = time.perf_counter() - t0
+
+    identical = ok.tolist() == ok_legacy and start_ok.tolist() == starts_legacy
+    print("=" * 60)
+    print(f"stages={len(feas.stage_names)}  hours={n:,}  duration={args.duration} h/stage")
+    print(f"feasible starts={int(start_ok.sum()):,}  windows={len(windows):,}")
+    print(f"python loop          : {t_legacy * 1e3:9.2f} ms")
+    print(f"StageTideFeasibility : {t_vector * 1e3:9.2f} ms")
+    print(f"identical result     : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
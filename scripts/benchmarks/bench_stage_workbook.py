@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Stage 워크북 → Stability JSON 벤치마크: 일반 load_workbook + ws.cell() vs read_only 스트리밍 (read_stage_workbook)
+
+Usage:
+    python scripts/benchmarks/bench_stage_workbook.py [--workbook LCT_BUSHRA_AGI_TR.xlsx] [--repeat 5]
+
+- --workbook 미지정 시 agi tr.py build_workbook_sheets() 로 전체 워크북 생성
+  (+ master_tanks.json 전 탱크 × Stage 행의 Stage_Tanks 시트 추가)
+- 기존 방식(일반 모드, cell 단위 while loop) 과 read_stage_workbook 의 median 시간(ms),
+  tracemalloc peak(MB) 및 stage_workbook_to_stability_json 출력 일치 여부 출력
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import bushra_excel_bridge_v1 as bridge  # noqa: E402
+
+MASTER_JSON = ROOT / "bushra_stability" / "data" / "master_tanks.json"
+
+
+def build_workbook(path: Path) -> None:
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    agi_tr = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(agi_tr)
+    wb = Workbook()
+    wb.remove(wb.active)
+    with contextlib.redirect_stdout(io.StringIO()):
+        agi_tr.build_workbook_sheets(wb)
+    stage_ws = wb["RORO_Stage_Scenarios"]
+    stages = [
+        stage_ws.cell(row=r, column=1).value
+        for r in range(bridge.FIRST_STAGE_ROW, stage_ws.max_row + 1)
+        if stage_ws.cell(row=r, column=1).value
+    ]
+    tanks_ws = wb.create_sheet("Stage_Tanks")
+    tanks_ws.append(["Stage", "Tank_ID", "Percent_Fill", "SG"])
+    for k, stage in enumerate(stages):
+        for j, tank in enumerate(bridge.load_master_tanks_json(MASTER_JSON)):
+            tanks_ws.append([stage, tank.tank_id, float((k * 7 + j * 13) % 100), None])
+    wb.save(path)
+
+
+def legacy_read(path: Path) -> dict:
+    """이전 구현: 일반 모드 load_workbook + ws.cell(row, col) while loop."""
+    wb = load_workbook(filename=path, data_only=True)
+    calc_params = {}
+    for row in wb["Calc"].iter_rows(min_row=2, values_only=True):
+        if row[0] and isinstance(row[3], (int, float)):
+            calc_params[str(row[0])] = float(row[3])
+
+    def _f(v):
+        return float(v) if isinstance(v, (int, float)) else None
+
+    ws = wb["RORO_Stage_Scenarios"]
+    stages = {}
+    r = bridge.FIRST_STAGE_ROW
+    while True:
+        name = ws.cell(row=r, column=1).value
+        if name is None or str(name).strip() == "":
+            break
+        stages[str(name)] = {
+            "name": str(name),
+            "mean_draft_m": _f(ws.cell(row=r, column=2).value),
+            "trim_m_input": _f(ws.cell(row=r, column=3).value),
+            "trim_cm_computed": _f(ws.cell(row=r, column=7).value),
+            "w_stage_t": _f(ws.cell(row=r, column=4).value),
+            "x_stage_m_mid": _f(ws.cell(row=r, column=5).value),
+        }
+        r += 1
+
+    stage_tanks = []
+    if "Stage_Tanks" in wb.sheetnames:
+        st_ws = wb["Stage_Tanks"]
+        header = [c.value for c in st_ws[1]]
+        col_idx = {str(h): i + 1 for i, h in enumerate(header) if h}
+        for row in st_ws.iter_rows(min_row=2, values_only=True):
+            if not any(row):
+                continue
+            stage_tanks.append(
+                (
+                    str(row[col_idx.get("Stage", 1) - 1]),
+                    str(row[col_idx.get("Tank_ID", 2) - 1]),
+                    row[col_idx.get("Percent_Fill", 3) - 1],
+                    row[col_idx.get("SG", 4) - 1] if "SG" in col_idx else None,
+                )
+            )
+    return {"calc_params": calc_params, "stages": stages, "stage_tanks": stage_tanks}
+
+
+def measure(func, path: Path, repeat: int):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func(path)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, statistics.median(times) * 1e3, peak / 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workbook", type=Path, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    tmp = Path(tempfile.mkdtemp(prefix="stage_wb_"))
+    path = args.workbook
+    if path is None:
+        path = tmp / "LCT_BUSHRA_AGI_TR.xlsx"
+        build_workbook(path)
+
+    old, t_old, m_old = measure(legacy_read, path, args.repeat)
+    new, t_new, m_new = measure(bridge.read_stage_workbook, path, args.repeat)
+
+    t0 = time.perf_counter()
+    out = bridge.stage_workbook_to_stability_json(path, MASTER_JSON, tmp / "stability.json")
+    t_json = (time.perf_counter() - t0) * 1e3
+
+    print("=" * 60)
+    print(f"workbook: {path.name} ({path.stat().st_size / 1e3:.0f} kB), stages={len(new['stages'])}, "
+          f"stage tanks={len(new['stage_tanks'])}")
+    print(f"일반 모드 + ws.cell   : {t_old:8.1f} ms  peak {m_old:6.1f} MB")
+    print(f"read_stage_workbook  : {t_new:8.1f} ms  peak {m_new:6.1f} MB  ({t_old / t_new:.1f}x)")
+    print(f"stability JSON 전체  : {t_json:8.1f} ms -> {out}")
+    print(f"결과 일치            : {old == new}")
+    print("=" * 60)
+    return 0 if old == new else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Stage 탱크 합계 벤치마크: build_tank_plan + tank_sums_for_stage (TankState) vs TankPlanMatrix
+
+Usage:
+    python scripts/benchmarks/bench_tank_plan.py [--stages 1000] [--tanks 31]
+
+- master_tanks.json 의 탱크를 --tanks 개까지 복제 (Tank_ID 접미사)
+- Stage 마다 임의 충전율 / SG override 생성
+- Stage 별 TankState 목록 + 합계 vs Stage × Tank 행렬 1회 곱 시간(ms) 및 결과 일치 여부 출력
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import bushra_excel_bridge_v1 as bridge  # noqa: E402
+
+MASTER_JSON = ROOT / "bushra_stability" / "data" / "master_tanks.json"
+
+
+def make_tanks(n_tanks: int):
+    base = bridge.load_master_tanks_json(MASTER_JSON)
+    return [replace(base[k % len(base)], tank_id=f"{base[k % len(base)].tank_id}#{k}") for k in range(n_tanks)]
+
+
+def make_stages(tanks, n_stages: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    stages = []
+    for i in range(n_stages):
+        fills = np.where(rng.random(len(tanks)) < 0.6, rng.uniform(0.0, 100.0, len(tanks)), 0.0)
+        pf_map = {t.tank_id: float(f) for t, f in zip(tanks, fills)}
+        sg_map = {t.tank_id: 1.1 for t in tanks if rng.random() < 0.1}
+        stages.append((f"Stage {i}", pf_map, sg_map))
+    return stages
+
+
+def legacy(tanks, stages):
+    return [
+        bridge.tank_sums_for_stage(bridge.build_tank_plan(tanks, pf_map, sg_override_by_id=sg_map))
+        for _, pf_map, sg_map in stages
+    ]
+
+
+def vectorised(tanks, stages):
+    return bridge.TankPlanMatrix.from_stage_maps(tanks, stages).tank_sums()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stages", type=int, default=1000)
+    parser.add_argument("--tanks", type=int, default=31)
+    args = parser.parse_args(argv)
+
+    tanks = make_tanks(args.tanks)
+    stages = make_stages(tanks, args.stages)
+
+    t0 = time.perf_counter()
+    old = legacy(tanks, stages)
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = vectorised(tanks, stages)
+    t_new = time.perf_counter() - t0
+
+    fields = ("total_weight_t", "lcg_m_ap", "vcg_m", "tcg_m", "total_fsm_tm")
+    a = np.array([[getattr(s, f) for f in fields] for s in old])
+    b = np.array([[getattr(s, f) for f in fields] for s in new])
+    identical = np.allclose(a, b, rtol=1e-12, atol=1e-9)
+
+    print(f"stages={args.stages}  tanks={args.tanks}")
+    print(f"TankState 경로     : {t_old * 1e3:9.2f} ms")
+    print(f"TankPlanMatrix     : {t_new * 1e3:9.2f} ms  ({t_old / t_new:.1f}x)")
+    print(f"결과 일치          : {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+조위 기간 벤치마크: December_Tide_2025 + Hourly_FWD_AFT_Heights 생성 시간 / 파일 크기 vs 조위 개월 수
+
+Usage:
+    python scripts/benchmarks/bench_tide_span.py [--months 1 3 6 12] [--repeat 3] [--csv]
+
+- data/gateab_v3_tide_data.json (12월 744h) 을 반복해 N개월 시간 연속 조위 파일 생성 (JSON / --csv)
+- $BUSHRA_TIDE_FILE 로 지정 후 Calc + 조위 + Hourly 시트 생성·저장 median 시간(ms), 파일 크기 출력
+- Hourly 공유 수식 블록 vs 셀마다 수식 문자열 저장 크기 비교
+- 최대 기간 워크북을 FormulaEngine 으로 계산해 TideWorkability 와 Dfwd / Status 일치 확인 (불일치 시 exit code 1)
+"""
+
+import argparse
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from openpyxl import Workbook
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.formula_engine import evaluate_workbook  # noqa: E402
+from src.roro_engine.tide import TIDE_FILE_ENV, TideWorkability  # noqa: E402
+from src.shared_formula import SharedFormula  # noqa: E402
+
+SHEETS = ("create_calc_sheet", "create_tide_sheet", "create_hourly_sheet")
+
+
+def write_series(path: Path, months: int, as_csv: bool) -> int:
+    with open(ROOT / "data" / "gateab_v3_tide_data.json", encoding="utf-8") as f:
+        base = [r["tide_m"] for r in json.load(f)]
+    start = datetime(2025, 12, 1)
+    hours = len(base) * months
+    rows = (
+        ((start + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"), base[i % len(base)])
+        for i in range(hours)
+    )
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if as_csv:
+            w = csv.writer(f)
+            w.writerow(["datetime_gst", "tide_m"])
+            w.writerows(rows)
+        else:
+            json.dump([{"datetime": t, "tide_m": h} for t, h in rows], f)
+    return hours
+
+
+def build(agi_tr, path: Path, shared: bool = True) -> float:
+    t0 = time.perf_counter()
+    wb = Workbook()
+    wb.remove(wb.active)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in SHEETS:
+            getattr(agi_tr, name)(wb)
+    if not shared:  # 비교용: 셀마다 수식 문자열
+        for row in wb["Hourly_FWD_AFT_Heights"].iter_rows():
+            for cell in row:
+                if isinstance(cell.value, SharedFormula):
+                    cell.value = cell.value.formula
+    wb.save(path)
+    return (time.perf_counter() - t0) * 1e3
+
+
+def check(path: Path, tide_file: Path) -> bool:
+    engine = evaluate_workbook(path)
+    values = engine.values("Hourly_FWD_AFT_Heights")
+    rows = sorted(int(k[1:]) for k in values if k.startswith("C"))
+    tw = TideWorkability.from_json(str(tide_file))
+    res = tw.evaluate()
+    dfwd = np.array([values[f"E{r}"] for r in rows])
+    status = [values[f"H{r}"] for r in rows]
+    return (
+        len(rows) == len(tw)
+        and np.allclose(dfwd, res["dfwd_m"], rtol=0, atol=1e-12)
+        and status == tw.status(res["ok"]).tolist()
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--months", type=int, nargs="+", default=[1, 3, 6, 12])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--csv", action="store_true", help="조위 파일을 CSV 로 생성")
+    args = parser.parse_args(argv)
+
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    agi_tr = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(agi_tr)
+
+    tmp = Path(tempfile.mkdtemp(prefix="tide_span_"))
+    previous = os.environ.get(TIDE_FILE_ENV)
+    print("=" * 80)
+    print(f"{'개월':>4s}{'시간':>8s}{'생성+저장 ms':>14s}{'ms/월':>10s}"
+          f"{'공유 수식 KB':>14s}{'KB/월':>9s}{'셀별 수식 KB':>14s}")
+    ok = True
+    try:
+        for months in args.months:
+            tide_file = tmp / f"tide_{months}m.{'csv' if args.csv else 'json'}"
+            hours = write_series(tide_file, months, args.csv)
+            os.environ[TIDE_FILE_ENV] = str(tide_file)
+            out = tmp / f"hourly_{months}m.xlsx"
+            ms = statistics.median(build(agi_tr, out) for _ in range(args.repeat))
+            size = out.stat().st_size / 1024
+            plain = tmp / f"hourly_{months}m_plain.xlsx"
+            build(agi_tr, plain, shared=False)
+            plain_size = plain.stat().st_size / 1024
+            print(f"{months:4d}{hours:8d}{ms:14.1f}{ms / months:10.1f}"
+                  f"{size:14.1f}{size / months:9.1f}{plain_size:14.1f}")
+        ok = check(out, tide_file)
+    finally:
+        if previous is None:
+            os.environ.pop(TIDE_FILE_ENV, None)
+        else:
+            os.environ[TIDE_FILE_ENV] = previous
+    print(f"{args.months[-1]}개월 Hourly 값 = TideWorkability: {ok}")
+    print("=" * 80)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
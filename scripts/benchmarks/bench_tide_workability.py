@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+조위 작업 가능 시간대 벤치마크: 기존 per-row loop vs TideWorkability (NumPy)
+
+Usage:
+    python scripts/benchmarks/bench_tide_workability.py [--hours 100000]
+
+- data/gateab_v3_tide_data.json 을 --hours 길이로 반복 확장 (다년치 시계열 가정)
+- 기존 realtime_analysis loop(math) 와 evaluate()+ok_intervals() 시간(ms) 및 Status 일치 여부 출력
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from src.roro_engine.params import DEFAULT_PARAMS  # noqa: E402
+from src.roro_engine.tide import TideWorkability  # noqa: E402
+
+
+def legacy_status(tide_m: list[float], p: dict) -> list[bool]:
+    out = []
+    for tide in tide_m:
+        dfwd = p["KminusZ_m"] + tide - p["L_ramp_m"] * math.tan(math.radians(p["theta_max_deg"]))
+        angle = math.degrees(math.atan((p["KminusZ_m"] - dfwd + tide) / p["L_ramp_m"]))
+        out.append(
+            p["min_fwd_draft_m"] <= dfwd <= p["max_fwd_draft_m"] and angle <= p["theta_max_deg"]
+        )
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    base = TideWorkability.from_json()
+    n = args.hours
+    times = np.datetime64("2025-12-01T00:00:00") + np.arange(n).astype("timedelta64[h]")
+    tide = np.resize(base.tide_m, n)
+    tw = TideWorkability(times, tide)
+
+    t0 = time.perf_counter()
+    legacy = legacy_status(tide.tolist(), DEFAULT_PARAMS)
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    res = tw.evaluate()
+    intervals = tw.ok_intervals(res["ok"])
+    t_vector = time.perf_counter() - t0
+
+    identical = res["ok"].tolist() == legacy
+    print("=" * 60)
+    print(f"hours={n:,}  OK={int(res['ok'].sum()):,}  windows={len(intervals):,}")
+    print(f"legacy loop          : {t_legacy * 1e3:9.2f} ms")
+    print(f"TideWorkability      : {t_vector * 1e3:9.2f} ms")
+    print(f"identical status     : {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
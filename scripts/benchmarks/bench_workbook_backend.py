@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+워크북 backend 벤치마크: openpyxl 일반 Workbook vs write_only 스트리밍 (src/sheet_payload.py)
+
+Usage:
+    python scripts/benchmarks/bench_workbook_backend.py [--repeat 3] [--out-dir /tmp]
+
+- 동일한 build_workbook_sheets() 를 두 backend 로 실행 후 저장
+- backend 별 시트 생성 / 저장 시간(ms), tracemalloc peak(MB) median 출력
+- 두 파일의 모든 셀 값·수식이 동일한지 확인 (불일치 시 exit code 1)
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def load_agi_tr():
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build(agi_tr, backend: str, path: Path) -> dict:
+    from src.sheet_payload import PayloadWorkbook, write_payload_workbook
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if backend == "write_only":
+            wb = PayloadWorkbook()
+        else:
+            wb = Workbook()
+            wb.remove(wb.active)
+        agi_tr.build_workbook_sheets(wb)
+        t1 = time.perf_counter()
+        if backend == "write_only":
+            write_payload_workbook(wb, path)
+        else:
+            wb.save(path)
+    t2 = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"sheets_ms": (t1 - t0) * 1e3, "save_ms": (t2 - t1) * 1e3, "peak_mb": peak / 1e6}
+
+
+def cell_values(path: Path) -> dict:
+    wb = load_workbook(path)
+    return {
+        ws.title: {k: c.value for k, c in ws._cells.items() if c.value is not None}
+        for ws in wb.worksheets
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out-dir", type=str, default=None)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    agi_tr = load_agi_tr()
+    out_dir = Path(args.out_dir or tempfile.mkdtemp(prefix="wb_backend_"))
+
+    print("=" * 60)
+    paths = {}
+    for backend in ("standard", "write_only"):
+        paths[backend] = out_dir / f"bench_{backend}.xlsx"
+        runs = [build(agi_tr, backend, paths[backend]) for _ in range(args.repeat)]
+        med = {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+        print(
+            f"{backend:<11}: sheets {med['sheets_ms']:8.1f} ms  save {med['save_ms']:8.1f} ms"
+            f"  peak {med['peak_mb']:6.1f} MB"
+        )
+
+    identical = cell_values(paths["standard"]) == cell_values(paths["write_only"])
+    print(f"identical cell values/formulas: {identical}")
+    print("=" * 60)
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
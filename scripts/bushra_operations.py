@@ -9,10 +9,17 @@ from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.utils import get_column_letter
 from datetime import datetime
 import json
-import math
+import numpy as np
 import pandas as pd
 import argparse
 import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가 (src.roro_engine)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.roro_engine.tide import TideWorkability  # noqa: E402
 
 
 class BushraOperations:
@@ -213,16 +220,19 @@ class BushraOperations:
 
         print("\n[Adding Data Validation]")
 
+        # 드롭다운 범위 = Hourly 시트의 실제 조위 시간 수 (1개월 고정 아님)
+        last_row = wb["Hourly_FWD_AFT_Heights"].max_row
+        hours = last_row - 1
         dv = DataValidation(
             type="list",
-            formula1="Hourly_FWD_AFT_Heights!$A$2:$A$745",
+            formula1=f"Hourly_FWD_AFT_Heights!$A$2:$A${last_row}",
             allow_blank=True,
             showDropDown=True,
             showErrorMessage=True,
             errorTitle="Invalid Time",
-            error="Please select a time from the dropdown list (December 2025, 744 hours)",
+            error=f"Please select a time from the dropdown list ({hours} hours)",
             promptTitle="Select Reference Time",
-            prompt="Choose a time from December 2025 tide table (744 hours available)",
+            prompt=f"Choose a time from the tide table ({hours} hours available)",
         )
 
         dv.add("C2:C6")
@@ -506,7 +516,7 @@ class BushraOperations:
 
         # 조수 데이터 검증
         tide = wb["December_Tide_2025"]
-        expected_rows = 745
+        expected_rows = wb["Hourly_FWD_AFT_Heights"].max_row  # 조위 시간 수 + 헤더
         actual_rows = tide.max_row
         if actual_rows == expected_rows:
             passed_tests.append(f"Tide data: {actual_rows} rows complete")
@@ -586,105 +596,104 @@ class BushraOperations:
 
     # ========== ANALYSIS FUNCTIONS ==========
 
-    def realtime_analysis(self):
-        """실시간 Draft 분석"""
+    def _calc_params(self):
+        """v4 HYBRID Calc 시트 파라미터 (read_only 로 D8:D18 만 읽음, 파일 없으면 None)"""
+        try:
+            wb = load_workbook(self.final_file, read_only=True, data_only=True)
+        except FileNotFoundError:
+            return None
+        rows = [
+            r[0]
+            for r in wb["Calc"].iter_rows(
+                min_row=8, max_row=18, min_col=4, max_col=4, values_only=True
+            )
+        ]
+        wb.close()
+        cell = dict(zip(range(8, 19), rows))
+        return {
+            "L_ramp": cell[8],
+            "theta_max": cell[9],
+            "KminusZ": cell[10],
+            "min_draft": cell[13],
+            "max_draft": cell[14],
+            "MTC": cell[17],
+            "LCF": cell[18],
+        }
+
+    def realtime_analysis(self, tide_json=None):
+        """실시간 Draft 분석 (TideWorkability: 조위 JSON 직접 로드, NumPy 벡터 계산)"""
         print("=" * 80)
         print("[INFO] MACHO-GPT LogiMaster - Stage 실시간 Draft 분석")
         print("=" * 80)
         print(f"분석 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
+        params = self._calc_params()
+        if params is None:
+            print("[WARN] Final file not found → 기본 파라미터(DEFAULT_PARAMS) 사용")
+            engine_params = None
+        else:
+            print("[OK] v4 HYBRID Calc 파라미터 로드 완료")
+            engine_params = {
+                "L_ramp_m": params["L_ramp"],
+                "theta_max_deg": params["theta_max"],
+                "KminusZ_m": params["KminusZ"],
+                "min_fwd_draft_m": params["min_draft"],
+                "max_fwd_draft_m": params["max_draft"],
+            }
+
         try:
-            wb = load_workbook(self.final_file, data_only=True)
-            print("[OK] v4 HYBRID 파일 로드 완료")
+            tw = TideWorkability.from_json(tide_json, params=engine_params)
         except FileNotFoundError:
-            print("[ERROR] Final file not found")
+            print(f"[ERROR] Tide data not found: {tide_json or 'data/gateab_v3_tide_data.json'}")
             return False
-
-        calc = wb["Calc"]
-        params = {
-            "L_ramp": calc.cell(8, 4).value,
-            "theta_max": calc.cell(9, 4).value,
-            "KminusZ": calc.cell(10, 4).value,
-            "min_draft": calc.cell(13, 4).value,
-            "max_draft": calc.cell(14, 4).value,
-            "MTC": calc.cell(17, 4).value,
-            "LCF": calc.cell(18, 4).value,
-        }
-
-        tide_sheet = wb["December_Tide_2025"]
-        tide_data = []
-        for row in range(2, tide_sheet.max_row + 1):
-            dt = tide_sheet.cell(row, 1).value
-            tide = tide_sheet.cell(row, 2).value
-            if dt and tide:
-                tide_data.append(
-                    {
-                        "datetime": dt,
-                        "tide_m": float(tide) if isinstance(tide, (int, float)) else 0,
-                    }
-                )
-
-        hourly_data = []
-        for tide_entry in tide_data:
-            dt = tide_entry["datetime"]
-            tide = tide_entry["tide_m"]
-            dfwd = (
-                params["KminusZ"]
-                + tide
-                - params["L_ramp"] * math.tan(math.radians(params["theta_max"]))
-            )
-            daft = dfwd
-            angle = math.degrees(
-                math.atan((params["KminusZ"] - dfwd + tide) / params["L_ramp"])
-            )
-            status = (
-                "OK"
-                if (
-                    params["min_draft"] <= dfwd <= params["max_draft"]
-                    and angle <= params["theta_max"]
-                )
-                else "CHECK"
-            )
-
-            hourly_data.append(
-                {
-                    "datetime": str(dt),
-                    "tide_m": tide,
-                    "dfwd_m": dfwd,
-                    "daft_m": daft,
-                    "status": status,
-                    "angle_deg": angle,
-                }
-            )
-
-        df = pd.DataFrame(hourly_data)
-        ok_windows = df[df["status"] == "OK"].copy()
-        optimal = (
-            ok_windows[(ok_windows["dfwd_m"] >= 2.0) & (ok_windows["dfwd_m"] <= 3.0)]
-            if len(ok_windows) > 0
-            else pd.DataFrame()
+        if params is None:
+            params = {
+                "L_ramp": tw.L_ramp_m,
+                "theta_max": tw.theta_max_deg,
+                "KminusZ": tw.KminusZ_m,
+                "min_draft": tw.min_fwd_draft_m,
+                "max_draft": tw.max_fwd_draft_m,
+            }
+
+        res = tw.evaluate()
+        ok = res["ok"]
+        kpi = tw.kpi(res)
+        windows = tw.windows(ok)
+
+        df = pd.DataFrame(
+            {
+                "datetime": np.char.replace(tw.times.astype(str), "T", " "),
+                "tide_m": tw.tide_m,
+                "dfwd_m": res["dfwd_m"],
+                "daft_m": res["daft_m"],
+                "status": tw.status(ok),
+                "angle_deg": res["angle_deg"],
+            }
         )
 
         print(f"\n[Status=OK 시간대]")
         print(
-            f"  전체: {len(ok_windows)}/{len(df)} ({len(ok_windows)/len(df)*100:.1f}%)"
+            f"  전체: {kpi['ok_hours']}/{len(tw)} ({kpi['workable_percentage']:.1f}%)"
         )
+        print(f"  연속 OK 구간: {len(windows)}개")
 
-        if len(ok_windows) > 0:
-            print(f"  Dfwd 최소: {ok_windows['dfwd_m'].min():.2f}m")
-            print(f"  Dfwd 최대: {ok_windows['dfwd_m'].max():.2f}m")
-            print(f"  Dfwd 평균: {ok_windows['dfwd_m'].mean():.2f}m")
+        if kpi["ok_hours"] > 0:
+            dfwd_ok = res["dfwd_m"][ok]
+            print(f"  Dfwd 최소: {dfwd_ok.min():.2f}m")
+            print(f"  Dfwd 최대: {dfwd_ok.max():.2f}m")
+            print(f"  Dfwd 평균: {dfwd_ok.mean():.2f}m")
 
         results = {
             "analysis_time": datetime.now().isoformat(),
             "parameters": params,
-            "tide_data_count": len(tide_data),
-            "ok_hours": len(ok_windows),
-            "optimal_hours": len(optimal),
+            "tide_data_count": len(tw),
+            "ok_hours": kpi["ok_hours"],
+            "optimal_hours": kpi["optimal_hours"],
             "kpi": {
-                "workable_percentage": len(ok_windows) / 744 * 100,
-                "optimal_percentage": len(optimal) / 744 * 100,
+                "workable_percentage": kpi["workable_percentage"],
+                "optimal_percentage": kpi["optimal_percentage"],
             },
+            "ok_windows": windows,
         }
 
         json_file = f"../data/stage_realtime_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -748,11 +757,14 @@ def main():
     )
     parser.add_argument("--comprehensive", action="store_true", help="종합 검증")
     parser.add_argument("--analyze", action="store_true", help="실시간 분석")
+    parser.add_argument(
+        "--tide", default=None, help="조위 파일 (JSON / CSV, 기간 제한 없음) – --analyze 용"
+    )
     parser.add_argument("--analyze-v3", action="store_true", help="v3 원본 분석")
 
     args = parser.parse_args()
 
-    if not any(vars(args).values()):
+    if not any(v for k, v in vars(args).items() if k != "tide"):
         parser.print_help()
         return
 
@@ -774,7 +786,7 @@ def main():
         ops.comprehensive_validation()
 
     if args.analyze:
-        ops.realtime_analysis()
+        ops.realtime_analysis(args.tide)
 
     if args.analyze_v3:
         ops.analyze_v3()
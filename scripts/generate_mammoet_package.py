@@ -65,10 +65,10 @@ def load_excel_data():
             "max_fwd_draft": safe_float(calc_ws["D14"].value),  # v4 HYBRID: D14
         }
         
-        # Read hourly data (all 744 hours)
+        # Read hourly data (all rows – tide series length, not fixed to 744 h)
         hourly_ws = wb["Hourly_FWD_AFT_Heights"]
         hourly_data = []
-        for row in range(2, 746):
+        for row in range(2, hourly_ws.max_row + 1):
             try:
                 dt = hourly_ws.cell(row=row, column=1).value
                 tide = hourly_ws.cell(row=row, column=2).value
@@ -5,6 +5,7 @@
 import os
 import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from openpyxl import load_workbook
 from openpyxl.styles import Protection
 import matplotlib.pyplot as plt
@@ -12,6 +13,12 @@ from matplotlib.backends.backend_pdf import PdfPages
 import matplotlib.patches as mpatches
 from matplotlib.table import Table
 
+# 프로젝트 루트를 경로에 추가 (src.formula_engine)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.formula_engine import load_workbook_values  # noqa: E402
+
 # Configuration
 EXCEL_INPUT = "../output/LCT_BUSHRA_GateAB_v4_HYBRID.xlsx"  # Updated to v4 HYBRID
 OUTPUT_DIR = "SUBMISSION_PACKAGE"
@@ -42,9 +49,9 @@ def create_output_directory():
         print(f"✓ Output directory exists: {OUTPUT_DIR}")
 
 def load_excel_data():
-    """Load data from Excel workbook"""
+    """Load data from Excel workbook (formula cells without cached values are computed in-process)"""
     try:
-        wb = load_workbook(EXCEL_INPUT, data_only=True)
+        wb = load_workbook_values(EXCEL_INPUT)
         
         # Read Calc sheet constants
         calc_ws = wb["Calc"]
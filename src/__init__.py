@@ -5,6 +5,11 @@ This package contains modular components for:
 - Tank data management (tank_data_manager.py)
 - Stage calculation (stage_calculator.py) - Phase 1
 - Stability validation (stability_validator.py) - Phase 2
+- RORO calculation engine (roro_engine/) - solve_stage, hydro/GM 보간, pre-ballast 최적화
+- Sheet payload capture + write_only streaming writer (sheet_payload.py)
+- Sheet dependency graph + process pool 시트 생성 (sheet_graph.py)
+- Excel 공유 수식 셀 값 (열 블록 수식 텍스트 1회 기록) (shared_formula.py)
+- 생성 워크북 수식 값 계산 (열 단위 NumPy 벡터, Excel 재계산 불필요) (formula_engine.py)
 """
 
 __version__ = "1.0.0"
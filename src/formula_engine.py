@@ -0,0 +1,1460 @@
+# -*- coding: utf-8 -*-
+"""
+Workbook formula engine (Excel 재계산 없이 생성 워크북 수식 값 계산)
+
+agi tr.py 가 만드는 워크북은 대부분 수식이며 (Hourly_FWD_AFT_Heights 7,440개,
+RORO_Stage_Scenarios extend_* 열, OPERATION SUMMARY, Calc),
+openpyxl `data_only=True` 는 Excel 이 재계산·저장하기 전까지 None 을 반환한다.
+FormulaEngine 은 생성 수식 서브셋을 프로세스 안에서 계산한다.
+
+- 열 단위 컴파일: 같은 열에서 행 번호만 다른 수식 (상대 행 참조를 오프셋으로
+  정규화한 문자열이 동일) 을 1개 그룹으로 묶고, 파싱·컴파일은 그룹당 1회.
+  그룹은 행 벡터 전체에 대해 NumPy 배열 연산으로 한 번에 계산된다.
+- 값 모델: 셀 값 = (kind, num, text) 배열 — BLANK / NUMBER / TEXT / BOOL / ERROR.
+  Excel 규칙 (빈 셀 = 0 / "", 텍스트 비교 대소문자 무시, 오류 전파) 을 따른다.
+- 의존성: 셀 참조를 읽을 때 해당 셀을 덮는 그룹을 먼저 계산 (lazy, memo).
+  그룹 단위 순환 (셀 단위로는 순환 아님) 이면 그룹을 1행씩 분할해 재시도한다.
+  실제 순환 참조 셀과 계산 중 예외가 난 그룹은 "#VALUE!" 오류 값이 되고
+  unsupported 에 기록된다 (strict=True 이면 CircularReferenceError / 예외 그대로).
+- 배열 수식 (SUMPRODUCT((A2:A9="Y")*B2:B9) 등 범위 산술) 과 행마다 범위가 바뀌는
+  수식은 1행 그룹으로 계산한다.
+
+지원 서브셋:
+    연산자  + - * / ^ & % = <> < > <= >= , 단항 -/+
+    논리    IF, IFERROR, AND, OR, NOT, TRUE, FALSE
+    검사    ISBLANK, ISERROR, ISERR, ISNA, ISNUMBER, ISTEXT
+    조회    INDEX, MATCH (0 / 1 / -1), VLOOKUP (근사·정확)
+    수학    TAN, ATAN, ATAN2, SIN, COS, ASIN, ACOS, RADIANS, DEGREES, PI, ABS,
+            SQRT, EXP, LN, LOG10, POWER, INT, MOD, ROUND, ROUNDUP, ROUNDDOWN
+    집계    SUM, AVERAGE, MAX, MIN, COUNT, SUMPRODUCT
+    텍스트  SEARCH, FIND
+    정의된 이름 (workbook defined names, 셀 / 범위)
+미지원 함수는 Excel 과 같이 "#NAME?" 오류 값이 된다 (unsupported 에 기록).
+IF 는 벡터 계산이므로 양쪽 분기를 모두 평가한다 (선택되지 않은 분기 오류는 무시).
+
+Usage:
+    engine = evaluate_workbook("LCT_BUSHRA_AGI_TR.xlsx")
+    engine.value("Hourly_FWD_AFT_Heights", "C2")
+    engine.values("Hourly_FWD_AFT_Heights")      # {"C2": 1.739..., ...}
+
+    wb = load_workbook_values("LCT_BUSHRA_AGI_TR.xlsx")  # data_only=True 대체
+"""
+
+import math
+import re
+from pathlib import Path
+
+import numpy as np
+from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string, get_column_letter, range_boundaries
+
+from src.shared_formula import SharedFormula
+
+# 셀 값 종류
+BLANK, NUMBER, TEXT, BOOL, ERROR = 0, 1, 2, 3, 4
+
+ERR_DIV0 = "#DIV/0!"
+ERR_NA = "#N/A"
+ERR_NAME = "#NAME?"
+ERR_NUM = "#NUM!"
+ERR_REF = "#REF!"
+ERR_VALUE = "#VALUE!"
+ERROR_CODES = ("#NULL!", ERR_DIV0, ERR_VALUE, ERR_REF, ERR_NAME, ERR_NUM, ERR_NA)
+
+
+class FormulaError(ValueError):
+    """수식 파싱 / 컴파일 실패 (미지원 문법·함수)"""
+
+
+class CircularReferenceError(FormulaError):
+    """셀 단위 순환 참조"""
+
+
+# ----------------------------------------------------------------------
+# 값 배열
+# ----------------------------------------------------------------------
+
+
+class Values:
+    """셀 값 배열: kind (int8), num (float64), text (object: 문자열 / 오류 코드)"""
+
+    __slots__ = ("kind", "num", "text")
+
+    def __init__(self, kind, num, text):
+        self.kind = kind
+        self.num = num
+        self.text = text
+
+    @property
+    def shape(self):
+        return self.kind.shape
+
+    @classmethod
+    def constant(cls, value, shape):
+        kind, num, text = _classify(value)
+        return cls(
+            np.full(shape, kind, dtype=np.int8),
+            np.full(shape, num, dtype=float),
+            np.full(shape, text, dtype=object),
+        )
+
+    @classmethod
+    def numbers(cls, num, error=None):
+        """숫자 배열 (+ 오류 코드 배열: None = 정상)"""
+        num = np.asarray(num, dtype=float)
+        kind = np.full(num.shape, NUMBER, dtype=np.int8)
+        text = np.empty(num.shape, dtype=object)
+        if error is not None:
+            bad = error.astype(bool)
+            kind[bad] = ERROR
+            text[bad] = error[bad]
+        return cls(kind, num, text)
+
+    @classmethod
+    def bools(cls, flag, error=None):
+        out = cls.numbers(np.asarray(flag, dtype=float), error)
+        out.kind[out.kind == NUMBER] = BOOL
+        return out
+
+    def where(self, mask, other):
+        """mask 위치는 self, 나머지는 other (broadcast)"""
+        return Values(
+            np.where(mask, self.kind, other.kind).astype(np.int8),
+            np.where(mask, self.num, other.num),
+            np.where(mask, self.text, other.text),
+        )
+
+    def with_errors(self, error):
+        """error (object 배열, None = 정상) 위치를 ERROR 로 덮어쓴 사본"""
+        if error is None:
+            return self
+        bad = error.astype(bool)
+        if not bad.any():
+            return self
+        kind = np.where(bad, ERROR, self.kind).astype(np.int8)
+        text = np.where(bad, error, self.text)
+        return Values(kind, self.num, text)
+
+    def errors(self):
+        """오류 코드 배열 (None = 정상)"""
+        error = np.empty(self.shape, dtype=object)
+        bad = self.kind == ERROR
+        error[bad] = self.text[bad]
+        return error
+
+    def to_python(self, i):
+        """i 번째 값 → 셀 값 (빈 참조 결과 = 0, Excel 과 동일)"""
+        kind = self.kind[i]
+        if kind == NUMBER:
+            return float(self.num[i]) + 0.0  # -0.0 → 0.0
+        if kind == TEXT or kind == ERROR:
+            return self.text[i]
+        if kind == BOOL:
+            return bool(self.num[i])
+        return 0.0
+
+
+def _classify(value):
+    """Python 셀 값 → (kind, num, text)"""
+    if value is None:
+        return BLANK, 0.0, ""
+    if isinstance(value, bool):
+        return BOOL, float(value), None
+    if isinstance(value, (int, float)):
+        return NUMBER, float(value), None
+    if isinstance(value, str):
+        if value in ERROR_CODES:
+            return ERROR, 0.0, value
+        return TEXT, 0.0, value
+    return TEXT, 0.0, value  # datetime 등: 값은 그대로 보존, 산술은 #VALUE!
+
+
+def _first_error(*errors):
+    """오류 코드 배열들 → 위치별 첫 오류 (None = 없음)"""
+    out = None
+    for error in errors:
+        if error is None:
+            continue
+        if out is None:
+            out = error.copy()
+        else:
+            missing = ~out.astype(bool)
+            out[missing] = error[missing]
+    return out
+
+
+def _broadcast_errors(error, shape):
+    return None if error is None else np.broadcast_to(error, shape).copy()
+
+
+def _text_to_number(text):
+    try:
+        return float(str(text).strip()) if str(text).strip() else None
+    except ValueError:
+        return None
+
+
+def _to_numbers(v: Values):
+    """산술 강제 변환: BLANK = 0, BOOL = 0/1, 숫자형 텍스트 허용 → (num, error)"""
+    num = np.where(v.kind == BLANK, 0.0, v.num)
+    error = v.errors()
+    for i in zip(*np.nonzero(v.kind == TEXT)):
+        parsed = _text_to_number(v.text[i])
+        if parsed is None:
+            error[i] = ERR_VALUE
+        else:
+            num[i] = parsed
+    return num, error
+
+
+def _to_bools(v: Values):
+    """논리 강제 변환: 숫자 ≠ 0, BLANK = FALSE, "TRUE"/"FALSE" 텍스트 → (flag, error)"""
+    flag = v.num != 0
+    error = v.errors()
+    for i in zip(*np.nonzero(v.kind == TEXT)):
+        word = str(v.text[i]).upper()
+        if word in ("TRUE", "FALSE"):
+            flag[i] = word == "TRUE"
+        else:
+            error[i] = ERR_VALUE
+    return flag & (v.kind != BLANK), error
+
+
+def _format_number(x: float) -> str:
+    return str(int(x)) if float(x).is_integer() and abs(x) < 1e15 else repr(float(x))
+
+
+def _to_texts(v: Values):
+    """& 연산 / SEARCH 용 텍스트 변환 → (text, error)"""
+    text = np.empty(v.shape, dtype=object)
+    for i in np.ndindex(v.shape):
+        kind = v.kind[i]
+        if kind == NUMBER:
+            text[i] = _format_number(v.num[i])
+        elif kind == BOOL:
+            text[i] = "TRUE" if v.num[i] else "FALSE"
+        elif kind == BLANK:
+            text[i] = ""
+        else:
+            text[i] = str(v.text[i])
+    return text, v.errors()
+
+
+# ----------------------------------------------------------------------
+# 정규화 + 파서
+# ----------------------------------------------------------------------
+
+# 문자열 리터럴은 건너뛰고, 행이 상대인 셀 참조 (A2, $B2) 만 A#0 형태로 바꾼다
+_REF_RE = re.compile(r'"(?:[^"]|"")*"|\'(?:[^\']|\'\')*\'|(?<![\w.$#])(\$?[A-Z]{1,3})(\$?)(\d+)(?![\w(])')
+
+
+def normalize_formula(formula: str, row: int) -> str:
+    """
+    상대 행 참조를 수식 위치 기준 오프셋으로 치환 (열 그룹 키)
+
+    "=IF($A5="","",B5*$B$9)" (row 5) → "=IF($A#0="","",B#0*$B$9)"
+    """
+
+    def sub(m):
+        if m.group(1) is None or m.group(2):
+            return m.group(0)
+        return f"{m.group(1)}#{int(m.group(3)) - row}"
+
+    return _REF_RE.sub(sub, formula)
+
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+class _Normalizer:
+    """
+    normalize_formula 캐시: 숫자만 다른 수식 (같은 열의 복사 수식) 은 같은 골격
+
+    골격별로 "상대 행 번호인 숫자 위치" 를 1회만 정규식으로 찾고, 이후에는
+    숫자 분할 + 결합만 한다 (Hourly 시트 7,440개 수식 정규화 비용 ~1/10).
+    """
+
+    def __init__(self):
+        self._relative = {}  # 골격 → 숫자 run 별 상대 행 여부
+
+    def __call__(self, formula: str, row: int) -> str:
+        parts = _DIGITS_RE.split(formula)
+        skeleton = tuple(parts[0::2])
+        relative = self._relative.get(skeleton)
+        if relative is None:
+            starts = {m.start(3) for m in _REF_RE.finditer(formula) if m.group(1) is not None and not m.group(2)}
+            relative = tuple(m.start() in starts for m in _DIGITS_RE.finditer(formula))
+            self._relative[skeleton] = relative
+        if not any(relative):
+            return formula
+        for i, rel in enumerate(relative):
+            if rel:
+                parts[2 * i + 1] = f"#{int(parts[2 * i + 1]) - row}"
+        return "".join(parts)
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<sheet>(?:'(?:[^']|'')+'|[A-Za-z_][\w.]*)!)
+  | (?P<colrange>\$?[A-Z]{1,3}:\$?[A-Z]{1,3}(?![\w$\#]))
+  | (?P<cell>\$?[A-Z]{1,3}(?:\$\d+|\#-?\d+))
+  | (?P<error>\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A))
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][\w.]*)
+  | (?P<op><>|<=|>=|[-+*/^&=<>%(),:])
+    """,
+    re.X,
+)
+
+_COMPARE_OPS = ("=", "<>", "<", ">", "<=", ">=")
+
+
+def _tokenize(text: str) -> list:
+    tokens, pos = [], 0
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if m is None:
+            raise FormulaError(f"unexpected character at {pos}: {text[pos:pos + 10]!r}")
+        pos = m.end()
+        if m.lastgroup != "ws":
+            tokens.append((m.lastgroup, m.group()))
+    return tokens
+
+
+_CELL_RE = re.compile(r"\$?([A-Z]{1,3})(\$|#)(-?\d+)")
+
+
+def _cell_spec(token: str):
+    """"$B#0" / "E$2" → (col, (absolute, row | offset))"""
+    m = _CELL_RE.fullmatch(token)
+    return column_index_from_string(m.group(1)), (m.group(2) == "$", int(m.group(3)))
+
+
+class _Parser:
+    """정규화된 수식 → AST (tuple). Excel 우선순위: 비교 < & < +- < */ < ^ < % < 단항"""
+
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        tok = self.peek()
+        if tok[0] is None or (value is not None and tok[1] != value):
+            raise FormulaError(f"expected {value or 'token'}, got {tok[1]!r}")
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        node = self.compare()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"unexpected token {self.peek()[1]!r}")
+        return node
+
+    def _binary(self, ops, operand):
+        node = operand()
+        while self.peek()[0] == "op" and self.peek()[1] in ops:
+            op = self.take()[1]
+            node = ("op", op, node, operand())
+        return node
+
+    def compare(self):
+        return self._binary(_COMPARE_OPS, self.concat)
+
+    def concat(self):
+        return self._binary(("&",), self.additive)
+
+    def additive(self):
+        return self._binary(("+", "-"), self.term)
+
+    def term(self):
+        return self._binary(("*", "/"), self.power)
+
+    def power(self):
+        return self._binary(("^",), self.unary)
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == "op" and value in ("-", "+"):
+            self.take()
+            operand = self.unary()
+            return ("neg", operand) if value == "-" else operand
+        node = self.primary()
+        while self.peek() == ("op", "%"):
+            self.take()
+            node = ("pct", node)
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == "number":
+            return ("const", float(value))
+        if kind == "string":
+            return ("const", value[1:-1].replace('""', '"'))
+        if kind == "error":
+            return ("const", value)
+        if kind == "op" and value == "(":
+            node = self.compare()
+            self.take(")")
+            return node
+        sheet = None
+        if kind == "sheet":
+            sheet = value[:-1]
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+            kind, value = self.take()
+        if kind == "colrange":
+            first, last = value.replace("$", "").split(":")
+            return ("range", sheet, column_index_from_string(first), column_index_from_string(last), None, None)
+        if kind == "cell":
+            col, row = _cell_spec(value)
+            if self.peek() == ("op", ":"):
+                self.take()
+                col2, row2 = _cell_spec(self.take()[1])
+                return ("range", sheet, min(col, col2), max(col, col2), row, row2)
+            return ("ref", sheet, col, row)
+        if kind == "name" and sheet is None:
+            upper = value.upper()
+            if self.peek() == ("op", "("):
+                self.take()
+                args = self.arguments()
+                if len(args) < _MIN_ARGS.get(upper, 0):
+                    raise FormulaError(f"{upper} needs at least {_MIN_ARGS[upper]} argument(s)")
+                return ("call", upper, args)
+            if upper in ("TRUE", "FALSE"):
+                return ("const", upper == "TRUE")
+            return ("name", value)
+        raise FormulaError(f"unexpected token {value!r}")
+
+    def arguments(self):
+        args = []
+        if self.peek() == ("op", ")"):
+            self.take()
+            return args
+        while True:
+            if self.peek()[1] in (",", ")") and self.peek()[0] == "op":
+                args.append(("missing",))
+            else:
+                args.append(self.compare())
+            if self.take()[1] == ")":
+                return args
+
+
+def parse_formula(formula: str):
+    """정규화된 수식 ("=..." 또는 "...") → AST"""
+    return _Parser(formula[1:] if formula.startswith("=") else formula).parse()
+
+
+# ----------------------------------------------------------------------
+# 평가 컨텍스트 + 범위 참조
+# ----------------------------------------------------------------------
+
+
+class _RangeRef:
+    """평가 전 범위 참조 (INDEX / MATCH 는 필요한 셀만 읽는다)"""
+
+    __slots__ = ("sheet", "c1", "c2", "r1", "r2")
+
+    def __init__(self, sheet, c1, c2, r1, r2):
+        self.sheet, self.c1, self.c2, self.r1, self.r2 = sheet, c1, c2, r1, r2
+
+    @property
+    def shape(self):
+        return (self.r2 - self.r1 + 1, self.c2 - self.c1 + 1)
+
+
+class _Context:
+    __slots__ = ("engine", "sheet", "rows", "n")
+
+    def __init__(self, engine, sheet, rows):
+        self.engine = engine
+        self.sheet = sheet
+        self.rows = rows
+        self.n = len(rows)
+
+    def materialize(self, value):
+        """_RangeRef → 2D Values, 나머지는 그대로"""
+        if isinstance(value, _RangeRef):
+            return self.engine._range_values(value)
+        return value
+
+
+def _row_array(ctx, spec):
+    absolute, value = spec
+    return np.full(ctx.n, value, dtype=np.int64) if absolute else ctx.rows + value
+
+
+# ----------------------------------------------------------------------
+# 연산자
+# ----------------------------------------------------------------------
+
+
+def _arith(op, a: Values, b: Values) -> Values:
+    na, ea = _to_numbers(a)
+    nb, eb = _to_numbers(b)
+    shape = np.broadcast_shapes(na.shape, nb.shape)
+    error = _first_error(_broadcast_errors(ea, shape), _broadcast_errors(eb, shape))
+    with np.errstate(all="ignore"):
+        if op == "+":
+            num = na + nb
+        elif op == "-":
+            num = na - nb
+        elif op == "*":
+            num = na * nb
+        elif op == "/":
+            num = na / nb
+            error = _first_error(error, np.where(np.broadcast_to(nb, shape) == 0, ERR_DIV0, None))
+        else:
+            num = np.power(na, nb)
+    error = _first_error(error, np.where(np.isfinite(num), None, ERR_NUM))
+    return Values.numbers(np.broadcast_to(num, shape).copy(), error)
+
+
+_TYPE_RANK = np.array([0, 0, 1, 2, 0], dtype=np.int8)  # NUMBER < TEXT < BOOL
+
+
+def _compare(op, a: Values, b: Values) -> Values:
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    ka, kb = np.broadcast_to(a.kind, shape), np.broadcast_to(b.kind, shape)
+    # 빈 셀은 상대 타입의 0 값 (0 / "" / FALSE); 둘 다 빈 셀이면 같음
+    ka_eff = np.where(ka == BLANK, np.where(kb == BLANK, NUMBER, kb), ka)
+    kb_eff = np.where(kb == BLANK, np.where(ka == BLANK, NUMBER, ka), kb)
+    ra, rb = _TYPE_RANK[ka_eff], _TYPE_RANK[kb_eff]
+    na = np.where(ka == BLANK, 0.0, np.broadcast_to(a.num, shape))
+    nb = np.where(kb == BLANK, 0.0, np.broadcast_to(b.num, shape))
+    # -1 / 0 / 1: 타입 순위 → 숫자 → 텍스트 (대소문자 무시)
+    cmp = np.sign(ra.astype(float) - rb).astype(np.int8)
+    same = ra == rb
+    cmp[same] = np.sign(na - nb)[same]
+    ta, tb = np.broadcast_to(a.text, shape), np.broadcast_to(b.text, shape)
+    text = same & (ka_eff == TEXT)
+    if text.any():
+        x = np.array(["" if k == BLANK else str(t).lower() for k, t in zip(ka[text], ta[text])], dtype=object)
+        y = np.array(["" if k == BLANK else str(t).lower() for k, t in zip(kb[text], tb[text])], dtype=object)
+        cmp[text] = (x > y).astype(np.int8) - (x < y)
+    flag = {
+        "=": cmp == 0,
+        "<>": cmp != 0,
+        "<": cmp < 0,
+        ">": cmp > 0,
+        "<=": cmp <= 0,
+        ">=": cmp >= 0,
+    }[op]
+    error = _first_error(_broadcast_errors(a.errors(), shape), _broadcast_errors(b.errors(), shape))
+    return Values.bools(flag, error)
+
+
+def _concat(a: Values, b: Values) -> Values:
+    ta, ea = _to_texts(a)
+    tb, eb = _to_texts(b)
+    shape = np.broadcast_shapes(ta.shape, tb.shape)
+    text = np.broadcast_to(ta, shape) + np.broadcast_to(tb, shape)
+    out = Values(np.full(shape, TEXT, dtype=np.int8), np.zeros(shape), text)
+    return out.with_errors(_first_error(_broadcast_errors(ea, shape), _broadcast_errors(eb, shape)))
+
+
+# ----------------------------------------------------------------------
+# 함수
+# ----------------------------------------------------------------------
+
+
+def _scalar_rows(ctx, value: Values) -> Values:
+    """행 값 배열을 그룹 길이 (n,) 로 맞춘다 (1행 그룹의 배열 결과는 첫 값)"""
+    if value.shape == (ctx.n,):
+        return value
+    if value.kind.size == 1 or ctx.n == 1:
+        first = tuple(0 for _ in value.shape)
+        return Values(
+            np.full(ctx.n, value.kind[first], dtype=np.int8),
+            np.full(ctx.n, value.num[first]),
+            np.full(ctx.n, value.text[first], dtype=object),
+        )
+    return Values(
+        np.broadcast_to(value.kind, (ctx.n,)).copy(),
+        np.broadcast_to(value.num, (ctx.n,)).copy(),
+        np.broadcast_to(value.text, (ctx.n,)).copy(),
+    )
+
+
+def _arg(ctx, args, i, default=None):
+    if i >= len(args) or args[i][0] == "missing":
+        return Values.constant(default, ctx.n) if default is not None else None
+    return ctx.materialize(args[i][1](ctx))
+
+
+def _fn_if(ctx, args):
+    flag, error = _to_bools(_arg(ctx, args, 0))
+    yes = _arg(ctx, args, 1, 0.0) if len(args) > 1 else Values.constant(True, ctx.n)
+    no = _arg(ctx, args, 2, False)
+    if len(args) > 2 and args[2][0] == "missing":
+        no = Values.constant(0.0, ctx.n)
+    return yes.where(flag, no).with_errors(error)
+
+
+def _fn_iferror(ctx, args):
+    value = _arg(ctx, args, 0)
+    fallback = _arg(ctx, args, 1, "")
+    return fallback.where(value.kind == ERROR, value)
+
+
+def _logical(reduce):
+    def fn(ctx, args):
+        flags, seen, errors = [], np.zeros(ctx.n, dtype=bool), []
+        for arg in args:
+            value = ctx.materialize(arg[1](ctx))
+            counted = (value.kind == NUMBER) | (value.kind == BOOL)
+            flag = (value.num != 0) & counted
+            error = value.errors()
+            if value.shape != (ctx.n,):  # 범위: 행 무관 → 1개 값으로 축약
+                counted_any = counted.any()
+                flag = np.full(ctx.n, reduce(flag[counted]) if counted_any else reduce(np.ones(0, bool)))
+                error = np.full(ctx.n, next((e for e in error.ravel() if e), None), dtype=object)
+                counted = np.full(ctx.n, counted_any)
+            flags.append(np.where(counted, flag, reduce(np.ones(0, bool))))
+            seen |= counted
+            errors.append(error)
+        flag = reduce(np.vstack(flags), axis=0)
+        error = _first_error(*errors, np.where(seen, None, ERR_VALUE))
+        return Values.bools(flag, error)
+
+    return fn
+
+
+def _fn_not(ctx, args):
+    flag, error = _to_bools(_arg(ctx, args, 0))
+    return Values.bools(~flag, error)
+
+
+def _is(test):
+    def fn(ctx, args):
+        value = _arg(ctx, args, 0)
+        return Values.bools(test(value))
+
+    return fn
+
+
+def _math(func, nargs=1):
+    def fn(ctx, args):
+        if len(args) != nargs:
+            raise FormulaError(f"expected {nargs} argument(s)")
+        nums, errors = zip(*(_to_numbers(_arg(ctx, args, i)) for i in range(nargs))) if nargs else ((), ())
+        with np.errstate(all="ignore"):
+            num = func(*nums) if nargs else np.full(ctx.n, func())
+        num = np.asarray(num, dtype=float)
+        shape = num.shape
+        error = _first_error(*(_broadcast_errors(e, shape) for e in errors), np.where(np.isfinite(num), None, ERR_NUM))
+        return Values.numbers(num, error)
+
+    return fn
+
+
+def _round_half_away(x, digits):
+    scale = np.power(10.0, np.trunc(digits))
+    # 표현 오차 보정 (2.675 → 2.68, Excel 과 동일)
+    return np.sign(x) * np.floor(np.abs(x) * scale + 0.5 + 1e-9) / scale
+
+
+def _excel_mod(x, y):
+    return np.where(y == 0, np.nan, x - y * np.floor(x / y))
+
+
+def _aggregate(kind):
+    """SUM / AVERAGE / MAX / MIN / COUNT: 범위·참조의 텍스트/빈 셀은 무시"""
+
+    def fn(ctx, args):
+        total = np.zeros(ctx.n)
+        count = np.zeros(ctx.n)
+        best = np.full(ctx.n, np.nan)
+        errors = []
+        for node_kind, arg in args:
+            raw = arg(ctx)
+            value = ctx.materialize(raw)
+            if value.shape != (ctx.n,) or node_kind in ("ref", "name"):
+                # 범위 / 셀 참조: 숫자만 집계
+                mask = value.kind == NUMBER
+                num = np.where(mask, value.num, np.nan)
+                error = value.errors()
+                if value.shape != (ctx.n,):
+                    flat_num, flat_mask = num.ravel(), mask.ravel()
+                    num = np.full(ctx.n, np.nan)
+                    num_sum = flat_num[flat_mask].sum()
+                    num_cnt = flat_mask.sum()
+                    num_max = flat_num[flat_mask].max() if num_cnt else np.nan
+                    num_min = flat_num[flat_mask].min() if num_cnt else np.nan
+                    total += num_sum
+                    count += num_cnt
+                    pick = num_max if kind == "MAX" else num_min
+                    best = _best(kind, best, np.full(ctx.n, pick))
+                    errors.append(np.full(ctx.n, next((e for e in error.ravel() if e), None), dtype=object))
+                    continue
+            else:
+                num, error = _to_numbers(value)
+                mask = np.ones(ctx.n, dtype=bool)
+            total += np.where(mask, num, 0.0)
+            count += mask
+            best = _best(kind, best, np.where(mask, num, np.nan))
+            errors.append(error)
+        error = _first_error(*errors)
+        if kind == "SUM":
+            return Values.numbers(total, error)
+        if kind == "COUNT":
+            return Values.numbers(count)
+        if kind == "AVERAGE":
+            with np.errstate(all="ignore"):
+                avg = total / count
+            return Values.numbers(np.nan_to_num(avg), _first_error(error, np.where(count == 0, ERR_DIV0, None)))
+        return Values.numbers(np.nan_to_num(best), error)
+
+    return fn
+
+
+def _best(kind, current, candidate):
+    op = np.fmax if kind == "MAX" else np.fmin
+    return op(current, candidate)
+
+
+def _fn_sumproduct(ctx, args):
+    product, errors = None, []
+    for arg in args:
+        value = ctx.materialize(arg[1](ctx))
+        num = np.where(value.kind == NUMBER, value.num, 0.0)  # 배열의 비숫자 = 0
+        errors.append(value.errors().ravel())
+        if product is not None and product.shape != num.shape:
+            return Values.constant(ERR_VALUE, ctx.n)
+        product = num if product is None else product * num
+    error = next((e for e in np.concatenate(errors) if e), None) if errors else None
+    return Values.numbers(np.full(ctx.n, product.sum()), np.full(ctx.n, error, dtype=object))
+
+
+def _search(case_sensitive):
+    def fn(ctx, args):
+        needle, e1 = _to_texts(_arg(ctx, args, 0))
+        haystack, e2 = _to_texts(_arg(ctx, args, 1))
+        start = _to_numbers(_arg(ctx, args, 2, 1.0))
+        shape = np.broadcast_shapes(needle.shape, haystack.shape)
+        needle, haystack = np.broadcast_to(needle, shape), np.broadcast_to(haystack, shape)
+        begin = np.broadcast_to(start[0], shape)
+        pos = np.zeros(shape)
+        error = _first_error(_broadcast_errors(e1, shape), _broadcast_errors(e2, shape), _broadcast_errors(start[1], shape))
+        for i in np.ndindex(shape):
+            n, h = needle[i], haystack[i]
+            if not case_sensitive:
+                n, h = n.lower(), h.lower()
+            found = h.find(n, int(begin[i]) - 1)
+            if found < 0 or begin[i] < 1:
+                error[i] = error[i] or ERR_VALUE
+            pos[i] = found + 1
+        return Values.numbers(pos, error)
+
+    return fn
+
+
+def _exact_index(values: Values) -> dict:
+    """정확 일치 조회 dict: (kind, 값) → 첫 위치 (1-based, 텍스트는 소문자)"""
+    index = {}
+    for i in range(values.kind.size - 1, -1, -1):
+        kind = values.kind[i]
+        if kind == NUMBER or kind == BOOL:
+            index[(kind, values.num[i])] = i + 1
+        elif kind == TEXT:
+            index[(TEXT, str(values.text[i]).lower())] = i + 1
+    return index
+
+
+def _lookup_positions(values: Values, key: Values, mode: int, index=None):
+    """
+    1D 조회 배열에서 key 위치 (1-based, 0 = 없음)
+
+    mode 0: 정확 일치 (텍스트 대소문자 무시), 1: key 이하 최대 (오름차순),
+    -1: key 이상 최소 (내림차순). index: _exact_index 결과 (재사용)
+    """
+    pos = np.zeros(key.shape, dtype=np.int64)
+    if mode == 0:
+        if index is None:
+            index = _exact_index(values)
+        cache = {}
+        for i in np.ndindex(key.shape):
+            kind = key.kind[i]
+            k = (TEXT, str(key.text[i]).lower()) if kind == TEXT else (kind, key.num[i])
+            if k not in cache:
+                cache[k] = index.get(k, 0)
+            pos[i] = cache[k]
+        return pos
+    numeric = np.flatnonzero(values.kind == NUMBER)
+    data = values.num[numeric]
+    number_key = key.kind == NUMBER
+    if mode > 0:
+        j = np.searchsorted(data, key.num, side="right") - 1
+        found = (j >= 0) & number_key
+    else:
+        # 내림차순: 뒤집어서 key 이상 최소
+        rev = data[::-1]
+        j_rev = np.searchsorted(rev, key.num, side="left")
+        found = (j_rev < rev.size) & number_key
+        j = rev.size - 1 - j_rev
+    pos[found] = numeric[j[found]] + 1
+    return pos
+
+
+def _match_mode(ctx, args, i, default):
+    value = _arg(ctx, args, i, default)
+    num, _ = _to_numbers(value)
+    mode = np.sign(num.ravel()[0]) if num.size else default
+    return int(mode)
+
+
+def _fn_match(ctx, args):
+    key = _arg(ctx, args, 0)
+    ref = args[1][1](ctx)
+    if not isinstance(ref, _RangeRef):
+        raise FormulaError("MATCH lookup_array must be a range")
+    mode = _match_mode(ctx, args, 2, 1.0)
+    along_rows = ref.shape[1] == 1
+    values, index = ctx.engine._lookup_table(ref, along_rows, mode == 0)
+    pos = _lookup_positions(values, key, mode, index)
+    error = _first_error(key.errors(), np.where(pos == 0, ERR_NA, None))
+    return Values.numbers(pos.astype(float), error)
+
+
+def _gather(ctx, sheet, cols, rows) -> Values:
+    """(열, 행) 벡터 → 셀 값 (열별로 모아서 읽음)"""
+    out = Values.constant(None, rows.shape)
+    for col in np.unique(cols):
+        mask = cols == col
+        part = ctx.engine._cells(sheet, int(col), rows[mask])
+        out.kind[mask], out.num[mask], out.text[mask] = part.kind, part.num, part.text
+    return out
+
+
+def _fn_index(ctx, args):
+    ref = args[0][1](ctx)
+    if not isinstance(ref, _RangeRef):
+        raise FormulaError("INDEX array must be a range")
+    height, width = ref.shape
+    first, e1 = _to_numbers(_arg(ctx, args, 1, 0.0))
+    second, e2 = _to_numbers(_arg(ctx, args, 2, 0.0))
+    first, second = np.trunc(first), np.trunc(second)
+    shape = np.broadcast_shapes(first.shape, second.shape)
+    if height == 1 and len(args) == 2:
+        row_i, col_i = np.ones(shape), np.broadcast_to(first, shape)
+    else:
+        row_i, col_i = np.broadcast_to(first, shape), np.broadcast_to(second, shape)
+    if width == 1:
+        col_i = np.where(col_i == 0, 1, col_i)
+    if height == 1:
+        row_i = np.where(row_i == 0, 1, row_i)
+    error = _first_error(_broadcast_errors(e1, shape), _broadcast_errors(e2, shape))
+    bad = (row_i < 1) | (row_i > height) | (col_i < 1) | (col_i > width)
+    error = _first_error(error, np.where(bad, ERR_REF, None))
+    ok = ~(error.astype(bool) if error is not None else np.zeros(shape, bool))
+    rows = np.where(ok, ref.r1 + row_i - 1, 0).astype(np.int64)
+    cols = np.where(ok, ref.c1 + col_i - 1, ref.c1).astype(np.int64)
+    return _gather(ctx, ref.sheet, cols, rows).with_errors(error)
+
+
+def _fn_vlookup(ctx, args):
+    key = _arg(ctx, args, 0)
+    ref = args[1][1](ctx)
+    if not isinstance(ref, _RangeRef):
+        raise FormulaError("VLOOKUP table_array must be a range")
+    col_i, e_col = _to_numbers(_arg(ctx, args, 2))
+    approx, e_mode = _to_bools(_arg(ctx, args, 3, True))
+    mode = 1 if bool(np.ravel(approx)[0]) else 0
+    values, index = ctx.engine._lookup_table(ref, True, mode == 0)
+    pos = _lookup_positions(values, key, mode, index)
+    col_i = np.broadcast_to(np.trunc(col_i), pos.shape)
+    bad_col = (col_i < 1) | (col_i > ref.shape[1])
+    error = _first_error(
+        key.errors(),
+        _broadcast_errors(e_col, pos.shape),
+        np.where(pos == 0, ERR_NA, None),
+        np.where(bad_col, ERR_REF, None),
+    )
+    found = pos > 0
+    rows = np.where(found, ref.r1 + pos - 1, 0).astype(np.int64)
+    cols = np.where(bad_col, ref.c1, ref.c1 + col_i - 1).astype(np.int64)
+    return _gather(ctx, ref.sheet, cols, rows).with_errors(error)
+
+
+_FUNCTIONS = {
+    "IF": _fn_if,
+    "IFERROR": _fn_iferror,
+    "AND": _logical(np.all),
+    "OR": _logical(np.any),
+    "NOT": _fn_not,
+    "ISBLANK": _is(lambda v: v.kind == BLANK),
+    "ISERROR": _is(lambda v: v.kind == ERROR),
+    "ISERR": _is(lambda v: (v.kind == ERROR) & (v.text != ERR_NA)),
+    "ISNA": _is(lambda v: (v.kind == ERROR) & (v.text == ERR_NA)),
+    "ISNUMBER": _is(lambda v: v.kind == NUMBER),
+    "ISTEXT": _is(lambda v: v.kind == TEXT),
+    "INDEX": _fn_index,
+    "MATCH": _fn_match,
+    "VLOOKUP": _fn_vlookup,
+    "TAN": _math(np.tan),
+    "ATAN": _math(np.arctan),
+    "ATAN2": _math(lambda x, y: np.where((x == 0) & (y == 0), np.nan, np.arctan2(y, x)), 2),
+    "SIN": _math(np.sin),
+    "COS": _math(np.cos),
+    "ASIN": _math(np.arcsin),
+    "ACOS": _math(np.arccos),
+    "RADIANS": _math(np.radians),
+    "DEGREES": _math(np.degrees),
+    "PI": _math(lambda: math.pi, 0),
+    "ABS": _math(np.abs),
+    "SQRT": _math(np.sqrt),
+    "EXP": _math(np.exp),
+    "LN": _math(np.log),
+    "LOG10": _math(np.log10),
+    "POWER": _math(np.power, 2),
+    "INT": _math(np.floor),
+    "MOD": _math(_excel_mod, 2),
+    "ROUND": _math(_round_half_away, 2),
+    "ROUNDUP": _math(lambda x, d: np.sign(x) * np.ceil(np.abs(x) * 10.0 ** np.trunc(d) - 1e-9) / 10.0 ** np.trunc(d), 2),
+    "ROUNDDOWN": _math(lambda x, d: np.sign(x) * np.floor(np.abs(x) * 10.0 ** np.trunc(d) + 1e-9) / 10.0 ** np.trunc(d), 2),
+    "SUM": _aggregate("SUM"),
+    "AVERAGE": _aggregate("AVERAGE"),
+    "MAX": _aggregate("MAX"),
+    "MIN": _aggregate("MIN"),
+    "COUNT": _aggregate("COUNT"),
+    "SUMPRODUCT": _fn_sumproduct,
+    "SEARCH": _search(False),
+    "FIND": _search(True),
+}
+
+SUPPORTED_FUNCTIONS = frozenset(_FUNCTIONS)
+
+# 최소 인자 수 (파싱 시 검사, 부족하면 Excel 과 같이 수식 오류 → "#NAME?")
+_MIN_ARGS = {
+    "IF": 1,
+    "IFERROR": 2,
+    "AND": 1,
+    "OR": 1,
+    "NOT": 1,
+    "ISBLANK": 1,
+    "ISERROR": 1,
+    "ISERR": 1,
+    "ISNA": 1,
+    "ISNUMBER": 1,
+    "ISTEXT": 1,
+    "INDEX": 2,
+    "MATCH": 2,
+    "VLOOKUP": 3,
+    "SUM": 1,
+    "AVERAGE": 1,
+    "MAX": 1,
+    "MIN": 1,
+    "COUNT": 1,
+    "SUMPRODUCT": 1,
+    "SEARCH": 2,
+    "FIND": 2,
+}
+
+# 범위 (_RangeRef) 를 그대로 받는 함수 인자 위치 (None = 모든 인자)
+_RANGE_ARGS = {
+    "INDEX": {0},
+    "MATCH": {1},
+    "VLOOKUP": {1},
+    "SUM": None,
+    "AVERAGE": None,
+    "MAX": None,
+    "MIN": None,
+    "COUNT": None,
+    "AND": None,
+    "OR": None,
+}
+
+
+# ----------------------------------------------------------------------
+# 컴파일
+# ----------------------------------------------------------------------
+
+
+class _Compiled:
+    """컴파일된 수식: fn(ctx) → Values, per_row = 1행씩 계산해야 하는 수식"""
+
+    __slots__ = ("fn", "per_row")
+
+    def __init__(self, fn, per_row):
+        self.fn = fn
+        self.per_row = per_row
+
+
+class _Compiler:
+    def __init__(self, engine):
+        self.engine = engine
+        self.per_row = False
+
+    def compile(self, node, range_ok=False):
+        kind = node[0]
+        if kind == "const":
+            value = node[1]
+            return lambda ctx: Values.constant(value, ctx.n)
+        if kind == "missing":
+            return lambda ctx: Values.constant(None, ctx.n)
+        if kind == "name":
+            return self.compile(self.engine._resolve_name(node[1]), range_ok)
+        if kind == "ref":
+            _, sheet, col, row = node
+            return lambda ctx: ctx.engine._cells(sheet or ctx.sheet, col, _row_array(ctx, row))
+        if kind == "range":
+            _, sheet, c1, c2, r1, r2 = node
+            if r1 is not None and not (r1[0] and r2[0]):
+                self.per_row = True  # 행마다 범위가 바뀜
+            if not range_ok:
+                self.per_row = True  # 범위 산술 (배열 수식)
+
+            def fn(ctx):
+                target = sheet or ctx.sheet
+                if r1 is None:
+                    return _RangeRef(target, c1, c2, 1, max(ctx.engine._max_row(target), 1))
+                top = int(_row_array(ctx, r1)[0])
+                bottom = int(_row_array(ctx, r2)[0])
+                return _RangeRef(target, c1, c2, min(top, bottom), max(top, bottom))
+
+            return fn
+        if kind == "neg":
+            operand = self.compile(node[1])
+            return lambda ctx: _arith("-", Values.constant(0.0, 1), ctx.materialize(operand(ctx)))
+        if kind == "pct":
+            operand = self.compile(node[1])
+            return lambda ctx: _arith("/", ctx.materialize(operand(ctx)), Values.constant(100.0, 1))
+        if kind == "op":
+            _, op, left_node, right_node = node
+            left, right = self.compile(left_node), self.compile(right_node)
+            if op == "&":
+                return lambda ctx: _concat(ctx.materialize(left(ctx)), ctx.materialize(right(ctx)))
+            impl = _compare if op in _COMPARE_OPS else _arith
+            return lambda ctx: impl(op, ctx.materialize(left(ctx)), ctx.materialize(right(ctx)))
+        if kind == "call":
+            _, name, arg_nodes = node
+            func = _FUNCTIONS.get(name)
+            if func is None:
+                raise FormulaError(f"unsupported function {name}")
+            range_args = _RANGE_ARGS.get(name, set())
+            if name == "SUMPRODUCT":
+                range_args = None
+                self.per_row = True
+            args = [
+                (n[0], self.compile(n, range_ok=range_args is None or i in range_args))
+                for i, n in enumerate(arg_nodes)
+            ]
+            return lambda ctx: func(ctx, args)
+        raise FormulaError(f"unknown node {kind}")
+
+
+class _Group:
+    """같은 열 + 같은 정규화 수식의 셀 묶음"""
+
+    __slots__ = ("sheet", "col", "key", "rows", "state")
+
+    def __init__(self, sheet, col, key, rows):
+        self.sheet = sheet
+        self.col = col
+        self.key = key
+        self.rows = rows
+        self.state = 0  # 0 = pending, 1 = in progress, 2 = done
+
+
+class _GroupCycle(Exception):
+    def __init__(self, group):
+        super().__init__(group)
+        self.group = group
+
+
+class _Column:
+    __slots__ = ("kind", "num", "text")
+
+    def __init__(self, size):
+        self.kind = np.zeros(size, dtype=np.int8)
+        self.num = np.zeros(size)
+        self.text = np.full(size, "", dtype=object)
+
+
+# ----------------------------------------------------------------------
+# 엔진
+# ----------------------------------------------------------------------
+
+
+class FormulaEngine:
+    """
+    openpyxl 워크북 (수식 로드, data_only=False) 의 수식 값 계산기
+
+    생성 시 상수 셀을 열 배열로 적재하고 수식 셀을 (열, 정규화 수식) 그룹으로 묶는다.
+    값은 요청 시 계산된다 (value / values / evaluate).
+    vectorize=False 이면 셀 1개씩 계산한다 (비교·디버깅용 기준 경로).
+    strict=True 이면 순환 참조 / 계산 예외를 오류 값 대신 그대로 발생시킨다.
+    """
+
+    def __init__(self, wb, vectorize: bool = True, strict: bool = False):
+        self.vectorize = vectorize
+        self.strict = strict
+        self._names = {}
+        for name, defined in _defined_names(wb):
+            self._names[name.upper()] = defined
+        self._columns = {}  # sheet → {col: _Column}
+        self._max_rows = {}
+        self._groups = {}  # (sheet, col) → [_Group]
+        self._compiled = {}  # key → _Compiled | FormulaError
+        self._normalize = _Normalizer()
+        self._lookups = {}  # 조회 범위 → [Values, 정확 일치 dict]
+        self.unsupported = {}  # "Sheet!A1" → 오류 메시지
+        for ws in wb.worksheets:
+            self._load_sheet(ws)
+
+    # -- 적재 ----------------------------------------------------------
+
+    def _load_sheet(self, ws):
+        cells, formulas = [], {}
+        max_row = 0
+        for r, row in enumerate(ws.iter_rows(values_only=True), start=1):
+            for c, value in enumerate(row, start=1):
+                if value is None:
+                    continue
+                max_row = r
+                if isinstance(value, SharedFormula):
+                    value = value.formula  # 생성 직후 (저장 전) 워크북
+                if isinstance(value, str) and value.startswith("=") and len(value) > 1:
+                    key = self._normalize(value, r)
+                    formulas.setdefault((c, key), []).append(r)
+                elif not isinstance(value, (str, int, float, bool)) and hasattr(value, "text"):
+                    formulas.setdefault((c, "=" + str(getattr(value, "text", "") or "").lstrip("=")), []).append(r)
+                else:
+                    cells.append((r, c, value))
+        title = ws.title
+        self._max_rows[title] = max_row
+        columns = self._columns.setdefault(title, {})
+        size = max_row + 1
+        for r, c, value in cells:
+            column = columns.get(c) or columns.setdefault(c, _Column(size))
+            column.kind[r], column.num[r], column.text[r] = _classify(value)
+        for (c, key), rows in formulas.items():
+            columns.get(c) or columns.setdefault(c, _Column(size))
+            rows = np.array(rows, dtype=np.int64)
+            chunks = [rows] if self.vectorize else [rows[i : i + 1] for i in range(rows.size)]
+            self._groups.setdefault((title, c), []).extend(_Group(title, c, key, chunk) for chunk in chunks)
+
+    def _max_row(self, sheet) -> int:
+        if sheet not in self._max_rows:
+            raise FormulaError(f"unknown sheet {sheet!r}")
+        return self._max_rows[sheet]
+
+    def _resolve_name(self, name):
+        target = self._names.get(name.upper())
+        if target is None:
+            raise FormulaError(f"unknown name {name}")
+        return target
+
+    # -- 셀 읽기 -------------------------------------------------------
+
+    def _require(self, sheet, col, lo, hi, rows=None):
+        """(sheet, col) 의 [lo, hi] 행을 덮는 수식 그룹을 먼저 계산"""
+        groups = self._groups.get((sheet, col))
+        if not groups:
+            return
+        for group in list(groups):
+            if group.state == 2:
+                continue
+            g = group.rows
+            if g[-1] < lo or g[0] > hi:
+                continue
+            inside = (g >= lo) & (g <= hi)
+            if rows is not None and inside.any():
+                inside = np.isin(g, rows)
+            if inside.any():
+                self._ensure(group)
+
+    def _cells(self, sheet, col, rows) -> Values:
+        rows = np.asarray(rows, dtype=np.int64)
+        if sheet not in self._columns:
+            raise FormulaError(f"unknown sheet {sheet!r}")
+        if rows.size:
+            self._require(sheet, col, int(rows.min()), int(rows.max()), rows)
+        column = self._columns[sheet].get(col)
+        if column is None:
+            return Values.constant(None, rows.shape)
+        idx = np.where((rows >= 1) & (rows < column.kind.size), rows, 0)
+        return Values(column.kind[idx], column.num[idx], column.text[idx])
+
+    def _lookup_table(self, ref: _RangeRef, along_rows: bool, exact: bool):
+        """
+        MATCH / VLOOKUP 조회 벡터 (첫 열 또는 첫 행) + 정확 일치 dict (캐시)
+
+        조회 범위 셀은 읽기 전에 계산이 끝나므로 이후 값이 바뀌지 않는다.
+        """
+        key = (ref.sheet, ref.c1, ref.c2, ref.r1, ref.r2, along_rows)
+        entry = self._lookups.get(key)
+        if entry is None:
+            if along_rows:
+                sub = _RangeRef(ref.sheet, ref.c1, ref.c1, ref.r1, ref.r2)
+            else:
+                sub = _RangeRef(ref.sheet, ref.c1, ref.c2, ref.r1, ref.r1)
+            v = self._range_values(sub)
+            entry = [Values(v.kind.ravel(), v.num.ravel(), v.text.ravel()), None]
+            self._lookups[key] = entry
+        if exact and entry[1] is None:
+            entry[1] = _exact_index(entry[0])
+        return entry[0], entry[1]
+
+    def _range_values(self, ref: _RangeRef) -> Values:
+        """범위 → 2D Values (행 × 열)"""
+        rows = np.arange(ref.r1, ref.r2 + 1, dtype=np.int64)
+        parts = [self._cells(ref.sheet, c, rows) for c in range(ref.c1, ref.c2 + 1)]
+        return Values(
+            np.column_stack([p.kind for p in parts]),
+            np.column_stack([p.num for p in parts]),
+            np.column_stack([p.text for p in parts]),
+        )
+
+    # -- 그룹 계산 -----------------------------------------------------
+
+    def _compile(self, key):
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            try:
+                compiler = _Compiler(self)
+                fn = compiler.compile(parse_formula(key))
+                compiled = _Compiled(fn, compiler.per_row)
+            except FormulaError as e:
+                compiled = e
+            self._compiled[key] = compiled
+        return compiled
+
+    def _split(self, group):
+        """그룹 → 1행 그룹들 (행 순서)"""
+        groups = self._groups[(group.sheet, group.col)]
+        singles = [_Group(group.sheet, group.col, group.key, group.rows[i : i + 1]) for i in range(group.rows.size)]
+        at = groups.index(group)
+        groups[at : at + 1] = singles
+        return singles
+
+    def _ensure(self, group):
+        if group.state == 2:
+            return
+        if group.state == 1:
+            raise _GroupCycle(group)
+        compiled = self._compile(group.key)
+        if isinstance(compiled, FormulaError):
+            self._store(group, Values.constant(ERR_NAME, group.rows.size))
+            for r in group.rows.tolist():
+                self.unsupported[f"{group.sheet}!{get_column_letter(group.col)}{r}"] = str(compiled)
+            group.state = 2
+            return
+        if compiled.per_row and group.rows.size > 1:
+            for single in self._split(group):
+                self._ensure(single)
+            return
+        group.state = 1
+        try:
+            ctx = _Context(self, group.sheet, group.rows)
+            result = _scalar_rows(ctx, ctx.materialize(compiled.fn(ctx)))
+        except _GroupCycle as e:
+            group.state = 0
+            if group.rows.size > 1:
+                for single in self._split(group):
+                    self._ensure(single)
+                return
+            if self.strict or e.group is not group:
+                raise
+            self._fail(group, "circular reference")
+            return
+        except FormulaError as e:
+            group.state = 0
+            self._compiled[group.key] = e
+            self._ensure(group)
+            return
+        except Exception as e:
+            group.state = 0
+            if self.strict:
+                raise
+            self._fail(group, f"{type(e).__name__}: {e}")
+            return
+        self._store(group, result)
+        group.state = 2
+
+    def _fail(self, group, message: str):
+        """계산 불가 그룹 → "#VALUE!" (unsupported 에 기록)"""
+        self._store(group, Values.constant(ERR_VALUE, group.rows.size))
+        for r in group.rows.tolist():
+            self.unsupported[f"{group.sheet}!{get_column_letter(group.col)}{r}"] = message
+        group.state = 2
+
+    def _store(self, group, result: Values):
+        column = self._columns[group.sheet][group.col]
+        column.kind[group.rows] = result.kind
+        column.num[group.rows] = result.num
+        column.text[group.rows] = result.text
+
+    def _ensure_top(self, group):
+        try:
+            self._ensure(group)
+        except _GroupCycle as e:
+            g = e.group
+            raise CircularReferenceError(
+                f"circular reference at {g.sheet}!{get_column_letter(g.col)}{int(g.rows[0])}"
+            ) from None
+
+    # -- 공개 API -------------------------------------------------------
+
+    def evaluate(self, sheets=None) -> "FormulaEngine":
+        """모든 (또는 지정 시트의) 수식 그룹 계산"""
+        for (sheet, _), groups in list(self._groups.items()):
+            if sheets is not None and sheet not in sheets:
+                continue
+            for group in list(groups):
+                self._ensure_top(group)
+            # 분할된 그룹 포함 전체 확인
+            for group in list(self._groups[(sheet, _)]):
+                self._ensure_top(group)
+        return self
+
+    def formula_cells(self, sheet):
+        """시트의 수식 셀 좌표 [(col, row), ...] (열 → 행 순)"""
+        out = []
+        for (title, col), groups in self._groups.items():
+            if title == sheet:
+                for group in groups:
+                    out.extend((col, int(r)) for r in group.rows)
+        return sorted(out)
+
+    def value(self, sheet: str, coordinate: str):
+        """셀 1개 값 (수식이면 계산, 필요한 의존 그룹만 계산)"""
+        col, row = _coordinate(coordinate)
+        for group in list(self._groups.get((sheet, col), ())):
+            if group.state != 2 and row in group.rows:
+                self._ensure_top(group)
+        values = self._cells(sheet, col, np.array([row]))
+        if values.kind[0] == BLANK:
+            return None if not self._is_formula(sheet, col, row) else 0.0
+        return values.to_python(0)
+
+    def _is_formula(self, sheet, col, row):
+        return any(row in g.rows for g in self._groups.get((sheet, col), ()))
+
+    def column(self, sheet: str, column: str, min_row: int, max_row: int) -> Values:
+        """열 구간 값 배열 (Values: kind / num / text)"""
+        rows = np.arange(min_row, max_row + 1, dtype=np.int64)
+        col = column_index_from_string(column)
+        for group in list(self._groups.get((sheet, col), ())):
+            if group.state != 2:
+                self._ensure_top(group)
+        return self._cells(sheet, col, rows)
+
+    def values(self, sheet: str) -> dict:
+        """시트의 수식 셀 값 {"C2": value, ...}"""
+        for group in list(self._groups_of(sheet)):
+            self._ensure_top(group)
+        out = {}
+        for (title, col), groups in self._groups.items():
+            if title != sheet:
+                continue
+            column = self._columns[sheet][col]
+            letter = get_column_letter(col)
+            for group in groups:
+                v = Values(column.kind[group.rows], column.num[group.rows], column.text[group.rows])
+                for i, r in enumerate(group.rows.tolist()):
+                    out[f"{letter}{r}"] = v.to_python(i)
+        return out
+
+    def _groups_of(self, sheet):
+        for (title, _), groups in list(self._groups.items()):
+            if title == sheet:
+                yield from list(groups)
+
+    def apply_to(self, wb, only_missing: bool = False):
+        """
+        wb (같은 워크북, data_only 로드 가능) 의 수식 셀에 계산 값 기록
+
+        only_missing=True: 캐시 값이 있는 셀 (None 아님) 은 그대로 둔다
+        """
+        for ws in wb.worksheets:
+            if ws.title not in self._columns:
+                continue
+            for col_row, value in self.values(ws.title).items():
+                cell = ws[col_row]
+                if only_missing and cell.value is not None and not _is_formula_text(cell.value):
+                    continue
+                cell.value = value
+        return wb
+
+
+def _is_formula_text(value):
+    return isinstance(value, str) and value.startswith("=")
+
+
+def _coordinate(coordinate: str):
+    m = re.fullmatch(r"\$?([A-Za-z]{1,3})\$?(\d+)", coordinate.strip())
+    if m is None:
+        raise ValueError(f"invalid cell coordinate {coordinate!r}")
+    return column_index_from_string(m.group(1).upper()), int(m.group(2))
+
+
+def _defined_names(wb):
+    """workbook defined names → (name, AST 노드) (셀 / 범위 1개짜리, 숫자 상수)"""
+    names = getattr(wb, "defined_names", None)
+    if names is None:
+        return
+    items = names.items() if hasattr(names, "items") else ((d.name, d) for d in names.definedName)
+    for name, defined in items:
+        try:
+            destinations = list(defined.destinations)
+        except Exception:
+            continue
+        if not destinations and getattr(defined, "type", None) == "NUMBER":
+            try:
+                yield name, ("const", float(defined.value))
+            except (TypeError, ValueError):
+                pass
+            continue
+        if len(destinations) != 1:
+            continue
+        sheet, ref = destinations[0]
+        ref = ref.replace("$", "")
+        try:
+            if ":" in ref:
+                c1, r1, c2, r2 = range_boundaries(ref)
+                if r1 is None:
+                    yield name, ("range", sheet, c1, c2, None, None)
+                else:
+                    yield name, ("range", sheet, c1, c2, (True, r1), (True, r2))
+            else:
+                col, row = _coordinate(ref)
+                yield name, ("ref", sheet, col, (True, row))
+        except (ValueError, TypeError):
+            continue
+
+
+def evaluate_workbook(source, sheets=None, vectorize: bool = True, strict: bool = False) -> FormulaEngine:
+    """
+    워크북 파일 (경로 / file-like) 또는 openpyxl Workbook 의 수식 계산
+
+    경로는 read_only 로 스트리밍 적재한다 (수식 문자열만 필요).
+    """
+    if isinstance(source, (str, Path)) or hasattr(source, "read"):
+        wb = load_workbook(source, read_only=True)
+        try:
+            engine = FormulaEngine(wb, vectorize, strict)
+        finally:
+            wb.close()
+    else:
+        engine = FormulaEngine(source, vectorize, strict)
+    return engine.evaluate(sheets)
+
+
+def load_workbook_values(path, fill_cached: bool = False):
+    """
+    `load_workbook(path, data_only=True)` 대체: 수식 셀을 계산 값으로 채운 Workbook
+
+    Excel 이 재계산·저장한 파일이면 캐시 값을 그대로 사용하고, 캐시가 없는
+    (None) 수식 셀만 FormulaEngine 값으로 채운다. fill_cached=True 이면 모든 수식
+    셀을 FormulaEngine 값으로 덮어쓴다.
+    """
+    engine = evaluate_workbook(path)
+    if hasattr(path, "seek"):
+        path.seek(0)
+    wb = load_workbook(path, data_only=True)
+    return engine.apply_to(wb, only_missing=not fill_cached)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+RORO calculation engine (agi tr.py 에서 분리)
+
+Modules:
+- params.py     : DEFAULT_PARAMS, TRIM_TARGET_MAP, TR/Pre-ballast Frame 배치
+- data_io.py    : data/*.json 경로 탐색 + 로더, 조위 JSON / CSV 스트리밍 리더
+- frames.py     : Frame ↔ x_from_mid_m 변환
+- hydro.py      : GM 2D grid / Hydro table scalar 보간 (GM grid 는 최초 사용 시 로드)
+- solver.py     : solve_stage, build_stage_loads, find_preballast_opt (표준 라이브러리만 사용)
+- tables.py     : HydroTables (NumPy 캐시 보간 객체)
+- batch.py      : solve_stages_batch (NumPy)
+- tanks.py      : build_tank_lookup
+- allocation.py : optimize_ballast_allocation (SciPy LP)
+- tide.py       : TideWorkability (NumPy 조위 작업 가능 시간대)
+- stage_tide.py : StageTideFeasibility (Stage × 조위 시간 판정 행렬 + 순차 실행 시간대)
+
+패키지 import 는 부작용이 없고, NumPy/SciPy 가 필요한 이름은 처음 접근할 때
+해당 모듈을 import 한다 (PEP 562). 순수 solver 만 필요하면:
+
+    from src.roro_engine.solver import solve_stage, LoadItem
+"""
+
+import importlib
+
+# name → submodule (lazy)
+_EXPORTS = {
+    "DEFAULT_PARAMS": "params",
+    "TRIM_TARGET_MAP": "params",
+    "FR_TR1_STOW": "params",
+    "FR_TR2_RAMP": "params",
+    "FR_PREBALLAST": "params",
+    "fr_to_x": "frames",
+    "x_to_fr": "frames",
+    "gm_2d_bilinear": "hydro",
+    "interpolate_tmean_from_disp": "hydro",
+    "get_gm_grid": "hydro",
+    "LoadItem": "solver",
+    "solve_stage": "solver",
+    "build_stage_loads": "solver",
+    "calc_draft_with_lcf": "solver",
+    "find_preballast_opt": "solver",
+    "HydroTables": "tables",
+    "pack_load_cases": "batch",
+    "solve_stages_batch": "batch",
+    "build_tank_lookup": "tanks",
+    "optimize_ballast_allocation": "allocation",
+    "TideWorkability": "tide",
+    "STAGE_SEQUENCE": "stage_tide",
+    "StageTideFeasibility": "stage_tide",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
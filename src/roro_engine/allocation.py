@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – 다탱크 ballast 분배 LP (scipy.optimize.linprog / HiGHS)
+"""
+
+import numpy as np
+from scipy.optimize import linprog
+from scipy.sparse import csr_matrix
+
+from .hydro import gm_2d_bilinear
+from .params import DEFAULT_PARAMS
+from .solver import build_stage_loads, calc_draft_with_lcf
+from .tanks import build_tank_lookup
+
+# ============================================================================
+# MULTI-TANK BALLAST ALLOCATION (LP, build_tank_lookup 전체 탱크 대상)
+# ============================================================================
+
+BALLAST_ALLOC_STAGES: tuple[str, ...] = (
+    "Stage 5_PreBallast",
+    "Stage 6A_Critical (Opt C)",
+)
+
+
+def _tank_fill_rate_tph(tank: dict, params: dict) -> float:
+    """
+    탱크별 주입 속도 (t/h) = min(pump_rate_effective_tph, air_vent_mm × vent_flow_coeff).
+    air_vent 정보가 없으면 pump_rate_effective_tph.
+    """
+    pump_rate = params.get("pump_rate_effective_tph", 100.00)
+    vent_coeff = params.get("vent_flow_coeff", 0.86)
+    air_vent = tank.get("air_vent_mm")
+    if isinstance(air_vent, (int, float)) and air_vent > 0:
+        return min(pump_rate, float(air_vent) * vent_coeff)
+    return pump_rate
+
+
+def optimize_ballast_allocation(
+    w_tr_unit_t: float = 271.20,
+    stages: tuple[str, ...] = BALLAST_ALLOC_STAGES,
+    params: dict | None = None,
+    tanks: dict | None = None,
+    tank_prefixes: tuple[str, ...] = ("FW",),
+    objective: str = "ballast",
+    base_disp_t: float = 2800.00,
+    max_iter: int = 10,
+) -> dict:
+    """
+    Pre-ballast 를 여러 탱크에 분배하는 LP 최적화 (find_preballast_opt 의 다탱크 확장).
+
+    모델 (find_preballast_opt / _stage_moment_and_drafts_for_preballast 와 동일):
+      - Stage 하중 = build_stage_loads(stage, 0) 의 CARGO + 탱크별 ballast w_i
+      - Trim_cm = Σ w·(x - LCF) / MTC,  FWD/AFT = calc_draft_with_lcf(Tmean_baseline, ...)
+        → FWD / Trim 은 w 에 대해 정확히 선형
+      - GM = gm_2d_bilinear(base_disp_t + W_stage, Trim_m) → 현재 해에서 선형화 후 재풀이 (SLP)
+
+    Gate (stages 의 모든 Stage 동시 만족):
+      - min_fwd_draft_m ≤ FWD ≤ max_fwd_draft_ops_m
+      - |Trim_cm| ≤ trim_limit_abs_cm
+      - GM ≥ gm_target_m
+    용량 제약:
+      - 0 ≤ w_i ≤ max_t (build_tank_lookup)
+      - Σ AFT 탱크(x > 0) ≤ max_aft_ballast_cap_t, Σ FWD 탱크(x < 0) ≤ max_fwd_ballast_cap_t
+
+    Args:
+        tanks: build_tank_lookup() 형식 dict (None이면 새로 생성)
+        tank_prefixes: 후보 탱크 이름 prefix (기본 "FW" = FW1/FW2/FWB/FWCARGO)
+        objective: "ballast" (총 중량 최소) | "pump_time" (Σ w_i / rate_i 최소)
+
+    반환:
+      {
+        "ok": bool,
+        "reason": str,
+        "allocation_t": {tank: t} (w > 0 인 탱크만),
+        "total_t": float,
+        "pump_time_h": float,
+        "stages": {stage: {W_stage_t, x_stage_m, TM_tm, Trim_cm, FWD_m, AFT_m, GM_m}},
+        "iterations": int,
+      }
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+    if objective not in ("ballast", "pump_time"):
+        raise ValueError(f"Unknown ballast objective: {objective!r}")
+    if max_iter < 1:
+        raise ValueError(f"max_iter must be >= 1, got {max_iter}")
+
+    min_fwd = params.get("min_fwd_draft_m", 1.50)
+    max_fwd = params.get("max_fwd_draft_ops_m", 2.70)
+    trim_limit = params.get("trim_limit_abs_cm", 240.00)
+    gm_min = params.get("gm_target_m", 1.50)
+    lcf = params.get("LCF_m_from_midship", 0.76)
+    mtc = params.get("MTC_t_m_per_cm", 34.00)
+    lbp = params.get("Lpp_m", params.get("LBP", 60.302))
+    tmean = params.get("Tmean_baseline_m", 2.00)
+
+    if tanks is None:
+        tanks = build_tank_lookup()
+    names = [
+        n
+        for n, t in tanks.items()
+        if n.startswith(tank_prefixes) and float(t.get("max_t", 0.0)) > 0.0
+    ]
+    if not names:
+        raise ValueError("No candidate ballast tanks.")
+
+    x = np.array([float(tanks[n]["x_from_mid_m"]) for n in names])
+    max_t = np.array([float(tanks[n]["max_t"]) for n in names])
+    rate = np.array([_tank_fill_rate_tph(tanks[n], params) for n in names])
+    n_tank = len(names)
+
+    # Stage별 CARGO 고정 성분 (w=0)
+    stage_params = dict(params)
+    stage_params["W_TR"] = w_tr_unit_t
+    cargo = []
+    for st in stages:
+        loads = [
+            ld for ld in build_stage_loads(st, 0.0, stage_params) if ld.kind != "BALLAST"
+        ]
+        w0 = sum(ld.weight_t for ld in loads)
+        tm0 = sum(ld.weight_t * (ld.x_from_mid_m - lcf) for ld in loads)
+        cargo.append((w0, tm0, sum(ld.weight_t * ld.x_from_mid_m for ld in loads)))
+
+    def _evaluate(alloc: np.ndarray) -> dict:
+        out = {}
+        w_b = float(alloc.sum())
+        tm_b = float(alloc @ (x - lcf))
+        m_b = float(alloc @ x)
+        for st, (w0, tm0, m0) in zip(stages, cargo):
+            w_st = w0 + w_b
+            tm = tm0 + tm_b
+            trim_cm = tm / mtc
+            fwd_m, aft_m = calc_draft_with_lcf(tmean, trim_cm, lcf, lbp)
+            out[st] = {
+                "W_stage_t": w_st,
+                "x_stage_m": (m0 + m_b) / w_st if w_st > 0 else 0.0,
+                "TM_tm": tm,
+                "Trim_cm": trim_cm,
+                "FWD_m": fwd_m,
+                "AFT_m": aft_m,
+                "GM_m": gm_2d_bilinear(base_disp_t + w_st, trim_cm / 100.0),
+            }
+        return out
+
+    # 선형 계수: d(Trim_cm)/dw_i, d(FWD)/dw_i  (calc_draft_with_lcf: FWD = Tmean - Trim_m·(1 - LCF/LBP))
+    d_trim = (x - lcf) / mtc
+    fwd_per_trim_cm = -(1.0 - lcf / lbp) / 100.0
+    d_fwd = d_trim * fwd_per_trim_cm
+
+    # 고정 행 (Trim / FWD / 그룹 용량) – 수치 여유 eps 만큼 안쪽으로
+    eps = 1e-6
+    rows: list[np.ndarray] = []
+    rhs: list[float] = []
+    for st, (w0, tm0, _m0) in zip(stages, cargo):
+        trim0 = tm0 / mtc
+        fwd0 = calc_draft_with_lcf(tmean, trim0, lcf, lbp)[0]
+        rows += [d_fwd, -d_fwd, d_trim, -d_trim]
+        rhs += [
+            max_fwd - fwd0 - eps,
+            fwd0 - min_fwd - eps,
+            trim_limit - trim0 - eps,
+            trim_limit + trim0 - eps,
+        ]
+    rows.append((x > 0).astype(float))
+    rhs.append(params.get("max_aft_ballast_cap_t", 28.00))
+    rows.append((x < 0).astype(float))
+    rhs.append(params.get("max_fwd_ballast_cap_t", 321.00))
+
+    cost = np.ones(n_tank) if objective == "ballast" else 1.0 / rate
+    bounds = list(zip(np.zeros(n_tank), max_t))
+
+    alloc = np.zeros(n_tank)
+    gm_rows: list[np.ndarray] = []
+    gm_rhs: list[float] = []
+    res = None
+    for it in range(1, max_iter + 1):
+        # GM 선형화 (현재 해 기준, 중앙차분) – 이전 반복의 절단면도 유지
+        cur = _evaluate(alloc)
+        for st in stages:
+            disp = base_disp_t + cur[st]["W_stage_t"]
+            trim_m = cur[st]["Trim_cm"] / 100.0
+            h_d, h_t = 1.0, 0.001
+            g_d = (
+                gm_2d_bilinear(disp + h_d, trim_m) - gm_2d_bilinear(disp - h_d, trim_m)
+            ) / (2.0 * h_d)
+            g_t = (
+                gm_2d_bilinear(disp, trim_m + h_t) - gm_2d_bilinear(disp, trim_m - h_t)
+            ) / (2.0 * h_t)
+            grad = g_d + g_t * d_trim / 100.0
+            # -(GM_k + grad·(w - w_k)) ≤ -gm_min
+            gm_rows.append(-grad)
+            gm_rhs.append(cur[st]["GM_m"] - float(grad @ alloc) - gm_min - eps)
+
+        a_ub = csr_matrix(np.vstack(rows + gm_rows))
+        b_ub = np.array(rhs + gm_rhs)
+        res = linprog(cost, A_ub=a_ub, b_ub=b_ub, bounds=bounds, method="highs")
+        if res.status != 0:
+            break
+
+        new_alloc = np.clip(res.x, 0.0, max_t)
+        result = _evaluate(new_alloc)
+        gm_ok = all(result[st]["GM_m"] >= gm_min - 1e-9 for st in stages)
+        converged = float(np.max(np.abs(new_alloc - alloc))) < 1e-6
+        alloc = new_alloc
+        if gm_ok or converged:
+            break
+
+    if res is None or res.status != 0:
+        return {
+            "ok": False,
+            "reason": f"LP infeasible: {res.message if res is not None else 'not solved'}",
+            "allocation_t": {},
+            "total_t": None,
+            "pump_time_h": None,
+            "stages": None,
+            "iterations": it,
+        }
+
+    result = _evaluate(alloc)
+    ok = all(
+        min_fwd - 1e-9 <= r["FWD_m"] <= max_fwd + 1e-9
+        and abs(r["Trim_cm"]) <= trim_limit + 1e-9
+        and r["GM_m"] >= gm_min - 1e-9
+        for r in result.values()
+    )
+    return {
+        "ok": ok,
+        "reason": (
+            "Feasible ballast allocation found."
+            if ok
+            else "GM gate not satisfied after linearisation."
+        ),
+        "allocation_t": {n: float(w) for n, w in zip(names, alloc) if w > 1e-9},
+        "total_t": float(alloc.sum()),
+        "pump_time_h": float((alloc / rate).sum()),
+        "stages": result,
+        "iterations": it,
+    }
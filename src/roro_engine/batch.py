@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – solve_stage() 배치 버전 (NumPy 벡터화)
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .solver import LoadItem
+from .tables import HydroTables
+
+# ============================================================================
+# BATCH STAGE SOLVER (NumPy 벡터화, what-if load case 일괄 계산)
+# ============================================================================
+
+def pack_load_cases(cases) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ragged load case 목록 → zero-padded 2D (weights, x) 배열.
+
+    Args:
+        cases: load case 시퀀스. 각 case 는 LoadItem 리스트 또는
+            (weight_t, x_from_mid_m) 튜플 리스트 (길이 서로 달라도 됨)
+
+    Returns:
+        (weights, x_positions): shape (N, K) 배열, K = 최대 load 개수.
+        빈 칸은 weight=0, x=0 으로 채워져 합산에 영향 없음.
+    """
+    n_cases = len(cases)
+    width = max((len(case) for case in cases), default=0)
+    weights = np.zeros((n_cases, width), dtype=float)
+    x_positions = np.zeros((n_cases, width), dtype=float)
+
+    for i, case in enumerate(cases):
+        for j, ld in enumerate(case):
+            if isinstance(ld, LoadItem):
+                weights[i, j] = ld.weight_t
+                x_positions[i, j] = ld.x_from_mid_m
+            else:
+                weights[i, j], x_positions[i, j] = ld
+
+    return weights, x_positions
+
+
+def _interpolate_tmean_array(disp_t: np.ndarray, hydro_table: list[dict]) -> np.ndarray:
+    """interpolate_tmean_from_disp() 의 벡터 버전 (HydroTables.tmean_array)."""
+    return HydroTables(hydro_table).tmean_array(disp_t)
+
+
+def _gm_2d_bilinear_array(disp_t: np.ndarray, trim_m: np.ndarray) -> np.ndarray:
+    """gm_2d_bilinear() 의 벡터 버전 (전역 GM grid 기반 HydroTables.gm_array)."""
+    return HydroTables.from_globals().gm_array(disp_t, trim_m)
+
+
+def solve_stages_batch(
+    base_disp_t, base_tmean_m, weights, x_positions=None, **params
+) -> Dict[str, np.ndarray]:
+    """
+    solve_stage() 의 배치 버전 – N개 load case 를 NumPy 로 한 번에 계산.
+
+    TR 중량/Frame/Pre-ballast 조합 등 what-if case 를 대량으로 평가할 때 사용.
+    각 case 결과는 solve_stage() 와 동일하다 (합산 순서까지 동일).
+
+    Args:
+        base_disp_t: 기본 배수량 (ton) - scalar 또는 shape (N,)
+        base_tmean_m: 기본 평균 흘수 (m) - solve_stage 와 동일하게 미사용 (호환용)
+        weights: shape (N, K) padded weight 배열 (ton),
+            또는 ragged load case 시퀀스 (x_positions=None 일 때, pack_load_cases 참조)
+        x_positions: shape (N, K) x_from_mid_m 배열 (m)
+        **params: solve_stage() 와 동일 (MTC, LCF, LBP, D_vessel, hydro_table, hydro_tables)
+
+    Returns:
+        dict: solve_stage() 와 동일한 키의 columnar 결과 (각 값은 shape (N,) 배열).
+        pandas.DataFrame(result) 로 바로 표 변환 가능.
+    """
+    if x_positions is None:
+        weights, x_positions = pack_load_cases(weights)
+
+    W = np.atleast_2d(np.asarray(weights, dtype=float))
+    X = np.atleast_2d(np.asarray(x_positions, dtype=float))
+    if W.shape != X.shape:
+        raise ValueError(f"weights {W.shape} and x_positions {X.shape} shape mismatch")
+
+    MTC = params.get("MTC", 34.00)
+    LCF = params.get("LCF", 0.76)
+    LBP = params.get("LBP", 60.302)
+    D_vessel = params.get("D_vessel", 3.65)
+    tables = params.get("hydro_tables")
+    if tables is None:
+        tables = HydroTables.from_globals(params.get("hydro_table", []))
+
+    n_cases = W.shape[0]
+
+    # 1. 중량/모멘트 합산 – 열 단위 누적 (solve_stage 의 sum() 과 동일한 순서)
+    delta_w = np.zeros(n_cases)
+    moment = np.zeros(n_cases)
+    tm = np.zeros(n_cases)
+    for w_col, x_col in zip(np.ascontiguousarray(W.T), np.ascontiguousarray(X.T)):
+        delta_w += w_col
+        moment += w_col * x_col
+        tm += w_col * (x_col - LCF)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_lcg = np.where(np.abs(delta_w) < 1e-6, 0.0, moment / delta_w)
+
+    # 2. Trim 계산
+    trim_cm = tm / MTC if MTC > 0 else np.zeros(n_cases)
+    trim_m = trim_cm / 100.0
+
+    # 3. 배수 및 평균흘수
+    disp_stage = np.asarray(base_disp_t, dtype=float) + delta_w
+    tmean_stage = tables.tmean_array(disp_stage)
+
+    # 4. LCF 기반 Dfwd/Daft (solve_stage 와 동일한 부호 규칙)
+    halfL = LBP / 2.0
+    dfwd_m = tmean_stage + (trim_m * (halfL - LCF) / LBP)
+    daft_m = tmean_stage + (trim_m * (halfL + LCF) / LBP)
+
+    # 5. GM 계산 (2D grid 보간)
+    gm_m = tables.gm_array(disp_stage, trim_m)
+
+    # 6. Freeboard 계산 (Height = D_vessel - Draft)
+    fwd_height_m = np.maximum(0.0, D_vessel - dfwd_m)
+    aft_height_m = np.maximum(0.0, D_vessel - daft_m)
+
+    # 7. 안전성 체크
+    trim_check = np.array(["EXCESSIVE", "OK"])[(np.abs(trim_cm) <= 240.0).view(np.int8)]
+    vs_270 = np.array(["NG", "OK"])[(dfwd_m <= 2.70).view(np.int8)]
+    gm_check = np.array(["LOW", "OK"])[(gm_m >= 1.50).view(np.int8)]
+
+    # 8. 결과 패키징 (solve_stage 와 동일한 키, 값은 shape (N,) 배열)
+    return {
+        "W_stage_t": delta_w,
+        "x_stage_m": x_lcg,
+        "TM_LCF_tm": tm,
+        "Disp_t": disp_stage,
+        "Tmean_m": tmean_stage,
+        "Trim_cm": trim_cm,
+        "Dfwd_m": dfwd_m,
+        "Daft_m": daft_m,
+        "GM_m": gm_m,
+        "FWD_Height_m": fwd_height_m,
+        "AFT_Height_m": aft_height_m,
+        "Trim_Check": trim_check,
+        "vs_2.70m": vs_270,
+        "GM_Check": gm_check,
+    }
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – data/*.json 경로 탐색 + JSON 로더 + 조위 파일 (JSON / CSV) 스트리밍 리더
+
+agi tr.py 에서 분리. 탐색 순서는 기존과 동일:
+  저장소 루트(agi tr.py 위치) → 현재 작업 디렉토리 → /mnt/data (Notebook 환경용)
+메시지는 print 대신 logging 으로 남긴다 (import 시 부작용 없음).
+"""
+
+import csv
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+TIDE_JSON = "data/gateab_v3_tide_data.json"
+TIDE_FILE_ENV = "BUSHRA_TIDE_FILE"  # 조위 파일 경로 override (JSON / CSV)
+
+_CHUNK = 1 << 16
+
+# agi tr.py 가 위치한 저장소 루트 (src/roro_engine/ 기준 2단계 위)
+SCRIPT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+
+def _gm2d_json_paths() -> list[str]:
+    """GM 2D Grid JSON 후보 경로 (기존 _load_json 전략과 동일)"""
+    return [
+        os.path.join(SCRIPT_DIR, "data", "LCT_BUSHRA_GM_2D_Grid.json"),
+        os.path.join(SCRIPT_DIR, "LCT_BUSHRA_GM_2D_Grid.json"),
+        os.path.join(os.getcwd(), "data", "LCT_BUSHRA_GM_2D_Grid.json"),
+        os.path.join(os.getcwd(), "LCT_BUSHRA_GM_2D_Grid.json"),
+        r"/mnt/data/LCT_BUSHRA_GM_2D_Grid.json",
+    ]
+
+
+def _json_base_dirs() -> list[str]:
+    """_load_json 탐색 순서: 스크립트 위치 → 현재 작업 디렉토리 → /mnt/data"""
+    return [
+        SCRIPT_DIR,
+        os.getcwd(),
+        r"/mnt/data",
+    ]
+
+
+def _find_json(filename: str) -> str | None:
+    """_load_json 과 동일한 순서로 존재하는 첫 경로 반환 (없으면 None)"""
+    for base_dir in _json_base_dirs():
+        path = os.path.join(base_dir, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _load_json(filename):
+    """
+    JSON 파일 로더 with backup strategy.
+    - 우선: 스크립트 위치 기준
+    - 다음: 현재 작업 디렉토리
+    - 마지막: /mnt/data (Notebook 환경용)
+
+    BACKUP: Returns None if file not found or parsing fails
+    """
+    for base_dir in _json_base_dirs():
+        path = os.path.join(base_dir, filename)
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                    logger.info("[OK] Loaded: %s", filename)
+                    return data
+            except json.JSONDecodeError as e:
+                logger.warning("[BACKUP] JSON parse error in %s: %s", filename, e)
+                continue  # Try next directory
+            except Exception as e:
+                logger.warning("[BACKUP] Error reading %s: %s", filename, e)
+                continue
+    logger.warning("[BACKUP] %s not found → using fallback", filename)
+    return None
+
+
+def find_tide_file(path: str | None = None) -> str | None:
+    """조위 파일 경로: 인자 → $BUSHRA_TIDE_FILE → data/gateab_v3_tide_data.json (_find_json 순서)"""
+    return path or os.environ.get(TIDE_FILE_ENV) or _find_json(TIDE_JSON)
+
+
+def _iter_json_array(f):
+    """JSON 배열 파일 → 원소를 하나씩 (전체 파일을 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    buf = f.read(_CHUNK).lstrip()
+    if not buf.startswith("["):
+        raise ValueError("tide JSON must be an array of records")
+    pos, eof = 1, False
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buf) and buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(_CHUNK)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        yield item
+        pos = end
+        if len(buf) - pos < _CHUNK // 2 and not eof:
+            chunk = f.read(_CHUNK)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+
+
+def _iter_csv(f):
+    """CSV (datetime*, tide*) 열 → 레코드 (헤더가 다르면 1, 2번째 열)"""
+    reader = csv.reader(f)
+    header = [h.strip().lower() for h in next(reader, [])]
+    t_col = next((i for i, h in enumerate(header) if "datetime" in h), 0)
+    h_col = next((i for i, h in enumerate(header) if h.startswith("tide")), 1)
+    for row in reader:
+        if len(row) > max(t_col, h_col) and row[t_col].strip():
+            tide = row[h_col].strip()
+            yield {"datetime": row[t_col].strip(), "tide_m": float(tide) if tide else 0.0}
+
+
+def iter_tide_records(path: str):
+    """
+    조위 파일 → {"datetime": str, "tide_m": float} 레코드 스트림
+
+    확장자 .csv 는 CSV, 그 외는 JSON 배열 ([{"datetime": ..., "tide_m": ...}, ...]).
+    길이 제한 없음 (수 주 ~ 1년 이상).
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if str(path).lower().endswith(".csv"):
+            yield from _iter_csv(f)
+            return
+        for r in _iter_json_array(f):
+            yield {"datetime": r.get("datetime", ""), "tide_m": r.get("tide_m", 0.0)}
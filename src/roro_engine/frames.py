@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – Frame ↔ x_from_mid_m 변환
+
+agi tr.py 에서 분리. 기본값(757 TCP)은 import 시 고정값이며,
+data/Frame_x_from_mid_m.json 기반 보정은 _init_frame_mapping() 호출 시에만 수행한다.
+"""
+
+import logging
+
+from .data_io import _load_json
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# FRAME ↔ x_from_mid_m Mapping (BUSHRA 757 TCP aligned)
+# ============================================================================
+
+# BUSHRA Tank Plan 757 TCP 기준:
+# - Frame 번호는 FWD 방향으로 증가
+# - Midship ≈ Fr_mid = Lpp / 2 ≈ 30.151
+# - 좌표계:  x_from_mid_m < 0.0  → FWD
+#           x_from_mid_m > 0.0  → AFT
+#
+# ⇒ x = _FRAME_OFFSET + _FRAME_SLOPE * Fr
+#    Fr_mid = 30.151  →  x = 0.0
+#    큰 Frame(예: 48–65, FWB1/2 실제 위치) → x < 0.0 (FWD 쪽)
+#    작은 Frame(예: 5–10)                → x > 0.0 (AFT 쪽)
+
+_FRAME_SLOPE = -1.0  # x 는 Frame 이 커질수록 감소 (Frame 증가 = FWD)
+_FRAME_OFFSET = 30.151  # Midship Frame → x = 0.0m
+
+
+def _init_frame_mapping():
+    """
+    Frame ↔ x_from_mid_m 매핑 초기화.
+    data/Frame_x_from_mid_m.json 이 있으면 거기서 SLOPE/OFFSET 자동 추정,
+    없으면 757 TCP 기준 기본값을 사용한다.
+    """
+    global _FRAME_SLOPE, _FRAME_OFFSET
+    data = _load_json("data/Frame_x_from_mid_m.json")
+    if not data or not isinstance(data, list) or len(data) < 2:
+        # Fallback: BUSHRA 757 TCP default (Fr 증가 = FWD, Midship = 30.151)
+        _FRAME_SLOPE = -1.0
+        _FRAME_OFFSET = 30.151
+        logger.info(
+            "[INFO] Frame mapping: SLOPE=%.6f, OFFSET=%.3f (default)",
+            _FRAME_SLOPE,
+            _FRAME_OFFSET,
+        )
+        return
+
+    try:
+        fr1 = float(data[0]["Fr"])
+        x1 = float(data[0]["x_from_mid_m"])
+        fr2 = float(data[1]["Fr"])
+        x2 = float(data[1]["x_from_mid_m"])
+        if fr2 != fr1:
+            _FRAME_SLOPE = (x2 - x1) / (fr2 - fr1)
+            _FRAME_OFFSET = x1 - _FRAME_SLOPE * fr1
+        logger.info(
+            "[INFO] Frame mapping: SLOPE=%.6f, OFFSET=%.3f", _FRAME_SLOPE, _FRAME_OFFSET
+        )
+    except Exception as e:
+        # Fallback: BUSHRA 757 TCP default (Fr 증가 = FWD, Midship = 30.151)
+        logger.error("[ERROR] Frame JSON parse fail → default: %s", e)
+        _FRAME_SLOPE = -1.0
+        _FRAME_OFFSET = 30.151
+        logger.info(
+            "[INFO] Frame mapping: SLOPE=%.6f, OFFSET=%.3f (default)",
+            _FRAME_SLOPE,
+            _FRAME_OFFSET,
+        )
+
+
+def fr_to_x(fr: float) -> float:
+    """
+    Convert Frame number to x [m from midship].
+
+    BUSHRA 757 TCP 기준:
+    - Frame 증가 = FWD 방향
+    - Frame 30.151 = Midship → x = 0.0
+    - Frame < 30.151 (AFT) → x > 0 (AFT)
+    - Frame > 30.151 (FWD) → x < 0 (FWD)
+
+    공식: x = _FRAME_SLOPE * (fr - _FRAME_OFFSET)
+    """
+    return _FRAME_SLOPE * (float(fr) - _FRAME_OFFSET)
+
+
+def x_to_fr(x: float) -> float:
+    """
+    Inverse: x [m from midship] → Frame number.
+
+    공식: fr = _FRAME_OFFSET - x (x = -1.0 * (fr - 30.151) 이므로)
+    """
+    return _FRAME_OFFSET - float(x)
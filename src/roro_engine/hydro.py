@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – GM 2D grid / Hydro table scalar 보간
+
+agi tr.py 에서 분리. GM 2D grid(LCT_BUSHRA_GM_2D_Grid.json)는 import 시점이 아니라
+최초 사용 시(get_gm_grid / gm_2d_bilinear) 한 번 로드한다.
+DISP_GRID / TRIM_GRID / GM_GRID / GM2D_DATA 는 모듈 속성으로 접근 가능 (lazy).
+"""
+
+import json
+import logging
+import os
+from bisect import bisect_left
+
+from .data_io import _gm2d_json_paths
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# GM 2D Grid 로드 (최초 사용 시 1회)
+# ============================================================================
+# GM 2D Grid JSON 로드 - LCT_BUSHRA_GM_2D_Grid.json 기반
+_GM_GRID_STATE: dict | None = None
+_GM_GRID_NAMES = ("GM2D_DATA", "DISP_GRID", "TRIM_GRID", "GM_GRID")
+
+
+def _load_gm2d_grid() -> dict:
+    """GM 2D Grid JSON 로드 및 모듈 상태 설정"""
+    global _GM_GRID_STATE
+
+    for json_path in _gm2d_json_paths():
+        if os.path.exists(json_path):
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                disp_grid = sorted(data.get("disp", []))
+                trim_grid = sorted(data.get("trim", []))
+                _GM_GRID_STATE = {
+                    "GM2D_DATA": data,
+                    "DISP_GRID": disp_grid,
+                    "TRIM_GRID": trim_grid,
+                    "GM_GRID": [row for row in data.get("gm_grid", [])],
+                }
+                logger.info(
+                    "[OK] GM 2D Grid loaded: %d×%d from %s",
+                    len(disp_grid),
+                    len(trim_grid),
+                    json_path,
+                )
+                return _GM_GRID_STATE
+            except Exception as e:
+                logger.error("[ERROR] GM grid parse error in %s: %s", json_path, e)
+                continue
+
+    # 최후의 fallback: 최소 안전 GM 그리드
+    logger.warning("[FALLBACK] Using minimal safe GM grid")
+    disp_grid = [2800, 3600]
+    trim_grid = [-2.0, 0.0, 2.0]
+    gm_grid = [[1.50] * 3, [1.50] * 3]
+    _GM_GRID_STATE = {
+        "GM2D_DATA": {"disp": disp_grid, "trim": trim_grid, "gm_grid": gm_grid},
+        "DISP_GRID": disp_grid,
+        "TRIM_GRID": trim_grid,
+        "GM_GRID": gm_grid,
+    }
+    return _GM_GRID_STATE
+
+
+def get_gm_grid() -> tuple[list, list, list]:
+    """(DISP_GRID, TRIM_GRID, GM_GRID) – 최초 호출 시 JSON 로드."""
+    state = _GM_GRID_STATE or _load_gm2d_grid()
+    return state["DISP_GRID"], state["TRIM_GRID"], state["GM_GRID"]
+
+
+def __getattr__(name: str):
+    # DISP_GRID 등 기존 전역 변수 이름 호환 (접근 시 lazy 로드)
+    if name in _GM_GRID_NAMES:
+        return (_GM_GRID_STATE or _load_gm2d_grid())[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def gm_2d_bilinear(disp_t: float, trim_m: float) -> float:
+    """
+    Bilinear interpolation on (disp, trim) → GM 2D grid.
+    Uses LCT_BUSHRA_GM_2D_Grid.json with 7x7 grid (7 displacement × 7 trim values).
+
+    Args:
+        disp_t: Displacement (tons)
+        trim_m: Trim in meters (bow down + / stern down - 등 프로젝트 convention에 맞게 사용)
+
+    Returns:
+        GM value (meters) or 1.50m fallback if data not available
+    """
+    # GM grid (최초 호출 시 JSON 로드, 이후 모듈 캐시)
+    ds, ts, g = get_gm_grid()
+
+    # Fallback: Grid가 비어있으면 안전한 최소값 반환
+    if not ds or not ts or not g:
+        logger.warning("[BACKUP] GM 2D Grid unavailable → using fallback GM=1.50m")
+        return 1.50  # Safe minimum GM requirement
+
+    try:
+
+        # --- 1) disp index 찾기 (clamp + 양구간 인덱스) ---
+        if disp_t <= ds[0]:
+            i0 = i1 = 0
+        elif disp_t >= ds[-1]:
+            i0 = i1 = len(ds) - 1
+        else:
+            k = bisect_left(ds, disp_t) - 1
+            if k < 0:
+                k = 0
+            i0, i1 = k, k + 1
+
+        # --- 2) trim index 찾기 (clamp + 양구간 인덱스) ---
+        if trim_m <= ts[0]:
+            j0 = j1 = 0
+        elif trim_m >= ts[-1]:
+            j0 = j1 = len(ts) - 1
+        else:
+            k = bisect_left(ts, trim_m) - 1
+            if k < 0:
+                k = 0
+            j0, j1 = k, k + 1
+
+        d0, d1 = ds[i0], ds[i1]
+        t0, t1 = ts[j0], ts[j1]
+
+        # --- 3) 보간 비율 (0~1) ---
+        if d1 != d0:
+            td = (disp_t - d0) / (d1 - d0)
+        else:
+            td = 0.0
+
+        if t1 != t0:
+            tt = (trim_m - t0) / (t1 - t0)
+        else:
+            tt = 0.0
+
+        # --- 4) 모서리 GM 값 ---
+        g00 = g[i0][j0]  # (d0, t0)
+        g10 = g[i1][j0]  # (d1, t0)
+        g01 = g[i0][j1]  # (d0, t1)
+        g11 = g[i1][j1]  # (d1, t1)
+
+        # --- 5) bilinear interpolation ---
+        gm = (
+            (1 - td) * (1 - tt) * g00
+            + td * (1 - tt) * g10
+            + (1 - td) * tt * g01
+            + td * tt * g11
+        )
+
+        # Sanity check for unrealistic GM values
+        if gm < 0 or gm > 5.0:
+            logger.warning("[BACKUP] GM=%.2fm unrealistic → fallback GM=1.50m", gm)
+            return 1.50
+
+        return float(gm)
+    except Exception as e:
+        logger.warning("[BACKUP] GM calculation error: %s → fallback GM=1.50m", e)
+        return 1.50
+
+
+# ============================================================================
+# Hydro Table 보간 함수
+# ============================================================================
+
+
+def interpolate_tmean_from_disp(disp_t: float, hydro_table: list[dict]) -> float:
+    """
+    Δdisp → Tmean 보간
+
+    Args:
+        disp_t: 배수량 (ton)
+        hydro_table: Hydro table 데이터 (list of dict)
+            각 dict는 "Displacement_t" 또는 "Disp_t"와 "Tmean_m" 키를 가져야 함
+
+    Returns:
+        Tmean (m) - 선형 보간된 평균 흘수
+    """
+    if not hydro_table or len(hydro_table) == 0:
+        logger.warning("[WARNING] Hydro table is empty → using fallback Tmean=2.00m")
+        return 2.00  # Fallback
+
+    try:
+        # 키 이름 확인 (다양한 형식 지원)
+        disp_key = None
+        tmean_key = None
+
+        for key in hydro_table[0].keys():
+            if "disp" in key.lower() or "displacement" in key.lower():
+                disp_key = key
+            if "tmean" in key.lower() or "mean" in key.lower():
+                tmean_key = key
+
+        if not disp_key or not tmean_key:
+            logger.warning(
+                "[WARNING] Hydro table format not recognized → using fallback Tmean=2.00m"
+            )
+            return 2.00
+
+        # Displacement 및 Tmean 배열 추출
+        disps = [float(row[disp_key]) for row in hydro_table]
+        tmeans = [float(row[tmean_key]) for row in hydro_table]
+
+        # 정렬 확인 (필요시 정렬)
+        if disps != sorted(disps):
+            # 정렬 필요
+            sorted_pairs = sorted(zip(disps, tmeans))
+            disps, tmeans = zip(*sorted_pairs)
+            disps = list(disps)
+            tmeans = list(tmeans)
+
+        # Clamp 및 보간
+        if disp_t <= disps[0]:
+            return tmeans[0]
+        elif disp_t >= disps[-1]:
+            return tmeans[-1]
+
+        # 선형 보간
+        i = bisect_left(disps, disp_t)
+        if i <= 0:
+            return tmeans[0]
+        elif i >= len(disps):
+            return tmeans[-1]
+
+        x0, x1 = disps[i - 1], disps[i]
+        y0, y1 = tmeans[i - 1], tmeans[i]
+
+        if x1 == x0:
+            return y0
+
+        tmean = y0 + (y1 - y0) * (disp_t - x0) / (x1 - x0)
+        return float(tmean)
+    except Exception as e:
+        logger.warning(
+            "[WARNING] Tmean interpolation error: %s → using fallback Tmean=2.00m", e
+        )
+        return 2.00
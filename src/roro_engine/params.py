@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – 기본 파라미터 / Stage Trim target / TR·Ballast Frame 배치
+
+agi tr.py 에서 분리 (import 시 부작용 없음, 표준 라이브러리만 사용).
+"""
+
+# ============================================================================
+# 기본 파라미터 (LCT BUSHRA – Hydro / Ops / Limits)
+# Excel Parameter/Constants 시트와 1:1 매핑
+# ============================================================================
+DEFAULT_PARAMS: dict[str, float] = {
+    # HYDRO BASE
+    "Tmean_baseline_m": 2.00,  # m  - Baseline mean draft (Stage 1)
+    "Tmean_baseline": 2.00,  # m  - Alias for backward compatibility
+    "Tide_ref": 2.00,  # m  - Reference tide level
+    "Trim_target_cm": 10.00,  # cm - Target trim (sanity check)
+    "MTC_t_m_per_cm": 34.00,  # t·m/cm - Moment to change trim
+    "LCF_m_from_midship": 0.76,  # m  - LCF from midship (corrected)
+    "D_vessel_m": 3.65,  # m  - Molded depth
+    "TPC_t_per_cm": 8.00,  # t/cm - Tons per cm immersion
+    "Lpp_m": 60.302,  # m  - Lpp (BV value, displayed 60.30)
+    # INPUT CONSTANTS
+    "L_ramp_m": 12.00,  # m  - Linkspan design length
+    "theta_max_deg": 6.00,  # deg- Max ramp angle
+    "KminusZ_m": 3.00,  # m  - K - Z (Aries)
+    # LIMITS & OPS
+    "min_fwd_draft_m": 1.50,  # m  - Minimum allowable forward draft
+    "max_fwd_draft_m": 3.50,  # m  - Max structural/nautical forward draft
+    "max_fwd_draft_ops_m": 2.70,  # m  - Ops limit for RORO
+    "gm_target_m": 1.50,  # m  - GM target
+    "linkspan_freeboard_target_m": 0.28,  # m - Linkspan freeboard target
+    "ramp_door_offset_m": 0.15,  # m  - Ramp door offset vs quay
+    "trim_limit_abs_cm": 240.00,  # cm - Trim envelope for RORO sequence
+    # PUMP / VENT
+    "pump_rate_tph": 10.00,  # t/h - Ship pump rate (slow)
+    "pump_rate_tph_hired": 100.00,  # t/h - Hired pump nominal rate
+    "pump_rate_effective_tph": 100.00,  # t/h - Effective rate (vent-limited)
+    "vent_flow_coeff": 0.86,  # t/h/mm - Vent flow coefficient (2025-11-18)
+    "max_pump_time_h": 6.00,  # h  - Max allowed pump time for fix
+    # BALLAST / CAP
+    # 가정/주의:
+    #   - X_Ballast_from_AP_m = 현재 52.50m는 이전 Forward ballast 전략(FWB1/2 근처)의 잔여값이다.
+    #   - Stern Pre-Ballast 전략에서는 FW2(FR 0–6, AFT)의 실제 LCG(AP)를 master_tanks.csv / Tank Plan에서 읽어와야 한다.
+    "X_Ballast_from_AP_m": 52.50,  # m  - [OLD] Forward ballast CG from AP (FWB1/2 쪽, 검증용 레거시 값)
+    "max_aft_ballast_cap_t": 28.00,  # t  - Max AFT Ballast Capacity (FW2 P/S, Fr 0–6, ~28t)
+    "max_fwd_ballast_cap_t": 321.00,  # t  - Max Forward Ballast Capacity (FWB1/2, Fr 48–65, ~321t)
+    # RAMP GEOMETRY
+    "ramp_hinge_x_mid_m": -30.151,  # m  - Ramp hinge x (midship reference)
+    "ramp_length_m": 8.30,  # m  - Ramp length (TRE 2020-08-04)
+    "linkspan_height_m": 2.00,  # m  - Jetty soffit height
+    "ramp_end_clearance_min_m": 0.40,  # m  - Minimum ramp-end clearance
+    # STRUCTURAL LIMITS
+    "limit_reaction_t": 201.60,  # t  - Aries hinge reaction limit
+    "hinge_limit_rx_t": 201.60,  # t  - Duplicate for clarity
+    "limit_share_load_t": 118.80,  # t  - Mammoet max share load on LCT
+    "limit_deck_press_tpm2": 10.00,  # t/m² - Deck pressure limit
+    "linkspan_area_m2": 12.00,  # m² - Linkspan effective area (1 TR)
+    "hinge_pin_area_m2": 0.117,  # m² - Hinge pin/doubler area (390×300 mm)
+}
+
+# ============================================================================
+# Stage-specific Trim Targets (updated 2025-11-22)
+# ============================================================================
+TRIM_TARGET_MAP: dict[str, float] = {
+    # qqq.md에 값 정의된 Stage들
+    "Stage 1": 0.00,  # 유지
+    "Stage 2": -96.50,  # qqq.md
+    "Stage 3": -96.50,  # qqq.md
+    "Stage 4": -96.50,  # qqq.md
+    "Stage 5": -89.58,  # qqq.md
+    # Stern Pre-Ballast: D-1에 의도적으로 stern trim(+2.40m AFT down) 세팅
+    "Stage 5_PreBallast": 240.00,  # qqq.md (의도적 stern trim; FW2, Fr.0–6 기준)
+    "Stage 6A_Critical (Opt C)": 0.00,  # qqq.md (even keel 목표)
+    "Stage 6A_Critical": 0.00,  # qqq.md와 동일 기준 유지
+    "Stage 6C": -96.50,  # qqq.md
+    "Stage 6C_TotalMassOpt": -96.50,  # Stage 6C와 동일 기준
+    "Stage 7": 0.00,  # 유지
+}
+
+# ============================================================================
+# TR / ballast layout (frames) – Stage 설명표 + Tank Plan 기준
+# ============================================================================
+FR_TR1_STOW: float = 42.00  # "TR1 secured at Fr.42 (aft)"
+FR_TR2_RAMP: float = (
+    17.95  # Stage 6A_Critical(Opt C) LCG Frame (x=12.20m → Fr=30.151-12.20≈17.95)
+)
+FR_PREBALLAST: float = 3.0  # FW2 Stern tank (Fr.0-6, AFT position)
+# CONFIRMED: Stern Pre-Ballast strategy for forward trim correction
@@ -0,0 +1,731 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – Stage solver / Stage load builder / Pre-ballast 최적화
+
+agi tr.py 의 순수 계산 진입점. 표준 라이브러리만 import 하므로
+(numpy / scipy / openpyxl / matplotlib 불필요) worker·테스트에서 가볍게 사용 가능.
+
+    from src.roro_engine.solver import solve_stage, build_stage_loads, LoadItem
+"""
+
+import math
+from typing import Any, Dict, List, NamedTuple
+
+from .frames import fr_to_x
+from .hydro import gm_2d_bilinear, interpolate_tmean_from_disp
+from .params import (
+    DEFAULT_PARAMS,
+    FR_PREBALLAST,
+    FR_TR1_STOW,
+    FR_TR2_RAMP,
+    TRIM_TARGET_MAP,
+)
+
+# ============================================================================
+# LOAD ITEM BUILDER
+# ============================================================================
+
+
+class LoadItem(NamedTuple):
+    """Stage별 하중 구성 요소"""
+
+    name: str
+    weight_t: float
+    x_from_mid_m: float
+    kind: str  # "TR", "SPMT", "BALLAST", "CONST", "CARGO"
+
+
+# ============================================================================
+# STAGE SOLVER (Hydro/GM 기반)
+# ============================================================================
+
+
+def solve_stage(
+    base_disp_t: float, base_tmean_m: float, loads: List[LoadItem], **params
+) -> Dict[str, Any]:
+    """
+    Calculate Δdisp, Trim, Draft, GM, Height, Check for each Stage.
+    Hydro/GM 데이터는 params 내부 참조.
+
+    Args:
+        base_disp_t: 기본 배수량 (ton) - Stage 1 기준
+        base_tmean_m: 기본 평균 흘수 (m) - Stage 1 기준
+        loads: LoadItem 리스트 (Stage별 하중 구성)
+        **params: 파라미터 딕셔너리
+            - MTC: Moment to change trim (t·m/cm)
+            - LCF: Longitudinal center of flotation from midship (m)
+            - LBP: Length between perpendiculars (m)
+            - hydro_table: Hydro table 데이터 (list of dict)
+            - hydro_tables: HydroTables (선택) – 주어지면 Tmean/GM 보간에 사용
+              (HydroTables.load() 캐시 객체, 반복 호출 시 table 재구성 없음)
+            - D_vessel: Vessel depth (m, 기본값 3.65)
+
+    Returns:
+        dict: {
+            "W_stage_t": Stage 추가 중량 (ton),
+            "x_stage_m": Stage LCG (m),
+            "TM_LCF_tm": Trim moment (t·m),
+            "Disp_t": 배수량 (ton),
+            "Tmean_m": 평균 흘수 (m),
+            "Trim_cm": Trim (cm),
+            "Dfwd_m": 선수 흘수 (m),
+            "Daft_m": 선미 흘수 (m),
+            "GM_m": GM (m),
+            "FWD_Height_m": 선수 Freeboard (m),
+            "AFT_Height_m": 선미 Freeboard (m),
+            "Trim_Check": Trim 체크 결과 ("OK" or "EXCESSIVE"),
+            "vs_2.70m": FWD draft 체크 ("OK" or "NG"),
+            "GM_Check": GM 체크 ("OK" or "LOW")
+        }
+    """
+    MTC = params.get("MTC", 34.00)
+    LCF = params.get("LCF", 0.76)
+    LBP = params.get("LBP", 60.302)
+    D_vessel = params.get("D_vessel", 3.65)
+    hydro_table = params.get("hydro_table", [])
+    tables = params.get("hydro_tables")
+
+    # 1. 중량/모멘트 합산
+    delta_w = sum(ld.weight_t for ld in loads)
+    if abs(delta_w) < 1e-6:
+        x_lcg = 0.0
+    else:
+        x_lcg = sum(ld.weight_t * ld.x_from_mid_m for ld in loads) / delta_w
+    tm = sum(ld.weight_t * (ld.x_from_mid_m - LCF) for ld in loads)
+
+    # 2. Trim 계산
+    trim_cm = tm / MTC if MTC > 0 else 0.0
+    trim_m = trim_cm / 100.0
+
+    # 3. 배수 및 평균흘수
+    disp_stage = base_disp_t + delta_w
+    if tables is not None:
+        tmean_stage = tables.tmean(disp_stage)
+    else:
+        tmean_stage = interpolate_tmean_from_disp(disp_stage, hydro_table)
+
+    # 4. LCF 기반 Dfwd/Daft (프로젝트 규칙: trim_m < 0 = bow down → FWD 깊어짐)
+    halfL = LBP / 2.0
+    # 수정: trim_m < 0 (bow down) → FWD가 깊어져야 함
+    dfwd_m = tmean_stage + (trim_m * (halfL - LCF) / LBP)
+    # 수정: Trim이 음수(Bow Down)일 때 Daft는 감소해야 하므로, '-'를 '+'로 변경
+    daft_m = tmean_stage + (trim_m * (halfL + LCF) / LBP)
+
+    # 5. GM 계산 (2D grid 보간)
+    if tables is not None:
+        gm_m = tables.gm(disp_stage, trim_m)
+    else:
+        gm_m = gm_2d_bilinear(disp_stage, trim_m)
+
+    # 6. Freeboard 계산 (Height = D_vessel - Draft)
+    fwd_height_m = max(0.0, D_vessel - dfwd_m)
+    aft_height_m = max(0.0, D_vessel - daft_m)
+
+    # 7. 안전성 체크
+    trim_check = "OK" if abs(trim_cm) <= 240.0 else "EXCESSIVE"
+    vs_270 = "OK" if dfwd_m <= 2.70 else "NG"
+    gm_check = "OK" if gm_m >= 1.50 else "LOW"
+
+    # 8. 결과 패키징
+    return {
+        "W_stage_t": delta_w,
+        "x_stage_m": x_lcg,
+        "TM_LCF_tm": tm,
+        "Disp_t": disp_stage,
+        "Tmean_m": tmean_stage,
+        "Trim_cm": trim_cm,
+        "Dfwd_m": dfwd_m,
+        "Daft_m": daft_m,
+        "GM_m": gm_m,
+        "FWD_Height_m": fwd_height_m,
+        "AFT_Height_m": aft_height_m,
+        "Trim_Check": trim_check,
+        "vs_2.70m": vs_270,
+        "GM_Check": gm_check,
+    }
+
+
+def calc_draft_with_lcf(
+    tmean_m: float, trim_cm: float, lcf_m: float, lbp_m: float
+) -> tuple[float, float]:
+    """
+    LCF 기반 정밀 Dfwd/Daft 계산.
+
+    Parameters
+    ----------
+    tmean_m : 평균 흘수 (m)
+    trim_cm : Trim (cm)  # +면 선미침(AFT deeper), -면 선수침(FWD deeper)
+    lcf_m   : LCF (m), F.P. 기준 길이
+    lbp_m   : LBP (m)
+
+    Returns
+    -------
+    (Dfwd_m, Daft_m) : 선수/선미 흘수 (m)
+    """
+    trim_m = trim_cm / 100.0
+
+    if lbp_m <= 0:
+        raise ValueError("LBP must be > 0")
+
+    r = lcf_m / lbp_m  # 무차원 비율 (0~1 근처)
+
+    dfwd_m = tmean_m - trim_m * (1.0 - r)
+    daft_m = tmean_m + trim_m * r
+
+    return dfwd_m, daft_m
+
+
+def build_stage5_loads(preballast_t: float, params: dict) -> List[LoadItem]:
+    """
+    Stage 5_PreBallast 구성 (TR1 + PreBallast)
+
+    Args:
+        preballast_t: Pre-ballast 중량 (ton)
+        params: 파라미터 딕셔너리
+            - W_TR: Transformer + SPMT 중량 (ton)
+            - FR_TR1: TR1 Frame 번호
+            - FR_PB: PreBallast Frame 번호 (FWB1/2 중심)
+
+    Returns:
+        LoadItem 리스트
+    """
+    W_TR = params.get("W_TR", 280.0)
+    FR_TR1 = params.get("FR_TR1", 42.0)
+    FR_PB = params.get("FR_PB", 55.5)  # FWB1/2 중심 Frame
+
+    x_tr1 = fr_to_x(FR_TR1)
+    x_pb = fr_to_x(FR_PB)
+
+    return [
+        LoadItem("TR1+SPMT", W_TR, x_tr1, "CARGO"),
+        LoadItem("PreBallast", preballast_t, x_pb, "BALLAST"),
+    ]
+
+
+def build_stage6a_loads(preballast_t: float, params: dict) -> List[LoadItem]:
+    """
+    Stage 6A 구성 (TR1 + TR2 + 동일 PreBallast)
+
+    Args:
+        preballast_t: Pre-ballast 중량 (ton)
+        params: 파라미터 딕셔너리
+            - W_TR: Transformer + SPMT 중량 (ton)
+            - FR_TR1: TR1 Frame 번호
+            - FR_TR2: TR2 Frame 번호
+            - FR_PB: PreBallast Frame 번호 (FWB1/2 중심)
+
+    Returns:
+        LoadItem 리스트
+    """
+    W_TR = params.get("W_TR", 280.0)
+    FR_TR1 = params.get("FR_TR1", 42.0)
+    FR_TR2 = params.get("FR_TR2", 17.95)  # Stage 6A_Critical LCG Frame
+    FR_PB = params.get("FR_PB", 3.0)  # FW2 중심 Frame (AFT 쪽, Fr 0-6, Mid_Fr=3.0)
+
+    x_tr1 = fr_to_x(FR_TR1)
+    x_tr2 = fr_to_x(FR_TR2)
+    x_pb = fr_to_x(FR_PB)
+
+    return [
+        LoadItem("TR1+SPMT", W_TR, x_tr1, "CARGO"),
+        LoadItem("TR2+SPMT", W_TR, x_tr2, "CARGO"),
+        LoadItem("PreBallast", preballast_t, x_pb, "BALLAST"),
+    ]
+
+
+def build_stage_loads(
+    stage_name: str, preballast_t: float, params: dict
+) -> List[LoadItem]:
+    """
+    Stage별 LoadItem 리스트 (모든 Stage 지원).
+
+    Args:
+        stage_name: Stage 이름 (Stage 1, Stage 2, ..., Stage 7, Stage 5_PreBallast, Stage 6A_Critical (Opt C), Stage 6C)
+        preballast_t: Pre-ballast 중량 (ton)
+        params: 파라미터 딕셔너리
+            - W_TR: Transformer + SPMT 중량 (ton)
+            - FR_TR1_STOW: TR1 최종 stow Frame 번호
+            - FR_TR1_RAMP_MID: TR1 ramp 중간 Frame 번호
+            - FR_TR1_RAMP_START: TR1 ramp 시작 Frame 번호
+            - FR_TR2_RAMP: TR2 ramp Frame 번호
+            - FR_TR2_STOW: TR2 최종 stow Frame 번호
+            - FR_PREBALLAST: PreBallast Frame 번호 (FW2 중심, AFT 쪽, Fr 0-6, Mid_Fr=3.0)
+
+    Returns:
+        LoadItem 리스트
+
+    가정:
+      - Stage 2/3/4: TR1+SPMT만 ramp→deck 이동
+      - Stage 5: TR1 최종 stow. (추가 하중 없음)
+      - Stage 5_Pre: TR1 stow + Pre-ballast
+      - Stage 6A: TR1 stow + TR2 ramp 진입 + Pre-ballast
+      - Stage 6C: 두 TR 모두 stow + Pre-ballast
+      - Stage 7: Cargo off (추가 하중 없음)
+    """
+    W_TR = params.get("W_TR", 280.0)
+    fr_tr1_pos = params.get("FR_TR1_STOW", params.get("FR_TR1", 42.0))
+    fr_tr1_ramp_mid = params.get("FR_TR1_RAMP_MID", 37.00)
+    fr_tr1_ramp_start = params.get("FR_TR1_RAMP_START", 40.15)
+    fr_tr2_ramp = params.get("FR_TR2_RAMP", params.get("FR_TR2", 17.95))
+    fr_tr2_stow = params.get("FR_TR2_STOW", 40.00)
+    fr_pb = params.get(
+        "FR_PREBALLAST", params.get("FR_PB", 3.0)
+    )  # FW2 (AFT 쪽, Fr 0-6, Mid_Fr=3.0)
+
+    loads: List[LoadItem] = []
+
+    if stage_name == "Stage 1":
+        return loads
+
+    if stage_name == "Stage 2":
+        # TR1 ramp start
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_ramp_start), "CARGO"))
+    elif stage_name == "Stage 3":
+        # TR1 mid-ramp
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_ramp_mid), "CARGO"))
+    elif stage_name == "Stage 4":
+        # TR1 on deck
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
+    elif stage_name == "Stage 5":
+        # TR1 최종 stow (Trim 이벤트는 base에서 이미 포함된 것으로 간주)
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
+    elif stage_name == "Stage 5_PreBallast":
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
+        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
+    elif stage_name == "Stage 6A_Critical (Opt C)":
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
+        loads.append(LoadItem("TR2+SPMT", W_TR, fr_to_x(fr_tr2_ramp), "CARGO"))
+        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
+    elif stage_name == "Stage 6C":
+        loads.append(LoadItem("TR1+SPMT", W_TR, fr_to_x(fr_tr1_pos), "CARGO"))
+        loads.append(LoadItem("TR2+SPMT", W_TR, fr_to_x(fr_tr2_stow), "CARGO"))
+        loads.append(LoadItem("PreBallast", preballast_t, fr_to_x(fr_pb), "BALLAST"))
+    elif stage_name == "Stage 7":
+        return loads
+
+    return loads
+
+
+def calc_trim(moment_tm: float, params: dict | None = None) -> float:
+    """
+    Return Trim [cm] from moment [t·m].
+
+    우선순위:
+    1) params["MTC_t_m_per_cm"]
+    2) params["MTC"]
+    3) 기본값 34.00
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+
+    mtc = params.get("MTC_t_m_per_cm", params.get("MTC", 34.00))
+    return round(moment_tm / mtc, 2)
+
+
+def draft_from_trim(trim_cm: float, params: dict | None = None) -> tuple[float, float]:
+    """
+    Return (FWD, AFT) draft [m].
+
+    Excel Stage 시트 로직과 동일:
+        Tmean_baseline_m 은 모든 Stage에서 동일하다고 가정.
+        부호 규칙:
+            Trim_cm < 0  → 선수침 (FWD 깊어짐)
+            Trim_cm > 0  → 선미침 (AFT 깊어짐)
+
+        Fwd = Tmean + Trim_cm / 200
+        Aft = Tmean - Trim_cm / 200
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+    tmean = params.get("Tmean_baseline_m", 2.00)
+    trim_m = trim_cm / 100.0
+    fwd = tmean + trim_m / 2.0
+    aft = tmean - trim_m / 2.0
+    # Excel과 맞추기 위해 2자리 반올림
+    return round(fwd, 2), round(aft, 2)
+
+
+def _stage_moment_and_drafts_for_preballast(
+    w_tr_unit_t: float,
+    w_preballast_t: float,
+    fr_tr1_stow: float,
+    fr_tr2_ramp: float,
+    fr_preballast: float,
+    params: dict | None = None,
+) -> dict:
+    """
+    Helper: 주어진 preballast 중량에서 Stage 5_PreBallast / 6A_Critical의
+    TM, Trim, Draft(FWD/AFT)를 한 번에 계산.
+
+    가정:
+      - Stage 5_PreBallast = TR1(Fr_tr1_stow) + Pre-ballast(FR_PREBALLAST)
+      - Stage 6A_Critical  = TR1 + TR2(Fr_tr2_ramp) + Pre-ballast
+      - Mean draft(Tmean)은 전체 Stage 동안 일정(=Tmean_baseline_m).
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+
+    lcf = params.get("LCF_m_from_midship", 0.76)
+    mtc = params.get("MTC_t_m_per_cm", 34.00)
+    lbp = params.get("Lpp_m", params.get("LBP", 60.302))
+    tmean = params.get("Tmean_baseline_m", 2.00)
+
+    # 위치 (x from midship)
+    x_tr1 = fr_to_x(fr_tr1_stow)
+    x_tr2 = fr_to_x(fr_tr2_ramp)
+    x_pb = fr_to_x(fr_preballast)
+
+    # --- Stage 5_PreBallast ---------------------------------------------------
+    w5 = w_tr_unit_t + w_preballast_t
+    if w5 <= 0:
+        raise ValueError("Stage 5_PreBallast weight must be positive.")
+
+    lcg5 = (w_tr_unit_t * x_tr1 + w_preballast_t * x_pb) / w5
+    tm5 = w5 * (lcg5 - lcf)
+    trim5_cm = tm5 / mtc
+    fwd5_m, aft5_m = calc_draft_with_lcf(tmean, trim5_cm, lcf, lbp)
+
+    # --- Stage 6A_Critical (Opt C) -------------------------------------------
+    w6 = 2.0 * w_tr_unit_t + w_preballast_t
+    lcg6 = (w_tr_unit_t * x_tr1 + w_tr_unit_t * x_tr2 + w_preballast_t * x_pb) / w6
+    tm6 = w6 * (lcg6 - lcf)
+    trim6_cm = tm6 / mtc
+    fwd6_m, aft6_m = calc_draft_with_lcf(tmean, trim6_cm, lcf, lbp)
+
+    return {
+        "w_preballast_t": w_preballast_t,
+        "stage5": {
+            "W_stage_t": w5,
+            "x_stage_m": lcg5,
+            "TM_tm": tm5,
+            "Trim_cm": trim5_cm,
+            "FWD_m": fwd5_m,
+            "AFT_m": aft5_m,
+        },
+        "stage6A": {
+            "W_stage_t": w6,
+            "x_stage_m": lcg6,
+            "TM_tm": tm6,
+            "Trim_cm": trim6_cm,
+            "FWD_m": fwd6_m,
+            "AFT_m": aft6_m,
+        },
+    }
+
+
+def simulate_stage(
+    stage_name: str,
+    w_stage_t: float,
+    x_stage_m: float,
+    params: dict | None = None,
+) -> dict:
+    """
+    간단 Stage 계산:
+    - 입력: Stage명, Stage 중량, Stage LCG(x)
+    - 출력: Trim, FWD/AFT draft, Target 대비 OK/EXCESSIVE
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+
+    tm = w_stage_t * x_stage_m  # t·m
+    trim_cm = calc_trim(tm, params)
+    fwd, aft = draft_from_trim(trim_cm, params)
+
+    target = TRIM_TARGET_MAP.get(stage_name, 240.00)
+    trim_check = "OK" if abs(trim_cm) <= abs(target) else "EXCESSIVE"
+
+    return {
+        "Stage": stage_name,
+        "W_stage_t": round(w_stage_t, 2),
+        "x_stage_m": round(x_stage_m, 2),
+        "TM_tm": round(tm, 2),
+        "Trim_cm": trim_cm,
+        "FWD_m": fwd,
+        "AFT_m": aft,
+        "Trim_target_cm": target,
+        "Trim_Check": trim_check,
+    }
+
+
+# ============================================================================
+# PRE-BALLAST OPTIMIZATION
+# ============================================================================
+
+
+def _preballast_metric(
+    result: dict,
+    min_fwd: float,
+    max_fwd: float,
+    trim_limit: float,
+    check_stage5: bool,
+) -> float | None:
+    """
+    Pre-ballast 후보 1개에 대한 Gate 판정 + 목적함수.
+
+    Returns:
+        metric = |margin6| + 0.1*|margin5| (Gate 통과 시), 불통과 시 None
+    """
+    st5 = result["stage5"]
+    st6 = result["stage6A"]
+
+    fwd5 = st5["FWD_m"]
+    fwd6 = st6["FWD_m"]
+    trim5 = abs(st5["Trim_cm"])
+    trim6 = abs(st6["Trim_cm"])
+
+    # Gate 1: Draft limits
+    # Stage 5도 CHECK_STAGE5=True인 경우 FWD≤max_fwd_draft_ops_m를 강제 (Harbor Master 제출용)
+    if check_stage5 and not (min_fwd <= fwd5 <= max_fwd):
+        return None
+    if not (min_fwd <= fwd6 <= max_fwd):
+        return None
+
+    # Gate 2: Trim envelope
+    # Stage 5 체크는 선택적 (Stage 5_PreBallast는 의도적 bow trim 240cm 목표)
+    if check_stage5 and trim5 > trim_limit:
+        return None
+    if trim6 > trim_limit:
+        return None
+
+    # Objective: Stage 6A FWD as close as possible to ops limit (max_fwd)
+    # PATCH FIX #4: Stage 5도 고려하여 페널티 추가
+    margin5 = max_fwd - fwd5  # Stage 5 마진
+    margin6 = max_fwd - fwd6  # Stage 6A 마진
+    # 목표: Stage 6A margin 최소이면서 Stage 5도 margin 양호
+    return abs(margin6) + 0.1 * abs(margin5)  # Stage 5 페널티 10%
+
+
+def _affine_interval(
+    c0: float, c1: float, lo: float, hi: float, w_min: float, w_max: float
+) -> tuple[float, float]:
+    """lo ≤ c0 + c1·w ≤ hi 를 만족하는 w 구간 ∩ [w_min, w_max] (공집합이면 lo > hi)."""
+    if abs(c1) < 1e-15:
+        return (w_min, w_max) if lo <= c0 <= hi else (1.0, 0.0)
+    w_a = (lo - c0) / c1
+    w_b = (hi - c0) / c1
+    return max(w_min, min(w_a, w_b)), min(w_max, max(w_a, w_b))
+
+
+def _find_preballast_analytic(
+    evaluate,
+    min_fwd: float,
+    max_fwd: float,
+    trim_limit: float,
+    check_stage5: bool,
+    search_min_t: float,
+    search_max_t: float,
+    tol_t: float,
+) -> dict | None:
+    """
+    Closed-form pre-ballast 탐색 (find_preballast_opt method="analytic").
+
+    Stage 5/6A 의 FWD / Trim 은 pre-ballast 중량 w 에 대해 affine 이므로
+      1) 양 끝점 2회 계산으로 계수 추출 (+ 중간점으로 affine 검증)
+      2) 각 Gate 를 w 구간으로 변환 → 교집합 = feasible interval
+      3) metric(|margin6| + 0.1·|margin5|, convex piecewise-linear)의
+         후보점(구간 끝점, margin=0 인 점)을 tol_t 격자에 snap 하여 비교
+    동률(1e-9 이내)이면 작은 ballast 우선 – scan 과 동일한 tie-break.
+
+    Returns:
+        best helper 결과 dict, feasible 해가 없으면 None.
+        (affine 검증 실패 시 ValueError)
+    """
+    r_a = evaluate(search_min_t)
+    r_b = evaluate(search_max_t)
+    span = search_max_t - search_min_t
+
+    def _coeffs(stage: str, key: str) -> tuple[float, float]:
+        y_a = r_a[stage][key]
+        y_b = r_b[stage][key]
+        c1 = (y_b - y_a) / span if span > 0 else 0.0
+        return y_a - c1 * search_min_t, c1
+
+    coeffs = {
+        (st, key): _coeffs(st, key)
+        for st in ("stage5", "stage6A")
+        for key in ("FWD_m", "Trim_cm")
+    }
+
+    # affine 가정 검증 (중간점)
+    if span > 0:
+        w_mid = search_min_t + 0.5 * span
+        r_mid = evaluate(w_mid)
+        for (st, key), (c0, c1) in coeffs.items():
+            y = r_mid[st][key]
+            if abs(c0 + c1 * w_mid - y) > 1e-6 * max(1.0, abs(y)):
+                raise ValueError(f"{st}.{key} is not affine in pre-ballast weight")
+
+    # feasible interval
+    lo, hi = search_min_t, search_max_t
+    gates = [("stage6A", "FWD_m", min_fwd, max_fwd)]
+    gates.append(("stage6A", "Trim_cm", -trim_limit, trim_limit))
+    if check_stage5:
+        gates.append(("stage5", "FWD_m", min_fwd, max_fwd))
+        gates.append(("stage5", "Trim_cm", -trim_limit, trim_limit))
+    for st, key, g_lo, g_hi in gates:
+        c0, c1 = coeffs[(st, key)]
+        lo, hi = _affine_interval(c0, c1, g_lo, g_hi, lo, hi)
+    if lo > hi:
+        return None
+
+    # 후보점: feasible 구간 끝점 + margin6 = 0 / margin5 = 0 인 점
+    candidates = [lo, hi]
+    for st in ("stage6A", "stage5"):
+        c0, c1 = coeffs[(st, "FWD_m")]
+        if abs(c1) > 1e-15:
+            candidates.append((max_fwd - c0) / c1)
+
+    # tol_t 격자(search_min_t + k·tol_t)에 snap – 구간 경계는 한 칸 안쪽도 확인
+    k_lo = math.ceil((lo - search_min_t) / tol_t - 1e-9)
+    k_hi = math.floor((hi - search_min_t) / tol_t + 1e-9)
+    ks: set[int] = {k_lo, k_lo + 1, k_hi - 1, k_hi}
+    for c in candidates:
+        k = (c - search_min_t) / tol_t
+        ks.update((math.floor(k), math.ceil(k)))
+
+    best: dict | None = None
+    best_metric: float | None = None
+    for k in sorted(k for k in ks if k_lo <= k <= k_hi):
+        w = round(search_min_t + k * tol_t, 9)
+        if w > search_max_t + 1e-9:
+            continue
+        result = evaluate(w)
+        metric = _preballast_metric(
+            result, min_fwd, max_fwd, trim_limit, check_stage5
+        )
+        if metric is None:
+            continue
+        # 오름차순 순회 → 동률이면 먼저 찾은(작은) ballast 유지
+        if best_metric is None or metric < best_metric - 1e-9:
+            best_metric = metric
+            best = result
+
+    return best
+
+
+def find_preballast_opt(
+    w_tr_unit_t: float = 271.20,
+    fr_tr1_stow: float = FR_TR1_STOW,
+    fr_tr2_ramp: float = FR_TR2_RAMP,
+    fr_preballast: float = FR_PREBALLAST,
+    params: dict | None = None,
+    search_min_t: float = 20.0,  # PATCH FIX #3: 최소 탐색량 설정 (0.00t 방지용)
+    search_max_t: float = 400.0,
+    search_step_t: float = 1.0,
+    method: str = "scan",
+    tol_t: float = 0.001,
+) -> dict:
+    """Stage 5_PreBallast ~ 6A_Critical(Opt C) 자동 최적화 루프.
+
+    STRATEGY UPDATE (2025-11-24):
+    - Pre-ballast location: FW2 Stern tank (Fr.0-6, AFT)
+    - Target: Stage 6A FWD as close to 2.70m as possible
+    - Validated solution: ~37.65t achieves FWD≈2.09m at Stage 6A
+
+    목적:
+      1) Stage 5_PreBallast, Stage 6A 모두에서
+         - min_fwd_draft_m ≤ FWD ≤ max_fwd_draft_ops_m
+         - |Trim_cm| ≤ trim_limit_abs_cm
+      2) 위 조건을 만족하는 해 중에서
+         - Stage 6A의 FWD가 max_fwd_draft_ops_m에 가장 가깝도록 (worst-case margin 최소)
+         - 동률일 경우 pre-ballast 중량이 더 작은 해 선호
+
+    탐색 방식 (method):
+      - "scan"     : search_min_t ~ search_max_t 를 search_step_t 간격으로 선형 탐색 (기존)
+      - "analytic" : FWD/Trim 이 pre-ballast 에 대해 affine 임을 이용한 closed-form 해.
+                     feasible 구간을 직접 구하고 tol_t 격자(기본 1 kg) 정밀도로 최적점 선택.
+                     결과는 search_step_t=tol_t 인 scan 과 동일 (helper 호출 ~10회).
+
+    OBSOLETE SCENARIOS (DO NOT USE):
+    - Bow Ballast 471t (FWB1+FWB2+FWCARGO1): FWD 2.99m → EXCEEDS LIMIT
+    - Forward ballast strategies: All superseded by Stern strategy
+
+    반환:
+      {
+        "ok": bool,
+        "reason": str,
+        "w_preballast_t": float | None,
+        "stage5": {...},
+        "stage6A": {...},
+      }
+    """
+    if params is None:
+        params = DEFAULT_PARAMS
+
+    min_fwd = params.get("min_fwd_draft_m", 1.50)
+    max_fwd = params.get("max_fwd_draft_ops_m", 2.70)
+    trim_limit = params.get("trim_limit_abs_cm", 240.00)
+    # NOTE: CHECK_STAGE5=True enforces FWD≤2.70m for Stage 5_PreBallast
+    # Set to False to allow intentional bow-down trim exploration
+    # CURRENT DESIGN: True (strict enforcement for Harbor Master approval)
+    check_stage5 = params.get("CHECK_STAGE5", True)
+
+    def _evaluate(w: float) -> dict:
+        return _stage_moment_and_drafts_for_preballast(
+            w_tr_unit_t=w_tr_unit_t,
+            w_preballast_t=w,
+            fr_tr1_stow=fr_tr1_stow,
+            fr_tr2_ramp=fr_tr2_ramp,
+            fr_preballast=fr_preballast,
+            params=params,
+        )
+
+    best: dict | None = None
+    best_metric: float | None = None
+
+    if method == "analytic":
+        if tol_t <= 0:
+            raise ValueError("tol_t must be positive.")
+        best = _find_preballast_analytic(
+            _evaluate,
+            min_fwd,
+            max_fwd,
+            trim_limit,
+            check_stage5,
+            search_min_t,
+            search_max_t,
+            tol_t,
+        )
+    elif method == "scan":
+        if search_step_t <= 0:
+            raise ValueError("search_step_t must be positive.")
+
+        w = search_min_t
+        while w <= search_max_t + 1e-9:
+            result = _evaluate(w)
+            metric = _preballast_metric(
+                result, min_fwd, max_fwd, trim_limit, check_stage5
+            )
+            if metric is None:
+                w += search_step_t
+                continue
+
+            if best_metric is None or metric < best_metric - 1e-9:
+                best_metric = metric
+                best = result
+            elif best is not None and abs(metric - best_metric) < 1e-9:
+                # tie-breaker: smaller ballast preferred
+                if w < best["w_preballast_t"]:
+                    best_metric = metric
+                    best = result
+
+            w += search_step_t
+    else:
+        raise ValueError(f"Unknown pre-ballast search method: {method!r}")
+
+    if best is None:
+        return {
+            "ok": False,
+            "reason": "No feasible pre-ballast found within search range.",
+            "w_preballast_t": None,
+            "stage5": None,
+            "stage6A": None,
+        }
+
+    return {
+        "ok": True,
+        "reason": "Feasible pre-ballast found.",
+        "w_preballast_t": best["w_preballast_t"],
+        "stage5": best["stage5"],
+        "stage6A": best["stage6A"],
+    }
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – StageTideFeasibility (Stage × 조위 시간 결합 판정, NumPy broadcasting)
+
+solve_stage() 로 구한 Stage별 실제 흘수(Dfwd/Daft, 조위 무관)를 조위 시계열 전체와
+(stages, 1) × (1, hours) broadcasting 으로 결합한다. Hourly 시트와 동일한 수식:
+    Ramp angle   = degrees(atan((KminusZ − Dfwd + tide) / L_ramp))
+    FWD/AFT Height = D_vessel − Dfwd/Daft + tide
+    OK  ⇔  min_fwd_draft ≤ Dfwd ≤ max_fwd_draft  and  angle ≤ θ_max
+           and  FWD_Height ≥ linkspan_freeboard_target
+
+Stage 1→7 순차 실행 가능 시간대: Stage i 가 duration_i 시간 동안 연속 OK 이고
+Stage 들이 선언 순서대로 이어서 진행될 때의 시작 시각 (시간 간격 = 조위 샘플 간격, 1h).
+1개월(744h) ~ 1년(8760h) × 9 Stage 를 수 ms 에 계산.
+
+Usage:
+    tw = TideWorkability.from_json()
+    feas = StageTideFeasibility.solve(tw, preballast_t, params)
+    feas.evaluate()["ok"]                  # (stages, hours) bool
+    feas.sequence_windows({"Stage 6A_Critical (Opt C)": 3})
+"""
+
+import numpy as np
+
+from .params import DEFAULT_PARAMS
+from .solver import build_stage_loads, solve_stage
+from .tide import TideWorkability, _runs
+
+# create_roro_sheet / export_stages_to_csv 의 stages_order 와 동일
+STAGE_SEQUENCE = (
+    "Stage 1",
+    "Stage 2",
+    "Stage 3",
+    "Stage 4",
+    "Stage 5",
+    "Stage 5_PreBallast",
+    "Stage 6A_Critical (Opt C)",
+    "Stage 6C",
+    "Stage 7",
+)
+
+
+class StageTideFeasibility:
+    """
+    Stage 흘수 (S,) × 조위 시계열 (H,) → (S, H) 판정 행렬 + 순차 실행 가능 시간대
+
+    Ramp/draft 한계는 tide (TideWorkability) 의 값을 그대로 사용하고,
+    D_vessel_m / linkspan_freeboard_target_m 는 params (DEFAULT_PARAMS 병합) 에서 읽는다.
+    """
+
+    def __init__(
+        self,
+        tide: TideWorkability,
+        stage_names,
+        dfwd_m,
+        daft_m,
+        params: dict | None = None,
+    ):
+        self.tide = tide
+        self.stage_names = tuple(stage_names)
+        self.dfwd_m = np.asarray(dfwd_m, dtype=float)
+        self.daft_m = np.asarray(daft_m, dtype=float)
+        if not (self.dfwd_m.shape == self.daft_m.shape == (len(self.stage_names),)):
+            raise ValueError("dfwd_m / daft_m must have one value per stage")
+        p = {**DEFAULT_PARAMS, **(params or {})}
+        self.D_vessel_m = float(p["D_vessel_m"])
+        self.freeboard_min_m = float(p["linkspan_freeboard_target_m"])
+
+    @classmethod
+    def from_stage_results(
+        cls, tide: TideWorkability, stage_results: dict, params: dict | None = None
+    ):
+        """{stage_name: solve_stage() 결과} (create_roro_sheet 의 stage_results 형식)"""
+        names = list(stage_results)
+        return cls(
+            tide,
+            names,
+            [stage_results[s]["Dfwd_m"] for s in names],
+            [stage_results[s]["Daft_m"] for s in names],
+            params,
+        )
+
+    @classmethod
+    def solve(
+        cls,
+        tide: TideWorkability,
+        preballast_t: float,
+        params: dict,
+        base_disp_t: float = 2800.00,
+        base_tmean_m: float = 2.00,
+        stages=STAGE_SEQUENCE,
+    ):
+        """build_stage_loads + solve_stage 로 Stage 흘수를 계산 (Stage 당 1회, 조위 무관)"""
+        results = {
+            st: solve_stage(
+                base_disp_t, base_tmean_m, build_stage_loads(st, preballast_t, params), **params
+            )
+            for st in stages
+        }
+        return cls.from_stage_results(tide, results, params)
+
+    def evaluate(self) -> dict[str, np.ndarray]:
+        """
+        Returns:
+            {"angle_deg", "fwd_height_m", "aft_height_m": (S, H) float,
+             "draft_ok": (S, 1) bool, "ok": (S, H) bool}
+        """
+        tw = self.tide
+        tide = tw.tide_m[np.newaxis, :]
+        dfwd = self.dfwd_m[:, np.newaxis]
+        daft = self.daft_m[:, np.newaxis]
+
+        angle = np.degrees(np.arctan((tw.KminusZ_m - dfwd + tide) / tw.L_ramp_m))
+        fwd_height = self.D_vessel_m - dfwd + tide
+        aft_height = self.D_vessel_m - daft + tide
+        draft_ok = (dfwd >= tw.min_fwd_draft_m) & (dfwd <= tw.max_fwd_draft_m)
+        ok = draft_ok & (angle <= tw.theta_max_deg) & (fwd_height >= self.freeboard_min_m)
+        return {
+            "angle_deg": angle,
+            "fwd_height_m": fwd_height,
+            "aft_height_m": aft_height,
+            "draft_ok": draft_ok,
+            "ok": ok,
+        }
+
+    def _durations(self, durations) -> np.ndarray:
+        if np.isscalar(durations):
+            durations = [durations] * len(self.stage_names)
+        elif isinstance(durations, dict):
+            unknown = set(durations) - set(self.stage_names)
+            if unknown:
+                raise ValueError(f"Unknown stages in durations: {sorted(unknown)}")
+            durations = [durations.get(s, 1) for s in self.stage_names]
+        d = np.asarray(durations, dtype=np.int64)
+        if d.shape != (len(self.stage_names),) or (d < 0).any():
+            raise ValueError("durations must be one non-negative hour count per stage")
+        return d
+
+    def sequence_start_ok(self, durations=1, ok: np.ndarray | None = None) -> np.ndarray:
+        """
+        Stage 선언 순서대로 연속 실행 가능한 시작 시각 mask (H,) bool
+
+        durations: Stage별 소요 시간 (h) – scalar, Stage 순서 배열,
+                   또는 {stage_name: hours} (누락 Stage 는 1h, 0 → 판정 제외)
+        시작 t 가능 ⇔ 모든 Stage i 가 [t + offset_i, t + offset_i + d_i) 구간 전체 OK
+        (offset_i = d_0 + … + d_{i-1}). 시계열 끝을 넘는 시작은 False.
+        """
+        d = self._durations(durations)
+        ok = self.evaluate()["ok"] if ok is None else np.asarray(ok, dtype=bool)
+        n_hours = ok.shape[1]
+        total = int(d.sum())
+        start_ok = np.zeros(n_hours, dtype=bool)
+        n_starts = n_hours - total + 1
+        if n_starts <= 0:
+            return start_ok
+
+        # Stage 별 누적 OK 개수 → 임의 구간의 OK 개수를 O(1) 로 조회
+        counts = np.zeros((ok.shape[0], n_hours + 1), dtype=np.int64)
+        np.cumsum(ok, axis=1, out=counts[:, 1:])
+        offsets = np.concatenate(([0], np.cumsum(d)[:-1]))
+        begin = np.arange(n_starts)[np.newaxis, :] + offsets[:, np.newaxis]
+        rows = np.arange(ok.shape[0])[:, np.newaxis]
+        held = counts[rows, begin + d[:, np.newaxis]] - counts[rows, begin]
+        start_ok[:n_starts] = (held == d[:, np.newaxis]).all(axis=0)
+        return start_ok
+
+    def sequence_windows(self, durations=1, ok: np.ndarray | None = None) -> list[dict]:
+        """
+        연속 시작 가능 구간 목록:
+            start / latest_start = 첫·마지막 가능 시작 시각, starts = 가능 시작 수,
+            finish = latest_start 로 시작했을 때 Stage 마지막 시각 종료 (exclusive)
+        """
+        total = int(self._durations(durations).sum())
+        start_ok = self.sequence_start_ok(durations, ok)
+        times = self.tide.times
+        step = times[1] - times[0] if len(times) > 1 else np.timedelta64(1, "h")
+        return [
+            {
+                "start": str(times[start]),
+                "latest_start": str(times[stop - 1]),
+                "finish": str(times[stop - 1] + total * step),
+                "starts": int(stop - start),
+            }
+            for start, stop in _runs(start_ok)
+        ]
+
+    def summary(self, ok: np.ndarray | None = None) -> list[dict]:
+        """Stage별 OK 시간 수 / 비율 (분모 = 시계열 길이)"""
+        ok = self.evaluate()["ok"] if ok is None else ok
+        n = max(len(self.tide), 1)
+        return [
+            {
+                "stage": name,
+                "Dfwd_m": float(self.dfwd_m[i]),
+                "Daft_m": float(self.daft_m[i]),
+                "ok_hours": int(ok[i].sum()),
+                "ok_percentage": float(ok[i].sum()) / n * 100,
+            }
+            for i, name in enumerate(self.stage_names)
+        ]
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – HydroTables (NumPy 기반 캐시 보간 객체)
+
+hydro.py 의 scalar 보간과 bit 단위로 동일한 결과를 내는 배열/캐시 버전.
+NumPy 가 필요하므로 solver 진입점(solver.py)에서는 import 하지 않는다.
+"""
+
+import json
+import logging
+import os
+from bisect import bisect_left
+from typing import Dict
+
+import numpy as np
+
+from .data_io import _find_json, _gm2d_json_paths
+from .hydro import get_gm_grid
+
+logger = logging.getLogger(__name__)
+
+
+def _bisect_left_array(axis: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """bisect_left(axis, v) 벡터 버전. 축이 짧으므로 비교 누적이 searchsorted 보다 빠름."""
+    pos = np.zeros(v.shape, dtype=np.intp)
+    for a in axis:
+        pos += v > a
+    return pos
+
+
+# ============================================================================
+# HydroTables – hydro table / GM 2D grid 캐시 보간 객체
+# ============================================================================
+
+
+def _hydro_table_columns(hydro_table: list[dict] | None) -> tuple[list, list]:
+    """
+    hydro_table(list of dict) → 정렬된 (disps, tmeans) 리스트.
+    키 탐지 / 정렬 규칙은 interpolate_tmean_from_disp() 와 동일. 인식 불가 시 ([], []).
+    """
+    if not hydro_table:
+        return [], []
+
+    disp_key = None
+    tmean_key = None
+    for key in hydro_table[0].keys():
+        if "disp" in key.lower() or "displacement" in key.lower():
+            disp_key = key
+        if "tmean" in key.lower() or "mean" in key.lower():
+            tmean_key = key
+    if not disp_key or not tmean_key:
+        return [], []
+
+    disps = [float(row[disp_key]) for row in hydro_table]
+    tmeans = [float(row[tmean_key]) for row in hydro_table]
+    if disps != sorted(disps):
+        disps, tmeans = (list(v) for v in zip(*sorted(zip(disps, tmeans))))
+    return disps, tmeans
+
+
+class HydroTables:
+    """
+    Hydro table (Δ→Tmean) + GM 2D grid (Δ, Trim→GM) 보간 객체.
+
+    JSON 을 한 번만 파싱해 연속 NumPy 배열 + 구간별 Δx/Δy(기울기)를 미리 계산.
+    - tmean(disp) / gm(disp, trim)             : scalar, bisect O(log n)
+    - tmean_array(disp) / gm_array(disp, trim) : NumPy 벡터 버전
+    결과는 interpolate_tmean_from_disp() / gm_2d_bilinear() 와 bit 단위로 동일
+    (clamp, 중복 Δ, GM sanity → 1.50 fallback 포함).
+
+    HydroTables.load() 는 (파일 경로, mtime) 을 key 로 캐시하므로
+    workbook 반복 생성 / 시나리오 sweep 에서 같은 객체를 재사용한다.
+    """
+
+    _CACHE: Dict[tuple, "HydroTables"] = {}
+
+    def __init__(
+        self,
+        hydro_table: list[dict] | None = None,
+        disp_grid=(),
+        trim_grid=(),
+        gm_grid=(),
+    ):
+        # --- Δ → Tmean ---
+        disps, tmeans = _hydro_table_columns(hydro_table)
+        self._disps = disps
+        self._tmeans = tmeans
+        self._dx = [x1 - x0 for x0, x1 in zip(disps, disps[1:])]
+        self._dy = [y1 - y0 for y0, y1 in zip(tmeans, tmeans[1:])]
+        self.disp_axis = np.asarray(disps, dtype=float)
+        self.tmean_values = np.asarray(tmeans, dtype=float)
+        self._dx_arr = np.asarray(self._dx, dtype=float)
+        self._dy_arr = np.asarray(self._dy, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # dTmean/dΔ (m/t), 구간별 – 중복 Δ 구간은 0
+            self.tmean_slope = np.where(
+                self._dx_arr == 0, 0.0, self._dy_arr / self._dx_arr
+            )
+
+        # --- (Δ, Trim) → GM ---
+        self._ds = [float(v) for v in disp_grid]
+        self._ts = [float(v) for v in trim_grid]
+        self._g = [[float(v) for v in row] for row in gm_grid]
+        self.gm_disp_axis = np.asarray(self._ds, dtype=float)
+        self.gm_trim_axis = np.asarray(self._ts, dtype=float)
+        self.gm_values = np.ascontiguousarray(self._g, dtype=float)
+
+    @property
+    def has_hydro(self) -> bool:
+        return bool(self._disps)
+
+    @property
+    def has_gm(self) -> bool:
+        return bool(self._ds and self._ts and self._g)
+
+    @classmethod
+    def from_gm_data(
+        cls, hydro_table: list[dict] | None, gm_data: dict | None
+    ) -> "HydroTables":
+        """LCT_BUSHRA_GM_2D_Grid.json 형식 dict 로 생성 (_load_gm2d_grid 와 동일하게 축 정렬)."""
+        gm_data = gm_data or {}
+        return cls(
+            hydro_table,
+            sorted(gm_data.get("disp", [])),
+            sorted(gm_data.get("trim", [])),
+            gm_data.get("gm_grid", []),
+        )
+
+    @classmethod
+    def from_globals(cls, hydro_table: list[dict] | None = None) -> "HydroTables":
+        """현재 모듈 GM grid (DISP_GRID / TRIM_GRID / GM_GRID, get_gm_grid) 기반 생성."""
+        return cls(hydro_table, *get_gm_grid())
+
+    @classmethod
+    def load(
+        cls, hydro_path: str | None = None, gm_path: str | None = None
+    ) -> "HydroTables":
+        """
+        hydro_table.json + LCT_BUSHRA_GM_2D_Grid.json 로드 (경로+mtime 캐시).
+
+        경로 미지정 시 _load_json / _load_gm2d_grid 와 동일한 순서로 탐색.
+        GM grid 파일이 없으면 _load_gm2d_grid 와 동일한 최소 안전 grid(1.50m) 사용.
+        """
+        if hydro_path is None:
+            hydro_path = _find_json(os.path.join("data", "hydro_table.json"))
+        if gm_path is None:
+            gm_path = next((p for p in _gm2d_json_paths() if os.path.exists(p)), None)
+
+        def _stamp(path):
+            if path is None or not os.path.exists(path):
+                return (path, None)
+            return (os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+        key = _stamp(hydro_path) + _stamp(gm_path)
+        cached = cls._CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        def _read(path):
+            if path is None or not os.path.exists(path):
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning("[BACKUP] Error reading %s: %s", path, e)
+                return None
+
+        hydro_table = _read(hydro_path)
+        if isinstance(hydro_table, dict):
+            hydro_table = hydro_table.get("data")
+        gm_data = _read(gm_path)
+        if not gm_data:
+            gm_data = {
+                "disp": [2800, 3600],
+                "trim": [-2.0, 0.0, 2.0],
+                "gm_grid": [[1.50] * 3, [1.50] * 3],
+            }
+
+        tables = cls.from_gm_data(hydro_table or [], gm_data)
+        cls._CACHE[key] = tables
+        return tables
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._CACHE.clear()
+
+    # ------------------------------------------------------------------
+    # Δ → Tmean
+    # ------------------------------------------------------------------
+    def tmean(self, disp_t: float) -> float:
+        """Δ → Tmean (m), scalar. interpolate_tmean_from_disp() 와 동일 (빈 table → 2.00)."""
+        disps = self._disps
+        if not disps:
+            return 2.00
+        if disp_t <= disps[0]:
+            return self._tmeans[0]
+        if disp_t >= disps[-1]:
+            return self._tmeans[-1]
+
+        k = bisect_left(disps, disp_t) - 1
+        dx = self._dx[k]
+        if dx == 0:
+            return self._tmeans[k]
+        return float(self._tmeans[k] + self._dy[k] * (disp_t - disps[k]) / dx)
+
+    def tmean_array(self, disp_t) -> np.ndarray:
+        """Δ → Tmean (m), 벡터 버전 (shape 유지, 최소 1-D)."""
+        disp_t = np.atleast_1d(np.asarray(disp_t, dtype=float))
+        xs = self.disp_axis
+        ys = self.tmean_values
+        if not len(xs):
+            return np.full(disp_t.shape, 2.00)
+        if len(xs) == 1:
+            return np.full(disp_t.shape, ys[0])
+
+        # 하한 clamp 는 첫 구간 보간(비율 0)과 값이 동일 → 하한만 먼저 clip
+        d = np.maximum(disp_t, xs[0])
+        k = np.clip(_bisect_left_array(xs, d), 1, len(xs) - 1) - 1
+        x0 = xs[k]
+        y0 = ys[k]
+        dx = self._dx_arr[k]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tmean = y0 + self._dy_arr[k] * (d - x0) / dx
+        if (self._dx_arr == 0).any():
+            tmean = np.where(dx == 0, y0, tmean)
+        tmean[disp_t >= xs[-1]] = ys[-1]
+        return tmean
+
+    # ------------------------------------------------------------------
+    # (Δ, Trim) → GM
+    # ------------------------------------------------------------------
+    def gm(self, disp_t: float, trim_m: float) -> float:
+        """(Δ, Trim_m) → GM (m), scalar. gm_2d_bilinear() 와 동일 (grid 없음/비현실 GM → 1.50)."""
+        ds, ts, g = self._ds, self._ts, self._g
+        if not (ds and ts and g):
+            return 1.50
+
+        # clamp + 양구간 인덱스 (gm_2d_bilinear 와 동일)
+        if disp_t <= ds[0]:
+            i0 = i1 = 0
+        elif disp_t >= ds[-1]:
+            i0 = i1 = len(ds) - 1
+        else:
+            i0 = max(bisect_left(ds, disp_t) - 1, 0)
+            i1 = i0 + 1
+        if trim_m <= ts[0]:
+            j0 = j1 = 0
+        elif trim_m >= ts[-1]:
+            j0 = j1 = len(ts) - 1
+        else:
+            j0 = max(bisect_left(ts, trim_m) - 1, 0)
+            j1 = j0 + 1
+
+        d0, d1 = ds[i0], ds[i1]
+        t0, t1 = ts[j0], ts[j1]
+        td = (disp_t - d0) / (d1 - d0) if d1 != d0 else 0.0
+        tt = (trim_m - t0) / (t1 - t0) if t1 != t0 else 0.0
+
+        g0, g1 = g[i0], g[i1]
+        gm = (
+            (1 - td) * (1 - tt) * g0[j0]
+            + td * (1 - tt) * g1[j0]
+            + (1 - td) * tt * g0[j1]
+            + td * tt * g1[j1]
+        )
+        if gm < 0 or gm > 5.0:
+            return 1.50
+        return float(gm)
+
+    def gm_array(self, disp_t, trim_m) -> np.ndarray:
+        """(Δ, Trim_m) → GM (m), 벡터 버전 (broadcast, 최소 1-D)."""
+        disp_t, trim_m = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(disp_t, dtype=float)),
+            np.atleast_1d(np.asarray(trim_m, dtype=float)),
+        )
+        if not self.has_gm:
+            return np.full(disp_t.shape, 1.50)
+
+        def _axis_index(axis: np.ndarray, v: np.ndarray):
+            if len(axis) == 1:
+                zero = np.zeros(v.shape, dtype=np.intp)
+                return zero, zero, np.zeros(v.shape)
+            # 축 범위 밖은 끝점으로 clip: 끝 구간 보간 비율이 0 또는 1 이 되어
+            # scalar 버전의 (i0 == i1) clamp 결과와 동일한 값
+            vc = np.clip(v, axis[0], axis[-1])
+            lo = np.clip(_bisect_left_array(axis, vc) - 1, 0, len(axis) - 2)
+            hi = lo + 1
+            a0 = axis[lo]
+            span = axis[hi] - a0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                frac = (vc - a0) / span
+            if (np.diff(axis) == 0).any():
+                frac[span == 0] = 0.0
+            return lo, hi, frac
+
+        g = self.gm_values
+        i0, i1, td = _axis_index(self.gm_disp_axis, disp_t)
+        j0, j1, tt = _axis_index(self.gm_trim_axis, trim_m)
+
+        gm = (
+            (1 - td) * (1 - tt) * g[i0, j0]
+            + td * (1 - tt) * g[i1, j0]
+            + (1 - td) * tt * g[i0, j1]
+            + td * tt * g[i1, j1]
+        )
+        gm[(gm < 0) | (gm > 5.0)] = 1.50
+        return gm
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – Ballast tank lookup (757 TCP Tank Plan + data/tank_*.json)
+"""
+
+import logging
+
+from .data_io import _load_json
+from .frames import fr_to_x
+
+logger = logging.getLogger(__name__)
+
+
+def get_fixed_tank_data():
+    """
+    Forward fresh water ballast tanks (FWB1/2) - 757 TCP Tank Plan Verified LCGs.
+
+    Coordinate System (Python Script Internal):
+    - Midship (0.0) is at 30.151m from AP.
+    - FWD is NEGATIVE (-), AFT is POSITIVE (+).
+    - Formula: x_from_mid = Midship_LCG (30.151) - Tank_LCG_from_AP
+
+    Reference: tank.md (Tank Plan 757 TCP)
+    - FWB1 LCG: 57.519 m from AP
+    - FWB2 LCG: 50.038 m from AP
+    """
+    MIDSHIP_LCG_FROM_AP = 30.151
+
+    # LCG to Script X conversion (Midship - LCG)
+    # FWD tanks will result in negative values (Correct for this script)
+    x_fwb1 = MIDSHIP_LCG_FROM_AP - 57.519  # 30.151 - 57.519 = -27.368 m
+    x_fwb2 = MIDSHIP_LCG_FROM_AP - 50.038  # 30.151 - 50.038 = -19.887 m
+    x_fwcargo1 = MIDSHIP_LCG_FROM_AP - 42.750  # 30.151 - 42.750 = -12.599 m
+    x_fwcargo2 = MIDSHIP_LCG_FROM_AP - 35.250  # 30.151 - 35.250 = -5.099 m
+
+    return {
+        # FWB1 (Bow Ballast) - Fr 56-FE
+        "FWB1.P": {
+            "x": x_fwb1,
+            "max_t": 50.57,
+            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
+            "note": "Bow Port (LCG 57.519m)",
+        },
+        "FWB1.S": {
+            "x": x_fwb1,
+            "max_t": 50.57,
+            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
+            "note": "Bow Stbd (LCG 57.519m)",
+        },
+        # FWB2 (Forward Ballast) - Fr 48-53
+        "FWB2.P": {
+            "x": x_fwb2,
+            "max_t": 109.98,
+            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
+            "note": "Fwd Port (LCG 50.038m)",
+        },
+        "FWB2.S": {
+            "x": x_fwb2,
+            "max_t": 109.98,
+            "SG": 1.000,  # Fixed: Fresh Water SG 1.000
+            "note": "Fwd Stbd (LCG 50.038m)",
+        },
+        # FWCARGO1 (Mid-Fwd) - Fr 43-48
+        "FWCARGO1.P": {
+            "x": x_fwcargo1,
+            "max_t": 148.35,
+            "SG": 1.000,
+            "note": "Mid-Fwd Cargo (LCG 42.750m)",
+        },
+        "FWCARGO1.S": {
+            "x": x_fwcargo1,
+            "max_t": 148.35,
+            "SG": 1.000,
+            "note": "Mid-Fwd Cargo (LCG 42.750m)",
+        },
+        # FWCARGO2 (Mid) - Fr 38-43
+        "FWCARGO2.P": {
+            "x": x_fwcargo2,
+            "max_t": 148.36,
+            "SG": 1.000,
+            "note": "Mid Cargo (LCG 35.250m)",
+        },
+        "FWCARGO2.S": {
+            "x": x_fwcargo2,
+            "max_t": 148.36,
+            "SG": 1.000,
+            "note": "Mid Cargo (LCG 35.250m)",
+        },
+    }
+
+
+def build_tank_lookup():
+    """
+    Tank 좌표/용량 JSON에서 Ballast 탱크 정보 취합.
+
+    Source:
+    - data/tank_coordinates.json : data[].Tank_Name, Mid_Fr, x_from_mid_m(선택), Weight_MT, Volume_m3
+    - data/tank_data.json        : data[].Tank_Name, Weight_MT (실측 100% 기준)
+    - get_fixed_tank_data()      : 757 TCP LCG(AP) → x_from_mid_m 변환 (FWB1/2, FWCARGO1/2)
+
+    좌표계:
+    - x_from_mid_m: Midship(0.0) 기준, FWD(-) / AFT(+)
+    - FWB1/2, FWCARGO1/2는 Tank Plan 757 TCP의 LCG(AP) → midship 변환값을 항상 우선 사용.
+    """
+    # 1) 고정 탱크 데이터 (FWB1/2, FWCARGO1/2) – LCG(AP) 기반 x, max_t, SG
+    fixed_data = get_fixed_tank_data()
+
+    # 2) JSON 로드 (없으면 None)
+    coords = _load_json("data/tank_coordinates.json")
+    tdata = _load_json("data/tank_data.json")
+
+    coord_index: dict[str, dict] = {}
+    tdata_index: dict[str, dict] = {}
+
+    if isinstance(coords, list):
+        for item in coords:
+            name = item.get("Tank_Name") or item.get("TankName")
+            if not name:
+                continue
+            coord_index[name] = item
+    elif isinstance(coords, dict) and "data" in coords:
+        for item in coords["data"]:
+            name = item.get("Tank_Name") or item.get("TankName")
+            if not name:
+                continue
+            coord_index[name] = item
+
+    if isinstance(tdata, list):
+        for item in tdata:
+            name = item.get("Tank_Name") or item.get("TankName")
+            if not name:
+                continue
+            tdata_index[name] = item
+    elif isinstance(tdata, dict) and "data" in tdata:
+        for item in tdata["data"]:
+            name = item.get("Tank_Name") or item.get("TankName")
+            if not name:
+                continue
+            tdata_index[name] = item
+
+    # 3) 전체 탱크 이름 집합
+    all_names: set[str] = set()
+    all_names.update(coord_index.keys())
+    all_names.update(tdata_index.keys())
+    all_names.update(fixed_data.keys())
+
+    lookup: dict[str, dict] = {}
+
+    for tank_name in sorted(all_names):
+        info: dict[str, float] = {}
+
+        # 3-1) FWB1/2, FWCARGO1/2는 LCG(AP) 기반 fixed_data 최우선
+        if tank_name in fixed_data:
+            fd = fixed_data[tank_name]
+            info["x_from_mid_m"] = float(fd["x"])
+            info["max_t"] = float(fd["max_t"])
+            info["SG"] = float(fd.get("SG", 1.0))
+
+        # 3-2) tank_coordinates.json 정보 병합 (Frame 기반 → x 변환 포함)
+        c = coord_index.get(tank_name)
+        if c:
+            x_val = c.get("x_from_mid_m")
+            if x_val is None:
+                mid_fr = c.get("Mid_Fr") or c.get("MidFr") or c.get("Fr")
+                if mid_fr is not None:
+                    x_val = fr_to_x(float(mid_fr))
+            if x_val is not None and "x_from_mid_m" not in info:
+                info["x_from_mid_m"] = float(x_val)
+
+            # JSON 쪽에 Weight_MT가 있고 fixed에 max_t 없으면 사용
+            if "max_t" not in info:
+                wt = c.get("Weight_MT")
+                if wt is not None:
+                    info["max_t"] = float(wt)
+
+        # 3-3) tank_data.json 정보 병합 (우선순위: fixed < coords < tdata)
+        d = tdata_index.get(tank_name)
+        if d:
+            if "max_t" not in info:
+                wt = d.get("Weight_MT") or d.get("Weight_t")
+                if wt is not None:
+                    info["max_t"] = float(wt)
+
+        # 3-4) SG / air_vent 기본값 – Fresh Water 기준 1.000
+        sg = float(info.get("SG", 1.0))
+
+        if tank_name.startswith("FWB"):
+            # Fresh Water Ballast – air vent 80mm
+            sg = 1.000
+            air_vent = 80
+        elif tank_name.startswith("FWCARGO"):
+            # Cargo FW tanks – air vent 125mm
+            sg = 1.000
+            air_vent = 125
+        else:
+            air_vent = ""
+
+        x_from_mid = float(info.get("x_from_mid_m", 0.0))
+        max_t = float(info.get("max_t", 0.0))
+
+        lookup[tank_name] = {
+            "x_from_mid_m": round(x_from_mid, 2),
+            "max_t": round(max_t, 2),
+            "SG": sg,
+            "air_vent_mm": air_vent,
+        }
+
+    logger.info("  [OK] Tank lookup built (tanks=%d)", len(lookup))
+    return lookup
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+RORO engine – TideWorkability (NumPy 기반 조위 작업 가능 시간대 엔진)
+
+Hourly_FWD_AFT_Heights 시트 수식과 동일한 계산을 조위 시계열 전체에 대해 배열로 수행:
+    Dfwd_req = KminusZ + tide − L_ramp · tan(θ_max)
+    Dfwd_adj = Dfwd_req − trim/2,  Daft_adj = Dfwd_req + trim/2
+    Ramp angle = degrees(atan((KminusZ − Dfwd_adj + tide) / L_ramp))
+    Status = OK  ⇔  min_fwd_draft ≤ Dfwd_adj ≤ max_fwd_draft  and  angle ≤ θ_max
+
+길이 제한 없음 (744h 1개월 ~ 수년치 100k h). 연속 OK 구간은 [start, stop) 인덱스로 반환.
+조위 파일은 JSON 배열 / CSV 모두 data_io.iter_tide_records 로 레코드 단위 스트리밍 읽기.
+"""
+
+import logging
+
+import numpy as np
+
+from .data_io import TIDE_FILE_ENV, TIDE_JSON, find_tide_file, iter_tide_records  # noqa: F401
+from .params import DEFAULT_PARAMS
+
+logger = logging.getLogger(__name__)
+
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    """bool 배열의 연속 True 구간 → (n, 2) [start, stop) 인덱스"""
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return np.column_stack((np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+class TideWorkability:
+    """
+    조위 시계열 → Dfwd / Ramp angle / Status 배열 + 연속 OK 시간대
+
+    Usage:
+        tw = TideWorkability.from_json()
+        res = tw.evaluate()
+        tw.windows(res["ok"])  # [{"start": ..., "end": ..., "hours": ...}, ...]
+    """
+
+    def __init__(self, times, tide_m, params: dict | None = None):
+        self.times = np.asarray(times, dtype="datetime64[s]")
+        self.tide_m = np.asarray(tide_m, dtype=float)
+        if self.times.shape != self.tide_m.shape:
+            raise ValueError("times and tide_m must have the same length")
+        p = {**DEFAULT_PARAMS, **(params or {})}
+        self.L_ramp_m = float(p["L_ramp_m"])
+        self.theta_max_deg = float(p["theta_max_deg"])
+        self.KminusZ_m = float(p["KminusZ_m"])
+        self.min_fwd_draft_m = float(p["min_fwd_draft_m"])
+        self.max_fwd_draft_m = float(p["max_fwd_draft_m"])
+
+    @classmethod
+    def from_records(cls, records: list[dict], params: dict | None = None):
+        """[{"datetime": "YYYY-MM-DD HH:MM:SS", "tide_m": float}, ...] (tide JSON 형식)"""
+        times = np.array([r["datetime"] for r in records], dtype="datetime64[s]")
+        tide = np.fromiter((r["tide_m"] for r in records), dtype=float, count=len(records))
+        return cls(times, tide, params)
+
+    @classmethod
+    def from_json(cls, path: str | None = None, params: dict | None = None):
+        """조위 파일 (JSON / CSV) 로드, 경로는 find_tide_file 순서로 탐색"""
+        path = find_tide_file(path)
+        if path is None:
+            raise FileNotFoundError(TIDE_JSON)
+        records = list(iter_tide_records(path))
+        logger.info("[OK] Tide series loaded: %s (%d h)", path, len(records))
+        return cls.from_records(records, params)
+
+    def __len__(self) -> int:
+        return self.tide_m.size
+
+    def evaluate(self, trim_m=0.0) -> dict[str, np.ndarray]:
+        """
+        trim_m: scalar 또는 시계열과 같은 길이의 배열 (Hourly 시트 D열, 기본 0 = even keel)
+
+        Returns:
+            {"dfwd_m", "daft_m", "angle_deg", "ok"} 배열
+        """
+        tide = self.tide_m
+        dfwd_req = (
+            self.KminusZ_m + tide - self.L_ramp_m * np.tan(np.radians(self.theta_max_deg))
+        )
+        half_trim = np.asarray(trim_m, dtype=float) / 2.0
+        dfwd = dfwd_req - half_trim
+        daft = dfwd_req + half_trim
+        angle = np.degrees(np.arctan((self.KminusZ_m - dfwd + tide) / self.L_ramp_m))
+        ok = (
+            (dfwd >= self.min_fwd_draft_m)
+            & (dfwd <= self.max_fwd_draft_m)
+            & (angle <= self.theta_max_deg)
+        )
+        return {"dfwd_m": dfwd, "daft_m": daft, "angle_deg": angle, "ok": ok}
+
+    @staticmethod
+    def status(ok: np.ndarray) -> np.ndarray:
+        """bool → "OK" / "CHECK" 문자열 배열"""
+        return np.where(ok, "OK", "CHECK")
+
+    @staticmethod
+    def ok_intervals(ok: np.ndarray, min_hours: int = 1) -> np.ndarray:
+        """연속 OK 구간 (n, 2) [start, stop) 인덱스 (길이 min_hours 이상)"""
+        runs = _runs(np.asarray(ok, dtype=bool))
+        return runs[(runs[:, 1] - runs[:, 0]) >= min_hours]
+
+    def windows(self, ok: np.ndarray, min_hours: int = 1) -> list[dict]:
+        """연속 OK 시간대: start = 첫 OK 시각, end = 마지막 OK 시각 (포함), hours = 샘플 수"""
+        return [
+            {
+                "start": str(self.times[start]),
+                "end": str(self.times[stop - 1]),
+                "hours": int(stop - start),
+            }
+            for start, stop in self.ok_intervals(ok, min_hours)
+        ]
+
+    def kpi(self, result: dict, optimal_range: tuple[float, float] = (2.0, 3.0)) -> dict:
+        """작업 가능률 (분모 = 시계열 길이)"""
+        ok = result["ok"]
+        dfwd = result["dfwd_m"]
+        optimal = ok & (dfwd >= optimal_range[0]) & (dfwd <= optimal_range[1])
+        n = max(len(self), 1)
+        return {
+            "ok_hours": int(ok.sum()),
+            "optimal_hours": int(optimal.sum()),
+            "workable_percentage": float(ok.sum()) / n * 100,
+            "optimal_percentage": float(optimal.sum()) / n * 100,
+        }
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Excel 공유 수식 (shared formula) 셀 값
+
+같은 수식을 행만 바꿔 반복하는 열 블록 (Hourly 시트 등) 을
+<f t="shared" ref="C2:C745" si="0">수식</f> (첫 셀) + <f t="shared" si="0"/> (나머지) 로 기록한다.
+수식 텍스트는 블록당 1번만 저장되므로 행 수가 늘어도 셀당 XML 크기가 일정하다.
+
+openpyxl 의 셀 writer 는 ArrayFormula 의 속성 (__iter__) 과 text 를 그대로 <f> 에 쓰므로
+SharedFormula 는 ArrayFormula 를 상속해 t / ref / si 만 바꾼다. 일반 Workbook 과
+write_only (src/sheet_payload.py) 양쪽에서 동작하고, openpyxl / Excel / LibreOffice 는
+읽을 때 공유 수식을 셀별 수식으로 변환한다.
+
+Usage:
+    for row, value in shared_formula_block('=IF($A{r}="","",$B{r}*2)', "C", 2, 745, si=0):
+        ws.cell(row=row, column=3).value = value
+"""
+
+from openpyxl.compat import safe_string
+from openpyxl.worksheet.formula import ArrayFormula
+
+
+class SharedFormula(ArrayFormula):
+    """
+    공유 수식 셀 1개
+
+    template : "{r}" 자리에 행 번호가 들어가는 수식 ("=..." 형식)
+    row      : 셀 행 번호
+    si       : 시트 안 공유 수식 id
+    ref      : 블록 범위 (첫 셀만, 나머지는 None)
+    """
+
+    t = "shared"
+
+    def __init__(self, template: str, row: int, si: int, ref: str | None = None):
+        self.template = template
+        self.row = row
+        self.si = si
+        self.ref = ref
+
+    @property
+    def text(self) -> str | None:
+        """<f> 에 기록할 수식 (첫 셀만)"""
+        return self.formula if self.ref else None
+
+    @property
+    def formula(self) -> str:
+        """이 셀의 전체 수식 (행 번호 적용)"""
+        return self.template.format(r=self.row)
+
+    def __iter__(self):
+        for k in ("t", "ref", "si"):
+            v = getattr(self, k)
+            if v is not None:
+                yield k, safe_string(v)
+
+    def __eq__(self, other):
+        if isinstance(other, SharedFormula):
+            return (self.formula, self.si, self.ref) == (other.formula, other.si, other.ref)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.formula, self.si, self.ref))
+
+    def __repr__(self):
+        return f"SharedFormula({self.formula!r}, si={self.si}, ref={self.ref!r})"
+
+
+def shared_formula_block(template: str, column: str, first_row: int, last_row: int, si: int):
+    """한 열 (column = 열 문자) 의 공유 수식 블록 → [(row, SharedFormula), ...]"""
+    ref = f"{column}{first_row}:{column}{last_row}"
+    return [
+        (row, SharedFormula(template, row, si, ref if row == first_row else None))
+        for row in range(first_row, last_row + 1)
+    ]
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Sheet dependency graph + (병렬) 실행기
+
+agi tr.py 의 시트 생성 단계를 SheetTask 그래프로 선언하고 실행한다.
+
+- 일반 task  : 빌더 함수 1개 (create_*_sheet). safe_sheet_creation 으로 감싸 실행
+               → 실패해도 None 결과로 계속 진행 (BACKUP PLAN 동일).
+               병렬 모드에서는 process pool 에서 독립 PayloadWorkbook 에 기록한 뒤
+               payload(SheetPayload + defined names)를 반환 → 메인에서 선언 순서대로 조립.
+               워커는 의존 task 의 *결과값*만 받고 다른 시트는 보지 못한다.
+- local task : 조립된 워크북을 수정하는 단계 (RORO 확장, OPERATION SUMMARY).
+               메인 프로세스에서 모든 일반 task 조립 후 선언 순서대로 실행하며,
+               오류 처리는 함수 자체가 담당한다.
+
+빌더 함수 호출 규약: builder(wb, *[results[d] for d in task.deps])
+
+Usage:
+    results = run_sheet_graph(wb, tasks, namespace=globals(), path=__file__,
+                              max_workers=4, timings=timings)
+"""
+
+import importlib.util
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from src.sheet_payload import PayloadWorkbook
+
+logger = logging.getLogger(__name__)
+
+# 빌더 모듈 namespace 캐시 (path → globals). fork 워커는 부모 캐시를 그대로 사용,
+# spawn/forkserver 워커는 최초 task 에서 파일을 한 번 로드한다.
+_NAMESPACES: dict[str, dict] = {}
+
+SAFE_CALL = "safe_sheet_creation"
+
+
+@dataclass(frozen=True)
+class SheetTask:
+    """시트 생성 단계 1개"""
+
+    name: str  # safe_sheet_creation 의 sheet_name (결과 key)
+    builder: str  # 빌더 함수 이름 (namespace 에서 조회 → pickle 가능)
+    deps: tuple[str, ...] = ()
+    local: bool = False
+
+
+def topological_order(tasks) -> list[SheetTask]:
+    """선언 순서를 유지하는 위상 정렬 (중복 이름 / 미정의 의존 / 순환 → ValueError)"""
+    by_name = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate sheet task: {task.name!r}")
+        by_name[task.name] = task
+    for task in tasks:
+        missing = [d for d in task.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"Sheet task {task.name!r} depends on unknown {missing}")
+
+    order: list[SheetTask] = []
+    done: set[str] = set()
+    pending = list(tasks)
+    while pending:
+        ready = [t for t in pending if all(d in done for d in t.deps)]
+        if not ready:
+            raise ValueError(
+                f"Cyclic sheet dependencies: {[t.name for t in pending]}"
+            )
+        for task in ready:
+            order.append(task)
+            done.add(task.name)
+        pending = [t for t in pending if t.name not in done]
+    return order
+
+
+def _namespace(path: str) -> dict:
+    ns = _NAMESPACES.get(path)
+    if ns is None:
+        spec = importlib.util.spec_from_file_location("_sheet_builders", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        ns = _NAMESPACES[path] = vars(module)
+    return ns
+
+
+def _run_remote_task(path: str, task: SheetTask, dep_results: tuple) -> dict:
+    """워커: 독립 PayloadWorkbook 에 시트를 기록하고 payload 반환"""
+    ns = _namespace(path)
+    wb = PayloadWorkbook()
+    t0 = time.perf_counter()
+    result = ns[SAFE_CALL](wb, ns[task.builder], task.name, *dep_results)
+    return {
+        "result": result,
+        "sheets": wb.worksheets,
+        "defined_names": dict(wb.defined_names),
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+def _task_failed(task: SheetTask, exc: Exception):
+    """워커/프로세스 오류 → safe_sheet_creation 과 동일한 복구 메시지"""
+    logging.error(f"✗ {task.name} creation failed: {exc}")
+    logging.warning(f"[BACKUP] Skipping {task.name}, continuing...")
+    print(f"  [BACKUP] Warning: {task.name} creation failed, continuing...")
+
+
+def _run_sequential(wb, order, ns, results, timings):
+    for task in order:
+        t0 = time.perf_counter()
+        args = tuple(results[d] for d in task.deps)
+        if task.local:
+            results[task.name] = ns[task.builder](wb, *args)
+        else:
+            results[task.name] = ns[SAFE_CALL](wb, ns[task.builder], task.name, *args)
+        timings[task.name] = time.perf_counter() - t0
+
+
+def _run_parallel(wb, order, path, max_workers, results, timings):
+    remote = [t for t in order if not t.local]
+    by_name = {t.name: t for t in remote}
+    if any(d not in by_name for t in remote for d in t.deps):
+        raise ValueError("Pool tasks may only depend on other pool tasks")
+
+    t0 = time.perf_counter()
+    outputs: dict[str, dict] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for task in remote:  # 위상 순서 → 의존 결과는 먼저 완료 대기
+            args = []
+            for dep in task.deps:
+                out = outputs.get(dep)
+                if out is None:
+                    out = outputs[dep] = _collect(futures[dep], by_name[dep])
+                args.append(out["result"])
+            futures[task.name] = pool.submit(_run_remote_task, path, task, tuple(args))
+        for task in remote:
+            if task.name not in outputs:
+                outputs[task.name] = _collect(futures[task.name], task)
+    timings["pool_wall"] = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    for task in remote:  # 선언 순서대로 조립 (완료 순서와 무관)
+        out = outputs[task.name]
+        for sheet in out["sheets"]:
+            wb.add_payload(sheet)
+        wb.defined_names.update(out["defined_names"])
+        results[task.name] = out["result"]
+        timings[task.name] = out["seconds"]
+    timings["assemble"] = time.perf_counter() - t1
+
+
+def _collect(future, task) -> dict:
+    try:
+        return future.result()
+    except Exception as e:
+        _task_failed(task, e)
+        return {"result": None, "sheets": [], "defined_names": {}, "seconds": 0.0}
+
+
+def run_sheet_graph(
+    wb,
+    tasks,
+    *,
+    namespace: dict,
+    path: str,
+    max_workers: int | None = 0,
+    timings: dict | None = None,
+) -> dict:
+    """
+    시트 그래프 실행
+
+    Args:
+        wb: openpyxl Workbook (순차) 또는 PayloadWorkbook (순차/병렬)
+        tasks: SheetTask 목록 (선언 순서 = 시트 순서)
+        namespace: 빌더 함수 조회용 globals() (메인 프로세스)
+        path: 빌더 모듈 파일 경로 (워커에서 namespace 재구성)
+        max_workers: 0 → 순차 실행, None/N → process pool (N workers)
+        timings: 단계별 소요 시간(s)을 기록할 dict (optional)
+
+    Returns:
+        {task.name: 빌더 반환값 (실패 시 None)}
+    """
+    order = topological_order(tasks)
+    results: dict = {}
+    timings = {} if timings is None else timings
+    path = os.path.abspath(path)
+
+    if max_workers == 0:
+        _run_sequential(wb, order, namespace, results, timings)
+        return results
+    if not isinstance(wb, PayloadWorkbook):
+        raise TypeError("Parallel sheet build requires a PayloadWorkbook")
+
+    _NAMESPACES[path] = namespace
+    try:
+        _run_parallel(wb, order, path, max_workers, results, timings)
+    except (OSError, NotImplementedError) as e:
+        # process pool 사용 불가 환경 (semaphore 없음 등) → 순차 실행으로 복구
+        logger.warning("[BACKUP] Process pool unavailable (%s), building sheets sequentially", e)
+        _run_sequential(wb, [t for t in order if not t.local], namespace, results, timings)
+
+    t0 = time.perf_counter()
+    for task in order:
+        if task.local:
+            t1 = time.perf_counter()
+            results[task.name] = namespace[task.builder](
+                wb, *(results[d] for d in task.deps)
+            )
+            timings[task.name] = time.perf_counter() - t1
+    timings["local"] = time.perf_counter() - t0
+    return results
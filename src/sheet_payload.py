@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Sheet payload capture + write-only streaming writer
+
+agi tr.py 의 시트 빌더(create_*_sheet, extend_*)는 openpyxl Worksheet API 의
+일부만 사용한다 (ws.cell / ws["A1"] / column_dimensions[...].width /
+merge_cells / freeze_panes / add_table / max_row / iter_rows).
+PayloadWorkbook / SheetPayload 는 이 API 를 흉내 내어 셀 값과 스타일 참조만
+가벼운 CellSpec 에 기록한다 (openpyxl 스타일 인덱싱 없음, pickle 가능).
+
+write_payload_workbook() 은 기록된 payload 를 openpyxl write_only 워크북으로
+시트 단위 스트리밍한다. 동일한 (font, fill, border, alignment, number_format,
+protection) 조합은 한 번만 openpyxl 스타일 테이블에 등록하고 StyleArray 를
+공유한다 (style interning).
+
+Usage:
+    wb = PayloadWorkbook()
+    create_calc_sheet(wb)
+    write_payload_workbook(wb, "out.xlsx")
+"""
+
+import warnings
+from collections import defaultdict
+from copy import copy
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border
+from openpyxl.utils.cell import coordinate_to_tuple, range_boundaries
+from openpyxl.workbook.child import avoid_duplicate_name
+from openpyxl.workbook.defined_name import DefinedNameDict
+from openpyxl.worksheet.cell_range import CellRange
+
+_STYLE_ATTRS = ("font", "fill", "border", "alignment", "number_format", "protection")
+_NO_STYLE = (None,) * len(_STYLE_ATTRS)
+
+
+class CellSpec:
+    """셀 1개의 값 + 스타일 참조 (None = 기본값)"""
+
+    __slots__ = ("value", "comment") + _STYLE_ATTRS
+
+    def __init__(self, value=None):
+        self.value = value
+        self.comment = None
+        self.font = None
+        self.fill = None
+        self.border = None
+        self.alignment = None
+        self.number_format = None
+        self.protection = None
+
+    @property
+    def styles(self) -> tuple:
+        """(font, fill, border, alignment, number_format, protection)"""
+        return (
+            self.font,
+            self.fill,
+            self.border,
+            self.alignment,
+            self.number_format,
+            self.protection,
+        )
+
+    @property
+    def has_style(self) -> bool:
+        return self.styles != _NO_STYLE
+
+
+class _ColumnDimension:
+    __slots__ = ("width",)
+
+    def __init__(self):
+        self.width = None
+
+
+class SheetPayload:
+    """openpyxl Worksheet 대체 기록기 (시트 빌더가 쓰는 API 서브셋)"""
+
+    def __init__(self, parent, title: str):
+        self.parent = parent
+        self.title = title
+        self._cells: dict[tuple[int, int], CellSpec] = {}
+        self.column_dimensions = defaultdict(_ColumnDimension)
+        self.merged_cells: list[str] = []
+        self.freeze_panes = None
+        self.tables: list = []
+
+    def __getstate__(self):
+        # parent(워크북)는 pickle 하지 않음 → PayloadWorkbook.add_payload 로 재연결
+        return {**self.__dict__, "parent": None}
+
+    # --- 셀 접근 (openpyxl 과 동일하게 읽기만 해도 셀이 생성됨) ---
+    def cell(self, row: int, column: int, value=None) -> CellSpec:
+        if row < 1 or column < 1:
+            raise ValueError("Row or column values must be at least 1")
+        spec = self._cells.get((row, column))
+        if spec is None:
+            spec = self._cells[(row, column)] = CellSpec()
+        if value is not None:
+            spec.value = value
+        return spec
+
+    def __getitem__(self, key: str):
+        if ":" not in key:
+            return self.cell(*coordinate_to_tuple(key))
+        min_col, min_row, max_col, max_row = range_boundaries(key)
+        return tuple(
+            tuple(self.cell(r, c) for c in range(min_col, max_col + 1))
+            for r in range(min_row, max_row + 1)
+        )
+
+    def __setitem__(self, key: str, value):
+        self[key].value = value
+
+    @property
+    def max_row(self) -> int:
+        return max((r for r, _ in self._cells), default=1)
+
+    @property
+    def max_column(self) -> int:
+        return max((c for _, c in self._cells), default=1)
+
+    def iter_rows(
+        self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False
+    ):
+        if not self._cells and not any((min_row, max_row, min_col, max_col)):
+            return
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        for r in range(min_row, max_row + 1):
+            cells = tuple(self.cell(r, c) for c in range(min_col, max_col + 1))
+            yield tuple(c.value for c in cells) if values_only else cells
+
+    def append(self, values):
+        row = self.max_row + 1 if self._cells else 1
+        for col, value in enumerate(values, start=1):
+            self.cell(row, col, value)
+
+    def merge_cells(self, range_string: str):
+        """병합: 좌상단 외 셀은 비우고, 좌상단 테두리를 외곽에 복사 (openpyxl 과 동일)"""
+        rng = CellRange(range_string)
+        self.merged_cells.append(rng.coord)
+        anchor = self.cell(rng.min_row, rng.min_col)
+        for row, col in rng.cells:
+            if (row, col) != (rng.min_row, rng.min_col):
+                self._cells[(row, col)] = CellSpec()
+        if anchor.border is None:
+            return
+        for name in ("top", "left", "right", "bottom"):
+            side = getattr(anchor.border, name)
+            if side is None or side.style is None:
+                continue
+            edge = Border(**{name: side})
+            for row, col in getattr(rng, name):
+                spec = self.cell(row, col)
+                spec.border = edge if spec.border is None else spec.border + edge
+
+    def add_table(self, table):
+        self.tables.append(table)
+
+    def rows_by_index(self) -> list[tuple[int, dict[int, CellSpec]]]:
+        """(row, {col: CellSpec}) 오름차순 — 스트리밍 writer 용"""
+        rows: dict[int, dict[int, CellSpec]] = defaultdict(dict)
+        for (r, c), spec in self._cells.items():
+            rows[r][c] = spec
+        return sorted(rows.items())
+
+
+class PayloadWorkbook:
+    """openpyxl Workbook 대체 기록기 (create_sheet / remove / defined_names)"""
+
+    def __init__(self):
+        self._sheets: list[SheetPayload] = []
+        self.defined_names = DefinedNameDict()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return [ws.title for ws in self._sheets]
+
+    @property
+    def worksheets(self) -> list[SheetPayload]:
+        return list(self._sheets)
+
+    @property
+    def active(self):
+        return self._sheets[0] if self._sheets else None
+
+    def create_sheet(self, title: str, index: int | None = None) -> SheetPayload:
+        ws = SheetPayload(self, avoid_duplicate_name(self.sheetnames, title))
+        if index is None:
+            self._sheets.append(ws)
+        else:
+            self._sheets.insert(index, ws)
+        return ws
+
+    def add_payload(self, ws: SheetPayload) -> SheetPayload:
+        """다른 프로세스/기록기에서 만든 SheetPayload 를 추가"""
+        ws.parent = self
+        ws.title = avoid_duplicate_name(self.sheetnames, ws.title)
+        self._sheets.append(ws)
+        return ws
+
+    def remove(self, ws: SheetPayload):
+        self._sheets.remove(ws)
+
+    def __getitem__(self, name: str) -> SheetPayload:
+        for ws in self._sheets:
+            if ws.title == name:
+                return ws
+        raise KeyError(f"Worksheet {name} does not exist.")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sheetnames
+
+    def close(self):
+        pass
+
+
+class StyleInterner:
+    """스타일 조합 → StyleArray 캐시 (조합당 openpyxl 스타일 등록 1회)"""
+
+    def __init__(self, ws):
+        self._ws = ws
+        self._arrays = {}
+        self._keep = []  # id() 재사용 방지
+
+    def style_array(self, objs: tuple):
+        """objs: CellSpec.styles → 공유 StyleArray"""
+        key = tuple(map(id, objs))
+        array = self._arrays.get(key)
+        if array is None:
+            template = WriteOnlyCell(self._ws)
+            for name, obj in zip(_STYLE_ATTRS, objs):
+                if obj is not None:
+                    setattr(template, name, obj)
+            array = self._arrays[key] = template._style
+            self._keep.append(objs)
+        return array
+
+
+def _initialise_table_columns(table, ws: SheetPayload):
+    """write_only 모드에서는 openpyxl 이 헤더로 테이블 컬럼을 채우지 못함 → 직접 설정"""
+    if table.tableColumns:
+        return
+    table._initialise_columns()
+    if table.headerRowCount:
+        min_col, min_row, _, _ = range_boundaries(table.ref)
+        for offset, column in enumerate(table.tableColumns):
+            column.name = str(ws.cell(min_row, min_col + offset).value)
+
+
+def write_payload_workbook(wb: PayloadWorkbook, path) -> None:
+    """PayloadWorkbook 을 openpyxl write_only 워크북으로 시트 단위 스트리밍 저장"""
+    out = Workbook(write_only=True)
+    interner = None  # 스타일 테이블은 워크북 단위 → 시트 간 공유
+
+    for payload in wb.worksheets:
+        ws = out.create_sheet(payload.title)
+        if interner is None:
+            interner = StyleInterner(ws)
+        for letter, dim in payload.column_dimensions.items():
+            if dim.width is not None:
+                ws.column_dimensions[letter].width = dim.width
+        if payload.freeze_panes is not None:
+            ws.freeze_panes = payload.freeze_panes
+        for coord in payload.merged_cells:
+            ws.merged_cells.add(coord)
+        for table in payload.tables:
+            _initialise_table_columns(table, payload)
+            with warnings.catch_warnings():
+                # 컬럼은 위에서 직접 채움 → "add table columns manually" 경고 불필요
+                warnings.simplefilter("ignore", UserWarning)
+                ws.add_table(table)
+
+        next_row = 1
+        for r, cols in payload.rows_by_index():
+            while next_row < r:
+                ws.append([])
+                next_row += 1
+            row = [None] * max(cols)
+            for c, spec in cols.items():
+                styles = spec.styles
+                if styles == _NO_STYLE and spec.comment is None:
+                    row[c - 1] = spec.value  # 스타일 없는 셀은 값만 전달
+                    continue
+                cell = WriteOnlyCell(ws, spec.value)
+                if styles != _NO_STYLE:
+                    cell._style = interner.style_array(styles)
+                if spec.comment is not None:
+                    cell.comment = copy(spec.comment)
+                row[c - 1] = cell
+            ws.append(row)
+            next_row += 1
+
+    for name, defn in wb.defined_names.items():
+        out.defined_names[name] = defn
+
+    out.save(path)
+
+
+__all__ = [
+    "CellSpec",
+    "SheetPayload",
+    "PayloadWorkbook",
+    "StyleInterner",
+    "write_payload_workbook",
+]
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures for agi tr.py engine tests."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def agi_tr():
+    """Load `agi tr.py` as a module (file name contains a space)."""
+    spec = importlib.util.spec_from_file_location("agi_tr", ROOT / "agi tr.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def hydro_table(agi_tr):
+    """data/hydro_table.json as list of dict."""
+    return agi_tr._load_json("data/hydro_table.json") or []
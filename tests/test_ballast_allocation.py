@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""optimize_ballast_allocation: 다탱크 LP ballast 분배 테스트."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tanks(agi_tr):
+    return agi_tr.build_tank_lookup()
+
+
+def _params(agi_tr, **overrides):
+    params = dict(agi_tr.DEFAULT_PARAMS, max_aft_ballast_cap_t=80.0)
+    params.update(overrides)
+    return params
+
+
+@pytest.mark.parametrize("objective", ["ballast", "pump_time"])
+def test_allocation_satisfies_all_gates(agi_tr, tanks, objective):
+    params = _params(agi_tr)
+    res = agi_tr.optimize_ballast_allocation(
+        params=params, tanks=tanks, objective=objective
+    )
+
+    assert res["ok"], res["reason"]
+    assert set(res["stages"]) == set(agi_tr.BALLAST_ALLOC_STAGES)
+    for st in res["stages"].values():
+        assert params["min_fwd_draft_m"] <= st["FWD_m"] <= params["max_fwd_draft_ops_m"]
+        assert abs(st["Trim_cm"]) <= params["trim_limit_abs_cm"]
+        assert st["GM_m"] >= params["gm_target_m"]
+
+    alloc = res["allocation_t"]
+    assert res["total_t"] == pytest.approx(sum(alloc.values()))
+    for name, w in alloc.items():
+        assert 0.0 < w <= tanks[name]["max_t"] + 1e-9
+    aft = sum(w for n, w in alloc.items() if tanks[n]["x_from_mid_m"] > 0)
+    assert aft <= params["max_aft_ballast_cap_t"] + 1e-6
+
+
+def test_single_tank_matches_draft_limit(agi_tr, tanks):
+    # FW2 단일 탱크(용량 확대) → 최소 ballast 는 Stage 5 FWD = max_fwd 가 되는 중량
+    params = _params(agi_tr)
+    fw2 = {"FW2.P": dict(tanks["FW2.P"], max_t=100.0)}
+    res = agi_tr.optimize_ballast_allocation(params=params, tanks=fw2)
+
+    assert res["ok"]
+    st5 = res["stages"]["Stage 5_PreBallast"]
+    assert st5["FWD_m"] == pytest.approx(params["max_fwd_draft_ops_m"], abs=1e-5)
+
+    # 동일 중량을 FW2 중심(Fr.3) 단일 ballast 로 계산한 결과와 일치
+    x_fw2 = tanks["FW2.P"]["x_from_mid_m"]
+    single = agi_tr._stage_moment_and_drafts_for_preballast(
+        w_tr_unit_t=271.20,
+        w_preballast_t=res["total_t"],
+        fr_tr1_stow=agi_tr.FR_TR1_STOW,
+        fr_tr2_ramp=agi_tr.FR_TR2_RAMP,
+        fr_preballast=agi_tr.x_to_fr(x_fw2),
+        params=params,
+    )
+    assert single["stage5"]["FWD_m"] == pytest.approx(st5["FWD_m"])
+    assert single["stage6A"]["Trim_cm"] == pytest.approx(
+        res["stages"]["Stage 6A_Critical (Opt C)"]["Trim_cm"]
+    )
+
+
+def test_gm_gate_is_enforced(agi_tr, tanks):
+    params = _params(agi_tr, gm_target_m=1.63)
+    res = agi_tr.optimize_ballast_allocation(params=params, tanks=tanks)
+
+    assert res["ok"], res["reason"]
+    assert min(st["GM_m"] for st in res["stages"].values()) >= 1.63
+    assert res["iterations"] > 1
+
+
+def test_aft_capacity_limit_reports_infeasible(agi_tr, tanks):
+    # 기본 AFT 용량(28 t)으로는 Stage 5 FWD≤2.70m 를 만족할 수 없음
+    res = agi_tr.optimize_ballast_allocation(tanks=tanks)
+    assert res["ok"] is False
+    assert res["allocation_t"] == {}
+
+
+def test_unknown_objective_rejected(agi_tr, tanks):
+    with pytest.raises(ValueError):
+        agi_tr.optimize_ballast_allocation(tanks=tanks, objective="cost")
+
+
+def test_non_positive_max_iter_rejected(agi_tr, tanks):
+    with pytest.raises(ValueError):
+        agi_tr.optimize_ballast_allocation(tanks=tanks, max_iter=0)
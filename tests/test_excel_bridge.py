@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""bushra_excel_bridge_v1.TankPlanMatrix: Stage × Tank 행렬 합계가 TankState 경로와 동일한지 확인."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from conftest import ROOT
+
+sys.path.insert(0, str(ROOT))
+
+import bushra_excel_bridge_v1 as bridge  # noqa: E402
+
+MASTER_JSON = ROOT / "bushra_stability" / "data" / "master_tanks.json"
+
+
+@pytest.fixture(scope="module")
+def tanks():
+    return bridge.load_master_tanks_json(MASTER_JSON)
+
+
+@pytest.fixture(scope="module")
+def stage_maps(tanks):
+    rng = np.random.default_rng(7)
+    stages = []
+    for k in range(6):
+        chosen = rng.choice(len(tanks), 8, replace=False)
+        pf_map = {tanks[j].tank_id: float(rng.choice([0.0, 5.0, 35.0, 50.0, 80.0, 100.0])) for j in chosen}
+        sg_map = {tanks[j].tank_id: 1.1 for j in chosen[:2]}
+        stages.append((f"Stage {k}", pf_map, sg_map))
+    stages.append(("Empty", {}, {}))
+    return stages
+
+
+def test_matrix_sums_match_tank_states(tanks, stage_maps):
+    matrix = bridge.TankPlanMatrix.from_stage_maps(tanks, stage_maps)
+    assert matrix.percent_fill.shape == (len(stage_maps), len(tanks))
+
+    for i, (name, pf_map, sg_map) in enumerate(stage_maps):
+        plan = bridge.build_tank_plan(tanks, pf_map, sg_override_by_id=sg_map)
+        expected = bridge.tank_sums_for_stage(plan)
+        actual = matrix.tank_sums()[i]
+        for field in ("total_weight_t", "lcg_m_ap", "vcg_m", "tcg_m", "total_fsm_tm"):
+            assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9), (name, field)
+
+        assert matrix.stage_plan(i) == plan
+        active = np.flatnonzero(matrix.active[i])
+        np.testing.assert_allclose(matrix.weight_t[i, active], [ts.weight_t for ts in plan])
+        np.testing.assert_allclose(matrix.fsm_effective_tm[i, active], [ts.fsm_effective_tm() for ts in plan])
+
+    assert matrix.tank_sums()[-1] == bridge.TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def test_fsm_effect_array_matches_scalar():
+    fills = np.linspace(0.0, 100.0, 101)
+    np.testing.assert_allclose(
+        bridge.calculate_fsm_effect_array(fills, 7.5),
+        [bridge.calculate_fsm_effect(p, 7.5) for p in fills],
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots requires Python 3.10")
+def test_tank_definition_slots(tanks):
+    assert not hasattr(tanks[0], "__dict__")
+
+
+def _stage_workbook(path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    calc = wb.active
+    calc.title = "Calc"
+    calc.append(["Parameter", None, None, "Value"])
+    calc.append(["Lpp_m", None, None, 60.302])
+    calc.append(["LCF_m_from_midship", None, None, 0.76])
+    calc.append(["MTC_t_m_per_cm", None, None, "n/a"])
+    calc.append([None, None, None, 1.0])
+    stage = wb.create_sheet("RORO_Stage_Scenarios")
+    stage.cell(row=14, column=1, value="Stage")
+    rows = [
+        ("Stage 1", 2.5, -0.1, 0.0, 0.0, None, -10.0),
+        ("Stage 5A", 2.6, None, 271.2, 12.0),  # G 열 없음
+        ("Stage 6", "x", 0.2, 100.0, -3.0, None, 20.0),
+    ]
+    for r, values in enumerate(rows, start=15):
+        for c, v in enumerate(values, start=1):
+            stage.cell(row=r, column=c, value=v)
+    stage.cell(row=19, column=1, value="ignored after blank row")
+    tanks_ws = wb.create_sheet("Stage_Tanks")
+    tanks_ws.append(["Stage", "Tank_ID", "Percent_Fill", "SG"])
+    tanks_ws.append(["Stage 5A", "FWB2.P", 80.0, 1.025])
+    tanks_ws.append(["Stage 5A", "FWB2.S", 50.0])
+    tanks_ws.append([None, None, None, None])
+    tanks_ws.append(["Stage 6", "UNKNOWN", 50.0, None])
+    tanks_ws.append(["Stage 6", "FWB2.S", 0.0, None])
+    wb.save(path)
+
+
+def test_read_stage_workbook(tmp_path):
+    path = tmp_path / "stage.xlsx"
+    _stage_workbook(path)
+
+    data = bridge.read_stage_workbook(path)
+    assert data["calc_params"] == {"Lpp_m": 60.302, "LCF_m_from_midship": 0.76}
+    assert list(data["stages"]) == ["Stage 1", "Stage 5A", "Stage 6"]
+    assert data["stages"]["Stage 5A"] == {
+        "name": "Stage 5A",
+        "mean_draft_m": 2.6,
+        "trim_m_input": None,
+        "trim_cm_computed": None,
+        "w_stage_t": 271.2,
+        "x_stage_m_mid": 12.0,
+    }
+    assert data["stages"]["Stage 6"]["mean_draft_m"] is None
+    assert data["stage_tanks"][1] == ("Stage 5A", "FWB2.S", 50.0, None)
+    assert len(data["stage_tanks"]) == 4
+
+    out = bridge.stage_workbook_to_stability_json(path, MASTER_JSON, tmp_path / "out.json")
+    import json
+
+    stages = {s["name"]: s for s in json.loads(out.read_text(encoding="utf-8"))["stages"]}
+    assert [i["name"].split(" ")[0] for i in stages["Stage 5A"]["items"]] == ["FWB2.P", "FWB2.S", "Stage"]
+    assert stages["Stage 6"]["items"][0]["name"] == "Stage 6_lump"
+    assert stages["Stage 5A"]["tank_sums"]["total_weight_t"] > 0.0
+
+
+def test_read_stage_workbook_evaluates_uncached_formulas(tmp_path):
+    from openpyxl import Workbook
+
+    path = tmp_path / "formulas.xlsx"
+    wb = Workbook()
+    calc = wb.active
+    calc.title = "Calc"
+    calc.append(["Parameter", None, None, "Value"])
+    calc.append(["MTC_t_m_per_cm", None, None, 34.0])
+    calc.append(["Lpp_m", None, None, "=D2*2"])
+    stage = wb.create_sheet("RORO_Stage_Scenarios")
+    stage.cell(row=14, column=1, value="Stage")
+    for r, (w, x) in enumerate([(100.0, 5.0), (50.0, -2.0)], start=15):
+        stage.cell(row=r, column=1, value=f"Stage {r - 14}")
+        stage.cell(row=r, column=2, value=2.5)
+        stage.cell(row=r, column=4, value=w)
+        stage.cell(row=r, column=5, value=x)
+        stage.cell(row=r, column=7, value=f"=D{r}*E{r}/Calc!$D$2")
+    wb.save(path)
+
+    cached = bridge.read_stage_workbook(path)
+    assert cached["stages"]["Stage 1"]["trim_cm_computed"] is None
+    assert "Lpp_m" not in cached["calc_params"]
+
+    data = bridge.read_stage_workbook(path, evaluate_formulas=True)
+    assert data["calc_params"]["Lpp_m"] == 68.0
+    assert data["stages"]["Stage 1"]["trim_cm_computed"] == pytest.approx(500.0 / 34.0)
+    assert data["stages"]["Stage 2"]["trim_cm_computed"] == pytest.approx(-100.0 / 34.0)
+
+
+def test_stage_tank_condition_matches_tank_states(tanks, stage_maps):
+    pytest.importorskip("scipy")
+    stage = bridge.StageTankCondition(tanks)
+    assert stage.sums() == bridge.TankSums(0.0, 0.0, 0.0, 0.0, 0.0)
+
+    # Forward, backward and repeated stages: only differing tanks are updated
+    for name, pf_map, sg_map in stage_maps + stage_maps[::-1]:
+        expected = bridge.tank_sums_for_stage(bridge.build_tank_plan(tanks, pf_map, sg_override_by_id=sg_map))
+        actual = stage.apply_stage(pf_map, sg_map)
+        for field in ("total_weight_t", "lcg_m_ap", "vcg_m", "tcg_m", "total_fsm_tm"):
+            assert getattr(actual, field) == pytest.approx(getattr(expected, field), abs=1e-9), (name, field)
+
+    # Same plan again: nothing changes; one tank edited: one O(1) update
+    name, pf_map, sg_map = stage_maps[0]
+    stage.apply_stage(pf_map, sg_map)
+    seq = stage.condition.last_seq
+    assert stage.apply_stage(pf_map, sg_map) == stage.sums()
+    assert stage.condition.last_seq == seq
+
+    tank_id = tanks[0].tank_id
+    actual = stage.set_fill(tank_id, 45.0)
+    assert stage.condition.last_seq == seq + (pf_map.get(tank_id, 0.0) != 45.0)
+    expected = bridge.tank_sums_for_stage(
+        bridge.build_tank_plan(tanks, {**pf_map, tank_id: 45.0}, sg_override_by_id=sg_map)
+    )
+    assert actual.total_weight_t == pytest.approx(expected.total_weight_t, abs=1e-9)
+    assert actual.total_fsm_tm == pytest.approx(expected.total_fsm_tm, abs=1e-9)
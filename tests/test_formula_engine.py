@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""src.formula_engine: 생성 워크북 수식 값 = scalar 기준 계산, Excel 의미 규칙."""
+
+import contextlib
+import io
+import math
+
+import numpy as np
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from src.formula_engine import (
+    CircularReferenceError,
+    FormulaEngine,
+    evaluate_workbook,
+    load_workbook_values,
+    normalize_formula,
+)
+from src.roro_engine.tide import TideWorkability
+
+
+@pytest.fixture(scope="module")
+def generated(agi_tr, tmp_path_factory):
+    path = tmp_path_factory.mktemp("formula_engine") / "agi_tr.xlsx"
+    with contextlib.redirect_stdout(io.StringIO()):
+        wb = Workbook()
+        wb.remove(wb.active)
+        agi_tr.build_workbook_sheets(wb)
+        wb.save(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def engine(generated):
+    return evaluate_workbook(generated)
+
+
+def _calc(engine, key):
+    wb_calc = engine.column("Calc", "C", 1, 60)
+    row = 1 + list(wb_calc.text).index(key)
+    return engine.value("Calc", f"E{row}")
+
+
+def test_hourly_sheet_matches_tide_workability(engine):
+    values = engine.values("Hourly_FWD_AFT_Heights")
+    rows = sorted(int(k[1:]) for k in values if k.startswith("C"))
+    tide = np.array([values[f"B{r}"] for r in rows])
+    params = {
+        k: _calc(engine, k)
+        for k in ("L_ramp_m", "theta_max_deg", "KminusZ_m", "min_fwd_draft_m", "max_fwd_draft_m")
+    }
+    res = TideWorkability(np.zeros(len(rows), dtype="datetime64[s]"), tide, params).evaluate()
+    np.testing.assert_allclose([values[f"C{r}"] for r in rows], res["dfwd_m"], rtol=0, atol=1e-12)
+    np.testing.assert_allclose([values[f"E{r}"] for r in rows], res["dfwd_m"], rtol=0, atol=1e-12)
+    np.testing.assert_allclose([values[f"G{r}"] for r in rows], res["angle_deg"], rtol=0, atol=1e-9)
+    assert [values[f"H{r}"] for r in rows] == TideWorkability.status(res["ok"]).tolist()
+    assert values["K2"] == "Even Keel"
+    assert isinstance(values["A2"], str) and values["A2"].startswith("2025-12-01")
+
+
+def test_roro_columns_match_scalar_formulas(engine, generated):
+    ws = load_workbook(generated)["RORO_Stage_Scenarios"]
+    mtc = _calc(engine, "MTC_t_m_per_cm")
+    lcf = _calc(engine, "LCF_m_from_midship")
+    tmean = ws["B6"].value
+    assert engine.value("RORO_Stage_Scenarios", "B9") == mtc
+    for r in range(19, 29):
+        w, x = ws[f"B{r}"].value, ws[f"D{r}"].value
+        if w in (None, "") or x in (None, ""):
+            continue
+        tm = w * (x - lcf)
+        trim = tm / mtc
+        assert engine.value("RORO_Stage_Scenarios", f"E{r}") == pytest.approx(tm)
+        assert engine.value("RORO_Stage_Scenarios", f"F{r}") == pytest.approx(trim)
+        if str(ws[f"G{r}"].value).startswith("=IF($A"):  # 일부 Stage 는 G/H 고정값
+            assert engine.value("RORO_Stage_Scenarios", f"G{r}") == pytest.approx(tmean + trim / 200)
+            assert engine.value("RORO_Stage_Scenarios", f"H{r}") == pytest.approx(tmean - trim / 200)
+    summary = engine.values("OPERATION SUMMARY")
+    assert summary["A11"] == ws["A19"].value
+    assert {summary[f"B{r}"] for r in range(11, 20)} <= {"NORMAL", "PRE-BALLAST", "CRITICAL"}
+    assert not engine.unsupported
+
+
+def test_calc_params_are_defined_names(engine, generated):
+    from src.roro_engine.params import DEFAULT_PARAMS
+
+    wb = load_workbook(generated)
+    names = wb.defined_names
+    assert set(DEFAULT_PARAMS) <= set(names)
+    assert names["pump_rate_tph"].attr_text == "'Calc'!$E$12"  # 중복 키: MATCH 와 같이 첫 행
+    assert names["trim_limit_abs_cm"].attr_text == "240.0"  # Calc 에 없는 키 → 상수
+    for key in ("L_ramp_m", "KminusZ_m", "MTC_t_m_per_cm", "pump_rate_effective_tph"):
+        row = names[key].attr_text.rsplit("$", 1)[1]
+        assert engine.value("Calc", f"E{row}") == _calc(engine, key)
+    assert engine.value("RORO_Stage_Scenarios", "B13") == _calc(engine, "pump_rate_effective_tph")
+    for name in ("Hourly_FWD_AFT_Heights", "RORO_Stage_Scenarios"):
+        formulas = [c.value for row in wb[name].iter_rows() for c in row if isinstance(c.value, str)]
+        assert not any("Calc!$E:$E" in f for f in formulas)
+
+
+def test_hourly_rows_follow_tide_series_length(agi_tr, tmp_path, monkeypatch):
+    import zipfile
+
+    from src.roro_engine.data_io import TIDE_FILE_ENV
+
+    hours = 24 * 45  # 1개월 초과
+    tide = np.round(1.5 + np.sin(np.arange(hours) / 6.0), 2)
+    times = np.datetime64("2026-01-01T00:00") + np.arange(hours).astype("timedelta64[h]")
+    tide_file = tmp_path / "tide.csv"
+    tide_file.write_text(
+        "datetime,tide_m\n" + "".join(f"{str(t).replace('T', ' ')},{h}\n" for t, h in zip(times, tide)),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(TIDE_FILE_ENV, str(tide_file))
+    wb = Workbook()
+    wb.remove(wb.active)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in ("create_calc_sheet", "create_tide_sheet", "create_hourly_sheet"):
+            getattr(agi_tr, name)(wb)
+    path = tmp_path / "hourly.xlsx"
+    wb.save(path)
+
+    with zipfile.ZipFile(path) as z:
+        index = wb.sheetnames.index("Hourly_FWD_AFT_Heights") + 1
+        xml = z.read(f"xl/worksheets/sheet{index}.xml").decode()
+    assert f'<f t="shared" ref="C2:C{hours + 1}" si="2">' in xml
+    assert xml.count("TAN(RADIANS(") == 1  # 수식 텍스트는 열당 1번
+
+    values = evaluate_workbook(path).values("Hourly_FWD_AFT_Heights")
+    assert f"C{hours + 1}" in values and f"C{hours + 2}" not in values
+    res = TideWorkability(times, tide, {}).evaluate()
+    dfwd = [values[f"E{r}"] for r in range(2, hours + 2)]
+    np.testing.assert_allclose(dfwd, res["dfwd_m"], rtol=0, atol=1e-12)
+    assert [values[f"H{r}"] for r in range(2, hours + 2)] == TideWorkability.status(res["ok"]).tolist()
+
+
+def test_vectorized_equals_per_cell(generated, engine):
+    wb = load_workbook(generated, read_only=True)
+    per_cell = FormulaEngine(wb, vectorize=False).evaluate()
+    wb.close()
+    for sheet in ("Calc", "RORO_Stage_Scenarios", "OPERATION SUMMARY"):
+        a, b = engine.values(sheet), per_cell.values(sheet)
+        assert a.keys() == b.keys()
+        for key, value in a.items():
+            if isinstance(value, float):
+                assert b[key] == pytest.approx(value, abs=1e-12), key
+            else:
+                assert b[key] == value, key
+
+
+def _engine(cells, names=None, strict=False):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "S"
+    for coord, value in cells.items():
+        ws[coord] = value
+    for name, target in (names or {}).items():
+        defined = DefinedName(name, attr_text=target)
+        if hasattr(wb.defined_names, "add"):
+            wb.defined_names.add(defined)
+        else:
+            wb.defined_names.append(defined)
+    return FormulaEngine(wb, strict=strict)
+
+
+def test_excel_semantics():
+    e = _engine(
+        {
+            "A1": 2,
+            "A2": "Y",
+            "A3": "",
+            "B1": "=-A1^2",
+            "B2": "=IF(A4=0, \"blank is zero\", \"x\")",
+            "B3": "=A3=\"\"",
+            "B4": "=A2=\"y\"",
+            "B5": "=1/0",
+            "B6": "=IFERROR(B5, -1)",
+            "B7": "=ISERROR(B5)+ISBLANK(A4)*10",
+            "B8": "=A2+1",
+            "B9": "=ROUND(2.675, 2)",
+            "B10": "=\"n=\"&A1&\"%\"",
+            "B11": "=SEARCH(\"ball\", \"Pre-Ballast\")",
+            "B12": "=AND(A1>1, OR(A4=\"\", FALSE))",
+            "B13": "=MAX(A1:A4, -5)+MIN(3, A1)",
+            "B14": "=50%",
+            "B15": "=\"abc\"<1",
+        }
+    )
+    expected = {
+        "B1": 4.0,
+        "B2": "blank is zero",
+        "B3": True,
+        "B4": True,
+        "B5": "#DIV/0!",
+        "B6": -1.0,
+        "B7": 11.0,
+        "B8": "#VALUE!",
+        "B9": 2.68,
+        "B10": "n=2%",
+        "B11": 5.0,
+        "B12": True,
+        "B13": 4.0,
+        "B14": 0.5,
+        "B15": False,
+    }
+    assert {k: e.value("S", k) for k in expected} == expected
+
+
+def test_lookups_and_defined_names():
+    cells = {f"A{r}": r * 10 for r in range(1, 6)}
+    cells.update({f"B{r}": f"key{r}" for r in range(1, 6)})
+    cells.update(
+        {
+            "C1": "=INDEX($A:$A, MATCH(\"KEY3\", $B:$B, 0))",
+            "C2": "=VLOOKUP(27, $A$1:$B$5, 2, 1)",
+            "C3": "=VLOOKUP(27, $A$1:$B$5, 2, FALSE)",
+            "C4": "=MATCH(5, $A$1:$A$5, 1)",
+            "C5": "=Limit*2",
+            "C6": "=SUM(Table)",
+            "C7": "=SUMPRODUCT(($B$1:$B$5<>\"key2\")*$A$1:$A$5)",
+            "C8": "=Factor*Limit",
+        }
+    )
+    e = _engine(cells, {"Limit": "S!$A$2", "Table": "S!$A$1:$A$5", "Factor": "2.5"})
+    assert e.value("S", "C1") == 30.0
+    assert e.value("S", "C2") == "key2"
+    assert e.value("S", "C3") == "#N/A"
+    assert e.value("S", "C4") == "#N/A"
+    assert e.value("S", "C5") == 40.0
+    assert e.value("S", "C6") == 150.0
+    assert e.value("S", "C7") == 130.0
+    assert e.value("S", "C8") == 50.0
+
+
+def test_dependency_order_and_cycles():
+    # X 그룹은 Y5 에, Y5 는 X4 에 의존 → 그룹 단위 순환만 있으므로 1행 분할로 계산
+    cells = {f"A{r}": r for r in range(1, 11)}
+    cells.update({f"X{r}": f"=Y{r}+A{r}" for r in range(1, 11)})
+    cells.update({f"Y{r}": f"=A{r}*100" for r in range(1, 11) if r != 5})
+    cells["Y5"] = "=X4"
+    e = _engine(cells).evaluate()
+    assert e.value("S", "X5") == 404 + 5
+    assert e.value("S", "X10") == 1010
+
+    # 셀 단위 순환 → 오류 값 (나머지 셀은 계속 계산)
+    e = _engine({"A1": "=B1+1", "B1": "=A1", "C1": 3, "D1": "=C1*2"}).evaluate()
+    assert e.value("S", "A1") == "#VALUE!"
+    assert e.value("S", "B1") == "#VALUE!"
+    assert e.value("S", "D1") == 6
+    assert e.unsupported["S!A1"] == "circular reference"
+
+    with pytest.raises(CircularReferenceError):
+        _engine({"A1": "=B1+1", "B1": "=A1"}, strict=True).evaluate()
+
+
+def test_runtime_failure_and_missing_arguments_are_errors(monkeypatch):
+    e = _engine({"A1": "=AND()", "A2": "=OR()", "A3": "=VLOOKUP(1)", "A4": "=A1", "B1": "=SUM(1,2)"}).evaluate()
+    assert [e.value("S", f"A{r}") for r in range(1, 5)] == ["#NAME?"] * 4
+    assert e.value("S", "B1") == 3
+    assert {"S!A1", "S!A2", "S!A3"} <= e.unsupported.keys()
+
+    def boom(*args):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(np, "arctan2", boom)
+    e = _engine({"A1": "=ATAN2(1,1)", "A2": "=A1+1", "B1": "=1+1"}).evaluate()
+    assert e.value("S", "A1") == "#VALUE!"
+    assert e.value("S", "A2") == "#VALUE!"
+    assert e.value("S", "B1") == 2
+    assert e.unsupported["S!A1"] == "ValueError: boom"
+    with pytest.raises(ValueError):
+        _engine({"A1": "=ATAN2(1,1)"}, strict=True).evaluate()
+
+
+def test_unsupported_function_is_name_error():
+    e = _engine({"A1": "=FOO(1)", "A2": "=A1+1"}).evaluate()
+    assert e.value("S", "A1") == "#NAME?"
+    assert e.value("S", "A2") == "#NAME?"
+    assert "S!A1" in e.unsupported
+
+
+def test_normalize_formula_keeps_absolute_rows_and_strings():
+    assert normalize_formula('=IF($A5="B5","",B5*$B$9+C4)', 5) == '=IF($A#0="B5","",B#0*$B$9+C#-1)'
+    assert normalize_formula("='RORO Stage'!A19+ATAN2(1,2)", 11) == "='RORO Stage'!A#8+ATAN2(1,2)"
+
+
+def test_load_workbook_values_fills_uncached_cells(generated):
+    wb = load_workbook_values(generated)
+    ws = wb["Hourly_FWD_AFT_Heights"]
+    assert isinstance(ws["C2"].value, float)
+    assert ws["H2"].value in ("OK", "CHECK")
+    assert not math.isnan(wb["RORO_Stage_Scenarios"]["F20"].value)
+    assert load_workbook(generated, data_only=True)["Hourly_FWD_AFT_Heights"]["C2"].value is None
+
+
+def test_load_workbook_values_with_circular_cells(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"], ws["B1"], ws["C1"], ws["D1"] = "=B1+1", "=C1", "=A1", 5
+    ws["E1"] = "=D1*2"
+    wb.save(tmp_path / "cycle.xlsx")
+    ws = load_workbook_values(tmp_path / "cycle.xlsx").active
+    assert ws["A1"].value == "#VALUE!"
+    assert ws["E1"].value == 10
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""HydroTables: 캐시 보간 객체 ↔ scalar 보간 함수 일치 테스트."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tables(agi_tr):
+    return agi_tr.HydroTables.load()
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(7)
+    disp = np.concatenate([rng.uniform(2000.0, 5200.0, 400), [2580.0, 3200.0, 4250.0]])
+    trim = np.concatenate([rng.uniform(-2.5, 2.5, 400), [-1.5, 0.0, 1.5]])
+    return disp, trim
+
+
+def test_scalar_matches_legacy_functions(agi_tr, tables, hydro_table, points):
+    disp, trim = points
+    for d, t in zip(disp.tolist(), trim.tolist()):
+        assert tables.tmean(d) == agi_tr.interpolate_tmean_from_disp(d, hydro_table)
+        assert tables.gm(d, t) == agi_tr.gm_2d_bilinear(d, t)
+
+
+def test_vector_matches_scalar(tables, points):
+    disp, trim = points
+    assert tables.tmean_array(disp).tolist() == [tables.tmean(d) for d in disp]
+    assert tables.gm_array(disp, trim).tolist() == [
+        tables.gm(d, t) for d, t in zip(disp, trim)
+    ]
+
+
+def test_empty_tables_use_fallbacks(agi_tr):
+    empty = agi_tr.HydroTables()
+    assert empty.tmean(3000.0) == 2.00
+    assert empty.gm(3000.0, 0.0) == 1.50
+    assert empty.tmean_array([1.0, 2.0]).tolist() == [2.00, 2.00]
+    assert empty.gm_array([1.0, 2.0], 0.0).tolist() == [1.50, 1.50]
+
+
+def test_unsorted_and_duplicate_rows(agi_tr):
+    rows = [
+        {"Disp_t": 3000.0, "Tmean_m": 2.3},
+        {"Disp_t": 2000.0, "Tmean_m": 1.5},
+        {"Disp_t": 3000.0, "Tmean_m": 2.3},
+        {"Disp_t": 4000.0, "Tmean_m": 3.1},
+    ]
+    t = agi_tr.HydroTables(rows)
+    for d in (1000.0, 2000.0, 2500.0, 3000.0, 3500.0, 4500.0):
+        assert t.tmean(d) == agi_tr.interpolate_tmean_from_disp(d, rows)
+    assert t.tmean_array([2500.0, 3500.0]).tolist() == [t.tmean(2500.0), t.tmean(3500.0)]
+
+
+def test_load_is_cached_by_path_and_mtime(agi_tr, tmp_path):
+    hydro = tmp_path / "hydro_table.json"
+    grid = tmp_path / "gm.json"
+    hydro.write_text(json.dumps([{"Disp_t": 1000, "Tmean_m": 1.0}, {"Disp_t": 2000, "Tmean_m": 2.0}]))
+    grid.write_text(json.dumps({"disp": [1000, 2000], "trim": [-1, 1], "gm_grid": [[1, 1], [2, 2]]}))
+
+    first = agi_tr.HydroTables.load(str(hydro), str(grid))
+    assert agi_tr.HydroTables.load(str(hydro), str(grid)) is first
+    assert first.tmean(1500.0) == pytest.approx(1.5)
+    assert first.gm(1500.0, 0.0) == pytest.approx(1.5)
+
+    hydro.write_text(json.dumps([{"Disp_t": 1000, "Tmean_m": 1.0}, {"Disp_t": 2000, "Tmean_m": 3.0}]))
+    stat = os.stat(hydro)
+    os.utime(hydro, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = agi_tr.HydroTables.load(str(hydro), str(grid))
+    assert reloaded is not first
+    assert reloaded.tmean(1500.0) == pytest.approx(2.0)
+
+
+def test_solve_stage_with_tables_matches_default(agi_tr, tables, hydro_table):
+    params = {"MTC": 34.00, "LCF": 0.76, "LBP": 60.302, "hydro_table": hydro_table}
+    loads = agi_tr.build_stage_loads("Stage 6A_Critical (Opt C)", 37.65, {"W_TR": 271.20})
+    plain = agi_tr.solve_stage(2800.0, 2.00, loads, **params)
+    cached = agi_tr.solve_stage(2800.0, 2.00, loads, hydro_tables=tables, **params)
+    assert cached == plain
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""find_preballast_opt: analytic 모드 ↔ linear scan 회귀 테스트."""
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        dict(search_min_t=20.0, search_max_t=400.0, search_step_t=1.0),
+        dict(search_min_t=20.0, search_max_t=400.0, search_step_t=0.5),
+        dict(search_min_t=30.0, search_max_t=600.0, search_step_t=2.0),
+    ],
+)
+@pytest.mark.parametrize("check_stage5", [True, False])
+def test_analytic_matches_scan_on_same_grid(agi_tr, search, check_stage5):
+    params = dict(agi_tr.DEFAULT_PARAMS, CHECK_STAGE5=check_stage5)
+
+    scan = agi_tr.find_preballast_opt(params=params, **search)
+    analytic = agi_tr.find_preballast_opt(
+        params=params,
+        search_min_t=search["search_min_t"],
+        search_max_t=search["search_max_t"],
+        method="analytic",
+        tol_t=search["search_step_t"],
+    )
+
+    assert set(analytic) == set(scan)
+    assert analytic["ok"] == scan["ok"]
+    assert analytic["w_preballast_t"] == pytest.approx(scan["w_preballast_t"], abs=1e-9)
+    assert analytic["stage6A"]["FWD_m"] == pytest.approx(scan["stage6A"]["FWD_m"])
+    assert analytic["stage5"]["Trim_cm"] == pytest.approx(scan["stage5"]["Trim_cm"])
+
+
+def test_analytic_fine_tolerance_not_worse_than_scan(agi_tr):
+    params = agi_tr.DEFAULT_PARAMS
+    max_fwd = params.get("max_fwd_draft_ops_m", 2.70)
+
+    def metric(res):
+        return abs(max_fwd - res["stage6A"]["FWD_m"]) + 0.1 * abs(
+            max_fwd - res["stage5"]["FWD_m"]
+        )
+
+    coarse = agi_tr.find_preballast_opt(params=params, search_step_t=1.0)
+    fine = agi_tr.find_preballast_opt(params=params, method="analytic", tol_t=0.001)
+
+    assert fine["ok"]
+    assert metric(fine) <= metric(coarse) + 1e-12
+    # 1 kg 격자 위의 해
+    k = (fine["w_preballast_t"] - 20.0) / 0.001
+    assert k == pytest.approx(round(k), abs=1e-6)
+
+
+def test_analytic_reports_infeasible_like_scan(agi_tr):
+    # 탐색 범위를 feasible 구간 밖으로 제한 → 두 방식 모두 실패 dict
+    params = dict(agi_tr.DEFAULT_PARAMS, max_fwd_draft_ops_m=0.50)
+    scan = agi_tr.find_preballast_opt(params=params)
+    analytic = agi_tr.find_preballast_opt(params=params, method="analytic")
+    assert scan["ok"] is False
+    assert analytic == scan
+
+
+def test_unknown_method_rejected(agi_tr):
+    with pytest.raises(ValueError):
+        agi_tr.find_preballast_opt(method="golden")
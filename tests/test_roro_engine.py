@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""src.roro_engine: 부작용 없는 import + agi tr.py re-export 테스트."""
+
+import json
+import subprocess
+import sys
+
+from conftest import ROOT
+
+_PROBE = """
+import sys, json
+import src.roro_engine.solver as solver
+import src.roro_engine.hydro as hydro
+state_before = hydro._GM_GRID_STATE is None
+res = solver.solve_stage(2800.0, 2.00, solver.build_stage_loads("Stage 5", 0.0, {}))
+print(json.dumps({
+    "heavy": sorted(m for m in ("numpy", "scipy", "openpyxl", "matplotlib") if m in sys.modules),
+    "grid_lazy": state_before,
+    "grid_loaded": hydro._GM_GRID_STATE is not None,
+    "gm": res["GM_m"],
+}))
+"""
+
+
+def test_solver_import_is_light_and_side_effect_free():
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = proc.stdout.strip().splitlines()
+    # solve_stage 결과 외에 stdout 출력 없음 (print → logging)
+    assert len(lines) == 1
+    out = json.loads(lines[0])
+    assert out["heavy"] == []
+    assert out["grid_lazy"] is True
+    assert out["grid_loaded"] is True
+    assert out["gm"] > 0
+
+
+def test_agi_tr_reexports_engine(agi_tr):
+    from src.roro_engine import batch, hydro, solver, tables
+
+    assert agi_tr.solve_stage is solver.solve_stage
+    assert agi_tr.find_preballast_opt is solver.find_preballast_opt
+    assert agi_tr.gm_2d_bilinear is hydro.gm_2d_bilinear
+    assert agi_tr.HydroTables is tables.HydroTables
+    assert agi_tr.solve_stages_batch is batch.solve_stages_batch
+    assert agi_tr.DISP_GRID == hydro.get_gm_grid()[0]
+
+
+def test_package_lazy_exports(agi_tr):
+    import src.roro_engine as engine
+
+    assert engine.solve_stage is engine.solver.solve_stage
+    assert "optimize_ballast_allocation" in engine.__all__
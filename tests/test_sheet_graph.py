@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""src.sheet_graph: 시트 의존 그래프 + process pool 실행 (오류 복구 포함)."""
+
+import contextlib
+import io
+import sys
+import textwrap
+
+import pytest
+
+from conftest import ROOT
+
+sys.path.insert(0, str(ROOT))
+
+from src.sheet_graph import SheetTask, run_sheet_graph, topological_order, _namespace  # noqa: E402
+from src.sheet_payload import PayloadWorkbook  # noqa: E402
+
+_BUILDERS = textwrap.dedent(
+    """
+    def safe_sheet_creation(wb, sheet_func, sheet_name, *args):
+        try:
+            return sheet_func(wb, *args)
+        except Exception:
+            return None
+
+    def build_a(wb):
+        wb.create_sheet("A")["A1"] = 1.5
+        return {"rows": 1}
+
+    def build_broken(wb):
+        wb.create_sheet("Broken")["A1"] = "partial"
+        raise RuntimeError("boom")
+
+    def build_b(wb):
+        ws = wb.create_sheet("B")
+        ws["A1"] = "=A!A1*2"
+        return "b"
+
+    def finish(wb, a_result, broken_result):
+        wb["A"]["B1"] = f"{a_result['rows']}/{broken_result}"
+        return len(wb.sheetnames)
+    """
+)
+
+TASKS = (
+    SheetTask("A", "build_a"),
+    SheetTask("Broken", "build_broken"),
+    SheetTask("B", "build_b"),
+    SheetTask("Finish", "finish", deps=("A", "Broken"), local=True),
+)
+
+
+@pytest.fixture()
+def builders(tmp_path):
+    path = tmp_path / "builders.py"
+    path.write_text(_BUILDERS, encoding="utf-8")
+    return str(path), _namespace(str(path))
+
+
+def test_topological_order_validates_graph():
+    assert [t.name for t in topological_order(TASKS)] == ["A", "Broken", "B", "Finish"]
+    with pytest.raises(ValueError, match="Cyclic"):
+        topological_order([SheetTask("x", "f", deps=("y",)), SheetTask("y", "f", deps=("x",))])
+    with pytest.raises(ValueError, match="unknown"):
+        topological_order([SheetTask("x", "f", deps=("nope",))])
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_graph_keeps_order_and_recovers_from_failures(builders, max_workers):
+    path, ns = builders
+    wb = PayloadWorkbook()
+    timings = {}
+    results = run_sheet_graph(
+        wb, TASKS, namespace=ns, path=path, max_workers=max_workers, timings=timings
+    )
+    # 실패한 시트도 생성된 부분까지는 남고 결과는 None (safe_sheet_creation 과 동일)
+    assert wb.sheetnames == ["A", "Broken", "B"]
+    assert results["Broken"] is None and results["B"] == "b"
+    assert results["Finish"] == 3 and wb["A"]["B1"].value == "1/None"
+    assert {"A", "Broken", "B", "Finish"} <= set(timings)
+    if max_workers:
+        assert {"pool_wall", "assemble", "local"} <= set(timings)
+
+
+def test_parallel_build_matches_sequential(agi_tr):
+    def snapshot(wb):
+        return (
+            wb.sheetnames,
+            {k: v.attr_text for k, v in wb.defined_names.items()},
+            [
+                {k: c.value for k, c in ws._cells.items() if c.value is not None}
+                for ws in wb.worksheets
+            ],
+        )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        seq, par = PayloadWorkbook(), PayloadWorkbook()
+        res_seq = agi_tr.build_workbook_sheets(seq)
+        timings = {}
+        res_par = agi_tr.build_workbook_sheets(par, max_workers=2, timings=timings)
+
+    assert res_seq[1:] == res_par[1:] and len(res_seq[0]) == len(res_par[0])
+    assert snapshot(seq) == snapshot(par)
+    assert "RORO_Stage_Scenarios" in timings and "pool_wall" in timings
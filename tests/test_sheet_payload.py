@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""src.sheet_payload: write_only backend 가 일반 openpyxl 워크북과 동일한지 확인."""
+
+import contextlib
+import io
+import pickle
+import sys
+from copy import copy
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from conftest import ROOT
+
+sys.path.insert(0, str(ROOT))
+
+from src.sheet_payload import PayloadWorkbook, write_payload_workbook  # noqa: E402
+import verify_excel_generation as verify  # noqa: E402
+
+
+def _style_tuple(cell):
+    return (
+        cell.number_format,
+        copy(cell.font),
+        copy(cell.fill),
+        copy(cell.border),
+        copy(cell.alignment),
+        cell.comment.text if cell.comment else None,
+    )
+
+
+@pytest.fixture(scope="module")
+def built_pair(agi_tr, tmp_path_factory):
+    out = tmp_path_factory.mktemp("wb_backend")
+    with contextlib.redirect_stdout(io.StringIO()):
+        wb_std = Workbook()
+        wb_std.remove(wb_std.active)
+        res_std = agi_tr.build_workbook_sheets(wb_std)
+        wb_std.save(out / "standard.xlsx")
+
+        wb_pay = PayloadWorkbook()
+        res_pay = agi_tr.build_workbook_sheets(wb_pay)
+        write_payload_workbook(wb_pay, out / "write_only.xlsx")
+    assert res_std[1:] == res_pay[1:]
+    return load_workbook(out / "standard.xlsx"), load_workbook(out / "write_only.xlsx")
+
+
+def test_write_only_backend_is_formula_identical(built_pair):
+    wb_std, wb_wo = built_pair
+    assert wb_std.sheetnames == wb_wo.sheetnames
+    issues = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert verify.verify_all_cells(wb_std, wb_wo, issues), issues
+
+
+def test_write_only_backend_keeps_styles_and_tables(built_pair):
+    wb_std, wb_wo = built_pair
+    for ws_std in wb_std.worksheets:
+        ws_wo = wb_wo[ws_std.title]
+        assert ws_std.freeze_panes == ws_wo.freeze_panes
+        for key, cell in ws_std._cells.items():
+            if cell.value is None and not cell.has_style:
+                continue
+            assert _style_tuple(cell) == _style_tuple(ws_wo._cells[key]), (ws_std.title, key)
+
+    tables = lambda ws: [  # noqa: E731
+        (t.name, t.ref, [c.name for c in t.tableColumns]) for t in ws.tables.values()
+    ]
+    roro = "RORO_Stage_Scenarios"
+    assert tables(wb_std[roro]) == tables(wb_wo[roro])
+    assert tables(wb_wo[roro])
+
+
+def test_payload_sheet_mirrors_worksheet_semantics():
+    wb = PayloadWorkbook()
+    ws = wb.create_sheet("S")
+    ws["B3"] = "=A1"
+    ws.cell(row=7, column=2).value  # 읽기만 해도 셀 생성 (openpyxl 과 동일)
+    assert (ws.max_row, ws.max_column) == (7, 2)
+
+    ws["A10"] = "keep"
+    ws["B10"] = "dropped"
+    ws.merge_cells("A10:C10")
+    assert ws["A10"].value == "keep" and ws["B10"].value is None
+
+    assert wb.create_sheet("S").title == "S1"
+    clone = pickle.loads(pickle.dumps(ws))
+    assert clone.parent is None and clone["B3"].value == "=A1"
+    assert [r for r in clone.iter_rows(min_row=3, max_row=3, values_only=True)] == [(None, "=A1", None)]
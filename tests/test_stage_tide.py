@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""StageTideFeasibility: Stage × 조위 판정 행렬 (scalar 계산과 동일) + 순차 실행 시간대."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.roro_engine.params import DEFAULT_PARAMS
+from src.roro_engine.solver import build_stage_loads, solve_stage
+from src.roro_engine.stage_tide import STAGE_SEQUENCE, StageTideFeasibility
+from src.roro_engine.tide import TideWorkability
+
+STAGE_PARAMS = {
+    "MTC": 34.00,
+    "LCF": 0.76,
+    "LBP": 60.302,
+    "D_vessel": 3.65,
+    "W_TR": 271.20,
+    "FR_TR1_RAMP_START": 40.15,
+    "FR_TR1_RAMP_MID": 37.00,
+    "FR_TR1_STOW": 42.0,
+    "FR_TR2_RAMP": 17.95,
+    "FR_TR2_STOW": 40.00,
+    "FR_PREBALLAST": 3.0,
+}
+
+
+def _scalar_ok(dfwd, tide, p):
+    angle = math.degrees(math.atan((p["KminusZ_m"] - dfwd + tide) / p["L_ramp_m"]))
+    height = p["D_vessel_m"] - dfwd + tide
+    return (
+        p["min_fwd_draft_m"] <= dfwd <= p["max_fwd_draft_m"]
+        and angle <= p["theta_max_deg"]
+        and height >= p["linkspan_freeboard_target_m"]
+    )
+
+
+def _synthetic(ok_rows):
+    """ok 행렬을 그대로 쓰는 2-Stage 객체 (시각 = 2025-12-01 00:00 부터 1h 간격)"""
+    ok = np.array(ok_rows, dtype=bool)
+    times = np.arange(ok.shape[1]).astype("timedelta64[h]") + np.datetime64("2025-12-01T00")
+    tw = TideWorkability(times, np.zeros(ok.shape[1]))
+    feas = StageTideFeasibility(tw, ["A", "B"], [2.0, 2.0], [2.0, 2.0])
+    return feas, ok
+
+
+@pytest.mark.parametrize("overrides", [{}, {"KminusZ_m": 1.2, "min_fwd_draft_m": 0.8}])
+def test_matrix_matches_scalar_stage_loop(hydro_table, overrides):
+    params = {**STAGE_PARAMS, "hydro_table": hydro_table, **overrides}
+    tw = TideWorkability.from_json(params=overrides)
+    feas = StageTideFeasibility.solve(tw, 40.0, params)
+    res = feas.evaluate()
+    assert res["ok"].shape == (len(STAGE_SEQUENCE), len(tw))
+
+    p = {**DEFAULT_PARAMS, **overrides}
+    for i, st in enumerate(STAGE_SEQUENCE):
+        stage = solve_stage(2800.0, 2.0, build_stage_loads(st, 40.0, params), **params)
+        assert feas.dfwd_m[i] == stage["Dfwd_m"]
+        expected = [_scalar_ok(stage["Dfwd_m"], t, p) for t in tw.tide_m.tolist()]
+        assert res["ok"][i].tolist() == expected, st
+    # KminusZ 1.2 → ramp angle 이 완화되어 일부 시간대 전 Stage OK
+    if overrides:
+        assert res["ok"].all(axis=0).any()
+
+
+def test_sequence_windows_follow_stage_order_and_durations():
+    feas, ok = _synthetic(
+        [
+            [1, 1, 1, 0, 1, 1, 0, 0, 0, 0],
+            [0, 0, 1, 1, 1, 0, 1, 1, 1, 1],
+        ]
+    )
+    # A 2h → B 2h: 시작 0 (A 0-1, B 2-3), 4 (A 4-5, B 6-7), 5 안 됨 (A 6 NG)
+    assert np.flatnonzero(feas.sequence_start_ok([2, 2], ok)).tolist() == [0, 1, 4]
+    # A 1h → B 3h: 시작 1 (B 2-4), 시작 5 (B 6-8), 6 안 됨 (A NG)
+    assert np.flatnonzero(feas.sequence_start_ok({"B": 3}, ok)).tolist() == [1, 5]
+    # 0h Stage 는 판정 제외 → B 연속 2h 구간의 시작
+    assert np.flatnonzero(feas.sequence_start_ok([0, 2], ok)).tolist() == [2, 3, 6, 7, 8]
+    assert feas.sequence_windows([0, 2], ok)[1] == {
+        "start": "2025-12-01T06:00:00",
+        "latest_start": "2025-12-01T08:00:00",
+        "finish": "2025-12-01T10:00:00",
+        "starts": 3,
+    }
+    # 총 소요 시간이 시계열보다 길면 시작 불가
+    assert not feas.sequence_start_ok([6, 6], ok).any()
+    with pytest.raises(ValueError):
+        feas.sequence_start_ok({"C": 1}, ok)
+
+
+def test_year_of_tide_data(hydro_table):
+    base = TideWorkability.from_json()
+    n = 8760
+    times = np.datetime64("2025-12-01T00:00:00") + np.arange(n).astype("timedelta64[h]")
+    params = {
+        **STAGE_PARAMS,
+        "hydro_table": hydro_table,
+        "KminusZ_m": 1.2,
+        "theta_max_deg": 10.0,
+    }
+    tw = TideWorkability(times, np.resize(base.tide_m, n), params)
+    feas = StageTideFeasibility.solve(tw, 40.0, params)
+    ok = feas.evaluate()["ok"]
+    start_ok = feas.sequence_start_ok(2, ok)
+    assert ok.shape == (9, n) and start_ok.shape == (n,) and start_ok.any()
+    # 가능한 시작 시각이면 해당 Stage 구간이 모두 OK
+    for t in np.flatnonzero(start_ok)[:50]:
+        assert all(ok[i, t + 2 * i : t + 2 * i + 2].all() for i in range(9))
+    assert sum(w["starts"] for w in feas.sequence_windows(2, ok)) == int(start_ok.sum())
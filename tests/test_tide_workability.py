@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""TideWorkability: Hourly 시트 수식(scalar loop)과 동일 + 연속 OK 구간."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.roro_engine.params import DEFAULT_PARAMS
+from src.roro_engine.tide import TideWorkability
+
+
+def _legacy_row(tide, p, trim=0.0):
+    """bushra_operations.realtime_analysis 의 기존 per-row 계산 (+ Hourly 시트 trim 보정)"""
+    dfwd_req = p["KminusZ_m"] + tide - p["L_ramp_m"] * math.tan(math.radians(p["theta_max_deg"]))
+    dfwd = dfwd_req - trim / 2
+    angle = math.degrees(math.atan((p["KminusZ_m"] - dfwd + tide) / p["L_ramp_m"]))
+    ok = p["min_fwd_draft_m"] <= dfwd <= p["max_fwd_draft_m"] and angle <= p["theta_max_deg"]
+    return dfwd, dfwd_req + trim / 2, angle, ok
+
+
+@pytest.fixture(scope="module")
+def tide():
+    return TideWorkability.from_json()
+
+
+@pytest.mark.parametrize("params", [{}, {"KminusZ_m": 1.2, "min_fwd_draft_m": 0.8}])
+def test_matches_scalar_loop(tide, params):
+    tw = TideWorkability(tide.times, tide.tide_m, params)
+    p = {**DEFAULT_PARAMS, **params}
+    trim = np.linspace(-0.5, 0.5, len(tw))
+    res = tw.evaluate(trim)
+    legacy = np.array([_legacy_row(t, p, d) for t, d in zip(tw.tide_m.tolist(), trim.tolist())])
+    np.testing.assert_allclose(res["dfwd_m"], legacy[:, 0], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(res["daft_m"], legacy[:, 1], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(res["angle_deg"], legacy[:, 2], rtol=0, atol=1e-9)
+    assert res["ok"].tolist() == legacy[:, 3].astype(bool).tolist()
+
+
+def test_windows_and_kpi_use_series_length():
+    times = np.arange("2025-12-01T00", "2025-12-01T10", dtype="datetime64[h]")
+    # K−Z=3.0, L·tanθ≈1.261, trim −0.2 → Dfwd_adj = tide + 1.839 (angle < θ_max)
+    tide = np.array([0.0, 0.5, 0.5, 2.5, 0.5, 0.5, 0.5, 2.5, 0.5, 0.5])
+    tw = TideWorkability(times, tide)
+    res = tw.evaluate(trim_m=-0.2)
+    assert tw.ok_intervals(res["ok"]).tolist() == [[0, 3], [4, 7], [8, 10]]
+    assert tw.ok_intervals(res["ok"], min_hours=3).tolist() == [[0, 3], [4, 7]]
+    assert tw.windows(res["ok"])[1] == {
+        "start": "2025-12-01T04:00:00",
+        "end": "2025-12-01T06:00:00",
+        "hours": 3,
+    }
+    assert tw.kpi(res)["workable_percentage"] == pytest.approx(80.0)
+    assert tw.status(res["ok"]).tolist()[3] == "CHECK"
+
+
+def test_scales_to_multi_year_series(tide):
+    n = 100_000
+    tile = -(-n // len(tide))
+    times = np.datetime64("2025-12-01T00:00:00") + np.arange(n).astype("timedelta64[h]")
+    tw = TideWorkability(times, np.tile(tide.tide_m, tile)[:n])
+    res = tw.evaluate()
+    assert res["ok"].shape == (n,)
+    assert tw.kpi(res)["ok_hours"] == int(res["ok"].sum())
+
+
+def test_tide_records_stream_json_and_csv(tide, tmp_path, monkeypatch):
+    import json
+
+    from src.roro_engine import data_io
+
+    path = data_io.find_tide_file()
+    with open(path, encoding="utf-8") as f:
+        records = json.load(f)
+    monkeypatch.setattr(data_io, "_CHUNK", 64)  # 청크 경계를 여러 번 넘김
+    assert list(data_io.iter_tide_records(path)) == records
+
+    csv_path = tmp_path / "tide.csv"
+    csv_path.write_text(
+        "datetime_gst,tide_m (CD)\n" + "".join(f"{r['datetime']},{r['tide_m']}\n" for r in records),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv(data_io.TIDE_FILE_ENV, str(csv_path))
+    tw = TideWorkability.from_json()
+    np.testing.assert_array_equal(tw.tide_m, tide.tide_m)
+    np.testing.assert_array_equal(tw.times, tide.times)
@@ -9,7 +9,7 @@
 - 명령줄 옵션 지원
 
 사용법:
-    python verify_excel_generation.py [--quick] [--detailed] [--formulas] [--original PATH] [--generated PATH]
+    python verify_excel_generation.py [--quick] [--detailed] [--formulas] [--all-cells] [--original PATH] [--generated PATH]
 """
 
 import argparse
@@ -291,11 +291,56 @@ def verify_formulas(wb_orig, wb_gen, issues):
     return True
 
 
+def verify_all_cells(wb_orig, wb_gen, issues, max_report=20):
+    """전 시트 전체 셀 값/수식 + 병합/열 너비/이름 정의 비교 (backend 간 동일성 검증용)"""
+    print("\n[8] 전체 셀 비교")
+    print("-" * 80)
+    mismatches = 0
+    for sheet_name in wb_orig.sheetnames:
+        if sheet_name not in wb_gen.sheetnames:
+            continue
+        ws_orig = wb_orig[sheet_name]
+        ws_gen = wb_gen[sheet_name]
+        max_row = max(ws_orig.max_row, ws_gen.max_row)
+        max_col = max(ws_orig.max_column, ws_gen.max_column)
+        sheet_mismatch = 0
+        for row in range(1, max_row + 1):
+            for col in range(1, max_col + 1):
+                orig_val = ws_orig.cell(row, col).value
+                gen_val = ws_gen.cell(row, col).value
+                if orig_val != gen_val:
+                    sheet_mismatch += 1
+                    if mismatches + sheet_mismatch <= max_report:
+                        print(f"❌ {sheet_name}!{get_column_letter(col)}{row}: 원본={orig_val!r}, 생성={gen_val!r}")
+        if sorted(map(str, ws_orig.merged_cells.ranges)) != sorted(map(str, ws_gen.merged_cells.ranges)):
+            sheet_mismatch += 1
+            print(f"❌ {sheet_name}: 병합 셀 불일치")
+        widths_orig = {k: d.width for k, d in ws_orig.column_dimensions.items()}
+        widths_gen = {k: d.width for k, d in ws_gen.column_dimensions.items()}
+        if widths_orig != widths_gen:
+            sheet_mismatch += 1
+            print(f"❌ {sheet_name}: 열 너비 불일치")
+        if sheet_mismatch:
+            issues.append(f"{sheet_name} 셀 {sheet_mismatch}개 불일치")
+        else:
+            print(f"✅ {sheet_name}: {max_row}행 x {max_col}열 일치")
+        mismatches += sheet_mismatch
+
+    names_orig = {k: d.attr_text for k, d in wb_orig.defined_names.items()}
+    names_gen = {k: d.attr_text for k, d in wb_gen.defined_names.items()}
+    if names_orig != names_gen:
+        mismatches += 1
+        issues.append("이름 정의(defined names) 불일치")
+        print("❌ 이름 정의 불일치")
+    return mismatches == 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="엑셀 생성 파일 검증")
     parser.add_argument("--quick", action="store_true", help="빠른 검증 (기본 검사만)")
     parser.add_argument("--detailed", action="store_true", help="상세 검증 (모든 값 출력)")
     parser.add_argument("--formulas", action="store_true", help="수식 상세 비교")
+    parser.add_argument("--all-cells", action="store_true", help="전 시트 전체 셀 값/수식 비교 (backend 동일성)")
     parser.add_argument("--original", type=str, default="LCT_BUSHRA_AGI_TR.xlsx", help="원본 파일 경로")
     parser.add_argument("--generated", type=str, default=None, help="생성 파일 경로 (자동 감지 시 생략)")
     
@@ -349,6 +394,9 @@ def main():
     
     if args.formulas:
         all_match &= verify_formulas(wb_orig, wb_gen, issues)
+
+    if args.all_cells:
+        all_match &= verify_all_cells(wb_orig, wb_gen, issues)
     
     wb_orig.close()
     wb_gen.close()